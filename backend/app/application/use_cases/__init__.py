@@ -10,6 +10,9 @@ from .student import (
     CreateStudentProfileUseCase,
     UpdateStudentProfileUseCase,
     RecordSessionCompletionUseCase,
+    RebuildStudentStatsUseCase,
+    RecordStudentPaymentUseCase,
+    RecordStudentRefundUseCase,
 )
 
 __all__ = [
@@ -22,4 +25,7 @@ __all__ = [
     "CreateStudentProfileUseCase",
     "UpdateStudentProfileUseCase",
     "RecordSessionCompletionUseCase",
+    "RebuildStudentStatsUseCase",
+    "RecordStudentPaymentUseCase",
+    "RecordStudentRefundUseCase",
 ]
@@ -7,6 +7,7 @@ from .ban_user import BanUserUseCase
 from .activate_user import ActivateUserUseCase
 from .get_pending_instructors import GetPendingInstructorsUseCase
 from .get_admin_dashboard_stats import GetAdminDashboardStatsUseCase
+from .daily_rollups import RefreshDailyRollupsUseCase, GetDailyRollupsUseCase, RollupSeries
 
 __all__ = [
     "RejectInstructorUseCase",
@@ -16,4 +17,7 @@ __all__ = [
     "ActivateUserUseCase",
     "GetPendingInstructorsUseCase",
     "GetAdminDashboardStatsUseCase",
+    "RefreshDailyRollupsUseCase",
+    "GetDailyRollupsUseCase",
+    "RollupSeries",
 ]
@@ -0,0 +1,228 @@
+"""Use cases for the daily analytics rollups."""
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+from app.domains.analytics.entities import (
+    DailyMetrics,
+    InstructorDailyRollup,
+    PlatformDailyRollup,
+)
+from app.domains.analytics.repositories import IDailyRollupRepository
+
+
+def _days(start: date, end: date) -> List[date]:
+    return [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+
+
+@dataclass
+class RollupRefreshResult:
+    """Outcome of a rollup refresh run."""
+
+    start: Optional[date]
+    end: Optional[date]
+    days: int = 0
+    instructor_rows: int = 0
+
+
+@dataclass
+class RollupSeries:
+    """Daily metrics over a range, plus their totals."""
+
+    start: date
+    end: date
+    rolled_up_through: Optional[date]  # Later days aren't rolled up yet and are omitted
+    days: List[DailyMetrics] = field(default_factory=list)
+    totals: Optional[DailyMetrics] = None
+
+
+class RefreshDailyRollupsUseCase:
+    """
+    Rebuild daily rollups from sessions and payments.
+
+    Every refreshed day is recomputed from scratch and replaced, so runs
+    are idempotent and can overlap. Without an explicit range the job
+    continues from the latest rolled-up day, re-rolling the last few days
+    to pick up late completions, cancellations and refunds.
+    """
+
+    def __init__(
+        self,
+        rollup_repo: IDailyRollupRepository,
+        platform_fee_percent: Decimal,
+        lookback_days: int = 3,
+        chunk_days: int = 31,
+    ):
+        """
+        Initialize use case.
+
+        Args:
+            rollup_repo: Daily rollup repository
+            platform_fee_percent: Platform fee applied to gross amounts
+            lookback_days: Already rolled-up days recomputed on incremental runs
+            chunk_days: Days aggregated per round of queries
+        """
+        self.rollup_repo = rollup_repo
+        self.platform_fee_percent = Decimal(platform_fee_percent)
+        self.lookback_days = lookback_days
+        self.chunk_days = chunk_days
+
+    def default_range(self, today: Optional[date] = None) -> Optional[tuple]:
+        """
+        Days an incremental run should refresh.
+
+        Returns:
+            (start, end), or None if there is nothing to roll up yet
+        """
+        end = today or datetime.utcnow().date()
+        latest = self.rollup_repo.get_latest_day()
+        if latest:
+            return min(latest, end) - timedelta(days=self.lookback_days), end
+
+        earliest = self.rollup_repo.get_earliest_activity_day()
+        if earliest is None:
+            return None
+        return min(earliest, end), end
+
+    def execute(
+        self,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+    ) -> RollupRefreshResult:
+        """
+        Refresh rollups for a range of days.
+
+        Args:
+            start: First day to refresh (default: incremental)
+            end: Last day to refresh (default: today, UTC)
+
+        Returns:
+            RollupRefreshResult with the refreshed range and row counts
+
+        Raises:
+            ValueError: If start is after end
+        """
+        if start is None:
+            default = self.default_range(today=end)
+            if default is None:
+                return RollupRefreshResult(start=None, end=None)
+            start, default_end = default
+            end = end or default_end
+        end = end or datetime.utcnow().date()
+
+        if start > end:
+            raise ValueError("start must be on or before end")
+
+        result = RollupRefreshResult(start=start, end=end)
+        chunk_start = start
+        while chunk_start <= end:
+            chunk_end = min(chunk_start + timedelta(days=self.chunk_days - 1), end)
+            result.instructor_rows += self._refresh_chunk(chunk_start, chunk_end)
+            result.days += (chunk_end - chunk_start).days + 1
+            chunk_start = chunk_end + timedelta(days=1)
+
+        return result
+
+    def _refresh_chunk(self, start: date, end: date) -> int:
+        """Recompute and replace one chunk of days; returns instructor rows written."""
+        now = datetime.utcnow()
+        instructor_rollups = self.rollup_repo.aggregate_instructor_days(start, end)
+
+        by_day: Dict[date, List[InstructorDailyRollup]] = defaultdict(list)
+        for rollup in instructor_rollups:
+            rollup.apply_platform_fee(self.platform_fee_percent)
+            rollup.updated_at = now
+            by_day[rollup.day].append(rollup)
+
+        # A platform row for every day, so quiet days show up as zeros
+        platform_rollups = [
+            PlatformDailyRollup.from_instructor_rollups(day, by_day.get(day, []))
+            for day in _days(start, end)
+        ]
+
+        self.rollup_repo.replace_days(start, end, instructor_rollups, platform_rollups)
+        return len(instructor_rollups)
+
+
+class GetDailyRollupsUseCase:
+    """
+    Read analytics series from the rollups only.
+
+    Admin-only; never touches sessions or payments.
+    """
+
+    def __init__(self, rollup_repo: IDailyRollupRepository, max_range_days: int = 366):
+        """
+        Initialize use case.
+
+        Args:
+            rollup_repo: Daily rollup repository
+            max_range_days: Longest range that may be requested
+        """
+        self.rollup_repo = rollup_repo
+        self.max_range_days = max_range_days
+
+    def get_platform_series(self, start: date, end: date) -> RollupSeries:
+        """
+        Platform-wide daily metrics.
+
+        Args:
+            start: First day included
+            end: Last day included
+
+        Returns:
+            RollupSeries of PlatformDailyRollup
+
+        Raises:
+            ValueError: If the range is invalid or too long
+        """
+        self._validate_range(start, end)
+        rollups = self.rollup_repo.get_platform_days(start, end)
+        return self._series(start, end, rollups, lambda day: PlatformDailyRollup(day=day))
+
+    def get_instructor_series(self, instructor_id: int, start: date, end: date) -> RollupSeries:
+        """
+        One instructor's daily metrics (days without activity are zeros).
+
+        Args:
+            instructor_id: Instructor profile ID
+            start: First day included
+            end: Last day included
+
+        Returns:
+            RollupSeries of InstructorDailyRollup
+
+        Raises:
+            ValueError: If the range is invalid or too long
+        """
+        self._validate_range(start, end)
+        rollups = self.rollup_repo.get_instructor_days(instructor_id, start, end)
+        return self._series(
+            start,
+            end,
+            rollups,
+            lambda day: InstructorDailyRollup(day=day, instructor_id=instructor_id),
+        )
+
+    def _validate_range(self, start: date, end: date) -> None:
+        if start > end:
+            raise ValueError("start must be on or before end")
+        if (end - start).days + 1 > self.max_range_days:
+            raise ValueError(f"Range too long: at most {self.max_range_days} days")
+
+    def _series(self, start: date, end: date, rollups: List[DailyMetrics], empty) -> RollupSeries:
+        latest = self.rollup_repo.get_latest_day()
+        series = RollupSeries(start=start, end=end, rolled_up_through=latest)
+        series.totals = DailyMetrics(day=start)
+        if latest is None or latest < start:
+            return series
+
+        by_day = {rollup.day: rollup for rollup in rollups}
+        for day in _days(start, min(end, latest)):
+            rollup = by_day.get(day) or empty(day)
+            series.days.append(rollup)
+            series.totals.add(rollup)
+        return series
@@ -1,6 +1,8 @@
 """Use case for getting admin dashboard statistics."""
 
 from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
 
 from app.domains.instructor.repositories import IInstructorProfileRepository
 from app.domains.instructor.value_objects import InstructorStatus
@@ -29,6 +31,9 @@ class AdminDashboardStats:
     rejected_instructors: int
     suspended_instructors: int
 
+    # When the counts were taken (stats may be served from a cached snapshot)
+    generated_at: Optional[datetime] = None
+
 
 class GetAdminDashboardStatsUseCase:
     """
@@ -63,41 +68,29 @@ class GetAdminDashboardStatsUseCase:
         Raises:
             RepositoryError: If database operation fails
         """
-        # User counts by role
-        total_users = self.user_repo.count()
-        total_students = self.user_repo.count(role=UserRole.STUDENT)
-        total_instructors = self.user_repo.count(role=UserRole.INSTRUCTOR)
-        total_admins = self.user_repo.count(role=UserRole.ADMIN)
-
-        # User counts by status
-        active_users = self.user_repo.count(status=UserStatus.ACTIVE)
-        suspended_users = self.user_repo.count(status=UserStatus.SUSPENDED)
-        banned_users = self.user_repo.count(status=UserStatus.BANNED)
-
-        # Instructor counts by status
-        pending_instructors = self.instructor_repo.count(
-            status=InstructorStatus.PENDING_REVIEW
-        )
-        verified_instructors = self.instructor_repo.count(
-            status=InstructorStatus.VERIFIED
-        )
-        rejected_instructors = self.instructor_repo.count(
-            status=InstructorStatus.REJECTED
-        )
-        suspended_instructors = self.instructor_repo.count(
-            status=InstructorStatus.SUSPENDED
-        )
+        # One grouped query per table instead of a COUNT per figure
+        user_counts = self.user_repo.count_by_role_and_status()
+        instructor_counts = self.instructor_repo.count_by_status()
+
+        def users(role: Optional[UserRole] = None, status: Optional[UserStatus] = None) -> int:
+            return sum(
+                count
+                for (user_role, user_status), count in user_counts.items()
+                if (role is None or user_role == role.value)
+                and (status is None or user_status == status.value)
+            )
 
         return AdminDashboardStats(
-            total_users=total_users,
-            total_students=total_students,
-            total_instructors=total_instructors,
-            total_admins=total_admins,
-            active_users=active_users,
-            suspended_users=suspended_users,
-            banned_users=banned_users,
-            pending_instructors=pending_instructors,
-            verified_instructors=verified_instructors,
-            rejected_instructors=rejected_instructors,
-            suspended_instructors=suspended_instructors,
+            total_users=users(),
+            total_students=users(role=UserRole.STUDENT),
+            total_instructors=users(role=UserRole.INSTRUCTOR),
+            total_admins=users(role=UserRole.ADMIN),
+            active_users=users(status=UserStatus.ACTIVE),
+            suspended_users=users(status=UserStatus.SUSPENDED),
+            banned_users=users(status=UserStatus.BANNED),
+            pending_instructors=instructor_counts.get(InstructorStatus.PENDING_REVIEW, 0),
+            verified_instructors=instructor_counts.get(InstructorStatus.VERIFIED, 0),
+            rejected_instructors=instructor_counts.get(InstructorStatus.REJECTED, 0),
+            suspended_instructors=instructor_counts.get(InstructorStatus.SUSPENDED, 0),
+            generated_at=datetime.utcnow(),
         )
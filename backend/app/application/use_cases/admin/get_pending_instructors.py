@@ -48,11 +48,12 @@ class GetPendingInstructorsUseCase:
         Raises:
             RepositoryError: If database operation fails
         """
-        # Get pending profiles
+        # Get pending profiles, oldest applicants first
         pending_profiles = self.instructor_repo.get_all(
             status=InstructorStatus.PENDING_REVIEW,
             skip=skip,
             limit=limit,
+            newest_first=False,
         )
 
         # Enrich with user data
@@ -4,10 +4,16 @@ from app.application.use_cases.booking.initiate_booking import InitiateBookingUs
 from app.application.use_cases.booking.confirm_booking import ConfirmBookingUseCase
 from app.application.use_cases.booking.cancel_booking import CancelBookingUseCase
 from app.application.use_cases.booking.get_booking_status import GetBookingStatusUseCase
+from app.application.use_cases.booking.reap_stale_payments import (
+    ReapStalePaymentsUseCase,
+    ReapRunResult,
+)
 
 __all__ = [
     "InitiateBookingUseCase",
     "ConfirmBookingUseCase",
     "CancelBookingUseCase",
     "GetBookingStatusUseCase",
+    "ReapStalePaymentsUseCase",
+    "ReapRunResult",
 ]
@@ -4,6 +4,7 @@ Cancel Booking Use Case.
 Cancels a pending payment or refunds a completed payment.
 """
 
+import logging
 from dataclasses import dataclass
 from typing import Optional
 
@@ -12,6 +13,10 @@ from app.domains.payment.services.payment_gateway import IPaymentGateway
 from app.domains.payment.value_objects.enums import PaymentStatus
 from app.domains.scheduling.repositories.booking_slot_repository import IBookingSlotRepository
 from app.domains.scheduling.repositories.session_repository import ISessionRepository
+from app.domains.student.repositories import IStudentProfileRepository, IStudentStatsRepository
+from app.application.use_cases.student.student_stats import RecordStudentRefundUseCase
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -48,6 +53,8 @@ class CancelBookingUseCase:
         slot_repo: IBookingSlotRepository,
         session_repo: ISessionRepository,
         payment_gateway: IPaymentGateway,
+        student_repo: Optional[IStudentProfileRepository] = None,
+        student_stats_repo: Optional[IStudentStatsRepository] = None,
     ):
         """
         Initialize use case with dependencies.
@@ -57,11 +64,15 @@ class CancelBookingUseCase:
             slot_repo: Booking slot repository
             session_repo: Session repository
             payment_gateway: Payment gateway for refunds
+            student_repo: Optional student profile repository (for stats)
+            student_stats_repo: Optional student stats repository
         """
         self.payment_repo = payment_repo
         self.slot_repo = slot_repo
         self.session_repo = session_repo
         self.payment_gateway = payment_gateway
+        self.student_repo = student_repo
+        self.student_stats_repo = student_stats_repo
 
     def execute(self, request: CancelBookingRequest) -> CancelBookingResponse:
         """
@@ -165,6 +176,7 @@ class CancelBookingUseCase:
                     # Update payment status
                     payment.refund(refund_result.refund_id)
                     self.payment_repo.update(payment)
+                    self._record_refund(payment)
                 else:
                     # Refund failed - still mark session cancelled but note the error
                     payment.extra_data["refund_error"] = refund_result.error_message
@@ -191,3 +203,18 @@ class CancelBookingUseCase:
             refund_initiated=refund_initiated,
             refund_amount=refund_amount,
         )
+
+    def _record_refund(self, payment) -> None:
+        """Remove the refunded payment from the student's stats."""
+        if not (self.student_repo and self.student_stats_repo):
+            return
+        try:
+            RecordStudentRefundUseCase(
+                student_repo=self.student_repo,
+                stats_repo=self.student_stats_repo,
+                session_repo=self.session_repo,
+                payment_repo=self.payment_repo,
+            ).execute(user_id=payment.student_id, amount=payment.amount)
+        except Exception as e:
+            # Stats can be rebuilt from history; don't fail the cancellation
+            logger.warning(f"Failed to update student stats: {e}")
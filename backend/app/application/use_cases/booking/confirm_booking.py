@@ -4,6 +4,7 @@ Confirm Booking Use Case.
 Step 2 of the booking flow: Verifies payment and creates the session.
 """
 
+import logging
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
@@ -17,8 +18,12 @@ from app.domains.scheduling.repositories.session_repository import ISessionRepos
 from app.domains.scheduling.entities.session import Session
 from app.domains.scheduling.value_objects import SessionType
 from app.domains.wallet.repositories import IWalletRepository
+from app.domains.student.repositories import IStudentProfileRepository, IStudentStatsRepository
+from app.application.use_cases.student.student_stats import RecordStudentPaymentUseCase
 from app.domains.wallet.value_objects.money import Money
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class ConfirmBookingRequest:
@@ -66,6 +71,8 @@ class ConfirmBookingUseCase:
         session_repo: ISessionRepository,
         wallet_repo: IWalletRepository,
         payment_gateway: IPaymentGateway,
+        student_repo: Optional[IStudentProfileRepository] = None,
+        student_stats_repo: Optional[IStudentStatsRepository] = None,
     ):
         """
         Initialize use case with dependencies.
@@ -76,12 +83,16 @@ class ConfirmBookingUseCase:
             session_repo: Session repository
             wallet_repo: Wallet repository
             payment_gateway: Payment gateway (Razorpay)
+            student_repo: Optional student profile repository (for stats)
+            student_stats_repo: Optional student stats repository
         """
         self.payment_repo = payment_repo
         self.slot_repo = slot_repo
         self.session_repo = session_repo
         self.wallet_repo = wallet_repo
         self.payment_gateway = payment_gateway
+        self.student_repo = student_repo
+        self.student_stats_repo = student_stats_repo
 
     def execute(self, request: ConfirmBookingRequest) -> ConfirmBookingResponse:
         """
@@ -237,7 +248,20 @@ class ConfirmBookingUseCase:
             # Log error but don't fail the booking
             print(f"Warning: Failed to credit wallet: {e}")
 
-        # 13. Return success response
+        # 13. Add the payment to the student's stats
+        if self.student_repo and self.student_stats_repo:
+            try:
+                RecordStudentPaymentUseCase(
+                    student_repo=self.student_repo,
+                    stats_repo=self.student_stats_repo,
+                    session_repo=self.session_repo,
+                    payment_repo=self.payment_repo,
+                ).execute(user_id=payment.student_id, amount=payment.amount)
+            except Exception as e:
+                # Stats can be rebuilt from history; don't fail the booking
+                logger.warning(f"Failed to update student stats: {e}")
+
+        # 14. Return success response
         return ConfirmBookingResponse(
             success=True,
             session_id=session.id,
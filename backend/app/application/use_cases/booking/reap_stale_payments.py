@@ -0,0 +1,142 @@
+"""Use case for failing checkouts that were abandoned mid-payment."""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from app.domains.payment.entities.payment import Payment
+from app.domains.payment.repositories.payment_repository import IPaymentRepository
+from app.domains.payment.services.payment_gateway import (
+    GatewayOrderStatus,
+    IPaymentGateway,
+    PaymentGatewayError,
+)
+
+logger = logging.getLogger(__name__)
+
+EXPIRED_REASON = "Checkout expired before payment was attempted"
+ABANDONED_REASON = "Payment was not completed at the gateway"
+
+
+@dataclass
+class ReapRunResult:
+    """Outcome of a reaper run."""
+
+    batches: int = 0
+    scanned: int = 0
+    expired: int = 0  # Checkout never attempted
+    failed: int = 0  # Attempted, but no successful payment
+    paid_unconfirmed: int = 0  # Paid at the gateway; left for confirmation/reconciliation
+    check_errors: int = 0  # Gateway couldn't be reached; retried next run
+    slots_released: int = 0
+
+    @property
+    def reaped(self) -> int:
+        return self.expired + self.failed
+
+
+class ReapStalePaymentsUseCase:
+    """
+    Fail PROCESSING payments whose checkout was abandoned.
+
+    A processing payment holds its slot (see get_pending_for_slot), so an
+    abandoned checkout keeps the slot unbookable until it is failed. Stale
+    payments are read in keyset batches, their orders checked with the
+    gateway through a bounded thread pool, and those without a successful
+    payment are failed in one guarded UPDATE per batch - which releases
+    their slots. Orders the gateway reports as paid are never failed.
+    """
+
+    def __init__(
+        self,
+        payment_repo: IPaymentRepository,
+        payment_gateway: IPaymentGateway,
+        stale_minutes: int = 30,
+        batch_size: int = 100,
+        concurrency: int = 8,
+    ):
+        """
+        Initialize use case.
+
+        Args:
+            payment_repo: Payment repository
+            payment_gateway: Payment gateway (order status lookups)
+            stale_minutes: Age after which a processing payment is checked
+            batch_size: Payments read and failed per batch
+            concurrency: Gateway status checks in flight at once
+        """
+        self.payment_repo = payment_repo
+        self.payment_gateway = payment_gateway
+        self.stale_minutes = stale_minutes
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+
+    def execute(self, max_batches: Optional[int] = None) -> ReapRunResult:
+        """
+        Reap stale processing payments until none are left to scan.
+
+        Args:
+            max_batches: Stop after this many batches (None: no limit)
+
+        Returns:
+            ReapRunResult with per-outcome counts
+        """
+        result = ReapRunResult()
+        after = None
+        with ThreadPoolExecutor(
+            max_workers=max(1, self.concurrency), thread_name_prefix="payment-reaper"
+        ) as executor:
+            while max_batches is None or result.batches < max_batches:
+                payments = self.payment_repo.get_processing_payments_older_than(
+                    self.stale_minutes, limit=self.batch_size, after=after
+                )
+                if not payments:
+                    break
+
+                result.batches += 1
+                result.scanned += len(payments)
+                self._reap_batch(executor, payments, result)
+                after = (payments[-1].created_at, payments[-1].id)
+
+        return result
+
+    def _reap_batch(
+        self,
+        executor: ThreadPoolExecutor,
+        payments: List[Payment],
+        result: ReapRunResult,
+    ) -> None:
+        """Check one batch with the gateway and fail the abandoned payments."""
+        statuses = executor.map(self._check_order, payments)
+
+        expired: Dict[int, str] = {}
+        failed: Dict[int, str] = {}
+        for payment, status in zip(payments, statuses):
+            if status is None:
+                result.check_errors += 1
+            elif status.is_paid:
+                result.paid_unconfirmed += 1
+                logger.warning(
+                    f"Payment {payment.id} is paid at the gateway "
+                    f"(order {payment.gateway_order_id}) but was never confirmed"
+                )
+            elif status.was_attempted:
+                failed[payment.id] = ABANDONED_REASON
+            else:
+                expired[payment.id] = EXPIRED_REASON
+
+        slots = self.payment_repo.fail_processing_payments({**expired, **failed})
+        result.expired += sum(1 for payment_id in expired if payment_id in slots)
+        result.failed += sum(1 for payment_id in failed if payment_id in slots)
+        result.slots_released += len(set(slots.values()))
+
+    def _check_order(self, payment: Payment) -> Optional[GatewayOrderStatus]:
+        """Gateway status of a payment's order; None if it couldn't be fetched."""
+        if not payment.gateway_order_id:
+            return GatewayOrderStatus(order_id="", status="created")
+        try:
+            return self.payment_gateway.get_order_status(payment.gateway_order_id)
+        except PaymentGatewayError as e:
+            logger.warning(f"Could not check order for payment {payment.id}: {e.message}")
+            return None
@@ -5,11 +5,19 @@ Ends a classroom session and cleans up resources.
 """
 
 from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
 import logging
 
+from app.domains.classroom.entities import ClassroomSession
 from app.domains.classroom.services import IVideoProvider
 from app.domains.classroom.repositories import IClassroomRepository
 from app.domains.classroom.value_objects import RoomStatus
+from app.domains.scheduling.repositories import ISessionRepository
+from app.domains.scheduling.value_objects import SessionStatus
+from app.application.use_cases.student.record_session_completion import (
+    RecordSessionCompletionUseCase,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -27,16 +35,22 @@ class EndClassroomUseCase:
 
     This use case:
     1. Marks the classroom as ended
-    2. Optionally deletes the room from provider
+    2. Completes the tutoring session and records it for the student, if
+       the class actually took place (started on time and ran)
+    3. Optionally deletes the room from provider
     """
 
     def __init__(
         self,
         classroom_repo: IClassroomRepository,
         video_provider: IVideoProvider,
+        session_repo: Optional[ISessionRepository] = None,
+        record_completion: Optional[RecordSessionCompletionUseCase] = None,
     ):
         self.classroom_repo = classroom_repo
         self.video_provider = video_provider
+        self.session_repo = session_repo
+        self.record_completion = record_completion
 
     def execute(self, session_id: int, user_id: int) -> bool:
         """
@@ -69,6 +83,9 @@ class EndClassroomUseCase:
         classroom.mark_ended()
         self.classroom_repo.save(classroom)
 
+        if self.session_repo:
+            self._complete_session(session_id, classroom)
+
         # Delete room from provider (cleanup)
         try:
             self.video_provider.delete_room(classroom.room_name)
@@ -83,3 +100,39 @@ class EndClassroomUseCase:
         )
 
         return True
+
+    def _complete_session(self, session_id: int, classroom: ClassroomSession) -> None:
+        """
+        Mark the tutoring session completed and update the student's stats.
+
+        A room closed before the scheduled start, or one nobody joined, is
+        not a lesson: the session is left as it is so it can still be
+        cancelled (and refunded).
+        """
+        session = self.session_repo.get_by_id(session_id)
+        if not session or session.status not in (
+            SessionStatus.CONFIRMED,
+            SessionStatus.IN_PROGRESS,
+        ):
+            return
+
+        if datetime.utcnow() < session.start_at:
+            logger.info(f"Classroom for session {session_id} ended before its start; not completing")
+            return
+        if not classroom.started_at or not classroom.duration_minutes:
+            logger.info(f"Classroom for session {session_id} never ran; not completing")
+            return
+
+        session.complete()
+        session = self.session_repo.save(session)
+
+        if self.record_completion:
+            try:
+                self.record_completion.execute(
+                    student_id=session.student_id,
+                    amount_spent=float(session.amount or 0),
+                    session=session,
+                )
+            except Exception as e:
+                # Stats can be rebuilt from history; don't fail ending the class
+                logger.warning(f"Failed to record completion of session {session_id}: {e}")
@@ -1,14 +1,18 @@
 """Use case for getting instructor dashboard data."""
 
+from datetime import datetime
 from decimal import Decimal
-from typing import Optional, List, Set
+from typing import List, Optional, Tuple
 
 from app.domains.instructor.entities import InstructorProfile, InstructorDashboard
 from app.domains.instructor.repositories import IInstructorProfileRepository
 from app.domains.instructor.value_objects import DashboardStats
+from app.domains.user.entities import User
 from app.domains.wallet.repositories import IWalletRepository
+from app.domains.wallet.value_objects import TransactionType, TransactionStatus
+from app.domains.scheduling.entities import Session
 from app.domains.scheduling.repositories import ISessionRepository
-from app.domains.scheduling.value_objects import SessionStatus
+from app.domains.scheduling.value_objects import InstructorSessionStats
 
 
 class GetInstructorDashboardUseCase:
@@ -16,7 +20,9 @@ class GetInstructorDashboardUseCase:
     Use case for retrieving instructor dashboard data.
 
     Orchestrates fetching instructor profile, user data, and calculating
-    statistics for dashboard display.
+    statistics for dashboard display. Once the profile is known, earnings,
+    upcoming sessions and session aggregates are independent and can be
+    loaded concurrently with one use case instance per DB session.
     """
 
     def __init__(
@@ -51,55 +57,99 @@ class GetInstructorDashboardUseCase:
             ValueError: If instructor profile not found
         """
         # 1. Fetch profile with user data
+        profile, user = self.get_profile(user_id)
+
+        # Stats cover the current calendar month (UTC) as the reporting period
+        month_start = self.current_period_start()
+
+        # 2. Get wallet earnings if wallet_repo is provided
+        total_earnings, earnings_this_month = self.get_earnings(profile.id, month_start)
+
+        # 3. Fetch upcoming sessions and session aggregates (computed in SQL,
+        #    so cost doesn't grow with the instructor's session history)
+        upcoming_sessions = self.get_upcoming_sessions(profile.id)
+        session_stats = self.get_session_stats(profile.id, month_start)
+
+        # 4. Return dashboard aggregate
+        return InstructorDashboard(
+            profile=profile,
+            user=user,
+            stats=self.build_stats(profile, total_earnings, earnings_this_month, session_stats),
+            upcoming_sessions=upcoming_sessions,
+        )
+
+    # ========================================================================
+    # Single Sections (independent once the profile is known)
+    # ========================================================================
+
+    @staticmethod
+    def current_period_start() -> datetime:
+        """Start of the stats reporting period: the current calendar month (UTC)."""
+        return datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+    def get_profile(self, user_id: int) -> Tuple[InstructorProfile, User]:
+        """
+        Fetch the instructor profile with its user.
+
+        Raises:
+            ValueError: If instructor profile not found
+        """
         result = self.instructor_repo.get_dashboard_data(user_id)
         if not result:
             raise ValueError(f"Instructor profile not found for user {user_id}")
+        return result
 
-        profile, user = result
-
-        # 2. Calculate profile completion percentage
-        completion = self._calculate_profile_completion(profile)
-
-        # 3. Get wallet earnings if wallet_repo is provided
+    def get_earnings(self, instructor_id: int, period_start: datetime) -> Tuple[Decimal, Decimal]:
+        """Total wallet earnings and earnings since period_start (zero without a wallet)."""
         total_earnings = Decimal("0.00")
+        earnings_this_month = Decimal("0.00")
         if self.wallet_repo:
-            wallet = self.wallet_repo.get_by_instructor_id(profile.id)
+            wallet = self.wallet_repo.get_by_instructor_id(instructor_id)
             if wallet:
                 total_earnings = wallet.total_earned
-
-        # 4. Fetch upcoming sessions and calculate stats from session repository
-        upcoming_sessions = []
-        upcoming_sessions_count = 0
-        total_students = 0
-
-        if self.session_repo:
-            # Get upcoming sessions for this instructor (by instructor profile id)
-            upcoming_sessions = self.session_repo.get_upcoming_by_instructor(
-                instructor_id=profile.id,
-                limit=10
-            )
-            upcoming_sessions_count = len(upcoming_sessions)
-
-            # Calculate unique students from all sessions (not just upcoming)
-            all_sessions = self.session_repo.get_by_instructor(instructor_id=profile.id)
-            unique_students: Set[int] = {s.student_id for s in all_sessions}
-            total_students = len(unique_students)
-
-        # 5. Build stats (uses existing profile data + wallet earnings + session data)
-        stats = DashboardStats(
-            upcoming_sessions_count=upcoming_sessions_count,
-            total_students=total_students,
-            completed_sessions=profile.total_sessions_completed,
-            total_earnings=total_earnings,
-            profile_completion_percent=completion,
+                earnings_this_month = self.wallet_repo.sum_transactions(
+                    wallet_id=wallet.id,
+                    transaction_type=TransactionType.DEPOSIT,
+                    status=TransactionStatus.COMPLETED,
+                    since=period_start,
+                )
+        return total_earnings, earnings_this_month
+
+    def get_upcoming_sessions(self, instructor_id: int) -> List[Session]:
+        """Next upcoming sessions for this instructor (by instructor profile id)."""
+        if not self.session_repo:
+            return []
+        return self.session_repo.get_upcoming_by_instructor(instructor_id=instructor_id, limit=10)
+
+    def get_session_stats(self, instructor_id: int, period_start: datetime) -> Optional[InstructorSessionStats]:
+        """Session aggregates, or None without a session repository."""
+        if not self.session_repo:
+            return None
+        return self.session_repo.get_instructor_stats(
+            instructor_id=instructor_id,
+            period_start=period_start,
         )
 
-        # 6. Return dashboard aggregate
-        return InstructorDashboard(
-            profile=profile,
-            user=user,
-            stats=stats,
-            upcoming_sessions=upcoming_sessions,
+    def build_stats(
+        self,
+        profile: InstructorProfile,
+        total_earnings: Decimal,
+        earnings_this_month: Decimal,
+        session_stats: Optional[InstructorSessionStats],
+    ) -> DashboardStats:
+        """Combine profile data, wallet earnings and session aggregates."""
+        aggregates = session_stats or InstructorSessionStats.create_empty()
+        return DashboardStats(
+            upcoming_sessions_count=aggregates.upcoming_sessions,
+            total_students=aggregates.total_students,
+            completed_sessions=(
+                aggregates.completed_sessions if session_stats
+                else profile.total_sessions_completed
+            ),
+            total_earnings=total_earnings,
+            profile_completion_percent=self._calculate_profile_completion(profile),
+            sessions_this_month=aggregates.period_completed_sessions,
+            earnings_this_month=earnings_this_month,
         )
 
     def _calculate_profile_completion(self, profile: InstructorProfile) -> int:
@@ -7,6 +7,7 @@ from .get_messages import GetMessagesUseCase
 from .mark_messages_read import MarkMessagesReadUseCase
 from .check_feature_access import CheckFeatureAccessUseCase, FeatureAccess
 from .get_unread_count import GetUnreadCountUseCase
+from .search_messages import SearchMessagesUseCase, MessageSearchPage
 
 __all__ = [
     "StartConversationUseCase",
@@ -17,4 +18,6 @@ __all__ = [
     "CheckFeatureAccessUseCase",
     "FeatureAccess",
     "GetUnreadCountUseCase",
+    "SearchMessagesUseCase",
+    "MessageSearchPage",
 ]
@@ -0,0 +1,103 @@
+"""Search messages use case."""
+
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from app.domains.messaging.entities import Message
+from app.domains.messaging.repositories import (
+    IConversationRepository,
+    IMessageRepository,
+)
+from app.utils.pagination import encode_cursor, decode_cursor
+
+
+@dataclass
+class MessageSearchPage:
+    """One page of ranked search hits."""
+
+    hits: List[Tuple[Message, float]] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+class SearchMessagesUseCase:
+    """
+    Full-text search across a user's message history.
+
+    Orchestrates:
+    1. Validate query and (optional) conversation access
+    2. Run ranked search scoped to the user's conversations
+    3. Build keyset cursor for the next page
+    """
+
+    def __init__(
+        self,
+        conversation_repo: IConversationRepository,
+        message_repo: IMessageRepository,
+    ):
+        """
+        Initialize use case.
+
+        Args:
+            conversation_repo: Conversation repository
+            message_repo: Message repository
+        """
+        self.conversation_repo = conversation_repo
+        self.message_repo = message_repo
+
+    def execute(
+        self,
+        user_id: int,
+        query: str,
+        conversation_id: Optional[int] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> MessageSearchPage:
+        """
+        Search messages.
+
+        Args:
+            user_id: User performing the search
+            query: Free-text query
+            conversation_id: Optional conversation to restrict the search to
+            limit: Max hits per page
+            cursor: Cursor returned with the previous page
+
+        Returns:
+            MessageSearchPage with hits and the cursor for the next page
+
+        Raises:
+            ValueError: If the query or cursor is invalid, or the user
+                doesn't have access to the conversation
+        """
+        if not query or not query.strip():
+            raise ValueError("Search query cannot be empty")
+
+        if conversation_id is not None:
+            conversation = self.conversation_repo.get_by_id(conversation_id)
+            if not conversation:
+                raise ValueError(f"Conversation {conversation_id} not found")
+            if not conversation.is_participant(user_id):
+                raise ValueError("Access denied to this conversation")
+
+        after = decode_cursor(cursor, size=2)
+        try:
+            after = (float(after[0]), int(after[1])) if after else None
+        except (TypeError, ValueError) as e:
+            raise ValueError("Invalid pagination cursor") from e
+
+        # Fetch one extra hit to know whether another page exists
+        hits = self.message_repo.search_messages(
+            user_id=user_id,
+            query=query,
+            conversation_id=conversation_id,
+            limit=limit + 1,
+            after=after,
+        )
+
+        next_cursor = None
+        if len(hits) > limit:
+            hits = hits[:limit]
+            last_message, last_rank = hits[-1]
+            next_cursor = encode_cursor(last_rank, last_message.id)
+
+        return MessageSearchPage(hits=hits, next_cursor=next_cursor)
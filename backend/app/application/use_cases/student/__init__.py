@@ -3,9 +3,17 @@
 from .create_student_profile import CreateStudentProfileUseCase
 from .update_student_profile import UpdateStudentProfileUseCase
 from .record_session_completion import RecordSessionCompletionUseCase
+from .student_stats import (
+    RebuildStudentStatsUseCase,
+    RecordStudentPaymentUseCase,
+    RecordStudentRefundUseCase,
+)
 
 __all__ = [
     "CreateStudentProfileUseCase",
     "UpdateStudentProfileUseCase",
     "RecordSessionCompletionUseCase",
+    "RebuildStudentStatsUseCase",
+    "RecordStudentPaymentUseCase",
+    "RecordStudentRefundUseCase",
 ]
@@ -1,7 +1,13 @@
 """Use case for recording a session completion for a student."""
 
+from typing import Optional
+
 from app.domains.student.entities import StudentProfile
-from app.domains.student.repositories import IStudentProfileRepository
+from app.domains.student.repositories import IStudentProfileRepository, IStudentStatsRepository
+from app.domains.scheduling.entities import Session
+from app.domains.scheduling.repositories import ISessionRepository
+from app.domains.payment.repositories import IPaymentRepository
+from .student_stats import RebuildStudentStatsUseCase
 
 
 class RecordSessionCompletionUseCase:
@@ -9,25 +15,45 @@ class RecordSessionCompletionUseCase:
     Use case for recording a completed session for a student.
 
     Records that a student has completed a session and updates their
-    total session count and total amount spent.
+    total session count and total amount spent. When the completed session
+    is passed and the stats repositories are configured, the student_stats
+    projection (minutes, instructors, streaks) is updated as well.
     """
 
-    def __init__(self, student_repo: IStudentProfileRepository):
+    def __init__(
+        self,
+        student_repo: IStudentProfileRepository,
+        stats_repo: Optional[IStudentStatsRepository] = None,
+        session_repo: Optional[ISessionRepository] = None,
+        payment_repo: Optional[IPaymentRepository] = None,
+    ):
         """
         Initialize RecordSessionCompletionUseCase.
 
         Args:
             student_repo: Repository for student profile persistence
+            stats_repo: Optional repository for the stats projection
+            session_repo: Optional session repository (required with stats_repo)
+            payment_repo: Optional payment repository (required with stats_repo)
         """
         self.student_repo = student_repo
+        self.stats_repo = stats_repo
+        self.session_repo = session_repo
+        self.payment_repo = payment_repo
 
-    def execute(self, student_id: int, amount_spent: float) -> StudentProfile:
+    def execute(
+        self,
+        student_id: int,
+        amount_spent: float,
+        session: Optional[Session] = None,
+    ) -> StudentProfile:
         """
         Execute the use case to record session completion.
 
         Args:
             student_id: ID of the student profile
             amount_spent: Amount spent for this session
+            session: The completed session, already persisted as COMPLETED
 
         Returns:
             Updated StudentProfile with session and spending information
@@ -52,4 +78,34 @@ class RecordSessionCompletionUseCase:
         # Save updated profile
         updated_profile = self.student_repo.update(profile)
 
+        if session is not None and self.stats_repo and self.session_repo and self.payment_repo:
+            self._update_stats(student_id, session)
+
         return updated_profile
+
+    def _update_stats(self, student_id: int, session: Session) -> None:
+        """Apply a completed session to the student_stats projection."""
+        stats = self.stats_repo.get_by_student_id(student_id, for_update=True)
+        if stats is None:
+            # No projection yet: build it from history (includes this session)
+            RebuildStudentStatsUseCase(
+                self.student_repo, self.stats_repo, self.session_repo, self.payment_repo
+            ).execute(student_id)
+            return
+
+        new_instructor = not self.session_repo.has_completed_session_with(
+            student_id=student_id,
+            instructor_id=session.instructor_id,
+            exclude_session_id=session.id,
+        )
+        in_order = stats.record_session_completion(
+            duration_minutes=session.duration_minutes,
+            session_start=session.start_at,
+            is_trial=session.is_trial,
+            new_instructor=new_instructor,
+        )
+        if not in_order:
+            # Session predates the latest active week; recompute streaks
+            stats.rebuild_streak(self.session_repo.get_completed_start_times_by_student(student_id))
+
+        self.stats_repo.save(stats)
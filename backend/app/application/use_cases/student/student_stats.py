@@ -0,0 +1,165 @@
+"""Use cases for maintaining the student stats projection."""
+
+from decimal import Decimal
+from typing import Optional
+
+from app.domains.student.entities import StudentStats
+from app.domains.student.repositories import IStudentProfileRepository, IStudentStatsRepository
+from app.domains.scheduling.repositories import ISessionRepository
+from app.domains.payment.repositories import IPaymentRepository
+from app.domains.payment.value_objects.enums import PaymentStatus
+
+
+class RebuildStudentStatsUseCase:
+    """
+    Use case for recomputing a student's stats from session and payment history.
+
+    Used for backfills, for students without a stats row yet, and when an
+    incremental update can't be applied (e.g. a session completed out of
+    order).
+    """
+
+    def __init__(
+        self,
+        student_repo: IStudentProfileRepository,
+        stats_repo: IStudentStatsRepository,
+        session_repo: ISessionRepository,
+        payment_repo: IPaymentRepository,
+    ):
+        """
+        Initialize RebuildStudentStatsUseCase.
+
+        Args:
+            student_repo: Repository for student profiles
+            stats_repo: Repository for the stats projection
+            session_repo: Repository for session history
+            payment_repo: Repository for payment history
+        """
+        self.student_repo = student_repo
+        self.stats_repo = stats_repo
+        self.session_repo = session_repo
+        self.payment_repo = payment_repo
+
+    def execute(self, student_id: int) -> StudentStats:
+        """
+        Rebuild and save stats for one student.
+
+        Args:
+            student_id: Student profile ID
+
+        Returns:
+            The rebuilt StudentStats
+
+        Raises:
+            ValueError: If student profile not found
+        """
+        profile = self.student_repo.get_by_id(student_id)
+        if not profile:
+            raise ValueError(f"Student profile with ID {student_id} not found")
+
+        session_stats = self.session_repo.get_student_stats(student_id)
+
+        # Payments reference the student's user ID
+        total_spent = self.payment_repo.sum_by_student_id(
+            student_id=profile.user_id,
+            status=PaymentStatus.COMPLETED,
+        )
+
+        stats = StudentStats.rebuild(
+            student_id=student_id,
+            total_sessions_completed=session_stats.completed_sessions,
+            total_minutes=session_stats.completed_minutes,
+            trial_sessions_completed=session_stats.trial_sessions_completed,
+            unique_instructors=session_stats.total_instructors,
+            total_spent=total_spent,
+            session_start_times=self.session_repo.get_completed_start_times_by_student(student_id),
+        )
+        return self.stats_repo.save(stats)
+
+    def execute_all(self, batch_size: int = 100) -> int:
+        """
+        Rebuild stats for every student.
+
+        Args:
+            batch_size: Number of student profiles loaded per page
+
+        Returns:
+            Number of students rebuilt
+        """
+        rebuilt = 0
+        skip = 0
+        while True:
+            profiles = self.student_repo.get_all(skip=skip, limit=batch_size)
+            if not profiles:
+                break
+            for profile in profiles:
+                self.execute(profile.id)
+                rebuilt += 1
+            skip += batch_size
+        return rebuilt
+
+
+class RecordStudentPaymentUseCase:
+    """
+    Use case for adding a completed payment to the student stats projection.
+
+    Call after the payment has been persisted as COMPLETED.
+    """
+
+    def __init__(
+        self,
+        student_repo: IStudentProfileRepository,
+        stats_repo: IStudentStatsRepository,
+        session_repo: ISessionRepository,
+        payment_repo: IPaymentRepository,
+    ):
+        """
+        Initialize RecordStudentPaymentUseCase.
+
+        Args:
+            student_repo: Repository for student profiles
+            stats_repo: Repository for the stats projection
+            session_repo: Repository for session history (for rebuilds)
+            payment_repo: Repository for payment history (for rebuilds)
+        """
+        self.student_repo = student_repo
+        self.stats_repo = stats_repo
+        self.rebuild = RebuildStudentStatsUseCase(student_repo, stats_repo, session_repo, payment_repo)
+
+    def execute(self, user_id: int, amount: Decimal) -> Optional[StudentStats]:
+        """
+        Record a completed payment.
+
+        Args:
+            user_id: Paying student's user ID (as stored on the payment)
+            amount: Amount paid
+
+        Returns:
+            Updated StudentStats, or None if the user has no student profile
+        """
+        profile = self.student_repo.get_by_user_id(user_id)
+        if not profile:
+            return None
+
+        stats = self.stats_repo.get_by_student_id(profile.id, for_update=True)
+        if stats is None:
+            # No projection yet: build it from history (includes this payment)
+            return self.rebuild.execute(profile.id)
+
+        self._apply(stats, amount)
+        return self.stats_repo.save(stats)
+
+    def _apply(self, stats: StudentStats, amount: Decimal) -> None:
+        stats.record_payment(amount)
+
+
+class RecordStudentRefundUseCase(RecordStudentPaymentUseCase):
+    """
+    Use case for removing a refunded payment from the student stats projection.
+
+    Call after the payment has been persisted as REFUNDED (a rebuild then
+    no longer counts it).
+    """
+
+    def _apply(self, stats: StudentStats, amount: Decimal) -> None:
+        stats.record_refund(amount)
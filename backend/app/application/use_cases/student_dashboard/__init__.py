@@ -2,6 +2,7 @@
 
 from .get_student_dashboard import (
     GetStudentDashboardUseCase,
+    STUDENT_DASHBOARD_SECTIONS,
     StudentDashboardOutput,
     UpcomingSessionDTO,
     StudentStatsDTO,
@@ -12,6 +13,7 @@ from .get_student_dashboard import (
 
 __all__ = [
     "GetStudentDashboardUseCase",
+    "STUDENT_DASHBOARD_SECTIONS",
     "StudentDashboardOutput",
     "UpcomingSessionDTO",
     "StudentStatsDTO",
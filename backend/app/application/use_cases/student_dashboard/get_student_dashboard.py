@@ -1,21 +1,22 @@
 """
 Get Student Dashboard Use Case.
 
-Aggregates all data needed for the student dashboard in a single optimized query.
+Aggregates all data needed for the student dashboard from a fixed number of
+bounded queries (pages and SQL aggregates), independent of account age.
 Following DDD principles with clear separation of concerns.
 """
 
 from dataclasses import dataclass, field
 from datetime import datetime, date, timedelta
 from decimal import Decimal
-from typing import List, Optional, Dict, Set
+from typing import Iterable, List, Optional, Dict, Set
 
 from app.domains.scheduling.repositories import ISessionRepository
-from app.domains.scheduling.value_objects import SessionStatus
+from app.domains.scheduling.value_objects import SessionStatus, StudentInstructorSummary
 from app.domains.payment.repositories import IPaymentRepository
 from app.domains.payment.value_objects.enums import PaymentStatus
 from app.domains.instructor.repositories import IInstructorProfileRepository
-from app.domains.student.repositories import IStudentProfileRepository
+from app.domains.student.repositories import IStudentProfileRepository, IStudentStatsRepository
 from app.domains.user.repositories import IUserRepository
 
 
@@ -51,6 +52,7 @@ class StudentStatsDTO:
     currency: str
     total_instructors: int
     trial_sessions_used: int
+    longest_streak_weeks: int = 0
 
 
 @dataclass
@@ -125,12 +127,24 @@ class StudentDashboardOutput:
     payment_history: List[PaymentHistoryDTO] = field(default_factory=list)
 
 
+# Dashboard sections, in display order (also the StudentDashboardOutput field names)
+STUDENT_DASHBOARD_SECTIONS = (
+    "upcoming_sessions",
+    "stats",
+    "my_instructors",
+    "session_history",
+    "payment_history",
+)
+
+
 class GetStudentDashboardUseCase:
     """
     Use case for getting all student dashboard data.
 
     Aggregates data from multiple repositories to provide a complete
-    dashboard view in a single use case execution.
+    dashboard view in a single use case execution. Each section can also be
+    loaded on its own (get_<section>), so independent sections can be
+    composed concurrently with one use case instance per DB session.
     """
 
     def __init__(
@@ -140,6 +154,7 @@ class GetStudentDashboardUseCase:
         instructor_repo: IInstructorProfileRepository,
         student_repo: IStudentProfileRepository,
         user_repo: IUserRepository,
+        stats_repo: Optional[IStudentStatsRepository] = None,
     ):
         """
         Initialize use case with required repositories.
@@ -150,14 +165,17 @@ class GetStudentDashboardUseCase:
             instructor_repo: Instructor repository for instructor data
             student_repo: Student profile repository for resolving user_id to profile_id
             user_repo: User repository for user details
+            stats_repo: Optional student_stats projection; when it has a row
+                for the student, quick stats are a single-row read
         """
         self.session_repo = session_repo
         self.payment_repo = payment_repo
         self.instructor_repo = instructor_repo
         self.student_repo = student_repo
         self.user_repo = user_repo
+        self.stats_repo = stats_repo
 
-    def _resolve_student_profile_id(self, user_id: int) -> int:
+    def resolve_student_profile_id(self, user_id: int) -> int:
         """
         Resolve a user_id to their student_profile_id.
 
@@ -179,58 +197,121 @@ class GetStudentDashboardUseCase:
             raise ValueError(f"No student profile found for user {user_id}")
         return student_profile.id
 
-    def execute(self, user_id: int) -> StudentDashboardOutput:
+    def execute(
+        self,
+        user_id: int,
+        history_limit: int = 20,
+        history_offset: int = 0,
+        payment_limit: int = 20,
+        payment_offset: int = 0,
+        sections: Optional[Iterable[str]] = None,
+    ) -> StudentDashboardOutput:
         """
         Execute the use case to get complete dashboard data.
 
+        Every section reads from bounded queries (pages, SQL aggregates),
+        and instructor details for all sections are loaded once, so the
+        number of queries doesn't grow with the account's history.
+
         Args:
             user_id: The student's user ID (from authentication)
+            history_limit: Page size for session history
+            history_offset: Offset into session history
+            payment_limit: Page size for payment history
+            payment_offset: Offset into payment history
+            sections: Sections to load (default: all); others are left empty
 
         Returns:
-            StudentDashboardOutput with all dashboard sections populated
+            StudentDashboardOutput with the requested sections populated
 
         Raises:
             ValueError: If user has no student profile
         """
+        wanted = set(STUDENT_DASHBOARD_SECTIONS if sections is None else sections)
+
         # Resolve user_id to student_profile_id
         # Sessions store profile IDs, not user IDs
-        student_profile_id = self._resolve_student_profile_id(user_id)
-
-        # Get upcoming sessions (next 7 days)
-        upcoming_sessions = self._get_upcoming_sessions(student_profile_id)
+        student_profile_id = self.resolve_student_profile_id(user_id)
 
-        # Get student statistics
-        stats = self._get_student_stats(student_profile_id)
-
-        # Get instructors the student has booked with
-        my_instructors = self._get_my_instructors(student_profile_id)
-
-        # Get session history (past sessions)
-        session_history = self._get_session_history(student_profile_id)
+        # Load the session rows each section needs, one bounded query each
+        upcoming = (
+            self.session_repo.get_upcoming_by_student(student_profile_id, limit=20)
+            if "upcoming_sessions" in wanted else []
+        )
+        instructor_summaries = (
+            self.session_repo.get_instructor_summaries_for_student(student_profile_id, limit=10)
+            if "my_instructors" in wanted else []
+        )
+        past_sessions = (
+            self.session_repo.get_past_by_student(
+                student_profile_id, limit=history_limit, offset=history_offset
+            )
+            if "session_history" in wanted else []
+        )
 
-        # Get payment history (uses user_id, not profile_id)
-        payment_history = self._get_payment_history(user_id)
+        # One shared instructor lookup for every section
+        instructor_cache = self._build_instructor_cache(
+            {s.instructor_id for s in upcoming}
+            | {summary.instructor_id for summary in instructor_summaries}
+            | {s.instructor_id for s in past_sessions}
+        )
 
         return StudentDashboardOutput(
-            upcoming_sessions=upcoming_sessions,
-            stats=stats,
-            my_instructors=my_instructors,
-            session_history=session_history,
-            payment_history=payment_history,
+            upcoming_sessions=self._get_upcoming_sessions(upcoming, instructor_cache),
+            stats=(
+                self._get_student_stats(student_profile_id, user_id)
+                if "stats" in wanted else None
+            ),
+            my_instructors=self._get_my_instructors(instructor_summaries, instructor_cache),
+            session_history=self._get_session_history(past_sessions, instructor_cache),
+            # Payments reference users, not profiles
+            payment_history=(
+                self._get_payment_history(user_id, payment_limit, payment_offset)
+                if "payment_history" in wanted else []
+            ),
         )
 
-    def _get_upcoming_sessions(self, student_id: int) -> List[UpcomingSessionDTO]:
-        """Get upcoming sessions for the next 7 days."""
-        now = datetime.utcnow()
-        end_date = (now + timedelta(days=7)).date()
+    # ========================================================================
+    # Single Sections
+    # ========================================================================
+
+    def get_upcoming_sessions(self, student_profile_id: int) -> List[UpcomingSessionDTO]:
+        """Load only the upcoming sessions section."""
+        upcoming = self.session_repo.get_upcoming_by_student(student_profile_id, limit=20)
+        instructor_cache = self._build_instructor_cache({s.instructor_id for s in upcoming})
+        return self._get_upcoming_sessions(upcoming, instructor_cache)
 
-        # Get upcoming sessions
-        sessions = self.session_repo.get_upcoming_by_student(student_id, limit=20)
+    def get_stats(self, student_profile_id: int, user_id: int) -> StudentStatsDTO:
+        """Load only the quick stats section."""
+        return self._get_student_stats(student_profile_id, user_id)
 
-        # Build instructor cache to avoid N+1 queries
-        instructor_ids = {s.instructor_id for s in sessions}
-        instructor_cache = self._build_instructor_cache(instructor_ids)
+    def get_my_instructors(self, student_profile_id: int) -> List[MyInstructorDTO]:
+        """Load only the my instructors section."""
+        summaries = self.session_repo.get_instructor_summaries_for_student(student_profile_id, limit=10)
+        instructor_cache = self._build_instructor_cache({summary.instructor_id for summary in summaries})
+        return self._get_my_instructors(summaries, instructor_cache)
 
+    def get_session_history(
+        self,
+        student_profile_id: int,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> List[SessionHistoryDTO]:
+        """Load only one page of the session history section."""
+        past_sessions = self.session_repo.get_past_by_student(student_profile_id, limit=limit, offset=offset)
+        instructor_cache = self._build_instructor_cache({s.instructor_id for s in past_sessions})
+        return self._get_session_history(past_sessions, instructor_cache)
+
+    def get_payment_history(self, user_id: int, limit: int = 20, offset: int = 0) -> List[PaymentHistoryDTO]:
+        """Load only one page of the payment history section (payments reference users)."""
+        return self._get_payment_history(user_id, limit, offset)
+
+    def _get_upcoming_sessions(
+        self,
+        sessions: list,
+        instructor_cache: Dict[int, dict],
+    ) -> List[UpcomingSessionDTO]:
+        """Build upcoming session DTOs."""
         upcoming = []
         for session in sessions:
             instructor = instructor_cache.get(session.instructor_id)
@@ -262,61 +343,54 @@ class GetStudentDashboardUseCase:
 
         return upcoming
 
-    def _get_student_stats(self, student_id: int) -> StudentStatsDTO:
-        """Calculate student statistics."""
-        now = datetime.utcnow()
-
-        # Get all completed sessions
-        completed_sessions = self.session_repo.get_by_student(
-            student_id=student_id,
-            status=SessionStatus.COMPLETED,
-        )
-
-        # Calculate total hours
-        total_minutes = sum(s.duration_minutes for s in completed_sessions)
-        total_hours = total_minutes / 60
-
-        # Calculate total spent from completed payments
-        payments = self.payment_repo.get_by_student_id(
-            student_id=student_id,
+    def _get_student_stats(self, student_id: int, user_id: int) -> StudentStatsDTO:
+        """Read student statistics from the projection, or SQL aggregates if it has no row."""
+        if self.stats_repo:
+            stats = self.stats_repo.get_by_student_id(student_id)
+            if stats:
+                return StudentStatsDTO(
+                    total_sessions_completed=stats.total_sessions_completed,
+                    total_hours_learning=stats.total_hours,
+                    current_streak_weeks=stats.streak_as_of(datetime.utcnow()),
+                    total_spent=stats.total_spent,
+                    currency="INR",
+                    total_instructors=stats.unique_instructors,
+                    trial_sessions_used=stats.trial_sessions_completed,
+                    longest_streak_weeks=stats.longest_streak_weeks,
+                )
+
+        session_stats = self.session_repo.get_student_stats(student_id)
+
+        # Payments store the student's user ID
+        total_spent = self.payment_repo.sum_by_student_id(
+            student_id=user_id,
             status=PaymentStatus.COMPLETED,
-            limit=1000,
         )
-        total_spent = sum(p.amount for p in payments)
-
-        # Get unique instructors
-        unique_instructors = {s.instructor_id for s in completed_sessions}
-
-        # Count trial sessions
-        trial_sessions = sum(1 for s in completed_sessions if s.is_trial)
 
         # Calculate streak (consecutive weeks with sessions)
-        streak = self._calculate_streak(completed_sessions)
+        streak = self._calculate_streak(
+            self.session_repo.get_completed_start_times_by_student(student_id)
+        )
 
         return StudentStatsDTO(
-            total_sessions_completed=len(completed_sessions),
-            total_hours_learning=round(total_hours, 1),
+            total_sessions_completed=session_stats.completed_sessions,
+            total_hours_learning=round(session_stats.completed_minutes / 60, 1),
             current_streak_weeks=streak,
             total_spent=total_spent,
             currency="INR",
-            total_instructors=len(unique_instructors),
-            trial_sessions_used=trial_sessions,
+            total_instructors=session_stats.total_instructors,
+            trial_sessions_used=session_stats.trial_sessions_completed,
         )
 
-    def _calculate_streak(self, sessions: list) -> int:
+    def _calculate_streak(self, start_times: List[datetime]) -> int:
         """Calculate consecutive weeks with at least one session."""
-        if not sessions:
+        if not start_times:
             return 0
 
-        # Get weeks with sessions
-        weeks_with_sessions: Set[tuple] = set()
-        for session in sessions:
-            # Get ISO week (year, week_number)
-            iso_cal = session.start_at.isocalendar()
-            weeks_with_sessions.add((iso_cal[0], iso_cal[1]))
-
-        if not weeks_with_sessions:
-            return 0
+        # Get weeks with sessions (ISO (year, week_number))
+        weeks_with_sessions: Set[tuple] = {
+            tuple(start_at.isocalendar()[:2]) for start_at in start_times
+        }
 
         # Get current week
         now = datetime.utcnow()
@@ -336,78 +410,40 @@ class GetStudentDashboardUseCase:
 
         return streak
 
-    def _get_my_instructors(self, student_id: int) -> List[MyInstructorDTO]:
-        """Get instructors the student has booked with."""
-        # Get all sessions for the student
-        all_sessions = self.session_repo.get_by_student(student_id=student_id)
-
-        # Group by instructor
-        instructor_sessions: Dict[int, list] = {}
-        for session in all_sessions:
-            if session.instructor_id not in instructor_sessions:
-                instructor_sessions[session.instructor_id] = []
-            instructor_sessions[session.instructor_id].append(session)
-
-        # Build instructor cache
-        instructor_cache = self._build_instructor_cache(set(instructor_sessions.keys()))
-
+    def _get_my_instructors(
+        self,
+        summaries: List[StudentInstructorSummary],
+        instructor_cache: Dict[int, dict],
+    ) -> List[MyInstructorDTO]:
+        """Build DTOs for the instructors the student has booked with (most recent first)."""
         instructors = []
-        for instructor_id, sessions in instructor_sessions.items():
-            instructor = instructor_cache.get(instructor_id)
+        for summary in summaries:
+            instructor = instructor_cache.get(summary.instructor_id)
             if not instructor:
                 continue
 
-            # Get last session date
-            completed_sessions = [s for s in sessions if s.status == SessionStatus.COMPLETED]
-            last_session = max(completed_sessions, key=lambda x: x.start_at) if completed_sessions else None
-
             instructors.append(MyInstructorDTO(
-                instructor_id=instructor_id,
+                instructor_id=summary.instructor_id,
                 user_id=instructor.get("user_id", 0),
                 name=instructor.get("name", "Unknown"),
                 photo_url=instructor.get("photo_url"),
                 headline=instructor.get("headline"),
-                total_sessions_with=len(sessions),
-                last_session_date=last_session.start_at if last_session else None,
+                total_sessions_with=summary.total_sessions,
+                last_session_date=summary.last_completed_at,
                 average_rating=instructor.get("average_rating"),
                 regular_session_price=instructor.get("regular_session_price"),
                 trial_session_price=instructor.get("trial_session_price"),
                 currency="INR",
             ))
 
-        # Sort by last session date (most recent first)
-        instructors.sort(
-            key=lambda x: x.last_session_date or datetime.min,
-            reverse=True
-        )
-
-        return instructors[:10]  # Limit to top 10
-
-    def _get_session_history(self, student_id: int) -> List[SessionHistoryDTO]:
-        """Get past sessions (completed, cancelled, no-show)."""
-        now = datetime.utcnow()
-
-        # Get all past sessions
-        all_sessions = self.session_repo.get_by_student(student_id=student_id)
-
-        # Filter to past sessions with final statuses
-        past_sessions = [
-            s for s in all_sessions
-            if s.status in (
-                SessionStatus.COMPLETED,
-                SessionStatus.CANCELLED,
-                SessionStatus.NO_SHOW,
-            ) or s.end_at < now
-        ]
-
-        # Sort by start time descending (most recent first)
-        past_sessions.sort(key=lambda x: x.start_at, reverse=True)
-        past_sessions = past_sessions[:20]  # Limit to 20
-
-        # Build instructor cache
-        instructor_ids = {s.instructor_id for s in past_sessions}
-        instructor_cache = self._build_instructor_cache(instructor_ids)
+        return instructors
 
+    def _get_session_history(
+        self,
+        past_sessions: list,
+        instructor_cache: Dict[int, dict],
+    ) -> List[SessionHistoryDTO]:
+        """Build DTOs for one page of past sessions (completed, cancelled, no-show)."""
         history = []
         for session in past_sessions:
             instructor = instructor_cache.get(session.instructor_id)
@@ -437,32 +473,37 @@ class GetStudentDashboardUseCase:
 
         return history
 
-    def _get_payment_history(self, student_id: int) -> List[PaymentHistoryDTO]:
-        """Get payment history."""
+    def _get_payment_history(
+        self,
+        student_id: int,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> List[PaymentHistoryDTO]:
+        """Get one page of payment history."""
         # Get recent payments
         payments = self.payment_repo.get_by_student_id(
             student_id=student_id,
-            limit=20,
+            limit=limit,
+            offset=offset,
         )
 
-        # Build instructor cache from payments
-        instructor_user_ids = {p.instructor_id for p in payments}
-        user_cache = {}
-        for user_id in instructor_user_ids:
-            user = self.user_repo.get_by_id(user_id)
-            if user:
-                user_cache[user_id] = f"{user.first_name} {user.last_name}"
+        # Build instructor cache from payments (one query for all instructors)
+        users = self.user_repo.get_many(p.instructor_id for p in payments)
+        user_cache = {
+            user_id: f"{user.first_name} {user.last_name}"
+            for user_id, user in users.items()
+        }
+
+        # Session dates for all payments in one query
+        sessions = self.session_repo.get_many(p.session_id for p in payments if p.session_id)
 
         history = []
         for payment in payments:
             instructor_name = user_cache.get(payment.instructor_id, "Unknown")
 
             # Get session date if available
-            session_date = None
-            if payment.session_id:
-                session = self.session_repo.get_by_id(payment.session_id)
-                if session:
-                    session_date = session.start_at
+            session = sessions.get(payment.session_id) if payment.session_id else None
+            session_date = session.start_at if session else None
 
             history.append(PaymentHistoryDTO(
                 payment_id=payment.id,
@@ -485,13 +526,13 @@ class GetStudentDashboardUseCase:
         """Build a cache of instructor data to avoid N+1 queries."""
         cache = {}
 
-        for instructor_id in instructor_ids:
-            profile = self.instructor_repo.get_by_id(instructor_id)
-            if not profile:
-                continue
+        # Two queries regardless of how many instructors: profiles, then users
+        profiles = self.instructor_repo.get_many(instructor_ids)
+        users = self.user_repo.get_many(profile.user_id for profile in profiles.values())
 
+        for instructor_id, profile in profiles.items():
             # Get user for name
-            user = self.user_repo.get_by_id(profile.user_id)
+            user = users.get(profile.user_id)
             if not user:
                 continue
 
@@ -4,10 +4,28 @@ from app.application.use_cases.wallet.create_wallet import CreateWalletUseCase
 from app.application.use_cases.wallet.deposit_funds import DepositFundsUseCase
 from app.application.use_cases.wallet.request_withdrawal import RequestWithdrawalUseCase
 from app.application.use_cases.wallet.get_wallet_balance import GetWalletBalanceUseCase
+from app.application.use_cases.wallet.process_payouts import (
+    ProcessPayoutsUseCase,
+    PayoutRunResult,
+)
+from app.application.use_cases.wallet.wallet_ledger import (
+    SnapshotWalletBalancesUseCase,
+    GetBalanceAsOfUseCase,
+    VerifyWalletBalanceUseCase,
+    SnapshotRunResult,
+    BalanceVerification,
+)
 
 __all__ = [
     "CreateWalletUseCase",
     "DepositFundsUseCase",
     "RequestWithdrawalUseCase",
     "GetWalletBalanceUseCase",
+    "ProcessPayoutsUseCase",
+    "PayoutRunResult",
+    "SnapshotWalletBalancesUseCase",
+    "GetBalanceAsOfUseCase",
+    "VerifyWalletBalanceUseCase",
+    "SnapshotRunResult",
+    "BalanceVerification",
 ]
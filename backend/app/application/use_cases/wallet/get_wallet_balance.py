@@ -1,8 +1,9 @@
 """Use case for getting wallet balance and transaction history."""
 
 from dataclasses import dataclass
+from datetime import datetime
 from decimal import Decimal
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 from app.domains.wallet.entities import Wallet, WalletTransaction
 from app.domains.wallet.repositories import IWalletRepository
@@ -28,9 +29,16 @@ class TransactionHistoryResponse:
     """Response containing transaction history."""
 
     transactions: List[WalletTransaction]
-    total_count: int
     has_more: bool
 
+    @property
+    def next_after(self) -> Optional[Tuple[datetime, int]]:
+        """Keyset cursor for the next page, if there is one."""
+        if not self.has_more or not self.transactions:
+            return None
+        last = self.transactions[-1]
+        return last.created_at, last.id
+
 
 class GetWalletBalanceUseCase:
     """
@@ -90,16 +98,21 @@ class GetTransactionHistoryUseCase:
         status: Optional[str] = None,
         limit: int = 50,
         offset: int = 0,
+        after: Optional[Tuple[datetime, int]] = None,
     ) -> TransactionHistoryResponse:
         """
-        Get transaction history for an instructor.
+        Get transaction history for an instructor, newest first.
+
+        Pages are keyset-paginated: pass the previous page's next_after as
+        after. No total count is computed.
 
         Args:
             instructor_id: The instructor profile ID
             transaction_type: Optional filter by type
             status: Optional filter by status
             limit: Max results (default 50)
-            offset: Pagination offset (default 0)
+            offset: Pagination offset (default 0, ignored when after is given)
+            after: (created_at, id) of the last transaction already seen
 
         Returns:
             TransactionHistoryResponse with transactions
@@ -122,6 +135,7 @@ class GetTransactionHistoryUseCase:
             status=txn_status,
             limit=limit + 1,  # Get one extra to check if there are more
             offset=offset,
+            after=after,
         )
 
         # Check if there are more results
@@ -129,15 +143,7 @@ class GetTransactionHistoryUseCase:
         if has_more:
             transactions = transactions[:limit]
 
-        # Get total count
-        total_count = self.wallet_repo.count_transactions(
-            wallet_id=wallet.id,
-            transaction_type=txn_type,
-            status=txn_status,
-        )
-
         return TransactionHistoryResponse(
             transactions=transactions,
-            total_count=total_count,
             has_more=has_more,
         )
@@ -0,0 +1,157 @@
+"""Use case for paying out pending withdrawals in batches."""
+
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+from app.domains.wallet.entities import WalletTransaction
+from app.domains.wallet.repositories import IWalletRepository
+from app.domains.wallet.services import (
+    IPayoutGateway,
+    PayoutGatewayError,
+    PayoutRequest,
+    PayoutStatus,
+)
+from app.domains.wallet.value_objects import BalanceChange, TransactionStatus
+
+
+@dataclass
+class PayoutRunResult:
+    """Outcome of a payout run."""
+
+    batches: int = 0
+    claimed: int = 0
+    completed: int = 0
+    failed: int = 0
+    processing: int = 0  # Accepted by the provider, re-checked once their claim expires
+    errors: List[str] = field(default_factory=list)  # Batches the gateway rejected
+
+
+class ProcessPayoutsUseCase:
+    """
+    Pay out pending withdrawals in batches.
+
+    Each batch is claimed and committed before the gateway is called, so no
+    row lock is held during the external call and concurrent workers pick
+    disjoint batches. Outcomes are applied in bulk, guarded by the claim:
+    a withdrawal is settled at most once even if a slow worker's claim
+    expired and another worker resubmitted it. That resubmission doesn't
+    pay twice only if the provider is idempotent per withdrawal across
+    runs (MockPayoutGateway only remembers payouts within one process).
+    """
+
+    def __init__(
+        self,
+        wallet_repo: IWalletRepository,
+        payout_gateway: IPayoutGateway,
+        commit: Callable[[], None],
+        batch_size: int = 100,
+        claim_ttl_seconds: int = 900,
+    ):
+        """
+        Initialize use case.
+
+        Args:
+            wallet_repo: Wallet repository
+            payout_gateway: Payout provider
+            commit: Commits the unit of work (claims must be committed
+                before payouts are submitted)
+            batch_size: Withdrawals claimed per batch
+            claim_ttl_seconds: Age after which a claim counts as abandoned
+        """
+        self.wallet_repo = wallet_repo
+        self.payout_gateway = payout_gateway
+        self.commit = commit
+        self.batch_size = batch_size
+        self.claim_ttl_seconds = claim_ttl_seconds
+
+    def execute(self, max_batches: Optional[int] = None) -> PayoutRunResult:
+        """
+        Process pending withdrawals until none are left to claim.
+
+        Args:
+            max_batches: Stop after this many batches (None: no limit)
+
+        Returns:
+            PayoutRunResult with per-outcome counts
+        """
+        result = PayoutRunResult()
+        while max_batches is None or result.batches < max_batches:
+            claim_token = uuid.uuid4().hex
+            stale_before = datetime.utcnow() - timedelta(seconds=self.claim_ttl_seconds)
+            withdrawals = self.wallet_repo.claim_pending_withdrawals(
+                claim_token, limit=self.batch_size, stale_before=stale_before
+            )
+            self.commit()
+            if not withdrawals:
+                break
+
+            result.batches += 1
+            result.claimed += len(withdrawals)
+            if not self._process_batch(claim_token, withdrawals, result):
+                break
+
+        return result
+
+    def _process_batch(
+        self,
+        claim_token: str,
+        withdrawals: List[WalletTransaction],
+        result: PayoutRunResult,
+    ) -> bool:
+        """Submit one claimed batch and apply its outcomes; False stops the run."""
+        try:
+            payouts = self.payout_gateway.submit_payouts(
+                [self._payout_request(withdrawal) for withdrawal in withdrawals]
+            )
+        except PayoutGatewayError as e:
+            # Hand the batch back for the next run rather than waiting out the claim
+            self.wallet_repo.release_withdrawal_claims(
+                claim_token, [withdrawal.id for withdrawal in withdrawals]
+            )
+            self.commit()
+            result.errors.append(e.message)
+            return False
+
+        completed: Dict[int, Optional[str]] = {}
+        failed: Dict[int, Optional[str]] = {}
+        for payout in payouts:
+            if payout.status == PayoutStatus.COMPLETED:
+                completed[payout.transaction_id] = payout.reference
+            elif payout.status == PayoutStatus.FAILED:
+                failed[payout.transaction_id] = payout.failure_reason or "Payout failed"
+            else:
+                # Stays claimed; re-submitted (and so re-checked) once the claim expires
+                result.processing += 1
+
+        settled_at = datetime.utcnow()
+        settled = self.wallet_repo.settle_withdrawals(
+            claim_token, TransactionStatus.COMPLETED, completed, settled_at
+        ) + self.wallet_repo.settle_withdrawals(
+            claim_token, TransactionStatus.FAILED, failed, settled_at
+        )
+
+        changes: Dict[int, BalanceChange] = defaultdict(BalanceChange)
+        for withdrawal in settled:
+            changes[withdrawal.wallet_id] += withdrawal.settlement_change
+            if withdrawal.status == TransactionStatus.COMPLETED:
+                result.completed += 1
+            else:
+                result.failed += 1
+        self.wallet_repo.apply_balance_changes(changes)
+        self.commit()
+        return True
+
+    @staticmethod
+    def _payout_request(withdrawal: WalletTransaction) -> PayoutRequest:
+        details = dict(withdrawal.extra_data or {})
+        return PayoutRequest(
+            transaction_id=withdrawal.id,
+            wallet_id=withdrawal.wallet_id,
+            amount=withdrawal.amount,
+            currency=details.pop("currency", "INR"),
+            payment_method=details.pop("payment_method", ""),
+            payment_details=details,
+        )
@@ -4,7 +4,8 @@ from typing import Optional, Dict, Any
 
 from app.domains.wallet.entities import WalletTransaction
 from app.domains.wallet.repositories import IWalletRepository
-from app.domains.wallet.value_objects import Money
+from app.domains.wallet.value_objects import Money, TransactionStatus
+from app.application.use_cases.wallet.wallet_retry import retry_on_wallet_conflict
 
 
 class RequestWithdrawalUseCase:
@@ -47,6 +48,30 @@ class RequestWithdrawalUseCase:
         Raises:
             ValueError: If wallet not found, insufficient funds, or withdrawal fails
         """
+        # Create money value object
+        money = Money.create(amount, currency)
+
+        # Build extra_data
+        extra_data = {
+            "payment_method": payment_method,
+            **(payment_details or {}),
+            "currency": money.currency,
+        }
+
+        # A concurrent debit can spend the balance between our read and the
+        # update; the retry reloads the wallet and re-validates the funds.
+        return retry_on_wallet_conflict(
+            lambda: self._withdraw(instructor_id, money, payment_method, extra_data)
+        )
+
+    def _withdraw(
+        self,
+        instructor_id: int,
+        money: Money,
+        payment_method: str,
+        extra_data: Dict[str, Any],
+    ) -> WalletTransaction:
+        """Load the wallet, request the withdrawal and persist it."""
         # Get wallet
         wallet = self.wallet_repo.get_by_instructor_id(instructor_id)
         if not wallet:
@@ -59,15 +84,6 @@ class RequestWithdrawalUseCase:
                 "You have a pending withdrawal. Please wait for it to complete."
             )
 
-        # Create money value object
-        money = Money.create(amount, currency)
-
-        # Build extra_data
-        extra_data = {
-            "payment_method": payment_method,
-            **(payment_details or {}),
-        }
-
         # Request withdrawal
         description = f"Withdrawal via {payment_method}"
         transaction = wallet.request_withdrawal(
@@ -103,6 +119,7 @@ class CompleteWithdrawalUseCase:
 
         Raises:
             ValueError: If transaction not found or not a pending withdrawal
+            WalletConflictError: If the withdrawal was settled concurrently
         """
         # Get transaction
         transaction = self.wallet_repo.get_transaction_by_id(transaction_id)
@@ -117,9 +134,11 @@ class CompleteWithdrawalUseCase:
         # Complete withdrawal
         wallet.complete_withdrawal(transaction)
 
-        # Update both
+        # Settle the transaction first, guarded on it still being pending, so
+        # a concurrent settle of the same withdrawal can't also apply the
+        # wallet change (WalletConflictError)
+        self.wallet_repo.update_transaction(transaction, expected_status=TransactionStatus.PENDING)
         self.wallet_repo.update(wallet)
-        self.wallet_repo.update_transaction(transaction)
 
         return transaction
 
@@ -145,6 +164,7 @@ class FailWithdrawalUseCase:
 
         Raises:
             ValueError: If transaction not found or not a pending withdrawal
+            WalletConflictError: If the withdrawal was settled concurrently
         """
         # Get transaction
         transaction = self.wallet_repo.get_transaction_by_id(transaction_id)
@@ -159,8 +179,8 @@ class FailWithdrawalUseCase:
         # Fail withdrawal (refunds to balance)
         wallet.fail_withdrawal(transaction, reason)
 
-        # Update both
+        # Guarded like completion: the refund is applied at most once
+        self.wallet_repo.update_transaction(transaction, expected_status=TransactionStatus.PENDING)
         self.wallet_repo.update(wallet)
-        self.wallet_repo.update_transaction(transaction)
 
         return transaction
@@ -0,0 +1,193 @@
+"""Use cases for wallet balance snapshots, verification and balance history."""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+
+from app.domains.wallet.entities import Wallet, WalletBalanceSnapshot
+from app.domains.wallet.repositories import IWalletRepository
+from app.domains.wallet.value_objects import BalanceChange
+
+
+def ledger_balances_at(
+    wallet_repo: IWalletRepository,
+    wallet_id: int,
+    as_of: datetime,
+) -> Tuple[WalletBalanceSnapshot, Optional[WalletBalanceSnapshot]]:
+    """
+    A wallet's balances at a point in time, from its ledger.
+
+    Starts from the latest snapshot at or before as_of and sums only the
+    transactions after it.
+
+    Returns:
+        (unsaved snapshot as of as_of, the stored snapshot it started from)
+    """
+    baseline = wallet_repo.get_latest_snapshots([wallet_id], as_of=as_of).get(wallet_id)
+    start = baseline or WalletBalanceSnapshot(wallet_id=wallet_id)
+
+    change = wallet_repo.get_ledger_changes({wallet_id: start.as_of}, until=as_of).get(wallet_id)
+    return start.advance(change or BalanceChange(), as_of), baseline
+
+
+@dataclass
+class SnapshotRunResult:
+    """Outcome of a snapshot run."""
+
+    as_of: datetime
+    wallets: int = 0
+    snapshots: int = 0  # Wallets with ledger activity since their last snapshot
+
+
+@dataclass
+class BalanceVerification:
+    """A wallet's stored balances compared with its ledger."""
+
+    wallet: Wallet
+    ledger: WalletBalanceSnapshot
+    snapshot_as_of: Optional[datetime]  # Snapshot the ledger sum started from
+
+    @property
+    def difference(self) -> BalanceChange:
+        """How far the stored balances are above the ledger's."""
+        return self.ledger.difference(
+            self.wallet.balance,
+            self.wallet.total_earned,
+            self.wallet.total_withdrawn,
+        )
+
+    @property
+    def is_consistent(self) -> bool:
+        return self.difference.is_zero
+
+
+class SnapshotWalletBalancesUseCase:
+    """
+    Record every active wallet's ledger balances at a cutoff.
+
+    Each snapshot is the wallet's previous snapshot plus the transactions
+    since it, so a run reads only new transactions. The cutoff lags "now"
+    by settle_seconds so transactions still being committed (created_at is
+    stamped before commit) land after it, not silently before it.
+    """
+
+    def __init__(
+        self,
+        wallet_repo: IWalletRepository,
+        settle_seconds: int = 300,
+        batch_size: int = 500,
+    ):
+        """
+        Initialize use case.
+
+        Args:
+            wallet_repo: Wallet repository
+            settle_seconds: How far behind now the default cutoff is
+            batch_size: Wallets processed per round of queries
+        """
+        self.wallet_repo = wallet_repo
+        self.settle_seconds = settle_seconds
+        self.batch_size = batch_size
+
+    def execute(self, as_of: Optional[datetime] = None) -> SnapshotRunResult:
+        """
+        Snapshot wallets with ledger activity since their last snapshot.
+
+        Args:
+            as_of: Cutoff (default: now minus settle_seconds, UTC)
+
+        Returns:
+            SnapshotRunResult with wallet and snapshot counts
+        """
+        as_of = as_of or datetime.utcnow() - timedelta(seconds=self.settle_seconds)
+        result = SnapshotRunResult(as_of=as_of)
+
+        after_id = 0
+        while True:
+            wallet_ids = self.wallet_repo.get_wallet_ids(after_id=after_id, limit=self.batch_size)
+            if not wallet_ids:
+                break
+            after_id = wallet_ids[-1]
+            result.wallets += len(wallet_ids)
+
+            baselines = self.wallet_repo.get_latest_snapshots(wallet_ids, as_of=as_of)
+            changes = self.wallet_repo.get_ledger_changes(
+                {
+                    wallet_id: baselines[wallet_id].as_of if wallet_id in baselines else None
+                    for wallet_id in wallet_ids
+                },
+                until=as_of,
+            )
+
+            snapshots = [
+                (baselines.get(wallet_id) or WalletBalanceSnapshot(wallet_id=wallet_id)).advance(change, as_of)
+                for wallet_id, change in sorted(changes.items())
+            ]
+            self.wallet_repo.save_snapshots(snapshots)
+            result.snapshots += len(snapshots)
+
+        return result
+
+
+class GetBalanceAsOfUseCase:
+    """Use case for an instructor's wallet balances at a past point in time."""
+
+    def __init__(self, wallet_repo: IWalletRepository):
+        self.wallet_repo = wallet_repo
+
+    def execute(self, instructor_id: int, as_of: datetime) -> WalletBalanceSnapshot:
+        """
+        Get wallet balances as of a point in time.
+
+        Args:
+            instructor_id: The instructor profile ID
+            as_of: Point in time (UTC); transactions at or before it count
+
+        Returns:
+            Ledger-derived balances (unsaved snapshot)
+
+        Raises:
+            ValueError: If wallet not found
+        """
+        wallet = self.wallet_repo.get_by_instructor_id(instructor_id)
+        if not wallet:
+            raise ValueError(f"Wallet not found for instructor {instructor_id}")
+
+        balances, _ = ledger_balances_at(self.wallet_repo, wallet.id, as_of)
+        return balances
+
+
+class VerifyWalletBalanceUseCase:
+    """
+    Use case for checking a wallet's stored balances against its ledger.
+
+    A write committed between reading the wallet and summing the ledger can
+    show up as a transient difference; re-run to confirm a mismatch.
+    """
+
+    def __init__(self, wallet_repo: IWalletRepository):
+        self.wallet_repo = wallet_repo
+
+    def execute(self, instructor_id: int) -> BalanceVerification:
+        """
+        Verify an instructor's wallet.
+
+        Args:
+            instructor_id: The instructor profile ID
+
+        Returns:
+            BalanceVerification with the stored and ledger balances
+
+        Raises:
+            ValueError: If wallet not found
+        """
+        wallet = self.wallet_repo.get_by_instructor_id(instructor_id)
+        if not wallet:
+            raise ValueError(f"Wallet not found for instructor {instructor_id}")
+
+        ledger, baseline = ledger_balances_at(self.wallet_repo, wallet.id, datetime.utcnow())
+        return BalanceVerification(
+            wallet=wallet,
+            ledger=ledger,
+            snapshot_as_of=baseline.as_of if baseline else None,
+        )
@@ -0,0 +1,37 @@
+"""Retry helper for wallet operations that can lose a race."""
+
+from typing import Callable, TypeVar
+
+from app.domains.wallet.repositories import WalletConflictError
+
+
+T = TypeVar("T")
+
+# Conflicts only happen when concurrent writers hit the same wallet, so a
+# handful of immediate retries (each reloading the wallet) is plenty.
+DEFAULT_ATTEMPTS = 3
+
+
+def retry_on_wallet_conflict(operation: Callable[[], T], attempts: int = DEFAULT_ATTEMPTS) -> T:
+    """
+    Run a load-validate-update wallet operation, retrying on conflicts.
+
+    The operation must reload the wallet each time it runs, so domain
+    checks (e.g. sufficient funds) see the current balances.
+
+    Args:
+        operation: Callable performing the whole operation
+        attempts: Maximum number of runs
+
+    Returns:
+        The operation's result
+
+    Raises:
+        WalletConflictError: If every attempt conflicted
+    """
+    for attempt in range(1, attempts + 1):
+        try:
+            return operation()
+        except WalletConflictError:
+            if attempt == attempts:
+                raise
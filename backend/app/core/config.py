@@ -92,6 +92,59 @@ class Settings(BaseSettings):
     CELERY_BROKER_URL: str = "redis://localhost:6379/1"
     CELERY_RESULT_BACKEND: str = "redis://localhost:6379/2"
 
+    # WebSocket heartbeat
+    WS_HEARTBEAT_INTERVAL_SECONDS: float = 20.0  # Ping idle sockets / run the reaper this often
+    WS_PONG_TIMEOUT_SECONDS: float = 20.0  # Evict if nothing received this long after a ping
+    WS_SEND_TIMEOUT_SECONDS: float = 5.0  # Treat a send that blocks longer as a dead socket
+    WS_PER_MESSAGE_DEFLATE: bool = True  # Offer permessage-deflate compression (uvicorn, via run_server.py)
+
+    # WebSocket typing indicators
+    TYPING_KEEPALIVE_SECONDS: float = 3.0  # Min interval between forwarded user_typing frames
+    TYPING_IDLE_TIMEOUT_SECONDS: float = 6.0  # Auto "stopped typing" after no typing_start
+    TYPING_STOP_GRACE_SECONDS: float = 1.0  # Delay typing_stop to coalesce with a quick restart
+    TYPING_DENIED_TTL_SECONDS: float = 60.0  # Ignore typing for a conversation the user can't access this long
+
+    # Instructor search result cache
+    SEARCH_CACHE_ENABLED: bool = True
+    SEARCH_CACHE_TTL_SECONDS: float = 30.0
+    SEARCH_CACHE_MAX_ENTRIES: int = 1024  # Per-process LRU size
+    SEARCH_CACHE_REDIS_URL: str = ""  # Shared tier across workers, e.g. REDIS_URL (empty = in-process only)
+
+    # Public instructor profile cache
+    PROFILE_CACHE_ENABLED: bool = True
+    PROFILE_CACHE_TTL_SECONDS: float = 300.0
+    PROFILE_CACHE_MAX_ENTRIES: int = 2048  # Per-process LRU size
+    PROFILE_CACHE_MAX_AGE_SECONDS: int = 0  # Browser/CDN max-age; 0 = revalidate every view (cheap 304s)
+
+    # Admin dashboard stats snapshot
+    ADMIN_STATS_CACHE_ENABLED: bool = True
+    ADMIN_STATS_CACHE_TTL_SECONDS: float = 30.0
+    ADMIN_STATS_CACHE_MAX_STALE_SECONDS: float = 600.0  # Older snapshots are recomputed in the request
+
+    # Dashboard section loading
+    DASHBOARD_PARALLEL_SECTIONS: bool = True  # Ignored on SQLite (single shared connection)
+    DASHBOARD_MAX_WORKERS: int = 4  # Per-process thread pool; each busy worker holds one DB connection
+
+    # Admin data exports
+    EXPORT_BATCH_SIZE: int = 1000  # Rows fetched per round trip from the server-side cursor
+
+    # Daily analytics rollups
+    ANALYTICS_ROLLUP_LOOKBACK_DAYS: int = 3  # Recent days re-rolled each run (late completions/cancellations)
+    ANALYTICS_MAX_RANGE_DAYS: int = 366  # Longest range the analytics endpoints return
+
+    # Wallet ledger snapshots
+    WALLET_SNAPSHOT_SETTLE_SECONDS: int = 300  # Snapshot cutoff lag behind now (uncommitted writes)
+    WALLET_SNAPSHOT_BATCH_SIZE: int = 500  # Wallets per round of snapshot queries
+
+    # Withdrawal payouts
+    PAYOUT_BATCH_SIZE: int = 100  # Withdrawals claimed and submitted per batch
+    PAYOUT_CLAIM_TTL_SECONDS: int = 900  # Claims older than this are picked up again
+
+    # Stale payment reaper
+    PAYMENT_REAPER_STALE_MINUTES: int = 30  # Processing payments older than this are checked
+    PAYMENT_REAPER_BATCH_SIZE: int = 100  # Payments checked and failed per batch
+    PAYMENT_REAPER_CONCURRENCY: int = 8  # Gateway status checks in flight at once
+
     # Session Reminders
     REMINDER_HOURS_BEFORE: int = 12
 
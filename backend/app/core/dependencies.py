@@ -23,7 +23,8 @@ from app.domains.instructor.repositories import (
     IEducationRepository,
     IExperienceRepository,
 )
-from app.domains.student.repositories import IStudentProfileRepository
+from app.domains.student.repositories import IStudentProfileRepository, IStudentStatsRepository
+from app.domains.analytics.repositories import IDailyRollupRepository
 from app.domains.file.repositories import IFileRepository
 from app.domains.subject.repositories import ISubjectRepository, IInstructorSubjectRepository
 from app.domains.scheduling.repositories import (
@@ -35,6 +36,7 @@ from app.domains.scheduling.repositories import (
 from app.domains.wallet.repositories import IWalletRepository
 from app.domains.payment.repositories import IPaymentRepository
 from app.domains.payment.services.payment_gateway import IPaymentGateway
+from app.domains.wallet.services import IPayoutGateway, PayoutGatewayError
 from app.domains.classroom.repositories import IClassroomRepository
 from app.domains.classroom.services import IVideoProvider, ClassroomService
 
@@ -42,11 +44,23 @@ from app.domains.classroom.services import IVideoProvider, ClassroomService
 from app.infrastructure.repositories.user_repository_impl import SQLAlchemyUserRepository
 from app.infrastructure.repositories.instructor_repository_impl import SQLAlchemyInstructorProfileRepository
 from app.infrastructure.repositories.student_repository_impl import SQLAlchemyStudentProfileRepository
+from app.infrastructure.repositories.student_stats_repository_impl import SQLAlchemyStudentStatsRepository
+from app.infrastructure.repositories.daily_rollup_repository_impl import SQLAlchemyDailyRollupRepository
 from app.infrastructure.repositories.education_repository_impl import SQLAlchemyEducationRepository
 from app.infrastructure.repositories.experience_repository_impl import SQLAlchemyExperienceRepository
 from app.infrastructure.repositories.file_repository_impl import SQLAlchemyFileRepository
 from app.infrastructure.repositories.subject_repository_impl import SQLAlchemySubjectRepository
 from app.infrastructure.repositories.instructor_subject_repository_impl import SQLAlchemyInstructorSubjectRepository
+from app.infrastructure.cache import (
+    PublicProfileCache,
+    SearchResultCache,
+    instructor_search_cache,
+    public_profile_cache,
+    SnapshotCache,
+    admin_stats_snapshot,
+)
+from app.infrastructure.dashboard import SectionComposer, dashboard_composer
+from app.infrastructure.export import RowExporter, admin_exporter
 from app.infrastructure.repositories.availability_repository_impl import AvailabilityRepositoryImpl
 from app.infrastructure.repositories.session_repository_impl import SessionRepositoryImpl
 from app.infrastructure.repositories.time_off_repository_impl import TimeOffRepositoryImpl
@@ -55,6 +69,7 @@ from app.infrastructure.repositories.wallet_repository_impl import SQLAlchemyWal
 from app.infrastructure.repositories.payment_repository_impl import PaymentRepositoryImpl
 from app.infrastructure.payment_gateways.razorpay_gateway import RazorpayGateway
 from app.infrastructure.payment_gateways.mock_gateway import MockGateway
+from app.infrastructure.payment_gateways.mock_payout_gateway import MockPayoutGateway
 from app.infrastructure.repositories.classroom_repository_impl import ClassroomRepositoryImpl
 from app.infrastructure.video_providers import (
     DailyVideoProvider,
@@ -90,6 +105,7 @@ from app.application.use_cases.student import (
     UpdateStudentProfileUseCase,
     RecordSessionCompletionUseCase,
 )
+from app.application.use_cases.student_dashboard import GetStudentDashboardUseCase
 from app.application.use_cases.file import (
     UploadFileUseCase,
     DeleteFileUseCase,
@@ -145,6 +161,16 @@ def get_student_repository(db: Session = Depends(get_db)) -> IStudentProfileRepo
     return SQLAlchemyStudentProfileRepository(db)
 
 
+def get_student_stats_repository(db: Session = Depends(get_db)) -> IStudentStatsRepository:
+    """Get StudentStats repository implementation."""
+    return SQLAlchemyStudentStatsRepository(db)
+
+
+def get_daily_rollup_repository(db: Session = Depends(get_db)) -> IDailyRollupRepository:
+    """Get daily analytics rollup repository implementation."""
+    return SQLAlchemyDailyRollupRepository(db)
+
+
 def get_education_repository(db: Session = Depends(get_db)) -> IEducationRepository:
     """Get Education repository implementation."""
     return SQLAlchemyEducationRepository(db)
@@ -170,6 +196,31 @@ def get_instructor_subject_repository(db: Session = Depends(get_db)) -> IInstruc
     return SQLAlchemyInstructorSubjectRepository(db)
 
 
+def get_instructor_search_cache() -> SearchResultCache:
+    """Get the shared instructor search result cache."""
+    return instructor_search_cache
+
+
+def get_public_profile_cache() -> PublicProfileCache:
+    """Get the shared public instructor profile cache."""
+    return public_profile_cache
+
+
+def get_admin_stats_snapshot() -> SnapshotCache:
+    """Get the shared admin dashboard stats snapshot."""
+    return admin_stats_snapshot
+
+
+def get_admin_exporter() -> RowExporter:
+    """Get the shared admin data exporter."""
+    return admin_exporter
+
+
+def get_dashboard_composer() -> SectionComposer:
+    """Get the shared dashboard section composer."""
+    return dashboard_composer
+
+
 def get_wallet_repository(db: Session = Depends(get_db)) -> IWalletRepository:
     """Get Wallet repository implementation."""
     return SQLAlchemyWalletRepository(db)
@@ -203,6 +254,29 @@ def get_payment_gateway() -> IPaymentGateway:
     )
 
 
+def get_payout_gateway() -> IPayoutGateway:
+    """
+    Get Payout gateway implementation.
+
+    Uses centralized settings configuration:
+    - settings.USE_MOCK_GATEWAY (for testing)
+
+    No real payout provider is integrated yet. Unlike payments there is no
+    fallback to the mock: it marks withdrawals completed without sending
+    any money, so it is only used when explicitly enabled.
+
+    Raises:
+        PayoutGatewayError: If no payout provider is configured
+    """
+    if settings.USE_MOCK_GATEWAY:
+        return MockPayoutGateway()
+
+    raise PayoutGatewayError(
+        message="No payout provider is configured",
+        code="NOT_CONFIGURED",
+    )
+
+
 # Scheduling Repository Dependencies
 
 def get_availability_repository(db: Session = Depends(get_db)) -> IAvailabilityRepository:
@@ -328,6 +402,27 @@ def get_instructor_dashboard_use_case(
     return GetInstructorDashboardUseCase(instructor_repo, wallet_repo, session_repo)
 
 
+def build_instructor_dashboard_use_case(db: Session) -> GetInstructorDashboardUseCase:
+    """Build GetInstructorDashboard use case on an explicit session (for section loaders)."""
+    return GetInstructorDashboardUseCase(
+        SQLAlchemyInstructorProfileRepository(db),
+        SQLAlchemyWalletRepository(db),
+        SessionRepositoryImpl(db),
+    )
+
+
+def build_student_dashboard_use_case(db: Session) -> GetStudentDashboardUseCase:
+    """Build GetStudentDashboard use case on an explicit session (for section loaders)."""
+    return GetStudentDashboardUseCase(
+        session_repo=SessionRepositoryImpl(db),
+        payment_repo=PaymentRepositoryImpl(db),
+        instructor_repo=SQLAlchemyInstructorProfileRepository(db),
+        student_repo=SQLAlchemyStudentProfileRepository(db),
+        user_repo=SQLAlchemyUserRepository(db),
+        stats_repo=SQLAlchemyStudentStatsRepository(db),
+    )
+
+
 def get_instructor_public_profile_use_case(
     instructor_repo: IInstructorProfileRepository = Depends(get_instructor_repository),
 ) -> GetInstructorPublicProfileUseCase:
@@ -358,9 +453,17 @@ def get_update_student_profile_use_case(
 
 def get_record_session_completion_use_case(
     student_repo: IStudentProfileRepository = Depends(get_student_repository),
+    stats_repo: IStudentStatsRepository = Depends(get_student_stats_repository),
+    session_repo: ISessionRepository = Depends(get_session_repository),
+    payment_repo: IPaymentRepository = Depends(get_payment_repository),
 ) -> RecordSessionCompletionUseCase:
     """Get RecordSessionCompletion use case."""
-    return RecordSessionCompletionUseCase(student_repo)
+    return RecordSessionCompletionUseCase(
+        student_repo,
+        stats_repo=stats_repo,
+        session_repo=session_repo,
+        payment_repo=payment_repo,
+    )
 
 
 # File Use Cases
@@ -775,6 +878,8 @@ def get_confirm_booking_use_case(
     session_repo: ISessionRepository = Depends(get_session_repository),
     wallet_repo: IWalletRepository = Depends(get_wallet_repository),
     payment_gateway: IPaymentGateway = Depends(get_payment_gateway),
+    student_repo: IStudentProfileRepository = Depends(get_student_repository),
+    student_stats_repo: IStudentStatsRepository = Depends(get_student_stats_repository),
 ) -> ConfirmBookingUseCase:
     """Get ConfirmBooking use case."""
     return ConfirmBookingUseCase(
@@ -783,6 +888,8 @@ def get_confirm_booking_use_case(
         session_repo=session_repo,
         wallet_repo=wallet_repo,
         payment_gateway=payment_gateway,
+        student_repo=student_repo,
+        student_stats_repo=student_stats_repo,
     )
 
 
@@ -791,6 +898,8 @@ def get_cancel_booking_use_case(
     slot_repo: IBookingSlotRepository = Depends(get_booking_slot_repository),
     session_repo: ISessionRepository = Depends(get_session_repository),
     payment_gateway: IPaymentGateway = Depends(get_payment_gateway),
+    student_repo: IStudentProfileRepository = Depends(get_student_repository),
+    student_stats_repo: IStudentStatsRepository = Depends(get_student_stats_repository),
 ) -> CancelBookingUseCase:
     """Get CancelBooking use case."""
     return CancelBookingUseCase(
@@ -798,6 +907,8 @@ def get_cancel_booking_use_case(
         slot_repo=slot_repo,
         session_repo=session_repo,
         payment_gateway=payment_gateway,
+        student_repo=student_repo,
+        student_stats_repo=student_stats_repo,
     )
 
 
@@ -928,9 +1039,15 @@ def get_join_classroom_use_case(
 def get_end_classroom_use_case(
     classroom_repo: IClassroomRepository = Depends(get_classroom_repository),
     video_provider: IVideoProvider = Depends(get_video_provider),
+    session_repo: ISessionRepository = Depends(get_session_repository),
+    record_completion: RecordSessionCompletionUseCase = Depends(
+        get_record_session_completion_use_case
+    ),
 ) -> EndClassroomUseCase:
     """Get EndClassroom use case."""
     return EndClassroomUseCase(
         classroom_repo=classroom_repo,
         video_provider=video_provider,
+        session_repo=session_repo,
+        record_completion=record_completion,
     )
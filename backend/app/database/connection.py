@@ -70,9 +70,17 @@ def init_db():
     """
     # Import all models here to ensure they're registered with Base
     from app.database import models
+    from app.infrastructure.search import (
+        ensure_instructor_search_schema,
+        ensure_message_search_schema,
+    )
 
     Base.metadata.create_all(bind=engine)
 
+    # Full-text indexes can't be expressed as ORM tables
+    ensure_message_search_schema(engine)
+    ensure_instructor_search_schema(engine)
+
 
 def drop_db():
     """
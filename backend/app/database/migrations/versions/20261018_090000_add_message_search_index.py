@@ -0,0 +1,76 @@
+"""Add full-text search index for messages.
+
+Revision ID: add_message_search_001
+Revises: add_room_id_001
+Create Date: 2026-10-18 09:00:00.000000
+
+Adds a full-text index over messages.content and backfills it from
+existing rows:
+- SQLite: FTS5 virtual table `messages_fts` (rowid = messages.id)
+- PostgreSQL: `messages.search_vector` tsvector column + GIN index
+
+After this migration the index is maintained incrementally by
+SQLAlchemyMessageRepository (app/infrastructure/search/message_search.py).
+
+This migration is idempotent - safe to run multiple times.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_message_search_001'
+down_revision: Union[str, Sequence[str], None] = 'add_room_id_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if a table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    """Create and backfill the message search index."""
+    bind = op.get_bind()
+
+    if bind.dialect.name == 'sqlite':
+        if table_exists('messages_fts'):
+            return
+
+        op.execute(
+            "CREATE VIRTUAL TABLE messages_fts "
+            "USING fts5(content, tokenize = 'unicode61')"
+        )
+        op.execute(
+            "INSERT INTO messages_fts (rowid, content) "
+            "SELECT id, content FROM messages "
+            "WHERE content IS NOT NULL AND deleted_at IS NULL"
+        )
+
+    elif bind.dialect.name == 'postgresql':
+        op.execute("ALTER TABLE messages ADD COLUMN IF NOT EXISTS search_vector tsvector")
+        op.execute(
+            "UPDATE messages SET search_vector = to_tsvector('simple', coalesce(content, '')) "
+            "WHERE search_vector IS NULL"
+        )
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_messages_search_vector "
+            "ON messages USING GIN (search_vector)"
+        )
+
+
+def downgrade() -> None:
+    """Drop the message search index."""
+    bind = op.get_bind()
+
+    if bind.dialect.name == 'sqlite':
+        op.execute("DROP TABLE IF EXISTS messages_fts")
+
+    elif bind.dialect.name == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_messages_search_vector")
+        op.execute("ALTER TABLE messages DROP COLUMN IF EXISTS search_vector")
@@ -0,0 +1,128 @@
+"""Add normalized instructor_languages table.
+
+Revision ID: add_instructor_languages_001
+Revises: add_message_search_001
+Create Date: 2026-10-18 10:00:00.000000
+
+instructor_profiles.languages stores a JSON list, which a language filter
+can only match by decoding every profile. This migration adds one row per
+(instructor, language) with an index on language and backfills it from the
+JSON column.
+
+Domain Entity: InstructorProfile (app/domains/instructor/entities/instructor_profile.py)
+- languages_spoken: LanguageProficiency value object
+
+After this migration the rows are kept in sync by InstructorProfileMapper;
+the JSON column remains the source for loading the domain entity.
+
+This migration is idempotent - safe to run multiple times.
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_instructor_languages_001'
+down_revision: Union[str, Sequence[str], None] = 'add_message_search_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Language ProficiencyLevel values (app/domains/instructor/value_objects/language_proficiency.py)
+PROFICIENCY_LEVELS = {"native", "fluent", "advanced", "intermediate", "basic"}
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if a table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def get_existing_indexes(table_name: str) -> set:
+    """Get set of existing index names for a table."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    try:
+        return {index['name'] for index in inspector.get_indexes(table_name)}
+    except Exception:
+        return set()
+
+
+def parse_languages(raw: str) -> dict:
+    """
+    Parse a profile's languages JSON into {language: proficiency}.
+
+    Mirrors InstructorProfileMapper.to_domain: names are title-cased and
+    unparseable values are skipped.
+    """
+    try:
+        data = json.loads(raw)
+    except (TypeError, ValueError):
+        return {}
+
+    languages = {}
+    for entry in data if isinstance(data, list) else []:
+        try:
+            name = str(entry["language"]).strip().title()
+            proficiency = str(entry["proficiency"])
+        except (KeyError, TypeError):
+            continue
+        if name and proficiency in PROFICIENCY_LEVELS:
+            languages.setdefault(name, proficiency)
+    return languages
+
+
+def upgrade() -> None:
+    """Create instructor_languages and backfill it from instructor_profiles.languages."""
+    if not table_exists('instructor_languages'):
+        op.create_table(
+            'instructor_languages',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('instructor_id', sa.Integer(), nullable=False),
+            sa.Column('language', sa.String(length=100), nullable=False),
+            sa.Column('proficiency', sa.String(length=20), nullable=False),
+            sa.ForeignKeyConstraint(['instructor_id'], ['instructor_profiles.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('instructor_id', 'language', name='uq_instructor_languages_instructor_language'),
+        )
+
+    existing_indexes = get_existing_indexes('instructor_languages')
+    if 'ix_instructor_languages_id' not in existing_indexes:
+        op.create_index('ix_instructor_languages_id', 'instructor_languages', ['id'], unique=False)
+    if 'ix_instructor_languages_language' not in existing_indexes:
+        op.create_index('ix_instructor_languages_language', 'instructor_languages', ['language'], unique=False)
+
+    # Backfill profiles that don't have any rows yet
+    bind = op.get_bind()
+    profiles = bind.execute(sa.text(
+        "SELECT p.id, p.languages FROM instructor_profiles p "
+        "WHERE p.languages IS NOT NULL "
+        "AND NOT EXISTS (SELECT 1 FROM instructor_languages l WHERE l.instructor_id = p.id)"
+    )).all()
+
+    rows = [
+        {"instructor_id": profile_id, "language": name, "proficiency": proficiency}
+        for profile_id, raw in profiles
+        for name, proficiency in parse_languages(raw).items()
+    ]
+    if rows:
+        bind.execute(
+            sa.text(
+                "INSERT INTO instructor_languages (instructor_id, language, proficiency) "
+                "VALUES (:instructor_id, :language, :proficiency)"
+            ),
+            rows,
+        )
+
+
+def downgrade() -> None:
+    """Drop instructor_languages table."""
+    if table_exists('instructor_languages'):
+        op.drop_index('ix_instructor_languages_language', table_name='instructor_languages')
+        op.drop_index('ix_instructor_languages_id', table_name='instructor_languages')
+        op.drop_table('instructor_languages')
@@ -0,0 +1,59 @@
+"""Add indexes for subject-filtered instructor search.
+
+Revision ID: add_subject_search_idx_001
+Revises: add_instructor_languages_001
+Create Date: 2026-10-18 11:00:00.000000
+
+Instructor search filters by subject (id or slug) and category through
+instructor_subjects, and batch-loads each result's subjects. Neither
+foreign key on instructor_subjects was indexed, so both directions of the
+join scanned the whole table.
+
+- instructor_subjects(subject_id, instructor_profile_id)
+- instructor_subjects(instructor_profile_id, subject_id)
+- subjects(category)
+
+This migration is idempotent - safe to run multiple times.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_subject_search_idx_001'
+down_revision: Union[str, Sequence[str], None] = 'add_instructor_languages_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    ('ix_instructor_subjects_subject_instructor', 'instructor_subjects', ['subject_id', 'instructor_profile_id']),
+    ('ix_instructor_subjects_instructor_subject', 'instructor_subjects', ['instructor_profile_id', 'subject_id']),
+    ('ix_subjects_category', 'subjects', ['category']),
+]
+
+
+def get_existing_indexes(table_name: str) -> set:
+    """Get set of existing index names for a table."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    try:
+        return {index['name'] for index in inspector.get_indexes(table_name)}
+    except Exception:
+        return set()
+
+
+def upgrade() -> None:
+    """Create subject search indexes."""
+    for name, table, columns in INDEXES:
+        if name not in get_existing_indexes(table):
+            op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    """Drop subject search indexes."""
+    for name, table, _ in reversed(INDEXES):
+        if name in get_existing_indexes(table):
+            op.drop_index(name, table_name=table)
@@ -0,0 +1,89 @@
+"""Add full-text search index for instructor profiles.
+
+Revision ID: add_instructor_search_001
+Revises: add_subject_search_idx_001
+Create Date: 2026-10-18 12:00:00.000000
+
+Adds a full-text index over instructor headline, subject names, bio and
+teaching experience, and backfills it from existing rows:
+- SQLite: FTS5 virtual table `instructor_profiles_fts` (rowid = profile id)
+- PostgreSQL: weighted `instructor_profiles.search_vector` tsvector column
+  (A headline, B subjects, C bio, D teaching experience) + GIN index
+
+After this migration the index is maintained incrementally by the
+instructor profile and instructor subject repositories
+(app/infrastructure/search/instructor_search.py).
+
+This migration is idempotent - safe to run multiple times.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_instructor_search_001'
+down_revision: Union[str, Sequence[str], None] = 'add_subject_search_idx_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if a table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    """Create and backfill the instructor search index."""
+    bind = op.get_bind()
+
+    if bind.dialect.name == 'sqlite':
+        if table_exists('instructor_profiles_fts'):
+            return
+
+        op.execute(
+            "CREATE VIRTUAL TABLE instructor_profiles_fts "
+            "USING fts5(headline, subjects, bio, teaching_experience, tokenize = 'unicode61')"
+        )
+        op.execute(
+            "INSERT INTO instructor_profiles_fts (rowid, headline, subjects, bio, teaching_experience) "
+            "SELECT p.id, p.headline, "
+            "(SELECT group_concat(s.name, ' ') FROM instructor_subjects isub "
+            "JOIN subjects s ON s.id = isub.subject_id "
+            "WHERE isub.instructor_profile_id = p.id AND s.is_active = 1), "
+            "p.bio, p.teaching_experience "
+            "FROM instructor_profiles p"
+        )
+
+    elif bind.dialect.name == 'postgresql':
+        op.execute("ALTER TABLE instructor_profiles ADD COLUMN IF NOT EXISTS search_vector tsvector")
+        op.execute(
+            "UPDATE instructor_profiles p SET search_vector = "
+            "setweight(to_tsvector('simple', coalesce(p.headline, '')), 'A') || "
+            "setweight(to_tsvector('simple', coalesce("
+            "(SELECT string_agg(s.name, ' ') FROM instructor_subjects isub "
+            "JOIN subjects s ON s.id = isub.subject_id "
+            "WHERE isub.instructor_profile_id = p.id AND s.is_active), '')), 'B') || "
+            "setweight(to_tsvector('simple', coalesce(p.bio, '')), 'C') || "
+            "setweight(to_tsvector('simple', coalesce(p.teaching_experience, '')), 'D') "
+            "WHERE p.search_vector IS NULL"
+        )
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_instructor_profiles_search_vector "
+            "ON instructor_profiles USING GIN (search_vector)"
+        )
+
+
+def downgrade() -> None:
+    """Drop the instructor search index."""
+    bind = op.get_bind()
+
+    if bind.dialect.name == 'sqlite':
+        op.execute("DROP TABLE IF EXISTS instructor_profiles_fts")
+
+    elif bind.dialect.name == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_instructor_profiles_search_vector")
+        op.execute("ALTER TABLE instructor_profiles DROP COLUMN IF EXISTS search_vector")
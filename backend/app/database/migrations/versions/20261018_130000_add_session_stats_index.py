@@ -0,0 +1,50 @@
+"""Add composite index for instructor session aggregates.
+
+Revision ID: add_session_stats_idx_001
+Revises: add_instructor_search_001
+Create Date: 2026-10-18 13:00:00.000000
+
+The instructor dashboard computes distinct students, completed, upcoming
+and this-month session counts in one aggregate query filtered by
+instructor, status and start time.
+
+- sessions(instructor_id, status, start_at)
+
+This migration is idempotent - safe to run multiple times.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_session_stats_idx_001'
+down_revision: Union[str, Sequence[str], None] = 'add_instructor_search_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEX_NAME = 'ix_sessions_instructor_status_start'
+
+
+def get_existing_indexes(table_name: str) -> set:
+    """Get set of existing index names for a table."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    try:
+        return {index['name'] for index in inspector.get_indexes(table_name)}
+    except Exception:
+        return set()
+
+
+def upgrade() -> None:
+    """Create session stats index."""
+    if INDEX_NAME not in get_existing_indexes('sessions'):
+        op.create_index(INDEX_NAME, 'sessions', ['instructor_id', 'status', 'start_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop session stats index."""
+    if INDEX_NAME in get_existing_indexes('sessions'):
+        op.drop_index(INDEX_NAME, table_name='sessions')
@@ -0,0 +1,50 @@
+"""Add composite index for student session aggregates.
+
+Revision ID: add_student_session_idx_001
+Revises: add_session_stats_idx_001
+Create Date: 2026-10-18 14:00:00.000000
+
+The student dashboard aggregates completed sessions (totals, per-instructor
+counts, streak dates) and pages through session history, all filtered by
+student, status and start time.
+
+- sessions(student_id, status, start_at)
+
+This migration is idempotent - safe to run multiple times.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_student_session_idx_001'
+down_revision: Union[str, Sequence[str], None] = 'add_session_stats_idx_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEX_NAME = 'ix_sessions_student_status_start'
+
+
+def get_existing_indexes(table_name: str) -> set:
+    """Get set of existing index names for a table."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    try:
+        return {index['name'] for index in inspector.get_indexes(table_name)}
+    except Exception:
+        return set()
+
+
+def upgrade() -> None:
+    """Create student session index."""
+    if INDEX_NAME not in get_existing_indexes('sessions'):
+        op.create_index(INDEX_NAME, 'sessions', ['student_id', 'status', 'start_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop student session index."""
+    if INDEX_NAME in get_existing_indexes('sessions'):
+        op.drop_index(INDEX_NAME, table_name='sessions')
@@ -0,0 +1,65 @@
+"""Add student_stats projection table.
+
+Revision ID: add_student_stats_001
+Revises: add_student_session_idx_001
+Create Date: 2026-10-18 15:00:00.000000
+
+One row per student profile with the dashboard quick stats (completed
+sessions, minutes, instructors, spend, weekly streaks), so the stats card
+is a single-row read instead of aggregates over the student's history.
+
+Domain Entity: StudentStats (app/domains/student/entities/student_stats.py)
+
+Rows are maintained by RecordSessionCompletionUseCase and
+ConfirmBookingUseCase; missing rows are built on first update, and
+existing students can be backfilled with:
+
+    python -m app.database.rebuild_student_stats
+
+This migration is idempotent - safe to run multiple times.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_student_stats_001'
+down_revision: Union[str, Sequence[str], None] = 'add_student_session_idx_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if a table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    """Create student_stats table."""
+    if not table_exists('student_stats'):
+        op.create_table(
+            'student_stats',
+            sa.Column('student_id', sa.Integer(), nullable=False),
+            sa.Column('total_sessions_completed', sa.Integer(), nullable=False, server_default='0'),
+            sa.Column('total_minutes', sa.Integer(), nullable=False, server_default='0'),
+            sa.Column('trial_sessions_completed', sa.Integer(), nullable=False, server_default='0'),
+            sa.Column('unique_instructors', sa.Integer(), nullable=False, server_default='0'),
+            sa.Column('total_spent', sa.Numeric(precision=12, scale=2), nullable=False, server_default='0'),
+            sa.Column('current_streak_weeks', sa.Integer(), nullable=False, server_default='0'),
+            sa.Column('longest_streak_weeks', sa.Integer(), nullable=False, server_default='0'),
+            sa.Column('last_active_week', sa.Date(), nullable=True),
+            sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+            sa.ForeignKeyConstraint(['student_id'], ['student_profiles.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('student_id'),
+        )
+
+
+def downgrade() -> None:
+    """Drop student_stats table."""
+    if table_exists('student_stats'):
+        op.drop_table('student_stats')
@@ -0,0 +1,75 @@
+"""Add indexes for admin user/instructor lists.
+
+Revision ID: add_admin_list_idx_001
+Revises: add_student_stats_001
+Create Date: 2026-10-18 16:00:00.000000
+
+The admin user and instructor lists are ordered newest first and paged
+with a (created_at, id) keyset cursor, and can be searched by email or
+name prefix (case-insensitive, so matched through lower()).
+
+- users(created_at, id)
+- users(lower(email)), users(lower(first_name)), users(lower(last_name))
+- instructor_profiles(created_at, id)
+- instructor_profiles(status, created_at, id)
+
+Expression indexes are created with raw CREATE INDEX IF NOT EXISTS, which
+both SQLite and PostgreSQL support and which doesn't depend on the
+inspector reflecting expression indexes.
+
+This migration is idempotent - safe to run multiple times.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_admin_list_idx_001'
+down_revision: Union[str, Sequence[str], None] = 'add_student_stats_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COLUMN_INDEXES = [
+    ('ix_users_created_at_id', 'users', ['created_at', 'id']),
+    ('ix_instructor_profiles_created_at_id', 'instructor_profiles', ['created_at', 'id']),
+    ('ix_instructor_profiles_status_created_id', 'instructor_profiles', ['status', 'created_at', 'id']),
+]
+
+EXPRESSION_INDEXES = [
+    ('ix_users_email_lower', 'users', 'lower(email)'),
+    ('ix_users_first_name_lower', 'users', 'lower(first_name)'),
+    ('ix_users_last_name_lower', 'users', 'lower(last_name)'),
+]
+
+
+def get_existing_indexes(table_name: str) -> set:
+    """Get set of existing index names for a table."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    try:
+        return {index['name'] for index in inspector.get_indexes(table_name)}
+    except Exception:
+        return set()
+
+
+def upgrade() -> None:
+    """Create admin list indexes."""
+    for name, table, columns in COLUMN_INDEXES:
+        if name not in get_existing_indexes(table):
+            op.create_index(name, table, columns, unique=False)
+
+    for name, table, expression in EXPRESSION_INDEXES:
+        op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({expression})")
+
+
+def downgrade() -> None:
+    """Drop admin list indexes."""
+    for name, _table, _expression in EXPRESSION_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+
+    for name, table, _columns in COLUMN_INDEXES:
+        if name in get_existing_indexes(table):
+            op.drop_index(name, table_name=table)
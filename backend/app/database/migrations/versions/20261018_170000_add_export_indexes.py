@@ -0,0 +1,56 @@
+"""Add created_at indexes for date-ranged admin exports.
+
+Revision ID: add_export_idx_001
+Revises: add_admin_list_idx_001
+Create Date: 2026-10-18 17:00:00.000000
+
+Admin exports stream payments and wallet transactions ordered by
+(created_at, id) and optionally bounded by a date range. Users use
+ix_users_created_at_id and sessions the existing start_at index.
+
+- payments(created_at, id)
+- wallet_transactions(created_at, id)
+
+This migration is idempotent - safe to run multiple times.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_export_idx_001'
+down_revision: Union[str, Sequence[str], None] = 'add_admin_list_idx_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    ('ix_payments_created_at_id', 'payments', ['created_at', 'id']),
+    ('ix_wallet_transactions_created_at_id', 'wallet_transactions', ['created_at', 'id']),
+]
+
+
+def get_existing_indexes(table_name: str) -> set:
+    """Get set of existing index names for a table."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    try:
+        return {index['name'] for index in inspector.get_indexes(table_name)}
+    except Exception:
+        return set()
+
+
+def upgrade() -> None:
+    """Create export indexes."""
+    for name, table, columns in INDEXES:
+        if name not in get_existing_indexes(table):
+            op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    """Drop export indexes."""
+    for name, table, _columns in INDEXES:
+        if name in get_existing_indexes(table):
+            op.drop_index(name, table_name=table)
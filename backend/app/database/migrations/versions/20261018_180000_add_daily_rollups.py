@@ -0,0 +1,119 @@
+"""Add daily analytics rollup tables.
+
+Revision ID: add_daily_rollups_001
+Revises: add_export_idx_001
+Create Date: 2026-10-18 18:00:00.000000
+
+Daily aggregates per instructor and platform-wide (bookings, cancellations,
+completed sessions/minutes, gross amount, platform fee), so analytics
+charts read a row per day instead of scanning sessions and payments.
+
+Domain Entities: InstructorDailyRollup, PlatformDailyRollup
+(app/domains/analytics/entities/daily_rollup.py)
+
+Also indexes the timestamps the refresh job aggregates by:
+
+- sessions(created_at), sessions(cancelled_at)
+- payments(completed_at)
+
+Fill the tables (and keep them fresh from cron) with:
+
+    python -m app.database.refresh_daily_rollups
+
+This migration is idempotent - safe to run multiple times.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_daily_rollups_001'
+down_revision: Union[str, Sequence[str], None] = 'add_export_idx_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SOURCE_INDEXES = [
+    ('ix_sessions_created_at', 'sessions', ['created_at']),
+    ('ix_sessions_cancelled_at', 'sessions', ['cancelled_at']),
+    ('ix_payments_completed_at', 'payments', ['completed_at']),
+]
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if a table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def get_existing_indexes(table_name: str) -> set:
+    """Get set of existing index names for a table."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    try:
+        return {index['name'] for index in inspector.get_indexes(table_name)}
+    except Exception:
+        return set()
+
+
+def metric_columns() -> list:
+    """Columns shared by both rollup tables."""
+    return [
+        sa.Column('bookings', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('cancellations', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('completed_sessions', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('completed_minutes', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('gross_amount', sa.Numeric(precision=12, scale=2), nullable=False, server_default='0'),
+        sa.Column('platform_fee', sa.Numeric(precision=12, scale=2), nullable=False, server_default='0'),
+    ]
+
+
+def upgrade() -> None:
+    """Create rollup tables and source indexes."""
+    if not table_exists('instructor_daily_rollups'):
+        op.create_table(
+            'instructor_daily_rollups',
+            sa.Column('day', sa.Date(), nullable=False),
+            sa.Column('instructor_id', sa.Integer(), nullable=False),
+            *metric_columns(),
+            sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+            sa.ForeignKeyConstraint(['instructor_id'], ['instructor_profiles.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('day', 'instructor_id'),
+        )
+    if 'ix_instructor_daily_rollups_instructor_day' not in get_existing_indexes('instructor_daily_rollups'):
+        op.create_index(
+            'ix_instructor_daily_rollups_instructor_day',
+            'instructor_daily_rollups',
+            ['instructor_id', 'day'],
+            unique=False,
+        )
+
+    if not table_exists('platform_daily_rollups'):
+        op.create_table(
+            'platform_daily_rollups',
+            sa.Column('day', sa.Date(), nullable=False),
+            *metric_columns(),
+            sa.Column('active_instructors', sa.Integer(), nullable=False, server_default='0'),
+            sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+            sa.PrimaryKeyConstraint('day'),
+        )
+
+    for name, table, columns in SOURCE_INDEXES:
+        if name not in get_existing_indexes(table):
+            op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    """Drop rollup tables and source indexes."""
+    for name, table, _columns in SOURCE_INDEXES:
+        if name in get_existing_indexes(table):
+            op.drop_index(name, table_name=table)
+
+    if table_exists('platform_daily_rollups'):
+        op.drop_table('platform_daily_rollups')
+    if table_exists('instructor_daily_rollups'):
+        op.drop_table('instructor_daily_rollups')
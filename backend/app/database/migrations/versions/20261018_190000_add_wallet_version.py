@@ -0,0 +1,51 @@
+"""Add optimistic-concurrency version to wallets.
+
+Revision ID: add_wallet_version_001
+Revises: add_daily_rollups_001
+Create Date: 2026-10-18 19:00:00.000000
+
+Wallet balances are now changed only by atomic
+`balance = balance + delta` updates; every write bumps wallets.version,
+and non-balance updates (status) are applied only if the version is the
+one that was read.
+
+Domain Entity: Wallet (app/domains/wallet/entities/wallet.py)
+
+This migration is idempotent - safe to run multiple times.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_wallet_version_001'
+down_revision: Union[str, Sequence[str], None] = 'add_daily_rollups_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def get_existing_columns(table_name: str) -> set:
+    """Get set of existing column names for a table."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    columns = inspector.get_columns(table_name)
+    return {col['name'] for col in columns}
+
+
+def upgrade() -> None:
+    """Add wallets.version."""
+    if 'version' not in get_existing_columns('wallets'):
+        with op.batch_alter_table('wallets', schema=None) as batch_op:
+            batch_op.add_column(
+                sa.Column('version', sa.Integer(), nullable=False, server_default='1')
+            )
+
+
+def downgrade() -> None:
+    """Drop wallets.version."""
+    if 'version' in get_existing_columns('wallets'):
+        with op.batch_alter_table('wallets', schema=None) as batch_op:
+            batch_op.drop_column('version')
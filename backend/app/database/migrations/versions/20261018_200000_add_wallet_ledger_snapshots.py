@@ -0,0 +1,94 @@
+"""Add wallet balance snapshots and ledger indexes.
+
+Revision ID: add_wallet_snapshots_001
+Revises: add_wallet_version_001
+Create Date: 2026-10-18 20:00:00.000000
+
+Periodic per-wallet balances derived from wallet_transactions, so balance
+verification and "balance as of" only sum transactions after the latest
+snapshot.
+
+Domain Entity: WalletBalanceSnapshot
+(app/domains/wallet/entities/balance_snapshot.py)
+
+Also indexes wallet_transactions for keyset-paginated history and the
+ledger sums:
+
+- wallet_transactions(wallet_id, created_at, id)
+- wallet_transactions(wallet_id, completed_at)
+
+Take snapshots (and keep taking them from cron) with:
+
+    python -m app.database.snapshot_wallet_balances
+
+This migration is idempotent - safe to run multiple times.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_wallet_snapshots_001'
+down_revision: Union[str, Sequence[str], None] = 'add_wallet_version_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+LEDGER_INDEXES = [
+    ('ix_wallet_transactions_wallet_created_id', 'wallet_transactions', ['wallet_id', 'created_at', 'id']),
+    ('ix_wallet_transactions_wallet_completed', 'wallet_transactions', ['wallet_id', 'completed_at']),
+]
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if a table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def get_existing_indexes(table_name: str) -> set:
+    """Get set of existing index names for a table."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    try:
+        return {index['name'] for index in inspector.get_indexes(table_name)}
+    except Exception:
+        return set()
+
+
+def upgrade() -> None:
+    """Create wallet_balance_snapshots and ledger indexes."""
+    if not table_exists('wallet_balance_snapshots'):
+        op.create_table(
+            'wallet_balance_snapshots',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('wallet_id', sa.Integer(), nullable=False),
+            sa.Column('as_of', sa.DateTime(), nullable=False),
+            sa.Column('balance', sa.Numeric(precision=12, scale=2), nullable=False),
+            sa.Column('total_earned', sa.Numeric(precision=12, scale=2), nullable=False),
+            sa.Column('total_withdrawn', sa.Numeric(precision=12, scale=2), nullable=False),
+            sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+            sa.ForeignKeyConstraint(['wallet_id'], ['wallets.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('wallet_id', 'as_of', name='uq_wallet_balance_snapshots_wallet_as_of'),
+        )
+    if 'ix_wallet_balance_snapshots_id' not in get_existing_indexes('wallet_balance_snapshots'):
+        op.create_index('ix_wallet_balance_snapshots_id', 'wallet_balance_snapshots', ['id'], unique=False)
+
+    for name, table, columns in LEDGER_INDEXES:
+        if name not in get_existing_indexes(table):
+            op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    """Drop wallet_balance_snapshots and ledger indexes."""
+    for name, table, _columns in LEDGER_INDEXES:
+        if name in get_existing_indexes(table):
+            op.drop_index(name, table_name=table)
+
+    if table_exists('wallet_balance_snapshots'):
+        op.drop_table('wallet_balance_snapshots')
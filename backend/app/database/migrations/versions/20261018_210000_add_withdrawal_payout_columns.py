@@ -0,0 +1,89 @@
+"""Add payout columns to wallet_transactions.
+
+Revision ID: add_payout_columns_001
+Revises: add_wallet_snapshots_001
+Create Date: 2026-10-18 21:00:00.000000
+
+The payout job claims pending withdrawals in batches (claim_token,
+claimed_at; SKIP LOCKED on PostgreSQL) before submitting them to the
+payout gateway, and records the provider's reference on completion.
+
+- wallet_transactions.payout_reference
+- wallet_transactions.claim_token
+- wallet_transactions.claimed_at
+- wallet_transactions(type, status, created_at, id)
+
+Domain Entity: WalletTransaction (app/domains/wallet/entities/wallet_transaction.py)
+
+This migration is idempotent - safe to run multiple times.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_payout_columns_001'
+down_revision: Union[str, Sequence[str], None] = 'add_wallet_snapshots_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+NEW_COLUMNS = [
+    ('payout_reference', sa.String(length=100)),
+    ('claim_token', sa.String(length=64)),
+    ('claimed_at', sa.DateTime()),
+]
+
+INDEX_NAME = 'ix_wallet_transactions_type_status_created'
+
+
+def get_existing_columns(table_name: str) -> set:
+    """Get set of existing column names for a table."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    columns = inspector.get_columns(table_name)
+    return {col['name'] for col in columns}
+
+
+def get_existing_indexes(table_name: str) -> set:
+    """Get set of existing index names for a table."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    try:
+        return {index['name'] for index in inspector.get_indexes(table_name)}
+    except Exception:
+        return set()
+
+
+def upgrade() -> None:
+    """Add payout columns and the pending-withdrawals index."""
+    existing = get_existing_columns('wallet_transactions')
+    missing = [(name, type_) for name, type_ in NEW_COLUMNS if name not in existing]
+    if missing:
+        with op.batch_alter_table('wallet_transactions', schema=None) as batch_op:
+            for name, type_ in missing:
+                batch_op.add_column(sa.Column(name, type_, nullable=True))
+
+    if INDEX_NAME not in get_existing_indexes('wallet_transactions'):
+        op.create_index(
+            INDEX_NAME,
+            'wallet_transactions',
+            ['type', 'status', 'created_at', 'id'],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Drop payout columns and the pending-withdrawals index."""
+    if INDEX_NAME in get_existing_indexes('wallet_transactions'):
+        op.drop_index(INDEX_NAME, table_name='wallet_transactions')
+
+    existing = get_existing_columns('wallet_transactions')
+    present = [name for name, _type in NEW_COLUMNS if name in existing]
+    if present:
+        with op.batch_alter_table('wallet_transactions', schema=None) as batch_op:
+            for name in present:
+                batch_op.drop_column(name)
@@ -0,0 +1,49 @@
+"""Add composite index for the stale payment reaper.
+
+Revision ID: add_payment_reaper_idx_001
+Revises: add_payout_columns_001
+Create Date: 2026-10-18 22:00:00.000000
+
+The reaper scans PROCESSING payments older than a threshold in keyset
+batches ordered by (created_at, id).
+
+- payments(status, created_at, id)
+
+This migration is idempotent - safe to run multiple times.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_payment_reaper_idx_001'
+down_revision: Union[str, Sequence[str], None] = 'add_payout_columns_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEX_NAME = 'ix_payments_status_created_id'
+
+
+def get_existing_indexes(table_name: str) -> set:
+    """Get set of existing index names for a table."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    try:
+        return {index['name'] for index in inspector.get_indexes(table_name)}
+    except Exception:
+        return set()
+
+
+def upgrade() -> None:
+    """Create payment reaper index."""
+    if INDEX_NAME not in get_existing_indexes('payments'):
+        op.create_index(INDEX_NAME, 'payments', ['status', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop payment reaper index."""
+    if INDEX_NAME in get_existing_indexes('payments'):
+        op.drop_index(INDEX_NAME, table_name='payments')
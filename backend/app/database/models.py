@@ -9,8 +9,8 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Type
 from sqlalchemy import (
-    Column, Integer, String, DateTime, Boolean, Text, Numeric, Float, JSON,
-    ForeignKey, Enum as SQLEnum, Table
+    Column, Integer, String, Date, DateTime, Boolean, Text, Numeric, Float, JSON,
+    ForeignKey, Enum as SQLEnum, Table, UniqueConstraint, Index, text
 )
 from sqlalchemy.orm import relationship
 import enum
@@ -174,6 +174,14 @@ class User(Base):
     """User ORM model (maps to users table)."""
 
     __tablename__ = "users"
+    __table_args__ = (
+        # Admin user list: newest first, keyset paginated
+        Index("ix_users_created_at_id", "created_at", "id"),
+        # Admin search: case-insensitive prefix match on email and names
+        Index("ix_users_email_lower", text("lower(email)")),
+        Index("ix_users_first_name_lower", text("lower(first_name)")),
+        Index("ix_users_last_name_lower", text("lower(last_name)")),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String(255), unique=True, nullable=False, index=True)
@@ -219,6 +227,11 @@ class InstructorProfile(Base):
     """Instructor profile ORM model."""
 
     __tablename__ = "instructor_profiles"
+    __table_args__ = (
+        # Admin instructor list: newest first, keyset paginated, optionally by status
+        Index("ix_instructor_profiles_created_at_id", "created_at", "id"),
+        Index("ix_instructor_profiles_status_created_id", "status", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, unique=True)
@@ -268,6 +281,29 @@ class InstructorProfile(Base):
     education = relationship("Education", back_populates="instructor_profile", cascade="all, delete-orphan")
     experience = relationship("Experience", back_populates="instructor_profile", cascade="all, delete-orphan")
     instructor_subjects = relationship("InstructorSubject", back_populates="instructor_profile", cascade="all, delete-orphan")
+    language_entries = relationship("InstructorLanguage", back_populates="instructor_profile", cascade="all, delete-orphan")
+
+
+class InstructorLanguage(Base):
+    """
+    Languages spoken by an instructor, one row per language.
+
+    Normalized copy of InstructorProfile.languages (kept in sync by
+    InstructorProfileMapper) so language filters can use an index.
+    """
+
+    __tablename__ = "instructor_languages"
+    __table_args__ = (
+        UniqueConstraint("instructor_id", "language", name="uq_instructor_languages_instructor_language"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    instructor_id = Column(Integer, ForeignKey("instructor_profiles.id", ondelete="CASCADE"), nullable=False)
+    language = Column(String(100), nullable=False, index=True)  # Title-cased, e.g. "English"
+    proficiency = Column(String(20), nullable=False)  # language ProficiencyLevel value
+
+    # Relationships
+    instructor_profile = relationship("InstructorProfile", back_populates="language_entries")
 
 
 class StudentProfile(Base):
@@ -304,6 +340,32 @@ class StudentProfile(Base):
     user = relationship("User", back_populates="student_profile")
 
 
+class StudentStats(Base):
+    """
+    Student dashboard statistics projection ORM model.
+
+    One row per student profile, maintained incrementally on session
+    completion and payment completion; rebuildable from sessions/payments.
+    """
+
+    __tablename__ = "student_stats"
+
+    student_id = Column(Integer, ForeignKey("student_profiles.id", ondelete="CASCADE"), primary_key=True)
+
+    total_sessions_completed = Column(Integer, nullable=False, default=0)
+    total_minutes = Column(Integer, nullable=False, default=0)
+    trial_sessions_completed = Column(Integer, nullable=False, default=0)
+    unique_instructors = Column(Integer, nullable=False, default=0)
+    total_spent = Column(Numeric(12, 2), nullable=False, default=Decimal("0.00"))
+
+    # Weekly learning streak ending at last_active_week
+    current_streak_weeks = Column(Integer, nullable=False, default=0)
+    longest_streak_weeks = Column(Integer, nullable=False, default=0)
+    last_active_week = Column(Date, nullable=True)  # Monday of the latest week with a session
+
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
 class Education(Base):
     """Education record ORM model."""
 
@@ -360,7 +422,7 @@ class Subject(Base):
     name = Column(String(100), nullable=False, unique=True)
     slug = Column(String(100), nullable=False, unique=True, index=True)
     description = Column(Text, nullable=True)
-    category = Column(String(100), nullable=True)
+    category = Column(String(100), nullable=True, index=True)
     is_active = Column(Boolean, nullable=False, default=True)
 
     # Timestamps
@@ -375,6 +437,11 @@ class InstructorSubject(Base):
     """Instructor-Subject relationship (many-to-many with extra fields)."""
 
     __tablename__ = "instructor_subjects"
+    __table_args__ = (
+        # Search: "instructors teaching subject X" and batch-loading subjects per instructor
+        Index("ix_instructor_subjects_subject_instructor", "subject_id", "instructor_profile_id"),
+        Index("ix_instructor_subjects_instructor_subject", "instructor_profile_id", "subject_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     instructor_profile_id = Column(Integer, ForeignKey("instructor_profiles.id", ondelete="CASCADE"), nullable=False)
@@ -476,6 +543,15 @@ class Session(Base):
     """Booked tutoring session ORM model."""
 
     __tablename__ = "sessions"
+    __table_args__ = (
+        # Per-instructor dashboard aggregates and upcoming-session lookups
+        Index("ix_sessions_instructor_status_start", "instructor_id", "status", "start_at"),
+        # Per-student dashboard aggregates and paginated history
+        Index("ix_sessions_student_status_start", "student_id", "status", "start_at"),
+        # Daily analytics rollups (bookings / cancellations per day)
+        Index("ix_sessions_created_at", "created_at"),
+        Index("ix_sessions_cancelled_at", "cancelled_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     instructor_id = Column(
@@ -770,6 +846,10 @@ class Wallet(Base):
     currency = Column(String(3), nullable=False, default="INR")
     status = Column(ValueEnum(WalletStatus), nullable=False, default=WalletStatus.ACTIVE)
 
+    # Optimistic concurrency: bumped by every write; balances change only via
+    # atomic `balance = balance + delta` updates
+    version = Column(Integer, nullable=False, default=1)
+
     # Timestamps
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -783,6 +863,16 @@ class WalletTransaction(Base):
     """Wallet transaction ORM model for tracking all wallet operations."""
 
     __tablename__ = "wallet_transactions"
+    __table_args__ = (
+        # Date-ranged admin exports
+        Index("ix_wallet_transactions_created_at_id", "created_at", "id"),
+        # Per-wallet history (keyset pages) and ledger sums since a snapshot
+        Index("ix_wallet_transactions_wallet_created_id", "wallet_id", "created_at", "id"),
+        # Withdrawals settled since a snapshot
+        Index("ix_wallet_transactions_wallet_completed", "wallet_id", "completed_at"),
+        # Payout job: oldest pending withdrawals first
+        Index("ix_wallet_transactions_type_status_created", "type", "status", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     wallet_id = Column(
@@ -809,6 +899,12 @@ class WalletTransaction(Base):
     # Failure tracking
     failure_reason = Column(Text, nullable=True)
 
+    # Payouts: provider reference, and the payout job's claim on a pending
+    # withdrawal (claimed_at older than the claim TTL counts as unclaimed)
+    payout_reference = Column(String(100), nullable=True)
+    claim_token = Column(String(64), nullable=True)
+    claimed_at = Column(DateTime, nullable=True)
+
     # Timestamps
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     completed_at = Column(DateTime, nullable=True)
@@ -817,6 +913,35 @@ class WalletTransaction(Base):
     wallet = relationship("Wallet", back_populates="transactions")
 
 
+class WalletBalanceSnapshot(Base):
+    """
+    Wallet balances derived from the transaction ledger at a point in time.
+
+    Written periodically by app.database.snapshot_wallet_balances; balance
+    verification and "balance as of" only sum transactions after the latest
+    snapshot.
+    """
+
+    __tablename__ = "wallet_balance_snapshots"
+    __table_args__ = (
+        UniqueConstraint("wallet_id", "as_of", name="uq_wallet_balance_snapshots_wallet_as_of"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    wallet_id = Column(
+        Integer,
+        ForeignKey("wallets.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    as_of = Column(DateTime, nullable=False)  # Includes transactions up to and at this time
+
+    balance = Column(Numeric(12, 2), nullable=False)
+    total_earned = Column(Numeric(12, 2), nullable=False)
+    total_withdrawn = Column(Numeric(12, 2), nullable=False)
+
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
 # ============================================================================
 # Payment Models
 # ============================================================================
@@ -825,6 +950,14 @@ class Payment(Base):
     """Payment ORM model for tracking lesson booking payments."""
 
     __tablename__ = "payments"
+    __table_args__ = (
+        # Date-ranged admin exports
+        Index("ix_payments_created_at_id", "created_at", "id"),
+        # Daily analytics rollups (revenue per day)
+        Index("ix_payments_completed_at", "completed_at"),
+        # Stale checkout reaper (processing payments, oldest first)
+        Index("ix_payments_status_created_id", "status", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -890,3 +1023,57 @@ class Payment(Base):
     instructor = relationship("User", foreign_keys=[instructor_id])
     session = relationship("Session", foreign_keys=[session_id])
     slot = relationship("BookingSlot", foreign_keys=[slot_id])
+
+
+# ============================================================================
+# Analytics Models
+# ============================================================================
+
+class InstructorDailyRollup(Base):
+    """
+    Daily activity rollup per instructor.
+
+    Rebuilt a whole day at a time by the rollup refresh job from sessions
+    and payments; analytics endpoints read only these tables.
+    """
+
+    __tablename__ = "instructor_daily_rollups"
+    __table_args__ = (
+        # Per-instructor trend charts
+        Index("ix_instructor_daily_rollups_instructor_day", "instructor_id", "day"),
+    )
+
+    day = Column(Date, primary_key=True)  # UTC day
+    instructor_id = Column(Integer, ForeignKey("instructor_profiles.id", ondelete="CASCADE"), primary_key=True)
+
+    bookings = Column(Integer, nullable=False, default=0)
+    cancellations = Column(Integer, nullable=False, default=0)
+    completed_sessions = Column(Integer, nullable=False, default=0)
+    completed_minutes = Column(Integer, nullable=False, default=0)
+    gross_amount = Column(Numeric(12, 2), nullable=False, default=Decimal("0.00"))
+    platform_fee = Column(Numeric(12, 2), nullable=False, default=Decimal("0.00"))
+
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class PlatformDailyRollup(Base):
+    """
+    Platform-wide daily activity rollup.
+
+    Sum of the day's instructor rollups; written for every refreshed day,
+    including days without activity.
+    """
+
+    __tablename__ = "platform_daily_rollups"
+
+    day = Column(Date, primary_key=True)  # UTC day
+
+    bookings = Column(Integer, nullable=False, default=0)
+    cancellations = Column(Integer, nullable=False, default=0)
+    completed_sessions = Column(Integer, nullable=False, default=0)
+    completed_minutes = Column(Integer, nullable=False, default=0)
+    gross_amount = Column(Numeric(12, 2), nullable=False, default=Decimal("0.00"))
+    platform_fee = Column(Numeric(12, 2), nullable=False, default=Decimal("0.00"))
+    active_instructors = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -0,0 +1,68 @@
+"""
+Pay out pending withdrawals through the payout gateway.
+
+Meant to run on a schedule (e.g. every few minutes from cron). Several
+workers may run at once: each claims its own batches of
+PAYOUT_BATCH_SIZE withdrawals. Payouts the provider is still processing
+are re-checked once their claim is older than PAYOUT_CLAIM_TTL_SECONDS.
+
+Refuses to run unless a payout provider is configured (the mock one only
+with USE_MOCK_GATEWAY=true):
+
+    python -m app.database.process_payouts
+    python -m app.database.process_payouts --max-batches 10
+"""
+
+from sqlalchemy.orm import Session
+
+from app.application.use_cases.wallet import ProcessPayoutsUseCase
+from app.core.config import settings
+from app.core.dependencies import get_payout_gateway
+from app.domains.wallet.services import PayoutGatewayError
+from app.infrastructure.repositories.wallet_repository_impl import SQLAlchemyWalletRepository
+
+
+def build_use_case(db: Session) -> ProcessPayoutsUseCase:
+    """Wire the payout use case to SQLAlchemy repositories and the payout gateway."""
+    return ProcessPayoutsUseCase(
+        wallet_repo=SQLAlchemyWalletRepository(db),
+        payout_gateway=get_payout_gateway(),
+        commit=db.commit,
+        batch_size=settings.PAYOUT_BATCH_SIZE,
+        claim_ttl_seconds=settings.PAYOUT_CLAIM_TTL_SECONDS,
+    )
+
+
+if __name__ == "__main__":
+    """Run payouts as a standalone script."""
+    import argparse
+
+    from app.database.connection import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Pay out pending withdrawals")
+    parser.add_argument("--max-batches", type=int, help="Stop after this many batches")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        use_case = build_use_case(db)
+    except PayoutGatewayError as e:
+        db.close()
+        print(f"❌ Not running payouts: {e.message}")
+        raise SystemExit(1)
+
+    try:
+        result = use_case.execute(max_batches=args.max_batches)
+        print(
+            f"✅ Claimed {result.claimed} withdrawal(s) in {result.batches} batch(es): "
+            f"{result.completed} completed, {result.failed} failed, "
+            f"{result.processing} still processing"
+        )
+        for error in result.errors:
+            print(f"⚠️  Gateway error, batch released: {error}")
+    except Exception as e:
+        print(f"❌ Error during payout run: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
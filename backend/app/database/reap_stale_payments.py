@@ -0,0 +1,59 @@
+"""
+Fail checkouts abandoned mid-payment and release their slots.
+
+Meant to run on a schedule (e.g. every few minutes from cron). Payments
+still PROCESSING after PAYMENT_REAPER_STALE_MINUTES are checked with the
+gateway, PAYMENT_REAPER_CONCURRENCY at a time; those without a successful
+payment are marked failed, which frees their slot for booking:
+
+    python -m app.database.reap_stale_payments
+    python -m app.database.reap_stale_payments --max-batches 10
+"""
+
+from sqlalchemy.orm import Session
+
+from app.application.use_cases.booking import ReapStalePaymentsUseCase
+from app.core.config import settings
+from app.core.dependencies import get_payment_gateway
+from app.infrastructure.repositories.payment_repository_impl import PaymentRepositoryImpl
+
+
+def build_use_case(db: Session) -> ReapStalePaymentsUseCase:
+    """Wire the reaper use case to the SQLAlchemy repository and payment gateway."""
+    return ReapStalePaymentsUseCase(
+        payment_repo=PaymentRepositoryImpl(db),
+        payment_gateway=get_payment_gateway(),
+        stale_minutes=settings.PAYMENT_REAPER_STALE_MINUTES,
+        batch_size=settings.PAYMENT_REAPER_BATCH_SIZE,
+        concurrency=settings.PAYMENT_REAPER_CONCURRENCY,
+    )
+
+
+if __name__ == "__main__":
+    """Run the reaper as a standalone script."""
+    import argparse
+
+    from app.database.connection import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Fail stale processing payments")
+    parser.add_argument("--max-batches", type=int, help="Stop after this many batches")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        result = build_use_case(db).execute(max_batches=args.max_batches)
+        print(
+            f"✅ Reaped {result.reaped} of {result.scanned} stale payment(s) in "
+            f"{result.batches} batch(es): {result.expired} expired, {result.failed} failed, "
+            f"{result.slots_released} slot(s) released"
+        )
+        if result.paid_unconfirmed:
+            print(f"⚠️  {result.paid_unconfirmed} payment(s) paid at the gateway but never confirmed")
+        if result.check_errors:
+            print(f"⚠️  {result.check_errors} payment(s) could not be checked, retried next run")
+    except Exception as e:
+        print(f"❌ Error during reaper run: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
@@ -0,0 +1,55 @@
+"""
+Rebuild the student_stats projection from session and payment history.
+
+Use after deploying the student_stats table, or to repair drift:
+
+    python -m app.database.rebuild_student_stats
+    python -m app.database.rebuild_student_stats --student-id 42
+"""
+
+from sqlalchemy.orm import Session
+
+from app.application.use_cases.student import RebuildStudentStatsUseCase
+from app.infrastructure.repositories.student_repository_impl import SQLAlchemyStudentProfileRepository
+from app.infrastructure.repositories.student_stats_repository_impl import SQLAlchemyStudentStatsRepository
+from app.infrastructure.repositories.session_repository_impl import SessionRepositoryImpl
+from app.infrastructure.repositories.payment_repository_impl import PaymentRepositoryImpl
+
+
+def build_use_case(db: Session) -> RebuildStudentStatsUseCase:
+    """Wire the rebuild use case to SQLAlchemy repositories."""
+    return RebuildStudentStatsUseCase(
+        student_repo=SQLAlchemyStudentProfileRepository(db),
+        stats_repo=SQLAlchemyStudentStatsRepository(db),
+        session_repo=SessionRepositoryImpl(db),
+        payment_repo=PaymentRepositoryImpl(db),
+    )
+
+
+if __name__ == "__main__":
+    """Run rebuild as a standalone script."""
+    import argparse
+
+    from app.database.connection import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Rebuild student_stats from history")
+    parser.add_argument("--student-id", type=int, help="Rebuild a single student profile")
+    parser.add_argument("--batch-size", type=int, default=100, help="Student profiles per page")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        use_case = build_use_case(db)
+        if args.student_id:
+            use_case.execute(args.student_id)
+            rebuilt = 1
+        else:
+            rebuilt = use_case.execute_all(batch_size=args.batch_size)
+        db.commit()
+        print(f"✅ Rebuilt stats for {rebuilt} student(s)")
+    except Exception as e:
+        print(f"❌ Error during rebuild: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
@@ -0,0 +1,59 @@
+"""
+Refresh the daily analytics rollups from sessions and payments.
+
+Meant to run on a schedule (e.g. hourly cron). Without arguments it
+continues from the latest rolled-up day, re-rolling the last
+ANALYTICS_ROLLUP_LOOKBACK_DAYS; days are replaced wholesale, so re-runs
+and overlapping ranges are safe:
+
+    python -m app.database.refresh_daily_rollups
+    python -m app.database.refresh_daily_rollups --start 2025-01-01 --end 2025-12-31
+"""
+
+from decimal import Decimal
+
+from sqlalchemy.orm import Session
+
+from app.application.use_cases.admin import RefreshDailyRollupsUseCase
+from app.core.config import settings
+from app.infrastructure.repositories.daily_rollup_repository_impl import SQLAlchemyDailyRollupRepository
+
+
+def build_use_case(db: Session) -> RefreshDailyRollupsUseCase:
+    """Wire the refresh use case to SQLAlchemy repositories."""
+    return RefreshDailyRollupsUseCase(
+        rollup_repo=SQLAlchemyDailyRollupRepository(db),
+        platform_fee_percent=Decimal(settings.PLATFORM_FEE_PERCENT),
+        lookback_days=settings.ANALYTICS_ROLLUP_LOOKBACK_DAYS,
+    )
+
+
+if __name__ == "__main__":
+    """Run refresh as a standalone script."""
+    import argparse
+    from datetime import date
+
+    from app.database.connection import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Refresh daily analytics rollups")
+    parser.add_argument("--start", type=date.fromisoformat, help="First day to refresh (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, help="Last day to refresh (default: today, UTC)")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        result = build_use_case(db).execute(start=args.start, end=args.end)
+        db.commit()
+        if result.days:
+            print(
+                f"✅ Refreshed {result.days} day(s) {result.start} → {result.end} "
+                f"({result.instructor_rows} instructor row(s))"
+            )
+        else:
+            print("✅ Nothing to roll up yet")
+    except Exception as e:
+        print(f"❌ Error during rollup refresh: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
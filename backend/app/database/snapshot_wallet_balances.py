@@ -0,0 +1,53 @@
+"""
+Record wallet balance snapshots from the transaction ledger.
+
+Meant to run on a schedule (e.g. nightly cron). Each run snapshots the
+wallets with transactions since their previous snapshot, up to a cutoff
+WALLET_SNAPSHOT_SETTLE_SECONDS behind now; balance verification and
+"balance as of" then only sum transactions after the latest snapshot:
+
+    python -m app.database.snapshot_wallet_balances
+    python -m app.database.snapshot_wallet_balances --as-of 2025-12-31T23:59:59
+"""
+
+from sqlalchemy.orm import Session
+
+from app.application.use_cases.wallet import SnapshotWalletBalancesUseCase
+from app.core.config import settings
+from app.infrastructure.repositories.wallet_repository_impl import SQLAlchemyWalletRepository
+
+
+def build_use_case(db: Session) -> SnapshotWalletBalancesUseCase:
+    """Wire the snapshot use case to SQLAlchemy repositories."""
+    return SnapshotWalletBalancesUseCase(
+        wallet_repo=SQLAlchemyWalletRepository(db),
+        settle_seconds=settings.WALLET_SNAPSHOT_SETTLE_SECONDS,
+        batch_size=settings.WALLET_SNAPSHOT_BATCH_SIZE,
+    )
+
+
+if __name__ == "__main__":
+    """Run snapshots as a standalone script."""
+    import argparse
+    from datetime import datetime
+
+    from app.database.connection import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Snapshot wallet balances from the ledger")
+    parser.add_argument("--as-of", type=datetime.fromisoformat, help="Cutoff (UTC, default: now minus settle time)")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        result = build_use_case(db).execute(as_of=args.as_of)
+        db.commit()
+        print(
+            f"✅ Snapshotted {result.snapshots} of {result.wallets} wallet(s) "
+            f"as of {result.as_of.isoformat()}"
+        )
+    except Exception as e:
+        print(f"❌ Error during wallet snapshot: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
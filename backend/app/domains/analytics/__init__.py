@@ -0,0 +1,11 @@
+"""Analytics domain module."""
+
+from .entities import DailyMetrics, InstructorDailyRollup, PlatformDailyRollup
+from .repositories import IDailyRollupRepository
+
+__all__ = [
+    "DailyMetrics",
+    "InstructorDailyRollup",
+    "PlatformDailyRollup",
+    "IDailyRollupRepository",
+]
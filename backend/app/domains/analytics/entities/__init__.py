@@ -0,0 +1,9 @@
+"""Analytics domain entities."""
+
+from .daily_rollup import DailyMetrics, InstructorDailyRollup, PlatformDailyRollup
+
+__all__ = [
+    "DailyMetrics",
+    "InstructorDailyRollup",
+    "PlatformDailyRollup",
+]
@@ -0,0 +1,92 @@
+"""Daily rollup entities (read-model projections for analytics)."""
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Iterable, Optional
+
+
+CENT = Decimal("0.01")
+
+
+@dataclass
+class DailyMetrics:
+    """
+    Activity counters for one UTC day.
+
+    - bookings: sessions booked (created) that day
+    - cancellations: sessions cancelled that day
+    - completed_sessions / completed_minutes: completed sessions starting that day
+    - gross_amount: payments completed that day
+    - platform_fee: platform's share of gross_amount
+    """
+
+    day: date
+    bookings: int = 0
+    cancellations: int = 0
+    completed_sessions: int = 0
+    completed_minutes: int = 0
+    gross_amount: Decimal = Decimal("0.00")
+    platform_fee: Decimal = Decimal("0.00")
+    updated_at: Optional[datetime] = None
+
+    @property
+    def instructor_earnings(self) -> Decimal:
+        """Gross amount minus the platform fee."""
+        return self.gross_amount - self.platform_fee
+
+    def apply_platform_fee(self, fee_percent: Decimal) -> None:
+        """
+        Set platform_fee from gross_amount.
+
+        Args:
+            fee_percent: Platform fee percentage, e.g. 20
+        """
+        self.platform_fee = (
+            self.gross_amount * Decimal(fee_percent) / Decimal("100")
+        ).quantize(CENT, rounding=ROUND_HALF_UP)
+
+    def add(self, other: "DailyMetrics") -> None:
+        """Accumulate another row's counters into this one."""
+        self.bookings += other.bookings
+        self.cancellations += other.cancellations
+        self.completed_sessions += other.completed_sessions
+        self.completed_minutes += other.completed_minutes
+        self.gross_amount += other.gross_amount
+        self.platform_fee += other.platform_fee
+
+
+@dataclass
+class InstructorDailyRollup(DailyMetrics):
+    """Daily metrics for one instructor."""
+
+    instructor_id: int = 0  # Instructor profile ID
+
+
+@dataclass
+class PlatformDailyRollup(DailyMetrics):
+    """Platform-wide daily metrics."""
+
+    active_instructors: int = 0  # Instructors with any activity that day
+
+    @classmethod
+    def from_instructor_rollups(
+        cls,
+        day: date,
+        rollups: Iterable[InstructorDailyRollup],
+    ) -> "PlatformDailyRollup":
+        """
+        Sum one day's instructor rollups.
+
+        Args:
+            day: The day being summed
+            rollups: That day's instructor rollups
+
+        Returns:
+            PlatformDailyRollup (all zeros if there are no rollups)
+        """
+        platform = cls(day=day, updated_at=datetime.utcnow())
+        for rollup in rollups:
+            platform.add(rollup)
+            platform.active_instructors += 1
+        return platform
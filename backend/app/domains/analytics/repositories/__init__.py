@@ -0,0 +1,7 @@
+"""Analytics domain repository interfaces."""
+
+from .daily_rollup_repository import IDailyRollupRepository
+
+__all__ = [
+    "IDailyRollupRepository",
+]
@@ -0,0 +1,107 @@
+"""Daily rollup repository interface."""
+
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import List, Optional
+
+from ..entities import InstructorDailyRollup, PlatformDailyRollup
+
+
+class IDailyRollupRepository(ABC):
+    """
+    Repository interface for the daily analytics rollups.
+
+    Rollups are written a whole day at a time by the refresh job, from
+    sessions and payments, and are the only thing analytics reads.
+    """
+
+    @abstractmethod
+    def aggregate_instructor_days(self, start: date, end: date) -> List[InstructorDailyRollup]:
+        """
+        Compute instructor rollups from sessions and payments.
+
+        Args:
+            start: First day (UTC) included
+            end: Last day (UTC) included
+
+        Returns:
+            One rollup per instructor and day with any activity, with
+            platform_fee not yet applied
+        """
+        pass
+
+    @abstractmethod
+    def replace_days(
+        self,
+        start: date,
+        end: date,
+        instructor_rollups: List[InstructorDailyRollup],
+        platform_rollups: List[PlatformDailyRollup],
+    ) -> None:
+        """
+        Replace all stored rollups for a range of days.
+
+        Existing rows for the range are deleted first, so re-running the
+        same range is idempotent.
+
+        Args:
+            start: First day included
+            end: Last day included
+            instructor_rollups: New instructor rows for the range
+            platform_rollups: New platform rows for the range
+        """
+        pass
+
+    @abstractmethod
+    def get_latest_day(self) -> Optional[date]:
+        """
+        Get the most recent day that has been rolled up.
+
+        Returns:
+            Latest platform rollup day, or None if nothing is rolled up yet
+        """
+        pass
+
+    @abstractmethod
+    def get_earliest_activity_day(self) -> Optional[date]:
+        """
+        Get the first day with any session or payment activity.
+
+        Returns:
+            Earliest activity day, or None if there is no activity
+        """
+        pass
+
+    @abstractmethod
+    def get_platform_days(self, start: date, end: date) -> List[PlatformDailyRollup]:
+        """
+        Get platform rollups for a range of days.
+
+        Args:
+            start: First day included
+            end: Last day included
+
+        Returns:
+            Rollups ordered by day (days not yet rolled up are missing)
+        """
+        pass
+
+    @abstractmethod
+    def get_instructor_days(
+        self,
+        instructor_id: int,
+        start: date,
+        end: date,
+    ) -> List[InstructorDailyRollup]:
+        """
+        Get one instructor's rollups for a range of days.
+
+        Args:
+            instructor_id: Instructor profile ID
+            start: First day included
+            end: Last day included
+
+        Returns:
+            Rollups ordered by day (days without activity are missing)
+        """
+        pass
@@ -1,10 +1,11 @@
 """Instructor profile repository interface."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, List, Tuple
+from datetime import datetime
+from typing import Optional, List, Tuple, Dict, Iterable
 
 from ..entities import InstructorProfile
-from ..value_objects import InstructorStatus
+from ..value_objects import InstructorStatus, InstructorSearchCriteria, InstructorSearchFacets
 from app.domains.user.entities import User
 
 
@@ -49,6 +50,22 @@ class IInstructorProfileRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_many(self, instructor_ids: Iterable[int]) -> Dict[int, InstructorProfile]:
+        """
+        Retrieve several instructor profiles by ID in one query.
+
+        Args:
+            instructor_ids: Instructor profile identifiers (duplicates are ignored).
+
+        Returns:
+            Dict of profile ID to InstructorProfile; missing profiles are omitted.
+
+        Raises:
+            RepositoryError: If database operation fails.
+        """
+        pass
+
     @abstractmethod
     def get_by_user_id(self, user_id: int) -> Optional[InstructorProfile]:
         """
@@ -71,17 +88,96 @@ class IInstructorProfileRepository(ABC):
         status: Optional[InstructorStatus] = None,
         skip: int = 0,
         limit: int = 100,
+        search: Optional[str] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+        newest_first: bool = True,
     ) -> List[InstructorProfile]:
         """
         Retrieve all instructor profiles with optional filtering.
 
         Args:
             status: Optional filter by InstructorStatus.
+            skip: Number of records to skip (ignored when after is given).
+            limit: Maximum number of records to return.
+            search: Case-insensitive prefix of the instructor's email, first
+                name or last name ("first last" matches both names).
+            after: Keyset cursor - (created_at, id) of the last profile of
+                the previous page.
+            newest_first: Order by (created_at, id) descending (default);
+                False for oldest first, e.g. review queues.
+
+        Returns:
+            List of InstructorProfile instances ordered by (created_at, id).
+
+        Raises:
+            RepositoryError: If database operation fails.
+        """
+        pass
+
+    @abstractmethod
+    def search(
+        self,
+        criteria: InstructorSearchCriteria,
+        skip: int = 0,
+        limit: int = 20,
+    ) -> Tuple[List[InstructorProfile], int]:
+        """
+        Search instructor profiles.
+
+        Filtering, ordering and pagination are applied by the data store.
+
+        Args:
+            criteria: Filters and sort order.
             skip: Number of records to skip (pagination).
             limit: Maximum number of records to return.
 
         Returns:
-            List of InstructorProfile instances.
+            Tuple of (page of InstructorProfile instances, total matching count).
+
+        Raises:
+            RepositoryError: If database operation fails.
+        """
+        pass
+
+    @abstractmethod
+    def search_ranked(
+        self,
+        criteria: InstructorSearchCriteria,
+        limit: int = 20,
+        after: Optional[Tuple[float, int]] = None,
+    ) -> Tuple[List[Tuple[InstructorProfile, float]], int]:
+        """
+        Full-text search over headline, bio, teaching experience and subjects.
+
+        Results match criteria.text_query plus all other filters and are
+        ordered best match first (lower rank is better), ties broken by ID.
+
+        Args:
+            criteria: Filters including text_query.
+            limit: Maximum number of records to return.
+            after: (rank, instructor_id) of the last hit on the previous page.
+
+        Returns:
+            Tuple of (list of (InstructorProfile, rank), total matching count).
+
+        Raises:
+            RepositoryError: If database operation fails.
+        """
+        pass
+
+    @abstractmethod
+    def get_search_facets(self, criteria: InstructorSearchCriteria) -> InstructorSearchFacets:
+        """
+        Count matching instructors per language, price bucket and subject.
+
+        Each facet ignores the criteria's own dimension (e.g. language counts
+        ignore criteria.language). All facets are computed in one round trip.
+
+        Args:
+            criteria: Current search filters.
+
+        Returns:
+            InstructorSearchFacets for the criteria.
 
         Raises:
             RepositoryError: If database operation fails.
@@ -137,6 +233,20 @@ class IInstructorProfileRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def count_by_status(self) -> Dict[InstructorStatus, int]:
+        """
+        Count instructor profiles grouped by status in a single query.
+
+        Returns:
+            Dictionary mapping status to number of profiles; statuses
+            without profiles are absent.
+
+        Raises:
+            RepositoryError: If database operation fails.
+        """
+        pass
+
     @abstractmethod
     def get_dashboard_data(self, user_id: int) -> Optional[Tuple[InstructorProfile, User]]:
         """
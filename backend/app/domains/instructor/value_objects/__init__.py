@@ -5,6 +5,8 @@ from .language_proficiency import Language, LanguageProficiency, ProficiencyLeve
 from .pricing import Pricing
 from .rating import Rating
 from .dashboard_stats import DashboardStats
+from .search_criteria import InstructorSearchCriteria, InstructorSortOrder
+from .search_facets import FacetCount, InstructorSearchFacets, PriceBucket, PRICE_BUCKETS
 
 __all__ = [
     "InstructorStatus",
@@ -14,4 +16,10 @@ __all__ = [
     "Pricing",
     "Rating",
     "DashboardStats",
+    "InstructorSearchCriteria",
+    "InstructorSortOrder",
+    "FacetCount",
+    "InstructorSearchFacets",
+    "PriceBucket",
+    "PRICE_BUCKETS",
 ]
@@ -17,6 +17,8 @@ class DashboardStats:
     completed_sessions: int
     total_earnings: Decimal
     profile_completion_percent: int
+    sessions_this_month: int = 0
+    earnings_this_month: Decimal = Decimal("0.00")
 
     def __post_init__(self):
         """Validate stats on creation."""
@@ -30,6 +32,10 @@ class DashboardStats:
             raise ValueError("Total earnings cannot be negative")
         if not 0 <= self.profile_completion_percent <= 100:
             raise ValueError("Profile completion must be between 0 and 100")
+        if self.sessions_this_month < 0:
+            raise ValueError("Sessions this month cannot be negative")
+        if self.earnings_this_month < 0:
+            raise ValueError("Earnings this month cannot be negative")
 
     @classmethod
     def create_empty(cls) -> "DashboardStats":
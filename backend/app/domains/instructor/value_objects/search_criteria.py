@@ -0,0 +1,86 @@
+"""InstructorSearchCriteria value object for instructor search."""
+
+from dataclasses import dataclass
+from decimal import Decimal
+from enum import Enum
+from typing import Optional
+
+from .instructor_status import InstructorStatus
+
+
+class InstructorSortOrder(str, Enum):
+    """Result ordering for instructor search."""
+
+    RECOMMENDED = "recommended"  # Best rated first
+    PRICE_LOW = "price_low"
+    PRICE_HIGH = "price_high"
+    NEWEST = "newest"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+@dataclass(frozen=True)
+class InstructorSearchCriteria:
+    """
+    Immutable value object describing an instructor search.
+
+    Repositories translate it into a single filtered, ordered query so
+    filtering and pagination happen in the database.
+    """
+
+    status: Optional[InstructorStatus] = InstructorStatus.VERIFIED
+    text_query: Optional[str] = None
+    min_price: Optional[Decimal] = None
+    max_price: Optional[Decimal] = None
+    language: Optional[str] = None
+    subject_id: Optional[int] = None
+    subject_slug: Optional[str] = None
+    category: Optional[str] = None
+    sort: InstructorSortOrder = InstructorSortOrder.RECOMMENDED
+
+    def __post_init__(self):
+        """Validate and normalize criteria on creation."""
+        if self.min_price is not None and self.min_price < 0:
+            raise ValueError("Minimum price cannot be negative")
+        if self.max_price is not None and self.max_price < 0:
+            raise ValueError("Maximum price cannot be negative")
+        if (
+            self.min_price is not None
+            and self.max_price is not None
+            and self.min_price > self.max_price
+        ):
+            raise ValueError("Invalid price range: minimum price is greater than maximum price")
+
+        if self.text_query is not None:
+            # Collapse whitespace so equivalent queries compare equal
+            object.__setattr__(self, 'text_query', " ".join(self.text_query.split()) or None)
+
+        # Normalize language the same way Language does ("english" -> "English")
+        if self.language is not None:
+            language = self.language.strip()
+            object.__setattr__(self, 'language', language.title() if language else None)
+
+        if self.subject_slug is not None:
+            object.__setattr__(self, 'subject_slug', self.subject_slug.strip().lower() or None)
+        if self.category is not None:
+            object.__setattr__(self, 'category', self.category.strip() or None)
+
+    @property
+    def is_text_search(self) -> bool:
+        """Check if results should be ranked by a free-text query."""
+        return self.text_query is not None
+
+    @property
+    def has_price_filter(self) -> bool:
+        """Check if a price range was requested."""
+        return self.min_price is not None or self.max_price is not None
+
+    @property
+    def has_subject_filter(self) -> bool:
+        """Check if results must teach a given subject or category."""
+        return (
+            self.subject_id is not None
+            or self.subject_slug is not None
+            or self.category is not None
+        )
@@ -0,0 +1,52 @@
+"""Facet value objects for instructor search."""
+
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Optional, Tuple
+
+
+@dataclass(frozen=True)
+class PriceBucket:
+    """Hourly-rate range used for the price facet: min_price <= rate < max_price."""
+
+    key: str
+    min_price: Decimal
+    max_price: Optional[Decimal] = None  # None = no upper bound
+
+    @property
+    def label(self) -> str:
+        """Human readable range, e.g. "15-30" or "50+"."""
+        if self.max_price is None:
+            return f"{self.min_price}+"
+        return f"{self.min_price}-{self.max_price}"
+
+
+PRICE_BUCKETS: Tuple[PriceBucket, ...] = (
+    PriceBucket(key="under_15", min_price=Decimal("0"), max_price=Decimal("15")),
+    PriceBucket(key="15_30", min_price=Decimal("15"), max_price=Decimal("30")),
+    PriceBucket(key="30_50", min_price=Decimal("30"), max_price=Decimal("50")),
+    PriceBucket(key="50_plus", min_price=Decimal("50")),
+)
+
+
+@dataclass(frozen=True)
+class FacetCount:
+    """Number of matching instructors for one facet value."""
+
+    key: str
+    label: str
+    count: int
+
+
+@dataclass(frozen=True)
+class InstructorSearchFacets:
+    """
+    Immutable value object with sidebar counts for an instructor search.
+
+    Each facet is counted against the current filters except its own
+    dimension, so selecting a language still shows counts for the others.
+    """
+
+    languages: Tuple[FacetCount, ...] = ()
+    price_buckets: Tuple[FacetCount, ...] = ()
+    subjects: Tuple[FacetCount, ...] = ()
@@ -1,7 +1,7 @@
 """Message repository interface (Port)."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 from ..entities import Message
 from ..value_objects import MessageStatus
@@ -128,3 +128,28 @@ class IMessageRepository(ABC):
             Total unread count
         """
         pass
+
+    @abstractmethod
+    def search_messages(
+        self,
+        user_id: int,
+        query: str,
+        conversation_id: Optional[int] = None,
+        limit: int = 20,
+        after: Optional[Tuple[float, int]] = None,
+    ) -> List[Tuple[Message, float]]:
+        """
+        Full-text search over messages in a user's conversations.
+
+        Args:
+            user_id: User performing the search (must be a participant)
+            query: Free-text query
+            conversation_id: Optional conversation to restrict the search to
+            limit: Maximum number of hits
+            after: (rank, message_id) of the last hit on the previous page
+
+        Returns:
+            List of (message, rank) tuples, best match first.
+            Lower rank is better.
+        """
+        pass
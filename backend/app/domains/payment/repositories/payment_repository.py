@@ -6,7 +6,9 @@ Following the repository pattern from DDD.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
 
 from app.domains.payment.entities.payment import Payment
 from app.domains.payment.value_objects.enums import PaymentStatus
@@ -135,6 +137,8 @@ class IPaymentRepository(ABC):
     def get_processing_payments_older_than(
         self,
         minutes: int,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, int]] = None,
     ) -> List[Payment]:
         """
         Get processing payments older than specified minutes.
@@ -143,9 +147,28 @@ class IPaymentRepository(ABC):
 
         Args:
             minutes: Age threshold in minutes
+            limit: Maximum number of payments returned (None: all)
+            after: Keyset cursor - (created_at, id) of the last payment of
+                the previous batch
 
         Returns:
-            List of stale processing payments
+            List of stale processing payments, oldest first
+        """
+        pass
+
+    @abstractmethod
+    def fail_processing_payments(self, reasons: Dict[int, str]) -> Dict[int, int]:
+        """
+        Mark processing payments as failed in one statement.
+
+        Payments that have left PROCESSING in the meantime (e.g. confirmed
+        by a late callback) are left untouched.
+
+        Args:
+            reasons: Failure reason by payment ID
+
+        Returns:
+            Slot ID by payment ID, for the payments actually failed
         """
         pass
 
@@ -166,3 +189,21 @@ class IPaymentRepository(ABC):
             Count of payments
         """
         pass
+
+    @abstractmethod
+    def sum_by_student_id(
+        self,
+        student_id: int,
+        status: Optional[PaymentStatus] = None,
+    ) -> Decimal:
+        """
+        Sum payment amounts by student ID.
+
+        Args:
+            student_id: Student identifier
+            status: Optional filter by status
+
+        Returns:
+            Total amount (0.00 if no payments)
+        """
+        pass
@@ -1,9 +1,15 @@
 """Payment domain services."""
 
-from app.domains.payment.services.payment_gateway import IPaymentGateway, GatewayOrder, GatewayVerificationResult
+from app.domains.payment.services.payment_gateway import (
+    IPaymentGateway,
+    GatewayOrder,
+    GatewayOrderStatus,
+    GatewayVerificationResult,
+)
 
 __all__ = [
     "IPaymentGateway",
     "GatewayOrder",
+    "GatewayOrderStatus",
     "GatewayVerificationResult",
 ]
@@ -46,6 +46,28 @@ class GatewayVerificationResult:
     payment_method: Optional[str] = None
 
 
+@dataclass
+class GatewayOrderStatus:
+    """
+    Value object representing an order's state at the gateway.
+
+    status is the gateway's order status: "created" (checkout never
+    attempted), "attempted" (no successful payment) or "paid".
+    """
+
+    order_id: str
+    status: str
+    payment_id: Optional[str] = None  # Captured payment, if paid
+
+    @property
+    def is_paid(self) -> bool:
+        return self.status == "paid"
+
+    @property
+    def was_attempted(self) -> bool:
+        return self.status == "attempted"
+
+
 @dataclass
 class RefundResult:
     """
@@ -140,6 +162,22 @@ class IPaymentGateway(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_order_status(self, order_id: str) -> GatewayOrderStatus:
+        """
+        Get an order's payment state from the gateway.
+
+        Args:
+            order_id: Gateway's order reference
+
+        Returns:
+            GatewayOrderStatus for the order
+
+        Raises:
+            PaymentGatewayError: If fetching fails
+        """
+        pass
+
     @abstractmethod
     def refund_payment(
         self,
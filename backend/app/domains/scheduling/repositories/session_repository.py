@@ -2,10 +2,15 @@
 
 from abc import ABC, abstractmethod
 from datetime import datetime, date
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from ..entities import Session
-from ..value_objects import SessionStatus
+from ..value_objects import (
+    SessionStatus,
+    InstructorSessionStats,
+    StudentSessionStats,
+    StudentInstructorSummary,
+)
 
 
 class ISessionRepository(ABC):
@@ -42,6 +47,19 @@ class ISessionRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_many(self, session_ids: Iterable[int]) -> Dict[int, Session]:
+        """
+        Get several sessions by ID in one query.
+
+        Args:
+            session_ids: Session IDs (duplicates are ignored)
+
+        Returns:
+            Dict of session ID to Session; missing sessions are omitted
+        """
+        pass
+
     @abstractmethod
     def get_by_instructor(
         self,
@@ -86,6 +104,97 @@ class ISessionRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_past_by_student(
+        self,
+        student_id: int,
+        limit: int = 20,
+        offset: int = 0
+    ) -> List[Session]:
+        """
+        Get one page of a student's past sessions, most recent first.
+
+        Past means finished (completed, cancelled, no-show) or already ended.
+
+        Args:
+            student_id: The student's profile ID
+            limit: Maximum number of sessions
+            offset: Number of sessions to skip
+
+        Returns:
+            List of sessions
+        """
+        pass
+
+    @abstractmethod
+    def get_student_stats(self, student_id: int) -> StudentSessionStats:
+        """
+        Aggregate a student's completed sessions in a single query.
+
+        Args:
+            student_id: The student's profile ID
+
+        Returns:
+            StudentSessionStats (counts, minutes, distinct instructors)
+        """
+        pass
+
+    @abstractmethod
+    def get_instructor_summaries_for_student(
+        self,
+        student_id: int,
+        limit: int = 10
+    ) -> List[StudentInstructorSummary]:
+        """
+        Per-instructor session counts for a student, grouped in SQL.
+
+        Ordered by most recently completed session first (instructors with
+        no completed session last).
+
+        Args:
+            student_id: The student's profile ID
+            limit: Maximum number of instructors
+
+        Returns:
+            List of StudentInstructorSummary
+        """
+        pass
+
+    @abstractmethod
+    def has_completed_session_with(
+        self,
+        student_id: int,
+        instructor_id: int,
+        exclude_session_id: Optional[int] = None
+    ) -> bool:
+        """
+        Check whether a student has completed a session with an instructor.
+
+        Args:
+            student_id: The student's profile ID
+            instructor_id: The instructor's profile ID
+            exclude_session_id: Session ID to ignore
+
+        Returns:
+            True if such a completed session exists
+        """
+        pass
+
+    @abstractmethod
+    def get_completed_start_times_by_student(self, student_id: int) -> List[datetime]:
+        """
+        Start times of a student's completed sessions, most recent first.
+
+        Loads a single column (no entity mapping), for streak calculation.
+
+        Args:
+            student_id: The student's profile ID
+
+        Returns:
+            List of start datetimes
+        """
+        pass
+
     @abstractmethod
     def get_by_instructor_date_range(
         self,
@@ -182,6 +291,26 @@ class ISessionRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_instructor_stats(
+        self,
+        instructor_id: int,
+        period_start: Optional[datetime] = None
+    ) -> InstructorSessionStats:
+        """
+        Aggregate an instructor's sessions in a single query.
+
+        Args:
+            instructor_id: The instructor's profile ID
+            period_start: Start of the reporting period for
+                period_completed_sessions (None = all time)
+
+        Returns:
+            InstructorSessionStats (distinct students, completed and
+            upcoming counts)
+        """
+        pass
+
     @abstractmethod
     def get_recurring_series(self, parent_session_id: int) -> List[Session]:
         """
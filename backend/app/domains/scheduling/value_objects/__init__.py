@@ -5,6 +5,8 @@ from .recurrence_rule import RecurrenceRule, DayOfWeek, RecurrenceFrequency
 from .session_status import SessionStatus
 from .session_type import SessionType
 from .availability_type import AvailabilityType
+from .instructor_session_stats import InstructorSessionStats
+from .student_session_stats import StudentSessionStats, StudentInstructorSummary
 
 __all__ = [
     "TimeSlot",
@@ -14,4 +16,7 @@ __all__ = [
     "SessionStatus",
     "SessionType",
     "AvailabilityType",
+    "InstructorSessionStats",
+    "StudentSessionStats",
+    "StudentInstructorSummary",
 ]
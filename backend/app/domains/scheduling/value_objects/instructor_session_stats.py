@@ -0,0 +1,23 @@
+"""InstructorSessionStats value object."""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class InstructorSessionStats:
+    """
+    Immutable value object with session aggregates for one instructor.
+
+    Computed by the session repository in SQL, so its cost does not grow
+    with the number of sessions loaded into memory.
+    """
+
+    total_students: int = 0
+    completed_sessions: int = 0
+    upcoming_sessions: int = 0
+    period_completed_sessions: int = 0  # Completed sessions starting on/after period_start
+
+    @classmethod
+    def create_empty(cls) -> "InstructorSessionStats":
+        """Stats for an instructor with no sessions."""
+        return cls()
@@ -0,0 +1,33 @@
+"""Student session aggregate value objects."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class StudentSessionStats:
+    """
+    Immutable value object with completed-session aggregates for one student.
+
+    Computed by the session repository in SQL.
+    """
+
+    completed_sessions: int = 0
+    completed_minutes: int = 0
+    total_instructors: int = 0  # Distinct instructors with a completed session
+    trial_sessions_completed: int = 0
+
+    @classmethod
+    def create_empty(cls) -> "StudentSessionStats":
+        """Stats for a student with no completed sessions."""
+        return cls()
+
+
+@dataclass(frozen=True)
+class StudentInstructorSummary:
+    """Per-instructor session counts for one student."""
+
+    instructor_id: int
+    total_sessions: int
+    last_completed_at: Optional[datetime] = None
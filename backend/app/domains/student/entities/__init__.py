@@ -1,7 +1,9 @@
 """Student domain entities."""
 
 from .student_profile import StudentProfile
+from .student_stats import StudentStats
 
 __all__ = [
     "StudentProfile",
+    "StudentStats",
 ]
@@ -0,0 +1,215 @@
+"""StudentStats domain entity (read-model projection)."""
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Iterable, Optional
+
+
+def week_start(moment: datetime) -> date:
+    """Monday of the ISO week containing moment."""
+    day = moment.date() if isinstance(moment, datetime) else moment
+    return day - timedelta(days=day.weekday())
+
+
+@dataclass
+class StudentStats:
+    """
+    Pre-computed dashboard statistics for one student.
+
+    Maintained incrementally as sessions complete and payments succeed or
+    are refunded, so the dashboard stats card is a single-row read. Can
+    always be rebuilt from session and payment history with rebuild().
+
+    A streak is a run of consecutive ISO weeks with at least one completed
+    session.
+    """
+
+    student_id: int  # Student profile ID
+    total_sessions_completed: int = 0
+    total_minutes: int = 0
+    trial_sessions_completed: int = 0
+    unique_instructors: int = 0
+    total_spent: Decimal = Decimal("0.00")
+
+    # Streak ending at last_active_week
+    current_streak_weeks: int = 0
+    longest_streak_weeks: int = 0
+    last_active_week: Optional[date] = None  # Monday of the latest week with a session
+
+    updated_at: Optional[datetime] = None
+
+    # ========================================================================
+    # Factory Methods
+    # ========================================================================
+
+    @classmethod
+    def create_for_student(cls, student_id: int) -> "StudentStats":
+        """
+        Create empty stats for a student.
+
+        Args:
+            student_id: Student profile ID
+
+        Returns:
+            New StudentStats with all counters at zero
+        """
+        return cls(student_id=student_id, updated_at=datetime.utcnow())
+
+    @classmethod
+    def rebuild(
+        cls,
+        student_id: int,
+        total_sessions_completed: int,
+        total_minutes: int,
+        trial_sessions_completed: int,
+        unique_instructors: int,
+        total_spent: Decimal,
+        session_start_times: Iterable[datetime],
+    ) -> "StudentStats":
+        """
+        Recompute stats from history.
+
+        Args:
+            student_id: Student profile ID
+            total_sessions_completed: Number of completed sessions
+            total_minutes: Minutes of completed sessions
+            trial_sessions_completed: Number of completed trial sessions
+            unique_instructors: Distinct instructors with a completed session
+            total_spent: Sum of completed payments
+            session_start_times: Start times of completed sessions (any order)
+
+        Returns:
+            StudentStats equal to what incremental updates would produce
+        """
+        stats = cls(
+            student_id=student_id,
+            total_sessions_completed=total_sessions_completed,
+            total_minutes=total_minutes,
+            trial_sessions_completed=trial_sessions_completed,
+            unique_instructors=unique_instructors,
+            total_spent=total_spent,
+        )
+        stats.rebuild_streak(session_start_times)
+        return stats
+
+    # ========================================================================
+    # Incremental Updates
+    # ========================================================================
+
+    def record_session_completion(
+        self,
+        duration_minutes: int,
+        session_start: datetime,
+        is_trial: bool = False,
+        new_instructor: bool = False,
+    ) -> bool:
+        """
+        Record a completed session.
+
+        Args:
+            duration_minutes: Session length
+            session_start: Session start time (determines the streak week)
+            is_trial: Whether it was a trial session
+            new_instructor: Whether it's the student's first completed
+                session with this instructor
+
+        Returns:
+            False if the session falls before last_active_week, in which case
+            the streak can't be updated incrementally and must be rebuilt
+            with rebuild_streak(); True otherwise
+
+        Raises:
+            ValueError: If duration is negative
+        """
+        if duration_minutes < 0:
+            raise ValueError("Duration cannot be negative")
+
+        self.total_sessions_completed += 1
+        self.total_minutes += duration_minutes
+        if is_trial:
+            self.trial_sessions_completed += 1
+        if new_instructor:
+            self.unique_instructors += 1
+        self.updated_at = datetime.utcnow()
+
+        week = week_start(session_start)
+        if self.last_active_week is None or week > self.last_active_week + timedelta(days=7):
+            self.current_streak_weeks = 1
+        elif week == self.last_active_week + timedelta(days=7):
+            self.current_streak_weeks += 1
+        elif week < self.last_active_week:
+            return False
+        # else: same week, streak unchanged
+
+        self.last_active_week = week
+        self.longest_streak_weeks = max(self.longest_streak_weeks, self.current_streak_weeks)
+        return True
+
+    def record_payment(self, amount: Decimal) -> None:
+        """
+        Record a completed payment.
+
+        Args:
+            amount: Amount paid
+
+        Raises:
+            ValueError: If amount is negative
+        """
+        if amount < 0:
+            raise ValueError("Amount cannot be negative")
+
+        self.total_spent += amount
+        self.updated_at = datetime.utcnow()
+
+    def record_refund(self, amount: Decimal) -> None:
+        """
+        Remove a refunded payment from the total spent.
+
+        Args:
+            amount: Amount refunded
+
+        Raises:
+            ValueError: If amount is negative
+        """
+        if amount < 0:
+            raise ValueError("Amount cannot be negative")
+
+        self.total_spent = max(self.total_spent - amount, Decimal("0.00"))
+        self.updated_at = datetime.utcnow()
+
+    def rebuild_streak(self, session_start_times: Iterable[datetime]) -> None:
+        """Recompute streak fields from completed session start times."""
+        weeks = sorted({week_start(start) for start in session_start_times})
+
+        current = longest = 0
+        previous = None
+        for week in weeks:
+            current = current + 1 if previous and week == previous + timedelta(days=7) else 1
+            longest = max(longest, current)
+            previous = week
+
+        self.current_streak_weeks = current
+        self.longest_streak_weeks = longest
+        self.last_active_week = previous
+        self.updated_at = datetime.utcnow()
+
+    # ========================================================================
+    # Domain Properties
+    # ========================================================================
+
+    def streak_as_of(self, moment: datetime) -> int:
+        """
+        Current streak as seen at a point in time.
+
+        Counts back from the week containing moment, so the streak is 0
+        until the student has a completed session this week.
+        """
+        if self.last_active_week != week_start(moment):
+            return 0
+        return self.current_streak_weeks
+
+    @property
+    def total_hours(self) -> float:
+        """Total learning time in hours (one decimal)."""
+        return round(self.total_minutes / 60, 1)
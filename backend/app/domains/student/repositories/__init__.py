@@ -1,7 +1,9 @@
 """Student domain repository interfaces."""
 
 from .student_repository import IStudentProfileRepository
+from .student_stats_repository import IStudentStatsRepository
 
 __all__ = [
     "IStudentProfileRepository",
+    "IStudentStatsRepository",
 ]
@@ -0,0 +1,43 @@
+"""Student stats repository interface."""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from ..entities import StudentStats
+
+
+class IStudentStatsRepository(ABC):
+    """
+    Repository interface for the StudentStats projection.
+
+    One row per student profile; written by the use cases that complete
+    sessions and payments, read by the student dashboard.
+    """
+
+    @abstractmethod
+    def get_by_student_id(self, student_id: int, for_update: bool = False) -> Optional[StudentStats]:
+        """
+        Get stats for a student.
+
+        Args:
+            student_id: Student profile ID
+            for_update: Lock the row until the transaction ends (use before
+                an incremental update to avoid lost updates)
+
+        Returns:
+            StudentStats if found, None otherwise
+        """
+        pass
+
+    @abstractmethod
+    def save(self, stats: StudentStats) -> StudentStats:
+        """
+        Insert or update stats for a student.
+
+        Args:
+            stats: StudentStats to persist
+
+        Returns:
+            Persisted StudentStats
+        """
+        pass
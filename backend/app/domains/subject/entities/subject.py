@@ -19,6 +19,7 @@ class Subject:
 
     # Core Attributes
     name: str = None
+    slug: Optional[str] = None
     category: str = None
     description: Optional[str] = None
     icon_url: Optional[str] = None
@@ -1,9 +1,9 @@
 """InstructorSubject repository interface."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Dict
 
-from ..entities import InstructorSubject
+from ..entities import InstructorSubject, Subject
 
 
 class IInstructorSubjectRepository(ABC):
@@ -149,3 +149,20 @@ class IInstructorSubjectRepository(ABC):
             RepositoryError: If database operation fails.
         """
         pass
+
+    @abstractmethod
+    def get_subjects_for_instructors(self, instructor_ids: List[int]) -> Dict[int, List[Subject]]:
+        """
+        Batch-load the active subjects taught by several instructors.
+
+        Args:
+            instructor_ids: Instructor profile identifiers.
+
+        Returns:
+            Dict mapping instructor profile ID to its subjects ordered by
+            name (instructors without subjects are omitted).
+
+        Raises:
+            RepositoryError: If database operation fails.
+        """
+        pass
@@ -1,7 +1,8 @@
 """User repository interface (Port)."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Dict, Iterable, Tuple
 
 from ..entities import User
 from ..value_objects import Email, UserRole, UserStatus
@@ -45,6 +46,19 @@ class IUserRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_many(self, user_ids: Iterable[int]) -> Dict[int, User]:
+        """
+        Get several users by ID in one query.
+
+        Args:
+            user_ids: User IDs (duplicates are ignored)
+
+        Returns:
+            Dict of user ID to User; missing users are omitted
+        """
+        pass
+
     @abstractmethod
     def get_by_email(self, email: Email) -> Optional[User]:
         """
@@ -78,18 +92,24 @@ class IUserRepository(ABC):
         status: Optional[UserStatus] = None,
         skip: int = 0,
         limit: int = 100,
+        search: Optional[str] = None,
+        after: Optional[Tuple[datetime, int]] = None,
     ) -> List[User]:
         """
-        Get all users with optional filtering.
+        Get all users with optional filtering, newest first.
 
         Args:
             role: Filter by role
             status: Filter by status
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored when after is given)
             limit: Maximum number of records to return
+            search: Case-insensitive prefix of email, first name or last
+                name ("first last" matches both names)
+            after: Keyset cursor - (created_at, id) of the last user of the
+                previous page
 
         Returns:
-            List of users
+            List of users ordered by (created_at, id) descending
         """
         pass
 
@@ -136,3 +156,17 @@ class IUserRepository(ABC):
             Number of users matching criteria
         """
         pass
+
+    @abstractmethod
+    def count_by_role_and_status(self) -> Dict[Tuple[str, str], int]:
+        """
+        Count users grouped by role and status in a single query.
+
+        Keys are the stored values rather than enums, so statuses the domain
+        doesn't model (e.g. pending_verification) still count towards totals.
+
+        Returns:
+            Dictionary mapping (role value, status value) to number of users;
+            combinations without users are absent
+        """
+        pass
@@ -1,13 +1,14 @@
 """Wallet domain module."""
 
-from app.domains.wallet.entities import Wallet, WalletTransaction
+from app.domains.wallet.entities import Wallet, WalletTransaction, WalletBalanceSnapshot
 from app.domains.wallet.value_objects import (
     Money,
     WalletStatus,
     TransactionType,
     TransactionStatus,
+    BalanceChange,
 )
-from app.domains.wallet.repositories import IWalletRepository
+from app.domains.wallet.repositories import IWalletRepository, WalletConflictError
 from app.domains.wallet.events import (
     WalletCreated,
     FundsDeposited,
@@ -20,13 +21,16 @@ __all__ = [
     # Entities
     "Wallet",
     "WalletTransaction",
+    "WalletBalanceSnapshot",
     # Value Objects
     "Money",
     "WalletStatus",
     "TransactionType",
     "TransactionStatus",
+    "BalanceChange",
     # Repositories
     "IWalletRepository",
+    "WalletConflictError",
     # Events
     "WalletCreated",
     "FundsDeposited",
@@ -2,5 +2,6 @@
 
 from app.domains.wallet.entities.wallet import Wallet
 from app.domains.wallet.entities.wallet_transaction import WalletTransaction
+from app.domains.wallet.entities.balance_snapshot import WalletBalanceSnapshot
 
-__all__ = ["Wallet", "WalletTransaction"]
+__all__ = ["Wallet", "WalletTransaction", "WalletBalanceSnapshot"]
@@ -0,0 +1,61 @@
+"""Wallet balance snapshot entity."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+
+from app.domains.wallet.value_objects import BalanceChange
+
+
+@dataclass
+class WalletBalanceSnapshot:
+    """
+    A wallet's balances as derived from its ledger at a point in time.
+
+    Snapshots are computed from wallet transactions only (never copied from
+    the wallets row), so the balance at any later moment is the latest
+    snapshot plus the transactions since its as_of - and comparing that to
+    the wallets row verifies it.
+    """
+
+    wallet_id: int
+    as_of: Optional[datetime] = None  # None: before the wallet's first transaction
+    balance: Decimal = Decimal("0.00")
+    total_earned: Decimal = Decimal("0.00")
+    total_withdrawn: Decimal = Decimal("0.00")
+
+    id: Optional[int] = None
+    created_at: Optional[datetime] = None
+
+    def advance(self, change: BalanceChange, as_of: datetime) -> "WalletBalanceSnapshot":
+        """
+        Snapshot after applying the ledger change up to as_of.
+
+        Args:
+            change: Net effect of the transactions in (self.as_of, as_of]
+            as_of: Point in time of the new snapshot
+
+        Returns:
+            New (unsaved) snapshot
+        """
+        return WalletBalanceSnapshot(
+            wallet_id=self.wallet_id,
+            as_of=as_of,
+            balance=self.balance + change.balance,
+            total_earned=self.total_earned + change.total_earned,
+            total_withdrawn=self.total_withdrawn + change.total_withdrawn,
+        )
+
+    def difference(
+        self,
+        balance: Decimal,
+        total_earned: Decimal,
+        total_withdrawn: Decimal,
+    ) -> BalanceChange:
+        """Amounts by which the given balances exceed this snapshot."""
+        return BalanceChange(
+            balance=Decimal(balance) - self.balance,
+            total_earned=Decimal(total_earned) - self.total_earned,
+            total_withdrawn=Decimal(total_withdrawn) - self.total_withdrawn,
+        )
@@ -6,6 +6,7 @@ from decimal import Decimal
 from typing import Optional, List, Dict, Any
 
 from app.domains.wallet.value_objects import (
+    BalanceChange,
     Money,
     WalletStatus,
     TransactionType,
@@ -20,6 +21,12 @@ class Wallet:
 
     Manages balance, tracks lifetime earnings, and creates
     transactions for all wallet operations.
+
+    Balance-changing operations update the in-memory balances and also
+    record the change as deltas (pending_balance_change); the repository
+    applies those atomically in SQL and reports the resulting balances
+    back through apply_persisted_balances(). version is bumped on every
+    write and guards updates that aren't plain deltas (e.g. status).
     """
 
     # Identity
@@ -39,9 +46,16 @@ class Wallet:
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
+    # Optimistic concurrency version (incremented on every write)
+    version: int = 1
+
     # Domain events (transient)
     _domain_events: List = field(default_factory=list, init=False, repr=False)
 
+    # Unsaved balance deltas and the transactions that caused them (transient)
+    _pending_change: BalanceChange = field(default_factory=BalanceChange, init=False, repr=False)
+    _pending_transactions: List[WalletTransaction] = field(default_factory=list, init=False, repr=False)
+
     # ========================================================================
     # Factory Methods
     # ========================================================================
@@ -131,6 +145,10 @@ class Wallet:
             reference_id=reference_id,
             description=description,
         )
+        self._record_change(
+            BalanceChange(balance=amount.amount, total_earned=amount.amount),
+            transaction,
+        )
 
         # Emit event
         self._add_domain_event(
@@ -203,6 +221,7 @@ class Wallet:
             description=description,
             extra_data=extra_data,
         )
+        self._record_change(BalanceChange(balance=-amount.amount), transaction)
 
         # Emit event
         self._add_domain_event(
@@ -242,6 +261,7 @@ class Wallet:
         # Update lifetime withdrawn
         self.total_withdrawn += transaction.amount
         self.updated_at = datetime.utcnow()
+        self._record_change(BalanceChange(total_withdrawn=transaction.amount))
 
         # Emit event
         self._add_domain_event(
@@ -280,6 +300,7 @@ class Wallet:
         # Refund to balance
         self.balance += transaction.amount
         self.updated_at = datetime.utcnow()
+        self._record_change(BalanceChange(balance=transaction.amount))
 
         # Emit event
         self._add_domain_event(
@@ -339,6 +360,7 @@ class Wallet:
             session_id=session_id,
             description=description,
         )
+        self._record_change(BalanceChange(balance=-amount.amount), transaction)
 
         return transaction
 
@@ -365,6 +387,61 @@ class Wallet:
         self.status = WalletStatus.SUSPENDED
         self.updated_at = datetime.utcnow()
 
+    # ========================================================================
+    # Persistence Support
+    # ========================================================================
+
+    def _record_change(
+        self,
+        change: BalanceChange,
+        transaction: Optional[WalletTransaction] = None,
+    ) -> None:
+        """Remember a balance change until the repository persists it."""
+        self._pending_change = self._pending_change + change
+        if transaction is not None:
+            self._pending_transactions.append(transaction)
+
+    @property
+    def pending_balance_change(self) -> BalanceChange:
+        """Balance deltas not yet persisted."""
+        return self._pending_change
+
+    def apply_persisted_balances(
+        self,
+        balance: Decimal,
+        total_earned: Decimal,
+        total_withdrawn: Decimal,
+        version: int,
+    ) -> None:
+        """
+        Adopt the balances stored by an atomic update.
+
+        Other writers may have changed the wallet since it was loaded, so
+        the stored balances can differ from the in-memory ones; the pending
+        transactions' balance_after is corrected to match, walking back
+        from the stored balance.
+
+        Args:
+            balance: Balance after the update
+            total_earned: Lifetime earnings after the update
+            total_withdrawn: Lifetime withdrawals after the update
+            version: Wallet version after the update
+        """
+        running_balance = balance
+        for transaction in reversed(self._pending_transactions):
+            transaction.balance_after = running_balance
+            if transaction.type == TransactionType.DEPOSIT:
+                running_balance -= transaction.amount
+            else:
+                running_balance += transaction.amount
+
+        self.balance = balance
+        self.total_earned = total_earned
+        self.total_withdrawn = total_withdrawn
+        self.version = version
+        self._pending_change = BalanceChange()
+        self._pending_transactions.clear()
+
     # ========================================================================
     # Properties
     # ========================================================================
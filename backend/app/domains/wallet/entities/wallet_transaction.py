@@ -6,6 +6,7 @@ from decimal import Decimal
 from typing import Optional, Dict, Any, List
 
 from app.domains.wallet.value_objects import (
+    BalanceChange,
     Money,
     TransactionType,
     TransactionStatus,
@@ -42,6 +43,9 @@ class WalletTransaction:
     # Failure tracking
     failure_reason: Optional[str] = None
 
+    # Payout provider's reference, once a withdrawal has been paid out
+    payout_reference: Optional[str] = None
+
     # Timestamps
     created_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
@@ -230,6 +234,23 @@ class WalletTransaction:
         """Check if transaction completed successfully."""
         return self.status == TransactionStatus.COMPLETED
 
+    @property
+    def settlement_change(self) -> BalanceChange:
+        """
+        Wallet balance change from settling this withdrawal.
+
+        Same as Wallet.complete_withdrawal / fail_withdrawal: a completed
+        withdrawal adds to total_withdrawn, a failed one is refunded to
+        the balance. Zero for anything else.
+        """
+        if self.type != TransactionType.WITHDRAWAL:
+            return BalanceChange()
+        if self.status == TransactionStatus.COMPLETED:
+            return BalanceChange(total_withdrawn=self.amount)
+        if self.status == TransactionStatus.FAILED:
+            return BalanceChange(balance=self.amount)
+        return BalanceChange()
+
     @property
     def amount_money(self) -> Money:
         """Get amount as Money value object."""
@@ -1,5 +1,5 @@
 """Wallet repository interfaces."""
 
-from app.domains.wallet.repositories.wallet_repository import IWalletRepository
+from app.domains.wallet.repositories.wallet_repository import IWalletRepository, WalletConflictError
 
-__all__ = ["IWalletRepository"]
+__all__ = ["IWalletRepository", "WalletConflictError"]
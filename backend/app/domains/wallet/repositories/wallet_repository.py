@@ -1,10 +1,22 @@
 """Wallet repository interface (Port)."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, Optional, List, Tuple
 
-from app.domains.wallet.entities import Wallet, WalletTransaction
-from app.domains.wallet.value_objects import TransactionType, TransactionStatus
+from app.domains.wallet.entities import Wallet, WalletTransaction, WalletBalanceSnapshot
+from app.domains.wallet.value_objects import BalanceChange, TransactionType, TransactionStatus
+
+
+class WalletConflictError(ValueError):
+    """
+    A wallet update lost a race with a concurrent writer.
+
+    Raised when a debit would overdraw the stored balance or a versioned
+    update finds the wallet changed since it was loaded. Reload the wallet
+    and retry the operation.
+    """
 
 
 class IWalletRepository(ABC):
@@ -63,11 +75,21 @@ class IWalletRepository(ABC):
         """
         Update an existing wallet.
 
+        Pending balance changes are applied as atomic deltas
+        (balance = balance + delta), so concurrent deposits never lose
+        each other's credits; the wallet then carries the stored balances
+        and version. Without pending balance changes, the remaining fields
+        (status, ...) are written only if the wallet's version is unchanged.
+
         Args:
             wallet: Wallet with updated fields
 
         Returns:
             Updated wallet
+
+        Raises:
+            WalletConflictError: If a debit would overdraw the stored
+                balance, or the wallet changed since it was loaded
         """
         pass
 
@@ -105,16 +127,25 @@ class IWalletRepository(ABC):
 
     @abstractmethod
     def update_transaction(
-        self, transaction: WalletTransaction
+        self,
+        transaction: WalletTransaction,
+        expected_status: Optional[TransactionStatus] = None,
     ) -> WalletTransaction:
         """
         Update an existing transaction.
 
         Args:
             transaction: Transaction with updated fields
+            expected_status: If given, only update while the stored status
+                still is this one (guards status transitions such as
+                settling a pending withdrawal against concurrent settles)
 
         Returns:
             Updated transaction
+
+        Raises:
+            WalletConflictError: If the stored status is no longer
+                expected_status
         """
         pass
 
@@ -126,19 +157,22 @@ class IWalletRepository(ABC):
         status: Optional[TransactionStatus] = None,
         limit: int = 50,
         offset: int = 0,
+        after: Optional[Tuple[datetime, int]] = None,
     ) -> List[WalletTransaction]:
         """
-        Get transactions for a wallet with optional filters.
+        Get transactions for a wallet with optional filters, newest first.
 
         Args:
             wallet_id: Wallet ID
             transaction_type: Optional filter by type
             status: Optional filter by status
             limit: Max results (default 50)
-            offset: Pagination offset (default 0)
+            offset: Pagination offset (default 0, ignored when after is given)
+            after: Keyset cursor - (created_at, id) of the last transaction
+                of the previous page
 
         Returns:
-            List of transactions
+            List of transactions ordered by (created_at, id) descending
         """
         pass
 
@@ -176,3 +210,172 @@ class IWalletRepository(ABC):
             Transaction count
         """
         pass
+
+    @abstractmethod
+    def sum_transactions(
+        self,
+        wallet_id: int,
+        transaction_type: Optional[TransactionType] = None,
+        status: Optional[TransactionStatus] = None,
+        since: Optional[datetime] = None,
+    ) -> Decimal:
+        """
+        Sum transaction amounts for a wallet with optional filters.
+
+        Args:
+            wallet_id: Wallet ID
+            transaction_type: Optional filter by type
+            status: Optional filter by status
+            since: Optional lower bound on created_at (inclusive)
+
+        Returns:
+            Total amount (0.00 if nothing matches)
+        """
+        pass
+
+    # ========================================================================
+    # Ledger Snapshots
+    # ========================================================================
+
+    @abstractmethod
+    def get_wallet_ids(self, after_id: int = 0, limit: int = 500) -> List[int]:
+        """
+        Get wallet IDs in ascending order, for batch jobs.
+
+        Args:
+            after_id: Return only IDs greater than this
+            limit: Max results
+
+        Returns:
+            List of wallet IDs
+        """
+        pass
+
+    @abstractmethod
+    def get_latest_snapshots(
+        self,
+        wallet_ids: List[int],
+        as_of: Optional[datetime] = None,
+    ) -> Dict[int, WalletBalanceSnapshot]:
+        """
+        Get each wallet's most recent balance snapshot.
+
+        Args:
+            wallet_ids: Wallets to look up
+            as_of: Only consider snapshots taken at or before this time
+
+        Returns:
+            Snapshot by wallet ID (wallets without one are missing)
+        """
+        pass
+
+    @abstractmethod
+    def get_ledger_changes(
+        self,
+        windows: Dict[int, Optional[datetime]],
+        until: datetime,
+    ) -> Dict[int, BalanceChange]:
+        """
+        Net effect of each wallet's transactions over a window.
+
+        Args:
+            windows: Wallet ID -> exclusive start of its window (None for
+                the wallet's whole history)
+            until: Inclusive end of every window
+
+        Returns:
+            Change by wallet ID, for wallets with any transaction activity
+            in their window (see BalanceChange.from_ledger)
+        """
+        pass
+
+    @abstractmethod
+    def save_snapshots(self, snapshots: List[WalletBalanceSnapshot]) -> None:
+        """
+        Save new balance snapshots in bulk.
+
+        Args:
+            snapshots: Snapshots to insert
+        """
+        pass
+
+    # ========================================================================
+    # Payouts
+    # ========================================================================
+
+    @abstractmethod
+    def claim_pending_withdrawals(
+        self,
+        claim_token: str,
+        limit: int,
+        stale_before: datetime,
+    ) -> List[WalletTransaction]:
+        """
+        Claim the oldest unclaimed pending withdrawals for payout.
+
+        Atomic across concurrent payout workers: rows another worker is
+        claiming are skipped, not waited on. Claims made before
+        stale_before are treated as abandoned and can be claimed again.
+
+        Args:
+            claim_token: Unique token of this claim
+            limit: Max withdrawals to claim
+            stale_before: Claims older than this are expired
+
+        Returns:
+            The claimed withdrawals, oldest first
+        """
+        pass
+
+    @abstractmethod
+    def release_withdrawal_claims(self, claim_token: str, transaction_ids: List[int]) -> int:
+        """
+        Release claims so the withdrawals can be picked up again.
+
+        Args:
+            claim_token: Token the withdrawals were claimed with
+            transaction_ids: Withdrawals to release
+
+        Returns:
+            Number of claims released
+        """
+        pass
+
+    @abstractmethod
+    def settle_withdrawals(
+        self,
+        claim_token: str,
+        status: TransactionStatus,
+        outcomes: Dict[int, Optional[str]],
+        settled_at: datetime,
+    ) -> List[WalletTransaction]:
+        """
+        Complete or fail claimed withdrawals in bulk.
+
+        Only withdrawals still pending and still held by claim_token are
+        updated, so applying the same outcomes again is a no-op.
+
+        Args:
+            claim_token: Token the withdrawals were claimed with
+            status: COMPLETED or FAILED
+            outcomes: Transaction ID -> payout reference (COMPLETED) or
+                failure reason (FAILED)
+            settled_at: Completion time recorded on the transactions
+
+        Returns:
+            The withdrawals that were actually settled by this call
+        """
+        pass
+
+    @abstractmethod
+    def apply_balance_changes(self, changes: Dict[int, BalanceChange]) -> None:
+        """
+        Apply balance deltas to many wallets in one round trip.
+
+        Each wallet is updated atomically (balance = balance + delta) and
+        its version bumped, as in update().
+
+        Args:
+            changes: Wallet ID -> change to apply
+        """
+        pass
@@ -0,0 +1,17 @@
+"""Wallet domain services."""
+
+from app.domains.wallet.services.payout_gateway import (
+    IPayoutGateway,
+    PayoutGatewayError,
+    PayoutRequest,
+    PayoutResult,
+    PayoutStatus,
+)
+
+__all__ = [
+    "IPayoutGateway",
+    "PayoutGatewayError",
+    "PayoutRequest",
+    "PayoutResult",
+    "PayoutStatus",
+]
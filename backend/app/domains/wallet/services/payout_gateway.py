@@ -0,0 +1,90 @@
+"""
+Payout Gateway Interface (Port).
+
+Defines the contract for sending withdrawals to instructors' external
+accounts. Implementations (adapters) handle specific payout providers.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+
+class PayoutStatus(str, Enum):
+    """Outcome of a payout as reported by the provider."""
+
+    COMPLETED = "completed"  # Money sent
+    FAILED = "failed"  # Rejected; the withdrawal is refunded to the wallet
+    PROCESSING = "processing"  # Accepted, final outcome not known yet
+
+
+@dataclass
+class PayoutRequest:
+    """
+    Value object representing one payout to submit.
+
+    idempotency_key is stable per withdrawal, so resubmitting the same
+    withdrawal (after a crash or an expired claim) never pays twice.
+    """
+
+    transaction_id: int
+    wallet_id: int
+    amount: Decimal
+    currency: str
+    payment_method: str
+    payment_details: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def idempotency_key(self) -> str:
+        return f"withdrawal-{self.transaction_id}"
+
+
+@dataclass
+class PayoutResult:
+    """
+    Value object representing a payout's outcome.
+    """
+
+    transaction_id: int
+    status: PayoutStatus
+    reference: Optional[str] = None  # Provider's payout reference
+    failure_reason: Optional[str] = None
+
+
+class IPayoutGateway(ABC):
+    """
+    Payout Gateway Interface (Port).
+
+    Implementations:
+    - MockPayoutGateway (development/testing)
+    """
+
+    @abstractmethod
+    def submit_payouts(self, requests: List[PayoutRequest]) -> List[PayoutResult]:
+        """
+        Submit a batch of payouts.
+
+        Must be idempotent per request.idempotency_key: resubmitting a
+        payout returns its current outcome instead of paying again.
+
+        Args:
+            requests: Payouts to submit
+
+        Returns:
+            One PayoutResult per request
+
+        Raises:
+            PayoutGatewayError: If the batch could not be submitted at all
+        """
+        pass
+
+
+class PayoutGatewayError(Exception):
+    """Exception raised when the payout provider can't be reached or rejects a batch."""
+
+    def __init__(self, message: str, code: Optional[str] = None):
+        self.message = message
+        self.code = code
+        super().__init__(message)
@@ -6,10 +6,12 @@ from app.domains.wallet.value_objects.enums import (
     TransactionStatus,
 )
 from app.domains.wallet.value_objects.money import Money
+from app.domains.wallet.value_objects.balance_change import BalanceChange
 
 __all__ = [
     "WalletStatus",
     "TransactionType",
     "TransactionStatus",
     "Money",
+    "BalanceChange",
 ]
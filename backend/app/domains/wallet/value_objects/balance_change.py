@@ -0,0 +1,75 @@
+"""BalanceChange value object for atomic wallet updates."""
+
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Mapping
+
+from app.domains.wallet.value_objects.enums import TransactionType, TransactionStatus
+
+
+@dataclass(frozen=True)
+class BalanceChange:
+    """
+    Pending change to a wallet's balances, as deltas.
+
+    Wallets persist balance changes as `balance = balance + delta` rather
+    than by writing the balance they read, so concurrent deposits to the
+    same wallet can't overwrite each other.
+    """
+
+    balance: Decimal = Decimal("0.00")
+    total_earned: Decimal = Decimal("0.00")
+    total_withdrawn: Decimal = Decimal("0.00")
+
+    @classmethod
+    def from_ledger(
+        cls,
+        created: Mapping[TransactionType, Decimal],
+        settled_withdrawals: Mapping[TransactionStatus, Decimal],
+    ) -> "BalanceChange":
+        """
+        Net effect of a window of wallet transactions.
+
+        Mirrors the Wallet operations: deposits credit the balance (and
+        earnings) when created, withdrawals and refunds debit it when
+        created, a withdrawal that fails is credited back when it settles
+        and one that completes counts as withdrawn when it settles.
+
+        Args:
+            created: Amounts by type, of transactions created in the window
+            settled_withdrawals: Amounts by final status, of withdrawals
+                settled (completed_at) in the window
+
+        Returns:
+            The change the window makes to the wallet's balances
+        """
+        def total(amounts: Mapping, *keys) -> Decimal:
+            return sum((Decimal(amounts.get(key, 0)) for key in keys), Decimal("0.00"))
+
+        return cls(
+            balance=(
+                total(created, TransactionType.DEPOSIT)
+                - total(created, TransactionType.WITHDRAWAL, TransactionType.REFUND)
+                + total(settled_withdrawals, TransactionStatus.FAILED)
+            ),
+            total_earned=total(created, TransactionType.DEPOSIT),
+            total_withdrawn=total(settled_withdrawals, TransactionStatus.COMPLETED),
+        )
+
+    def __add__(self, other: "BalanceChange") -> "BalanceChange":
+        """Combine two changes."""
+        return BalanceChange(
+            balance=self.balance + other.balance,
+            total_earned=self.total_earned + other.total_earned,
+            total_withdrawn=self.total_withdrawn + other.total_withdrawn,
+        )
+
+    @property
+    def is_zero(self) -> bool:
+        """Check if the change leaves every balance as it is."""
+        return not (self.balance or self.total_earned or self.total_withdrawn)
+
+    @property
+    def is_debit(self) -> bool:
+        """Check if the change lowers the withdrawable balance."""
+        return self.balance < 0
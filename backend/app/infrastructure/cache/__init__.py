@@ -0,0 +1,27 @@
+"""Result caches."""
+
+from app.infrastructure.cache.commit_hooks import run_after_commit
+from app.infrastructure.cache.profile_cache import (
+    CachedProfile,
+    PublicProfileCache,
+    public_profile_cache,
+)
+from app.infrastructure.cache.snapshot_cache import (
+    SnapshotCache,
+    admin_stats_snapshot,
+)
+from app.infrastructure.cache.search_cache import (
+    SearchResultCache,
+    instructor_search_cache,
+)
+
+__all__ = [
+    "run_after_commit",
+    "CachedProfile",
+    "PublicProfileCache",
+    "public_profile_cache",
+    "SnapshotCache",
+    "admin_stats_snapshot",
+    "SearchResultCache",
+    "instructor_search_cache",
+]
@@ -0,0 +1,45 @@
+"""
+Defer cache invalidation until a session's transaction commits.
+
+Invalidating while the write is still uncommitted lets a concurrent
+request re-cache pre-commit data, so caches register their invalidation
+with run_after_commit(db, ...) instead. Callbacks run after the commit and
+are discarded if the transaction rolls back.
+"""
+
+from typing import Any, Callable, Dict, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+_PENDING_CALLBACKS = "pending_after_commit_callbacks"
+
+
+def run_after_commit(db: Session, callback: Callable[..., Any], *args: Any) -> None:
+    """
+    Call callback(*args) once the session's current transaction commits.
+
+    Registering the same callback with the same arguments more than once
+    in a transaction runs it once.
+
+    Args:
+        db: Session whose commit triggers the callback
+        callback: Callable to run (e.g. a cache's invalidate method)
+        *args: Hashable positional arguments for the callback
+    """
+    pending: Dict[Tuple[Callable[..., Any], Tuple[Any, ...]], None] = db.info.setdefault(
+        _PENDING_CALLBACKS, {}
+    )
+    pending[(callback, args)] = None
+
+
+@event.listens_for(Session, "after_commit")
+def _run_pending_callbacks(session: Session) -> None:
+    for callback, args in session.info.pop(_PENDING_CALLBACKS, ()):
+        callback(*args)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_callbacks(session: Session) -> None:
+    session.info.pop(_PENDING_CALLBACKS, None)
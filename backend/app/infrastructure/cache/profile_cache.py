@@ -0,0 +1,171 @@
+"""
+Cache for public instructor profile projections.
+
+Entries are keyed by instructor profile id and carry a per-instructor
+version. invalidate(instructor_id) bumps the version and drops the entry,
+so a projection built from pre-write data (a render that started before
+the write) is never stored under the new version.
+
+Each entry also carries a content ETag, letting the profile endpoint
+answer conditional requests with 304 without touching the database.
+
+Repositories call invalidate_on_commit(db, ...) when they change data
+shown on a public profile; the entry is dropped only once the transaction
+commits. Invalidation is per process: other workers converge within the
+TTL.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.infrastructure.cache.commit_hooks import run_after_commit
+
+
+@dataclass(frozen=True)
+class CachedProfile:
+    """A cached public profile projection."""
+
+    instructor_id: int
+    user_id: int
+    version: int
+    etag: str
+    payload: Dict[str, Any]
+
+
+class PublicProfileCache:
+    """Versioned per-instructor TTL cache for public profile projections."""
+
+    def __init__(self, ttl_seconds: float = 300.0, max_entries: int = 2048, enabled: bool = True):
+        """
+        Initialize cache.
+
+        Args:
+            ttl_seconds: Lifetime of a cached projection
+            max_entries: Size of the in-process LRU
+            enabled: If False, every lookup is a miss and nothing is stored
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.enabled = enabled
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()  # instructor_id -> (expires_at, CachedProfile)
+        self._versions: Dict[int, int] = {}
+        self._instructor_by_user: Dict[int, int] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_etag(payload: Dict[str, Any]) -> str:
+        """Strong ETag for a JSON-serializable payload."""
+        body = json.dumps(payload, sort_keys=True, default=str)
+        return '"' + hashlib.sha1(body.encode("utf-8")).hexdigest()[:20] + '"'
+
+    def current_version(self, instructor_id: int) -> int:
+        """Version to pass to put() for a projection about to be built."""
+        with self._lock:
+            return self._versions.get(instructor_id, 0)
+
+    def get(self, instructor_id: int) -> Optional[CachedProfile]:
+        """Get the cached projection for an instructor, or None on miss."""
+        if not self.enabled:
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(instructor_id)
+            if entry is not None:
+                expires_at, cached = entry
+                if expires_at > now and cached.version == self._versions.get(instructor_id, 0):
+                    self._entries.move_to_end(instructor_id)
+                    self.hits += 1
+                    return cached
+                del self._entries[instructor_id]
+            self.misses += 1
+        return None
+
+    def put(self, instructor_id: int, user_id: int, payload: Dict[str, Any], version: int) -> CachedProfile:
+        """
+        Store a projection built while current_version() returned version.
+
+        Returns:
+            The CachedProfile (with ETag), stored or not
+        """
+        cached = CachedProfile(
+            instructor_id=instructor_id,
+            user_id=user_id,
+            version=version,
+            etag=self.make_etag(payload),
+            payload=payload,
+        )
+        if not self.enabled:
+            return cached
+
+        with self._lock:
+            self._instructor_by_user[user_id] = instructor_id
+            if version != self._versions.get(instructor_id, 0):
+                # Invalidated while the projection was being built
+                return cached
+            self._entries[instructor_id] = (time.monotonic() + self.ttl_seconds, cached)
+            self._entries.move_to_end(instructor_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return cached
+
+    def invalidate(self, instructor_id: int) -> None:
+        """Drop an instructor's projection and bump its version."""
+        with self._lock:
+            self._versions[instructor_id] = self._versions.get(instructor_id, 0) + 1
+            self._entries.pop(instructor_id, None)
+            self.invalidations += 1
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Invalidate the projection that shows this user's name, if any."""
+        with self._lock:
+            instructor_id = self._instructor_by_user.get(user_id)
+        if instructor_id is not None:
+            self.invalidate(instructor_id)
+
+    def invalidate_on_commit(
+        self,
+        db: Session,
+        instructor_id: Optional[int] = None,
+        user_id: Optional[int] = None,
+    ) -> None:
+        """Invalidate by instructor id and/or user id once the transaction commits."""
+        if instructor_id is not None:
+            run_after_commit(db, self.invalidate, instructor_id)
+        if user_id is not None:
+            run_after_commit(db, self.invalidate_user, user_id)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for monitoring."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "invalidations": self.invalidations,
+            }
+
+
+# Public instructor profiles (/api/instructor/profile/{instructor_id})
+public_profile_cache = PublicProfileCache(
+    ttl_seconds=settings.PROFILE_CACHE_TTL_SECONDS,
+    max_entries=settings.PROFILE_CACHE_MAX_ENTRIES,
+    enabled=settings.PROFILE_CACHE_ENABLED,
+)
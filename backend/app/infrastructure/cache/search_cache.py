@@ -0,0 +1,248 @@
+"""
+Short-lived cache for public search results.
+
+Two tiers:
+- In-process LRU with a TTL (always on).
+- Optional shared Redis tier, so workers share results and invalidations.
+
+Invalidation is generation based: every key embeds the current generation
+and invalidate() bumps it, so stale entries simply stop being addressable
+and age out. With Redis the generation lives in Redis and every worker
+observes a bump on its next lookup.
+
+Repositories call invalidate_on_commit(db) when they change data that can
+appear in results; the generation is bumped only once the transaction
+commits, so a concurrent request can't re-cache pre-commit data.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.infrastructure.cache.commit_hooks import run_after_commit
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - optional dependency
+    redis = None
+
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize(value: Any) -> Any:
+    """Make equivalent parameter values produce identical keys."""
+    if isinstance(value, Decimal):
+        return str(value.quantize(Decimal("0.01")))
+    if isinstance(value, str):
+        return value.strip()
+    return value
+
+
+class SearchResultCache:
+    """Generation-versioned TTL cache for JSON-serializable results."""
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl_seconds: float = 30.0,
+        max_entries: int = 1024,
+        redis_url: str = "",
+        enabled: bool = True,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            namespace: Key prefix (also names the shared generation counter)
+            ttl_seconds: Lifetime of a cached result
+            max_entries: Size of the in-process LRU
+            redis_url: Optional Redis URL for the shared tier
+            enabled: If False, every lookup is a miss and nothing is stored
+        """
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.enabled = enabled
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (expires_at, value)
+        self._generation = 0
+
+        self._redis = None
+        if redis_url:
+            if redis is None:
+                logger.warning("SEARCH_CACHE_REDIS_URL is set but redis is not installed; using in-process cache only")
+            else:
+                self._redis = redis.Redis.from_url(redis_url, socket_timeout=0.25, socket_connect_timeout=0.25)
+
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.backend_errors = 0
+
+    # ------------------------------------------------------------------
+    # Keys and generations
+    # ------------------------------------------------------------------
+
+    def make_key(self, params: Dict[str, Any]) -> str:
+        """
+        Build a cache key from request parameters.
+
+        Parameter order and formatting differences (e.g. "20" vs "20.00")
+        don't produce different keys.
+        """
+        normalized = {name: _normalize(value) for name, value in params.items() if value is not None}
+        payload = json.dumps(normalized, sort_keys=True, default=str)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def _current_generation(self) -> int:
+        """Generation to read/write under (shared one if Redis is reachable)."""
+        if self._redis is None:
+            return self._generation
+
+        try:
+            shared = int(self._redis.get(f"{self.namespace}:generation") or 0)
+        except redis.RedisError as e:
+            self.backend_errors += 1
+            logger.warning(f"Search cache backend unavailable: {e}")
+            return self._generation
+
+        with self._lock:
+            if shared != self._generation:
+                # Another worker invalidated; local entries are stale
+                self._generation = shared
+                self._entries.clear()
+        return shared
+
+    # ------------------------------------------------------------------
+    # Read / write
+    # ------------------------------------------------------------------
+
+    def lookup(self, key: str) -> Tuple[Optional[Any], int]:
+        """
+        Look up a cached value.
+
+        Returns:
+            Tuple of (value or None on miss, generation). Pass the generation
+            to store() so a result computed across an invalidation is filed
+            under the old, unreachable generation instead of the new one.
+        """
+        if not self.enabled:
+            return None, self._generation
+
+        generation = self._current_generation()
+        full_key = f"{self.namespace}:{generation}:{key}"
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(full_key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(full_key)
+                    self.hits += 1
+                    return value, generation
+                del self._entries[full_key]
+
+        if self._redis is not None:
+            try:
+                raw = self._redis.get(full_key)
+            except redis.RedisError as e:
+                self.backend_errors += 1
+                logger.warning(f"Search cache backend unavailable: {e}")
+                raw = None
+
+            if raw is not None:
+                value = json.loads(raw)
+                self._store_local(full_key, value)
+                with self._lock:
+                    self.shared_hits += 1
+                return value, generation
+
+        with self._lock:
+            self.misses += 1
+        return None, generation
+
+    def store(self, key: str, value: Any, generation: int) -> None:
+        """Store a JSON-serializable value under the generation returned by lookup()."""
+        if not self.enabled:
+            return
+
+        full_key = f"{self.namespace}:{generation}:{key}"
+        self._store_local(full_key, value)
+
+        if self._redis is not None:
+            try:
+                self._redis.set(full_key, json.dumps(value, default=str), ex=max(1, int(self.ttl_seconds)))
+            except redis.RedisError as e:
+                self.backend_errors += 1
+                logger.warning(f"Search cache backend unavailable: {e}")
+
+    def _store_local(self, full_key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[full_key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(full_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # Invalidation
+    # ------------------------------------------------------------------
+
+    def invalidate(self) -> None:
+        """Drop every cached result (in this worker and, if shared, all workers)."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self.invalidations += 1
+
+        if self._redis is not None:
+            try:
+                generation = int(self._redis.incr(f"{self.namespace}:generation"))
+                with self._lock:
+                    self._generation = generation
+            except redis.RedisError as e:
+                self.backend_errors += 1
+                logger.warning(f"Search cache backend unavailable: {e}")
+
+    def invalidate_on_commit(self, db: Session) -> None:
+        """Invalidate once the session's current transaction commits."""
+        run_after_commit(db, self.invalidate)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for monitoring."""
+        with self._lock:
+            lookups = self.hits + self.shared_hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "shared_backend": self._redis is not None,
+                "entries": len(self._entries),
+                "generation": self._generation,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "shared_hits": self.shared_hits,
+                "misses": self.misses,
+                "hit_ratio": round((self.hits + self.shared_hits) / lookups, 4) if lookups else 0.0,
+                "invalidations": self.invalidations,
+                "backend_errors": self.backend_errors,
+            }
+
+
+# Public instructor search (/api/instructor/search)
+instructor_search_cache = SearchResultCache(
+    namespace="instructor_search",
+    ttl_seconds=settings.SEARCH_CACHE_TTL_SECONDS,
+    max_entries=settings.SEARCH_CACHE_MAX_ENTRIES,
+    redis_url=settings.SEARCH_CACHE_REDIS_URL,
+    enabled=settings.SEARCH_CACHE_ENABLED,
+)
@@ -0,0 +1,176 @@
+"""
+Cached snapshot of an expensive, slowly changing value.
+
+Used for platform-wide counters (admin dashboard) where a result that is a
+few seconds old is fine but recomputing it on every page view isn't.
+
+- Younger than ttl_seconds: served as is.
+- Older, but younger than max_stale_seconds: served as is while a single
+  background thread recomputes it (stale-while-revalidate).
+- Missing or older than that: recomputed in the request.
+
+Loaders receive their own DB session, since a background refresh outlives
+the request that triggered it.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Generic, Optional, TypeVar
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.database.connection import SessionLocal
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SnapshotCache(Generic[T]):
+    """Single-value TTL cache with background refresh."""
+
+    def __init__(
+        self,
+        name: str,
+        ttl_seconds: float = 30.0,
+        max_stale_seconds: float = 600.0,
+        enabled: bool = True,
+        background_refresh: bool = True,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            name: Used in log messages and the refresh thread name
+            ttl_seconds: Age up to which the snapshot is served without refreshing
+            max_stale_seconds: Age up to which a stale snapshot is still served
+                while refreshing in the background
+            enabled: If False, every lookup recomputes the value
+            background_refresh: If False, stale snapshots are recomputed in
+                the request (e.g. SQLite, whose single connection can't be
+                shared with a refresh thread)
+            session_factory: Creates the DB session handed to the loader
+        """
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.max_stale_seconds = max_stale_seconds
+        self.enabled = enabled
+        self.background_refresh = background_refresh
+        self.session_factory = session_factory
+
+        self._lock = threading.Lock()
+        self._value: Optional[T] = None
+        self._taken_at = 0.0  # monotonic time the current value's computation started
+        self._refreshing = False
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refresh_errors = 0
+
+    def get(self, loader: Callable[[Session], T]) -> T:
+        """
+        Get the snapshot, computing it with loader when needed.
+
+        Args:
+            loader: Computes the value from a DB session
+
+        Returns:
+            The cached or freshly computed value
+        """
+        if not self.enabled:
+            return self._load(loader)
+
+        with self._lock:
+            value = self._value
+            age = time.monotonic() - self._taken_at
+            if value is not None and age < self.ttl_seconds:
+                self.hits += 1
+                return value
+            serve_stale = (
+                value is not None
+                and self.background_refresh
+                and age < self.max_stale_seconds
+            )
+            if serve_stale:
+                self.stale_hits += 1
+                start_refresh = not self._refreshing
+                self._refreshing = True
+            else:
+                self.misses += 1
+
+        if serve_stale:
+            if start_refresh:
+                threading.Thread(
+                    target=self._refresh,
+                    args=(loader,),
+                    name=f"{self.name}-refresh",
+                    daemon=True,
+                ).start()
+            return value
+
+        started = time.monotonic()
+        value = self._load(loader)
+        self._store(value, started)
+        return value
+
+    def invalidate(self) -> None:
+        """Drop the snapshot; the next lookup recomputes it."""
+        with self._lock:
+            self._value = None
+            self._taken_at = 0.0
+
+    def _load(self, loader: Callable[[Session], T]) -> T:
+        db = self.session_factory()
+        try:
+            return loader(db)
+        finally:
+            db.close()
+
+    def _store(self, value: T, taken_at: float) -> None:
+        with self._lock:
+            # Never replace a snapshot with one whose computation started earlier
+            if taken_at >= self._taken_at:
+                self._value = value
+                self._taken_at = taken_at
+
+    def _refresh(self, loader: Callable[[Session], T]) -> None:
+        started = time.monotonic()
+        try:
+            self._store(self._load(loader), started)
+        except Exception as e:
+            with self._lock:
+                self.refresh_errors += 1
+            logger.warning(f"Background refresh of {self.name} failed: {e}")
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for monitoring."""
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "ttl_seconds": self.ttl_seconds,
+                "age_seconds": (
+                    round(time.monotonic() - self._taken_at, 1) if self._value is not None else None
+                ),
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "refresh_errors": self.refresh_errors,
+            }
+
+
+# Admin dashboard platform statistics (/api/admin/dashboard/stats)
+admin_stats_snapshot = SnapshotCache(
+    name="admin_dashboard_stats",
+    ttl_seconds=settings.ADMIN_STATS_CACHE_TTL_SECONDS,
+    max_stale_seconds=settings.ADMIN_STATS_CACHE_MAX_STALE_SECONDS,
+    enabled=settings.ADMIN_STATS_CACHE_ENABLED,
+    background_refresh=not settings.DATABASE_URL.startswith("sqlite"),
+)
@@ -0,0 +1,15 @@
+"""Dashboard composition."""
+
+from app.infrastructure.dashboard.section_composer import (
+    ComposedSections,
+    SectionComposer,
+    dashboard_composer,
+    parse_sections,
+)
+
+__all__ = [
+    "ComposedSections",
+    "SectionComposer",
+    "dashboard_composer",
+    "parse_sections",
+]
@@ -0,0 +1,152 @@
+"""
+Concurrent loading of independent dashboard sections.
+
+A dashboard is a set of named sections that don't depend on each other.
+SectionComposer runs each section's loader on a bounded, process-wide
+thread pool with its own DB session (SQLAlchemy sessions aren't thread
+safe), and records how long every section took.
+
+Sections run in separate transactions, so they may observe slightly
+different snapshots; dashboards are read-only views where that's fine.
+
+On SQLite the engine shares a single connection (StaticPool), so sections
+run one after another instead.
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.database.connection import SessionLocal
+
+
+logger = logging.getLogger(__name__)
+
+SectionLoader = Callable[[Session], Any]
+
+
+def parse_sections(raw: Optional[str], available: Iterable[str]) -> Tuple[str, ...]:
+    """
+    Parse a comma separated sections= parameter.
+
+    Args:
+        raw: Parameter value, e.g. "stats,upcoming_sessions" (None/empty = all)
+        available: Valid section names, in display order
+
+    Returns:
+        Requested section names, in display order
+
+    Raises:
+        ValueError: If a requested section doesn't exist
+    """
+    available = tuple(available)
+    if not raw or not raw.strip():
+        return available
+
+    requested = {name.strip() for name in raw.split(",") if name.strip()}
+    unknown = requested - set(available)
+    if unknown:
+        raise ValueError(
+            f"Invalid sections: {', '.join(sorted(unknown))}. "
+            f"Available: {', '.join(available)}"
+        )
+    return tuple(name for name in available if name in requested)
+
+
+@dataclass
+class ComposedSections:
+    """Results and timings of one composition."""
+
+    results: Dict[str, Any] = field(default_factory=dict)
+    timings_ms: Dict[str, float] = field(default_factory=dict)
+    total_ms: float = 0.0
+
+    def server_timing(self) -> str:
+        """Server-Timing header value, e.g. "stats;dur=4.2, total;dur=9.1"."""
+        entries = [f"{name};dur={duration:.1f}" for name, duration in self.timings_ms.items()]
+        entries.append(f"total;dur={self.total_ms:.1f}")
+        return ", ".join(entries)
+
+
+class SectionComposer:
+    """Runs named section loaders concurrently, each with its own DB session."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        max_workers: int = 4,
+        parallel: bool = True,
+    ):
+        """
+        Initialize composer.
+
+        Args:
+            session_factory: Creates the DB session handed to each loader
+            max_workers: Size of the shared thread pool (bounds concurrent
+                section queries, and so DB connections, per process)
+            parallel: If False, sections run sequentially in the caller
+        """
+        self.session_factory = session_factory
+        self.max_workers = max_workers
+        self.parallel = parallel and max_workers > 1
+        self._executor = (
+            ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dashboard-section")
+            if self.parallel else None
+        )
+
+    def _run_section(self, loader: SectionLoader) -> Tuple[Any, float]:
+        """Run one loader in a fresh session; returns (result, elapsed ms)."""
+        started = time.perf_counter()
+        db = self.session_factory()
+        try:
+            return loader(db), (time.perf_counter() - started) * 1000
+        finally:
+            db.close()
+
+    async def compose(self, loaders: Dict[str, SectionLoader]) -> ComposedSections:
+        """
+        Load every section.
+
+        Args:
+            loaders: Section name -> callable taking a DB session
+
+        Returns:
+            ComposedSections with a result and timing per section
+
+        Raises:
+            Exception: The first failing section's exception (in loader
+                order), once all sections have finished
+        """
+        started = time.perf_counter()
+        composed = ComposedSections()
+
+        if self._executor is None:
+            for name, loader in loaders.items():
+                composed.results[name], composed.timings_ms[name] = self._run_section(loader)
+        else:
+            futures = {
+                name: asyncio.wrap_future(self._executor.submit(self._run_section, loader))
+                for name, loader in loaders.items()
+            }
+            outcomes = await asyncio.gather(*futures.values(), return_exceptions=True)
+            for name, outcome in zip(futures, outcomes):
+                if isinstance(outcome, BaseException):
+                    raise outcome
+                composed.results[name], composed.timings_ms[name] = outcome
+
+        composed.total_ms = (time.perf_counter() - started) * 1000
+        logger.debug(f"Dashboard sections loaded: {composed.server_timing()}")
+        return composed
+
+
+# Shared by the student and instructor dashboards
+dashboard_composer = SectionComposer(
+    max_workers=settings.DASHBOARD_MAX_WORKERS,
+    parallel=settings.DASHBOARD_PARALLEL_SECTIONS and not settings.DATABASE_URL.startswith("sqlite"),
+)
@@ -0,0 +1,17 @@
+"""Streaming data exports."""
+
+from app.infrastructure.export.row_export import (
+    EXPORT_DATASETS,
+    EXPORT_FORMATS,
+    ExportDataset,
+    RowExporter,
+    admin_exporter,
+)
+
+__all__ = [
+    "EXPORT_DATASETS",
+    "EXPORT_FORMATS",
+    "ExportDataset",
+    "RowExporter",
+    "admin_exporter",
+]
@@ -0,0 +1,272 @@
+"""
+Streaming table exports (CSV / NDJSON) for admin reporting.
+
+Rows are read through a server-side cursor (yield_per), so the database
+hands them over in batches of EXPORT_BATCH_SIZE and neither the query
+result nor the encoded file is ever held in memory as a whole. Only plain
+columns are selected - no ORM entities, relationships or identity map -
+which keeps memory flat however large the table is.
+
+Every dataset is ordered and range-filtered on an indexed timestamp
+(with id as tie-breaker), so a date-bounded export reads only that slice
+of the index.
+
+Exports open their own DB session: the response body is produced after
+the request handler (and its session) has finished.
+"""
+
+import csv
+import io
+import json
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.database.connection import SessionLocal
+from app.database.models import (
+    User as SQLAlchemyUser,
+    Payment as SQLAlchemyPayment,
+    Session as SQLAlchemySession,
+    WalletTransaction as SQLAlchemyWalletTransaction,
+)
+
+
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+
+@dataclass(frozen=True)
+class ExportDataset:
+    """A table export: the columns written and the timestamp it's ordered/filtered by."""
+
+    name: str
+    columns: Tuple[Any, ...]
+    date_column: Any
+    id_column: Any
+
+    @property
+    def headers(self) -> Tuple[str, ...]:
+        return tuple(column.key for column in self.columns)
+
+
+EXPORT_DATASETS: Dict[str, ExportDataset] = {
+    dataset.name: dataset
+    for dataset in (
+        ExportDataset(
+            name="users",
+            columns=(
+                SQLAlchemyUser.id,
+                SQLAlchemyUser.email,
+                SQLAlchemyUser.first_name,
+                SQLAlchemyUser.last_name,
+                SQLAlchemyUser.role,
+                SQLAlchemyUser.status,
+                SQLAlchemyUser.is_email_verified,
+                SQLAlchemyUser.timezone,
+                SQLAlchemyUser.created_at,
+                SQLAlchemyUser.last_login_at,
+                SQLAlchemyUser.deleted_at,
+            ),
+            date_column=SQLAlchemyUser.created_at,
+            id_column=SQLAlchemyUser.id,
+        ),
+        ExportDataset(
+            name="payments",
+            columns=(
+                SQLAlchemyPayment.id,
+                SQLAlchemyPayment.student_id,
+                SQLAlchemyPayment.instructor_id,
+                SQLAlchemyPayment.session_id,
+                SQLAlchemyPayment.amount,
+                SQLAlchemyPayment.currency,
+                SQLAlchemyPayment.status,
+                SQLAlchemyPayment.lesson_type,
+                SQLAlchemyPayment.payment_method,
+                SQLAlchemyPayment.gateway,
+                SQLAlchemyPayment.gateway_order_id,
+                SQLAlchemyPayment.gateway_payment_id,
+                SQLAlchemyPayment.failure_reason,
+                SQLAlchemyPayment.created_at,
+                SQLAlchemyPayment.completed_at,
+            ),
+            date_column=SQLAlchemyPayment.created_at,
+            id_column=SQLAlchemyPayment.id,
+        ),
+        ExportDataset(
+            name="sessions",
+            columns=(
+                SQLAlchemySession.id,
+                SQLAlchemySession.instructor_id,
+                SQLAlchemySession.student_id,
+                SQLAlchemySession.subject_id,
+                SQLAlchemySession.session_type,
+                SQLAlchemySession.status,
+                SQLAlchemySession.start_at,
+                SQLAlchemySession.end_at,
+                SQLAlchemySession.duration_minutes,
+                SQLAlchemySession.amount,
+                SQLAlchemySession.currency,
+                SQLAlchemySession.cancelled_at,
+                SQLAlchemySession.cancelled_by,
+                SQLAlchemySession.created_at,
+            ),
+            date_column=SQLAlchemySession.start_at,
+            id_column=SQLAlchemySession.id,
+        ),
+        ExportDataset(
+            name="wallet_transactions",
+            columns=(
+                SQLAlchemyWalletTransaction.id,
+                SQLAlchemyWalletTransaction.wallet_id,
+                SQLAlchemyWalletTransaction.type,
+                SQLAlchemyWalletTransaction.amount,
+                SQLAlchemyWalletTransaction.balance_after,
+                SQLAlchemyWalletTransaction.status,
+                SQLAlchemyWalletTransaction.reference_type,
+                SQLAlchemyWalletTransaction.reference_id,
+                SQLAlchemyWalletTransaction.description,
+                SQLAlchemyWalletTransaction.failure_reason,
+                SQLAlchemyWalletTransaction.created_at,
+                SQLAlchemyWalletTransaction.completed_at,
+            ),
+            date_column=SQLAlchemyWalletTransaction.created_at,
+            id_column=SQLAlchemyWalletTransaction.id,
+        ),
+    )
+}
+
+
+def _plain(value: Any) -> Any:
+    """Convert a column value to a JSON/CSV friendly scalar."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+class RowExporter:
+    """Streams export datasets from a server-side cursor."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        batch_size: int = 1000,
+    ):
+        """
+        Initialize exporter.
+
+        Args:
+            session_factory: Creates the DB session each export reads from
+            batch_size: Rows fetched per round trip (and per output chunk)
+        """
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+
+    def get_dataset(self, name: str) -> ExportDataset:
+        """
+        Look up a dataset by name.
+
+        Raises:
+            ValueError: If no such dataset exists
+        """
+        dataset = EXPORT_DATASETS.get(name)
+        if dataset is None:
+            raise ValueError(
+                f"Unknown export '{name}'. Available: {', '.join(EXPORT_DATASETS)}"
+            )
+        return dataset
+
+    def iter_rows(
+        self,
+        dataset: ExportDataset,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+    ) -> Iterator[Sequence[Any]]:
+        """
+        Yield rows of a dataset, oldest first.
+
+        Args:
+            dataset: Dataset to export
+            start: First day included (on the dataset's date column)
+            end: Last day included
+
+        Yields:
+            Row tuples in dataset.columns order
+        """
+        query = select(*dataset.columns).order_by(dataset.date_column, dataset.id_column)
+        if start:
+            query = query.where(dataset.date_column >= datetime.combine(start, time.min))
+        if end:
+            query = query.where(
+                dataset.date_column < datetime.combine(end + timedelta(days=1), time.min)
+            )
+
+        db = self.session_factory()
+        try:
+            # yield_per streams from a server-side cursor where the driver supports it
+            result = db.execute(query.execution_options(yield_per=self.batch_size))
+            for partition in result.partitions():
+                yield from partition
+        finally:
+            db.close()
+
+    def stream(
+        self,
+        dataset: ExportDataset,
+        export_format: str,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+    ) -> Iterator[str]:
+        """
+        Encode a dataset as CSV (with header row) or NDJSON.
+
+        Args:
+            dataset: Dataset to export
+            export_format: "csv" or "ndjson"
+            start: First day included
+            end: Last day included
+
+        Yields:
+            Text chunks of roughly batch_size rows each
+        """
+        headers = dataset.headers
+        buffer = io.StringIO()
+        writer = csv.writer(buffer) if export_format == "csv" else None
+
+        if writer:
+            writer.writerow(headers)
+
+        pending = 0
+        for row in self.iter_rows(dataset, start, end):
+            values = [_plain(value) for value in row]
+            if writer:
+                writer.writerow(values)
+            else:
+                buffer.write(json.dumps(dict(zip(headers, values)), separators=(",", ":")))
+                buffer.write("\n")
+
+            pending += 1
+            if pending >= self.batch_size:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+                pending = 0
+
+        remainder = buffer.getvalue()
+        if remainder:
+            yield remainder
+
+
+# Admin exports (/api/admin/exports/{dataset})
+admin_exporter = RowExporter(batch_size=settings.EXPORT_BATCH_SIZE)
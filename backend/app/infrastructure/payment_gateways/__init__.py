@@ -2,8 +2,10 @@
 
 from app.infrastructure.payment_gateways.razorpay_gateway import RazorpayGateway
 from app.infrastructure.payment_gateways.mock_gateway import MockGateway
+from app.infrastructure.payment_gateways.mock_payout_gateway import MockPayoutGateway
 
 __all__ = [
     "RazorpayGateway",
     "MockGateway",
+    "MockPayoutGateway",
 ]
@@ -13,6 +13,7 @@ from app.domains.payment.services.payment_gateway import (
     IPaymentGateway,
     GatewayOrder,
     GatewayVerificationResult,
+    GatewayOrderStatus,
     RefundResult,
 )
 
@@ -150,6 +151,29 @@ class MockGateway(IPaymentGateway):
             "currency": "INR",
         }
 
+    def get_order_status(self, order_id: str) -> GatewayOrderStatus:
+        """
+        Get mock order status.
+
+        Orders this instance hasn't seen are reported as never attempted.
+
+        Args:
+            order_id: Order reference
+
+        Returns:
+            GatewayOrderStatus
+        """
+        order = self._orders.get(order_id, {})
+        payment_id = next(
+            (pid for pid, payment in self._payments.items() if payment.get("order_id") == order_id),
+            None,
+        )
+        return GatewayOrderStatus(
+            order_id=order_id,
+            status=order.get("status", "created"),
+            payment_id=payment_id,
+        )
+
     def refund_payment(
         self,
         payment_id: str,
@@ -0,0 +1,76 @@
+"""
+Mock Payout Gateway Implementation.
+
+Used for development and testing without sending real payouts.
+"""
+
+import uuid
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+from app.domains.wallet.services.payout_gateway import (
+    IPayoutGateway,
+    PayoutRequest,
+    PayoutResult,
+    PayoutStatus,
+)
+
+
+class MockPayoutGateway(IPayoutGateway):
+    """
+    Mock Payout Gateway for testing.
+
+    Pays out everything immediately, except payouts above max_amount
+    (failed) and to payment methods listed in processing_methods (left
+    processing). Results are remembered per idempotency key, like a real
+    provider, so resubmitting a payout returns its first outcome - but
+    only in process memory: a payout resubmitted by a later run (or
+    another worker process) is "paid" again.
+    """
+
+    def __init__(
+        self,
+        max_amount: Optional[Decimal] = None,
+        processing_methods: tuple = (),
+    ):
+        """
+        Initialize mock gateway.
+
+        Args:
+            max_amount: Payouts above this amount fail (None: no limit)
+            processing_methods: Payment methods whose payouts stay processing
+        """
+        self.max_amount = max_amount
+        self.processing_methods = processing_methods
+        self._payouts: Dict[str, PayoutResult] = {}
+
+    def submit_payouts(self, requests: List[PayoutRequest]) -> List[PayoutResult]:
+        """Submit mock payouts."""
+        return [self._submit(request) for request in requests]
+
+    def _submit(self, request: PayoutRequest) -> PayoutResult:
+        existing = self._payouts.get(request.idempotency_key)
+        if existing and existing.status != PayoutStatus.PROCESSING:
+            return existing
+
+        if self.max_amount is not None and request.amount > self.max_amount:
+            result = PayoutResult(
+                transaction_id=request.transaction_id,
+                status=PayoutStatus.FAILED,
+                failure_reason=f"Amount exceeds payout limit of {self.max_amount}",
+            )
+        elif request.payment_method in self.processing_methods:
+            result = PayoutResult(
+                transaction_id=request.transaction_id,
+                status=PayoutStatus.PROCESSING,
+                reference=existing.reference if existing else f"pout_mock_{uuid.uuid4().hex[:16]}",
+            )
+        else:
+            result = PayoutResult(
+                transaction_id=request.transaction_id,
+                status=PayoutStatus.COMPLETED,
+                reference=existing.reference if existing else f"pout_mock_{uuid.uuid4().hex[:16]}",
+            )
+
+        self._payouts[request.idempotency_key] = result
+        return result
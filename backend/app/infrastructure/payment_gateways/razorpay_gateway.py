@@ -16,6 +16,7 @@ from app.domains.payment.services.payment_gateway import (
     IPaymentGateway,
     GatewayOrder,
     GatewayVerificationResult,
+    GatewayOrderStatus,
     RefundResult,
     PaymentGatewayError,
 )
@@ -212,6 +213,45 @@ class RazorpayGateway(IPaymentGateway):
                 gateway_response={"error": str(e)},
             )
 
+    def get_order_status(self, order_id: str) -> GatewayOrderStatus:
+        """
+        Get an order's payment state from Razorpay.
+
+        Args:
+            order_id: Gateway's order reference
+
+        Returns:
+            GatewayOrderStatus (with the captured payment ID if paid)
+
+        Raises:
+            PaymentGatewayError: If fetching fails
+        """
+        try:
+            order = self.client.order.fetch(order_id)
+            payment_id = None
+            if order.get("status") == "paid":
+                payments = self.client.order.payments(order_id).get("items", [])
+                captured = [p for p in payments if p.get("status") == "captured"]
+                payment_id = captured[0]["id"] if captured else None
+
+            return GatewayOrderStatus(
+                order_id=order_id,
+                status=order.get("status", "created"),
+                payment_id=payment_id,
+            )
+        except BadRequestError as e:
+            raise PaymentGatewayError(
+                message=f"Invalid order ID: {str(e)}",
+                code="BAD_REQUEST",
+                gateway_response={"error": str(e)},
+            )
+        except Exception as e:
+            raise PaymentGatewayError(
+                message=f"Failed to fetch order: {str(e)}",
+                code="UNKNOWN_ERROR",
+                gateway_response={"error": str(e)},
+            )
+
     def refund_payment(
         self,
         payment_id: str,
@@ -3,6 +3,8 @@
 from .user_mapper import UserMapper
 from .instructor_mapper import InstructorProfileMapper
 from .student_mapper import StudentProfileMapper
+from .student_stats_mapper import StudentStatsMapper
+from .daily_rollup_mapper import DailyRollupMapper
 from .education_mapper import EducationMapper
 from .experience_mapper import ExperienceMapper
 from .subject_mapper import SubjectMapper
@@ -20,6 +22,8 @@ __all__ = [
     "UserMapper",
     "InstructorProfileMapper",
     "StudentProfileMapper",
+    "StudentStatsMapper",
+    "DailyRollupMapper",
     "EducationMapper",
     "ExperienceMapper",
     "SubjectMapper",
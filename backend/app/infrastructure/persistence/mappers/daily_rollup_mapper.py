@@ -0,0 +1,94 @@
+"""Mapper for daily rollup entities and SQLAlchemy rollup models."""
+
+from decimal import Decimal
+
+from app.domains.analytics.entities import (
+    InstructorDailyRollup as DomainInstructorDailyRollup,
+    PlatformDailyRollup as DomainPlatformDailyRollup,
+)
+from app.infrastructure.persistence.sqlalchemy_models import (
+    InstructorDailyRollup as SQLAlchemyInstructorDailyRollup,
+    PlatformDailyRollup as SQLAlchemyPlatformDailyRollup,
+)
+
+
+class DailyRollupMapper:
+    """
+    Maps between domain daily rollups and SQLAlchemy rollup models.
+    """
+
+    @staticmethod
+    def instructor_to_domain(db_rollup: SQLAlchemyInstructorDailyRollup) -> DomainInstructorDailyRollup:
+        """
+        Convert SQLAlchemy InstructorDailyRollup to domain entity.
+
+        Args:
+            db_rollup: SQLAlchemy InstructorDailyRollup model instance
+
+        Returns:
+            Domain InstructorDailyRollup entity
+        """
+        return DomainInstructorDailyRollup(
+            day=db_rollup.day,
+            instructor_id=db_rollup.instructor_id,
+            bookings=db_rollup.bookings or 0,
+            cancellations=db_rollup.cancellations or 0,
+            completed_sessions=db_rollup.completed_sessions or 0,
+            completed_minutes=db_rollup.completed_minutes or 0,
+            gross_amount=Decimal(str(db_rollup.gross_amount or 0)),
+            platform_fee=Decimal(str(db_rollup.platform_fee or 0)),
+            updated_at=db_rollup.updated_at,
+        )
+
+    @staticmethod
+    def platform_to_domain(db_rollup: SQLAlchemyPlatformDailyRollup) -> DomainPlatformDailyRollup:
+        """
+        Convert SQLAlchemy PlatformDailyRollup to domain entity.
+
+        Args:
+            db_rollup: SQLAlchemy PlatformDailyRollup model instance
+
+        Returns:
+            Domain PlatformDailyRollup entity
+        """
+        return DomainPlatformDailyRollup(
+            day=db_rollup.day,
+            bookings=db_rollup.bookings or 0,
+            cancellations=db_rollup.cancellations or 0,
+            completed_sessions=db_rollup.completed_sessions or 0,
+            completed_minutes=db_rollup.completed_minutes or 0,
+            gross_amount=Decimal(str(db_rollup.gross_amount or 0)),
+            platform_fee=Decimal(str(db_rollup.platform_fee or 0)),
+            active_instructors=db_rollup.active_instructors or 0,
+            updated_at=db_rollup.updated_at,
+        )
+
+    @staticmethod
+    def instructor_to_row(rollup: DomainInstructorDailyRollup) -> dict:
+        """Column values for a bulk insert into instructor_daily_rollups."""
+        return {
+            "day": rollup.day,
+            "instructor_id": rollup.instructor_id,
+            "bookings": rollup.bookings,
+            "cancellations": rollup.cancellations,
+            "completed_sessions": rollup.completed_sessions,
+            "completed_minutes": rollup.completed_minutes,
+            "gross_amount": rollup.gross_amount,
+            "platform_fee": rollup.platform_fee,
+            "updated_at": rollup.updated_at,
+        }
+
+    @staticmethod
+    def platform_to_row(rollup: DomainPlatformDailyRollup) -> dict:
+        """Column values for a bulk insert into platform_daily_rollups."""
+        return {
+            "day": rollup.day,
+            "bookings": rollup.bookings,
+            "cancellations": rollup.cancellations,
+            "completed_sessions": rollup.completed_sessions,
+            "completed_minutes": rollup.completed_minutes,
+            "gross_amount": rollup.gross_amount,
+            "platform_fee": rollup.platform_fee,
+            "active_instructors": rollup.active_instructors,
+            "updated_at": rollup.updated_at,
+        }
@@ -13,7 +13,10 @@ from app.domains.instructor.value_objects import (
     Pricing,
     Rating,
 )
-from app.infrastructure.persistence.sqlalchemy_models import InstructorProfile as SQLAlchemyInstructorProfile
+from app.infrastructure.persistence.sqlalchemy_models import (
+    InstructorProfile as SQLAlchemyInstructorProfile,
+    InstructorLanguage as SQLAlchemyInstructorLanguage,
+)
 
 
 class InstructorProfileMapper:
@@ -21,7 +24,8 @@ class InstructorProfileMapper:
     Maps between domain InstructorProfile entity and SQLAlchemy InstructorProfile model.
 
     Handles conversion of complex value objects:
-    - LanguageProficiency (domain) <-> JSON string (database)
+    - LanguageProficiency (domain) <-> JSON string (database), mirrored
+      into instructor_languages rows for indexed language filtering
     - Pricing (domain) <-> separate numeric fields (database)
     - Rating (domain) <-> average_rating + total_ratings fields (database)
     - InstructorStatus enum conversion
@@ -176,7 +180,7 @@ class InstructorProfileMapper:
             regular_price = float(domain_instructor.pricing.regular_session_price)
             trial_price = float(domain_instructor.pricing.trial_session_price) if domain_instructor.pricing.trial_session_price else None
 
-        return SQLAlchemyInstructorProfile(
+        db_instructor = SQLAlchemyInstructorProfile(
             user_id=domain_instructor.user_id,
             country_of_birth=domain_instructor.country_of_birth,
             languages=languages_json,
@@ -195,6 +199,9 @@ class InstructorProfileMapper:
             average_rating=float(domain_instructor.rating.average_score),
             total_ratings=domain_instructor.rating.total_reviews,
         )
+        InstructorProfileMapper.sync_language_entries(db_instructor, domain_instructor)
+
+        return db_instructor
 
     @staticmethod
     def update_orm_instance(
@@ -244,3 +251,39 @@ class InstructorProfileMapper:
         db_instructor.average_rating = float(domain_instructor.rating.average_score)
         db_instructor.total_ratings = domain_instructor.rating.total_reviews
         db_instructor.updated_at = domain_instructor.updated_at
+        InstructorProfileMapper.sync_language_entries(db_instructor, domain_instructor)
+
+    @staticmethod
+    def sync_language_entries(
+        db_instructor: SQLAlchemyInstructorProfile,
+        domain_instructor: DomainInstructorProfile
+    ) -> None:
+        """
+        Bring the instructor_languages rows in line with languages_spoken.
+
+        Existing rows are updated in place and only added/removed languages
+        produce inserts/deletes, so (instructor_id, language) stays unique
+        within a single flush.
+
+        Args:
+            db_instructor: SQLAlchemy InstructorProfile model instance to update
+            domain_instructor: Domain InstructorProfile entity with new values
+        """
+        wanted: Dict[str, str] = {}
+        if domain_instructor.languages_spoken:
+            for lang in domain_instructor.languages_spoken.languages:
+                wanted.setdefault(lang.name, lang.proficiency.value)
+
+        existing = {entry.language: entry for entry in db_instructor.language_entries}
+
+        for name, entry in existing.items():
+            if name not in wanted:
+                db_instructor.language_entries.remove(entry)
+            elif entry.proficiency != wanted[name]:
+                entry.proficiency = wanted[name]
+
+        for name, proficiency in wanted.items():
+            if name not in existing:
+                db_instructor.language_entries.append(
+                    SQLAlchemyInstructorLanguage(language=name, proficiency=proficiency)
+                )
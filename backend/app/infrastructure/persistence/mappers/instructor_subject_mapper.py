@@ -44,13 +44,13 @@ class InstructorSubjectMapper:
 
         return DomainInstructorSubject(
             id=str(db_instructor_subject.id) if db_instructor_subject.id else None,
-            instructor_id=str(db_instructor_subject.instructor_id),
+            instructor_id=str(db_instructor_subject.instructor_profile_id),
             subject_id=str(db_instructor_subject.subject_id),
             years_of_experience=years,
             description=None,  # Not in SQLAlchemy model
             is_primary=False,  # Not in SQLAlchemy model
             created_at=db_instructor_subject.created_at,
-            updated_at=db_instructor_subject.updated_at,
+            updated_at=db_instructor_subject.created_at,  # Not in SQLAlchemy model
         )
 
     @staticmethod
@@ -76,7 +76,7 @@ class InstructorSubjectMapper:
             proficiency = ProficiencyLevel.NATIVE
 
         return {
-            "instructor_id": int(domain_instructor_subject.instructor_id),
+            "instructor_profile_id": int(domain_instructor_subject.instructor_id),
             "subject_id": int(domain_instructor_subject.subject_id),
             "proficiency_level": proficiency,
         }
@@ -104,7 +104,7 @@ class InstructorSubjectMapper:
             proficiency = ProficiencyLevel.NATIVE
 
         return SQLAlchemyInstructorSubject(
-            instructor_id=int(domain_instructor_subject.instructor_id),
+            instructor_profile_id=int(domain_instructor_subject.instructor_id),
             subject_id=int(domain_instructor_subject.subject_id),
             proficiency_level=proficiency,
         )
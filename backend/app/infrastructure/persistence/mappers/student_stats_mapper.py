@@ -0,0 +1,62 @@
+"""Mapper for StudentStats entity and SQLAlchemy StudentStats model."""
+
+from decimal import Decimal
+
+from app.domains.student.entities import StudentStats as DomainStudentStats
+from app.infrastructure.persistence.sqlalchemy_models import StudentStats as SQLAlchemyStudentStats
+
+
+class StudentStatsMapper:
+    """
+    Maps between domain StudentStats entity and SQLAlchemy StudentStats model.
+    """
+
+    @staticmethod
+    def to_domain(db_stats: SQLAlchemyStudentStats) -> DomainStudentStats:
+        """
+        Convert SQLAlchemy StudentStats to domain StudentStats entity.
+
+        Args:
+            db_stats: SQLAlchemy StudentStats model instance
+
+        Returns:
+            Domain StudentStats entity
+        """
+        if db_stats is None:
+            return None
+
+        return DomainStudentStats(
+            student_id=db_stats.student_id,
+            total_sessions_completed=db_stats.total_sessions_completed or 0,
+            total_minutes=db_stats.total_minutes or 0,
+            trial_sessions_completed=db_stats.trial_sessions_completed or 0,
+            unique_instructors=db_stats.unique_instructors or 0,
+            total_spent=Decimal(str(db_stats.total_spent or 0)),
+            current_streak_weeks=db_stats.current_streak_weeks or 0,
+            longest_streak_weeks=db_stats.longest_streak_weeks or 0,
+            last_active_week=db_stats.last_active_week,
+            updated_at=db_stats.updated_at,
+        )
+
+    @staticmethod
+    def update_orm_instance(
+        db_stats: SQLAlchemyStudentStats,
+        domain_stats: DomainStudentStats
+    ) -> None:
+        """
+        Update SQLAlchemy StudentStats instance from domain StudentStats.
+
+        Args:
+            db_stats: SQLAlchemy StudentStats model instance to update
+            domain_stats: Domain StudentStats entity with new values
+        """
+        db_stats.total_sessions_completed = domain_stats.total_sessions_completed
+        db_stats.total_minutes = domain_stats.total_minutes
+        db_stats.trial_sessions_completed = domain_stats.trial_sessions_completed
+        db_stats.unique_instructors = domain_stats.unique_instructors
+        db_stats.total_spent = domain_stats.total_spent
+        db_stats.current_streak_weeks = domain_stats.current_streak_weeks
+        db_stats.longest_streak_weeks = domain_stats.longest_streak_weeks
+        db_stats.last_active_week = domain_stats.last_active_week
+        if domain_stats.updated_at:
+            db_stats.updated_at = domain_stats.updated_at
@@ -31,6 +31,7 @@ class SubjectMapper:
         return DomainSubject(
             id=str(db_subject.id) if db_subject.id else None,
             name=db_subject.name,
+            slug=db_subject.slug,
             category=db_subject.category.value if hasattr(db_subject.category, 'value') else db_subject.category,
             description=db_subject.description,
             icon_url=None,  # Not in current SQLAlchemy model
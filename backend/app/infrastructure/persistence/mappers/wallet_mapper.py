@@ -7,11 +7,12 @@ from typing import Dict, Any, Optional
 from app.database.models import (
     Wallet as WalletORM,
     WalletTransaction as WalletTransactionORM,
+    WalletBalanceSnapshot as WalletBalanceSnapshotORM,
     WalletStatus as WalletStatusORM,
     TransactionType as TransactionTypeORM,
     TransactionStatus as TransactionStatusORM,
 )
-from app.domains.wallet.entities import Wallet, WalletTransaction
+from app.domains.wallet.entities import Wallet, WalletTransaction, WalletBalanceSnapshot
 from app.domains.wallet.value_objects import (
     WalletStatus,
     TransactionType,
@@ -47,6 +48,7 @@ class WalletMapper:
             status=WalletStatus(orm_wallet.status.value),
             created_at=orm_wallet.created_at,
             updated_at=orm_wallet.updated_at,
+            version=orm_wallet.version or 1,
         )
 
     @staticmethod
@@ -54,6 +56,9 @@ class WalletMapper:
         """
         Convert domain entity to persistence dict.
 
+        Balances are left out: they only change through atomic deltas
+        (see Wallet.pending_balance_change).
+
         Args:
             wallet: Wallet domain entity
 
@@ -62,9 +67,6 @@ class WalletMapper:
         """
         return {
             "instructor_id": wallet.instructor_id,
-            "balance": wallet.balance,
-            "total_earned": wallet.total_earned,
-            "total_withdrawn": wallet.total_withdrawn,
             "currency": wallet.currency,
             "status": WalletStatusORM(wallet.status.value),
             "updated_at": wallet.updated_at,
@@ -90,6 +92,7 @@ class WalletMapper:
             status=WalletStatusORM(wallet.status.value),
             created_at=wallet.created_at,
             updated_at=wallet.updated_at,
+            version=wallet.version,
         )
 
     # ========================================================================
@@ -127,6 +130,7 @@ class WalletMapper:
             description=orm_txn.description,
             extra_data=extra_data,
             failure_reason=orm_txn.failure_reason,
+            payout_reference=orm_txn.payout_reference,
             created_at=orm_txn.created_at,
             completed_at=orm_txn.completed_at,
         )
@@ -158,6 +162,7 @@ class WalletMapper:
             "description": txn.description,
             "extra_data": extra_data_str,
             "failure_reason": txn.failure_reason,
+            "payout_reference": txn.payout_reference,
             "completed_at": txn.completed_at,
         }
 
@@ -188,6 +193,36 @@ class WalletMapper:
             description=txn.description,
             extra_data=extra_data_str,
             failure_reason=txn.failure_reason,
+            payout_reference=txn.payout_reference,
             created_at=txn.created_at,
             completed_at=txn.completed_at,
         )
+
+    # ========================================================================
+    # Balance Snapshot Mapping
+    # ========================================================================
+
+    @staticmethod
+    def snapshot_to_domain(orm_snapshot: WalletBalanceSnapshotORM) -> WalletBalanceSnapshot:
+        """Convert ORM snapshot to domain entity."""
+        return WalletBalanceSnapshot(
+            id=orm_snapshot.id,
+            wallet_id=orm_snapshot.wallet_id,
+            as_of=orm_snapshot.as_of,
+            balance=Decimal(str(orm_snapshot.balance)),
+            total_earned=Decimal(str(orm_snapshot.total_earned)),
+            total_withdrawn=Decimal(str(orm_snapshot.total_withdrawn)),
+            created_at=orm_snapshot.created_at,
+        )
+
+    @staticmethod
+    def snapshot_to_row(snapshot: WalletBalanceSnapshot) -> Dict[str, Any]:
+        """Convert domain snapshot to a row for bulk insert."""
+        return {
+            "wallet_id": snapshot.wallet_id,
+            "as_of": snapshot.as_of,
+            "balance": snapshot.balance,
+            "total_earned": snapshot.total_earned,
+            "total_withdrawn": snapshot.total_withdrawn,
+            "created_at": snapshot.created_at,
+        }
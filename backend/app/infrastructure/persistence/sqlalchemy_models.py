@@ -8,7 +8,9 @@ Re-exported here for clarity in the infrastructure layer.
 from app.database.models import (
     User,
     InstructorProfile,
+    InstructorLanguage,
     StudentProfile,
+    StudentStats,
     Education,
     Experience,
     Subject,
@@ -25,12 +27,17 @@ from app.database.models import (
     BookingSlot,
     Session,
     TimeOff,
+    # Analytics models
+    InstructorDailyRollup,
+    PlatformDailyRollup,
 )
 
 __all__ = [
     "User",
     "InstructorProfile",
+    "InstructorLanguage",
     "StudentProfile",
+    "StudentStats",
     "Education",
     "Experience",
     "Subject",
@@ -47,4 +54,7 @@ __all__ = [
     "BookingSlot",
     "Session",
     "TimeOff",
+    # Analytics models
+    "InstructorDailyRollup",
+    "PlatformDailyRollup",
 ]
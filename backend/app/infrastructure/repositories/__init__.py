@@ -3,6 +3,8 @@
 from .user_repository_impl import SQLAlchemyUserRepository
 from .instructor_repository_impl import SQLAlchemyInstructorProfileRepository
 from .student_repository_impl import SQLAlchemyStudentProfileRepository
+from .student_stats_repository_impl import SQLAlchemyStudentStatsRepository
+from .daily_rollup_repository_impl import SQLAlchemyDailyRollupRepository
 from .education_repository_impl import SQLAlchemyEducationRepository
 from .experience_repository_impl import SQLAlchemyExperienceRepository
 from .file_repository_impl import SQLAlchemyFileRepository
@@ -20,6 +22,8 @@ __all__ = [
     "SQLAlchemyUserRepository",
     "SQLAlchemyInstructorProfileRepository",
     "SQLAlchemyStudentProfileRepository",
+    "SQLAlchemyStudentStatsRepository",
+    "SQLAlchemyDailyRollupRepository",
     "SQLAlchemyEducationRepository",
     "SQLAlchemyExperienceRepository",
     "SQLAlchemyFileRepository",
@@ -0,0 +1,232 @@
+"""SQLAlchemy implementation of daily rollup repository."""
+
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.domains.analytics.entities import InstructorDailyRollup, PlatformDailyRollup
+from app.domains.analytics.repositories import IDailyRollupRepository
+from app.infrastructure.persistence.mappers import DailyRollupMapper
+from app.database.models import (
+    InstructorDailyRollup as SQLAlchemyInstructorDailyRollup,
+    PlatformDailyRollup as SQLAlchemyPlatformDailyRollup,
+    InstructorProfile as SQLAlchemyInstructorProfile,
+    Payment as SQLAlchemyPayment,
+    PaymentStatus as PaymentStatusORM,
+    Session as SQLAlchemySession,
+)
+
+
+def _as_date(value) -> date:
+    """date() of a datetime column: a date on PostgreSQL, an ISO string on SQLite."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+def _day_bounds(start: date, end: date) -> Tuple[datetime, datetime]:
+    """[start 00:00, end+1 00:00) for range filters on indexed timestamps."""
+    return datetime.combine(start, time.min), datetime.combine(end + timedelta(days=1), time.min)
+
+
+class SQLAlchemyDailyRollupRepository(IDailyRollupRepository):
+    """
+    SQLAlchemy implementation of IDailyRollupRepository.
+
+    Aggregation runs one GROUP BY per metric over a timestamp range, each
+    served by an index on that timestamp, so refreshing a day reads only
+    that day's sessions and payments.
+    """
+
+    def __init__(self, db: Session):
+        """
+        Initialize repository with database session.
+
+        Args:
+            db: SQLAlchemy database session
+        """
+        self.db = db
+        self.mapper = DailyRollupMapper
+
+    def aggregate_instructor_days(self, start: date, end: date) -> List[InstructorDailyRollup]:
+        """Compute instructor rollups from sessions and payments."""
+        try:
+            since, until = _day_bounds(start, end)
+            rollups: Dict[Tuple[date, int], InstructorDailyRollup] = {}
+
+            def rollup_for(day, instructor_id: int) -> InstructorDailyRollup:
+                key = (_as_date(day), instructor_id)
+                if key not in rollups:
+                    rollups[key] = InstructorDailyRollup(day=key[0], instructor_id=instructor_id)
+                return rollups[key]
+
+            # Bookings: sessions created that day
+            booked_day = func.date(SQLAlchemySession.created_at)
+            for day, instructor_id, count in (
+                self.db.query(booked_day, SQLAlchemySession.instructor_id, func.count())
+                .filter(SQLAlchemySession.created_at >= since, SQLAlchemySession.created_at < until)
+                .group_by(booked_day, SQLAlchemySession.instructor_id)
+            ):
+                rollup_for(day, instructor_id).bookings = count
+
+            # Cancellations: sessions cancelled that day
+            cancelled_day = func.date(SQLAlchemySession.cancelled_at)
+            for day, instructor_id, count in (
+                self.db.query(cancelled_day, SQLAlchemySession.instructor_id, func.count())
+                .filter(
+                    SQLAlchemySession.cancelled_at >= since,
+                    SQLAlchemySession.cancelled_at < until,
+                    SQLAlchemySession.status == "cancelled",
+                )
+                .group_by(cancelled_day, SQLAlchemySession.instructor_id)
+            ):
+                rollup_for(day, instructor_id).cancellations = count
+
+            # Completed sessions and minutes, by the day the session started
+            started_day = func.date(SQLAlchemySession.start_at)
+            for day, instructor_id, count, minutes in (
+                self.db.query(
+                    started_day,
+                    SQLAlchemySession.instructor_id,
+                    func.count(),
+                    func.coalesce(func.sum(SQLAlchemySession.duration_minutes), 0),
+                )
+                .filter(
+                    SQLAlchemySession.start_at >= since,
+                    SQLAlchemySession.start_at < until,
+                    SQLAlchemySession.status == "completed",
+                )
+                .group_by(started_day, SQLAlchemySession.instructor_id)
+            ):
+                rollup = rollup_for(day, instructor_id)
+                rollup.completed_sessions = count
+                rollup.completed_minutes = int(minutes)
+
+            # Gross amount: payments completed that day (payments reference the instructor's user)
+            paid_day = func.date(SQLAlchemyPayment.completed_at)
+            for day, instructor_id, amount in (
+                self.db.query(
+                    paid_day,
+                    SQLAlchemyInstructorProfile.id,
+                    func.coalesce(func.sum(SQLAlchemyPayment.amount), 0),
+                )
+                .join(
+                    SQLAlchemyInstructorProfile,
+                    SQLAlchemyInstructorProfile.user_id == SQLAlchemyPayment.instructor_id,
+                )
+                .filter(
+                    SQLAlchemyPayment.completed_at >= since,
+                    SQLAlchemyPayment.completed_at < until,
+                    SQLAlchemyPayment.status == PaymentStatusORM.COMPLETED,
+                )
+                .group_by(paid_day, SQLAlchemyInstructorProfile.id)
+            ):
+                rollup_for(day, instructor_id).gross_amount = Decimal(str(amount))
+
+            return sorted(rollups.values(), key=lambda r: (r.day, r.instructor_id))
+
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to aggregate daily rollups: {str(e)}")
+
+    def replace_days(
+        self,
+        start: date,
+        end: date,
+        instructor_rollups: List[InstructorDailyRollup],
+        platform_rollups: List[PlatformDailyRollup],
+    ) -> None:
+        """Replace all stored rollups for a range of days."""
+        try:
+            self.db.query(SQLAlchemyInstructorDailyRollup).filter(
+                SQLAlchemyInstructorDailyRollup.day >= start,
+                SQLAlchemyInstructorDailyRollup.day <= end,
+            ).delete(synchronize_session=False)
+            self.db.query(SQLAlchemyPlatformDailyRollup).filter(
+                SQLAlchemyPlatformDailyRollup.day >= start,
+                SQLAlchemyPlatformDailyRollup.day <= end,
+            ).delete(synchronize_session=False)
+
+            if instructor_rollups:
+                self.db.execute(
+                    SQLAlchemyInstructorDailyRollup.__table__.insert(),
+                    [self.mapper.instructor_to_row(rollup) for rollup in instructor_rollups],
+                )
+            if platform_rollups:
+                self.db.execute(
+                    SQLAlchemyPlatformDailyRollup.__table__.insert(),
+                    [self.mapper.platform_to_row(rollup) for rollup in platform_rollups],
+                )
+            self.db.flush()
+
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise Exception(f"Failed to save daily rollups: {str(e)}")
+
+    def get_latest_day(self) -> Optional[date]:
+        """Get the most recent day that has been rolled up."""
+        try:
+            latest = self.db.query(func.max(SQLAlchemyPlatformDailyRollup.day)).scalar()
+            return _as_date(latest) if latest else None
+
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to get latest rollup day: {str(e)}")
+
+    def get_earliest_activity_day(self) -> Optional[date]:
+        """Get the first day with any session or payment activity."""
+        try:
+            candidates = [
+                self.db.query(func.min(SQLAlchemySession.created_at)).scalar(),
+                self.db.query(func.min(SQLAlchemySession.start_at)).scalar(),
+                self.db.query(func.min(SQLAlchemyPayment.completed_at)).scalar(),
+            ]
+            days = [_as_date(value) for value in candidates if value]
+            return min(days) if days else None
+
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to get earliest activity day: {str(e)}")
+
+    def get_platform_days(self, start: date, end: date) -> List[PlatformDailyRollup]:
+        """Get platform rollups for a range of days."""
+        try:
+            db_rollups = (
+                self.db.query(SQLAlchemyPlatformDailyRollup)
+                .filter(
+                    SQLAlchemyPlatformDailyRollup.day >= start,
+                    SQLAlchemyPlatformDailyRollup.day <= end,
+                )
+                .order_by(SQLAlchemyPlatformDailyRollup.day)
+                .all()
+            )
+            return [self.mapper.platform_to_domain(db_rollup) for db_rollup in db_rollups]
+
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to get platform rollups: {str(e)}")
+
+    def get_instructor_days(
+        self,
+        instructor_id: int,
+        start: date,
+        end: date,
+    ) -> List[InstructorDailyRollup]:
+        """Get one instructor's rollups for a range of days."""
+        try:
+            db_rollups = (
+                self.db.query(SQLAlchemyInstructorDailyRollup)
+                .filter(
+                    SQLAlchemyInstructorDailyRollup.instructor_id == instructor_id,
+                    SQLAlchemyInstructorDailyRollup.day >= start,
+                    SQLAlchemyInstructorDailyRollup.day <= end,
+                )
+                .order_by(SQLAlchemyInstructorDailyRollup.day)
+                .all()
+            )
+            return [self.mapper.instructor_to_domain(db_rollup) for db_rollup in db_rollups]
+
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to get instructor rollups: {str(e)}")
@@ -1,16 +1,34 @@
 """SQLAlchemy implementation of InstructorProfile repository."""
 
-from typing import Optional, List, Tuple
-from sqlalchemy.orm import Session
+from dataclasses import replace
+from datetime import datetime
+from typing import Optional, List, Tuple, Dict, Iterable
+from sqlalchemy import and_, case, distinct, func, literal_column, or_, select, union_all
+from sqlalchemy.orm import Session, Query
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.domains.instructor.entities import InstructorProfile
-from app.domains.instructor.value_objects import InstructorStatus
+from app.domains.instructor.value_objects import (
+    InstructorStatus,
+    InstructorSearchCriteria,
+    InstructorSearchFacets,
+    InstructorSortOrder,
+    FacetCount,
+    PRICE_BUCKETS,
+)
 from app.domains.instructor.repositories import IInstructorProfileRepository
 from app.domains.user.entities import User
 from app.infrastructure.persistence.mappers import InstructorProfileMapper, UserMapper
+from app.infrastructure.cache import instructor_search_cache, public_profile_cache
+from app.infrastructure.search import InstructorSearchIndex, user_search_filter
+from app.infrastructure.repositories.instructor_subject_repository_impl import (
+    SQLAlchemyInstructorSubjectRepository,
+)
 from app.infrastructure.persistence.sqlalchemy_models import (
     InstructorProfile as SQLAlchemyInstructorProfile,
+    InstructorLanguage as SQLAlchemyInstructorLanguage,
+    InstructorSubject as SQLAlchemyInstructorSubject,
+    Subject as SQLAlchemySubject,
     User as SQLAlchemyUser,
 )
 
@@ -32,6 +50,7 @@ class SQLAlchemyInstructorProfileRepository(IInstructorProfileRepository):
         """
         self.db = db
         self.mapper = InstructorProfileMapper
+        self.search_index = InstructorSearchIndex(db)
 
     def save(self, profile: InstructorProfile) -> InstructorProfile:
         """Save instructor profile to database."""
@@ -39,6 +58,8 @@ class SQLAlchemyInstructorProfileRepository(IInstructorProfileRepository):
             db_profile = self.mapper.create_orm_instance(profile)
             self.db.add(db_profile)
             self.db.flush()
+            self.search_index.index(db_profile.id)
+            self._invalidate_search_cache(db_profile.status)
 
             profile.id = db_profile.id
             return profile
@@ -59,6 +80,22 @@ class SQLAlchemyInstructorProfileRepository(IInstructorProfileRepository):
         except SQLAlchemyError as e:
             raise Exception(f"Failed to get instructor profile by ID: {str(e)}")
 
+    def get_many(self, instructor_ids: Iterable[int]) -> Dict[int, InstructorProfile]:
+        """Get several instructor profiles by ID in one query."""
+        ids = set(instructor_ids)
+        if not ids:
+            return {}
+
+        try:
+            db_profiles = self.db.query(SQLAlchemyInstructorProfile).filter(
+                SQLAlchemyInstructorProfile.id.in_(ids)
+            ).all()
+
+            return {db_profile.id: self.mapper.to_domain(db_profile) for db_profile in db_profiles}
+
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to get instructor profiles by IDs: {str(e)}")
+
     def get_by_user_id(self, user_id: int) -> Optional[InstructorProfile]:
         """Get instructor profile by user ID."""
         try:
@@ -76,21 +113,288 @@ class SQLAlchemyInstructorProfileRepository(IInstructorProfileRepository):
         status: Optional[InstructorStatus] = None,
         skip: int = 0,
         limit: int = 100,
+        search: Optional[str] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+        newest_first: bool = True,
     ) -> List[InstructorProfile]:
-        """Get all instructor profiles with optional filtering."""
+        """Get all instructor profiles with optional filtering, ordered by (created_at, id)."""
         try:
             query = self.db.query(SQLAlchemyInstructorProfile)
 
             if status:
                 query = query.filter(SQLAlchemyInstructorProfile.status == status.value)
 
-            db_profiles = query.offset(skip).limit(limit).all()
+            if search:
+                search_filter = user_search_filter(search)
+                if search_filter is not None:
+                    query = query.join(
+                        SQLAlchemyUser, SQLAlchemyUser.id == SQLAlchemyInstructorProfile.user_id
+                    ).filter(search_filter)
+
+            # Keyset pagination on (created_at, id); OFFSET only without a cursor
+            created_col = SQLAlchemyInstructorProfile.created_at
+            id_col = SQLAlchemyInstructorProfile.id
+            if after:
+                created_at, profile_id = after
+                if newest_first:
+                    query = query.filter(or_(
+                        created_col < created_at,
+                        and_(created_col == created_at, id_col < profile_id),
+                    ))
+                else:
+                    query = query.filter(or_(
+                        created_col > created_at,
+                        and_(created_col == created_at, id_col > profile_id),
+                    ))
+
+            if newest_first:
+                query = query.order_by(created_col.desc(), id_col.desc())
+            else:
+                query = query.order_by(created_col, id_col)
+            if not after:
+                query = query.offset(skip)
+
+            db_profiles = query.limit(limit).all()
 
             return [self.mapper.to_domain(db_profile) for db_profile in db_profiles]
 
         except SQLAlchemyError as e:
             raise Exception(f"Failed to get all instructor profiles: {str(e)}")
 
+    def search(
+        self,
+        criteria: InstructorSearchCriteria,
+        skip: int = 0,
+        limit: int = 20,
+    ) -> Tuple[List[InstructorProfile], int]:
+        """Search instructor profiles with database-side filtering and pagination."""
+        try:
+            query = self._search_query(criteria)
+
+            total = query.order_by(None).count()
+            if total == 0 or skip >= total:
+                return [], total
+
+            db_profiles = (
+                query.order_by(*self._search_ordering(criteria.sort))
+                .offset(skip)
+                .limit(limit)
+                .all()
+            )
+
+            return [self.mapper.to_domain(db_profile) for db_profile in db_profiles], total
+
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to search instructor profiles: {str(e)}")
+
+    def search_ranked(
+        self,
+        criteria: InstructorSearchCriteria,
+        limit: int = 20,
+        after: Optional[Tuple[float, int]] = None,
+    ) -> Tuple[List[Tuple[InstructorProfile, float]], int]:
+        """Full-text search ordered by relevance with keyset pagination."""
+        try:
+            hits = self.search_index.matches(criteria.text_query or "")
+            if hits is None:
+                return [], 0
+
+            query = self._search_query(criteria).join(
+                hits, hits.c.instructor_id == SQLAlchemyInstructorProfile.id
+            )
+            total = query.order_by(None).count()
+            if total == 0:
+                return [], 0
+
+            if after is not None:
+                after_score, after_id = after
+                query = query.filter(
+                    (hits.c.score > after_score)
+                    | ((hits.c.score == after_score) & (SQLAlchemyInstructorProfile.id > after_id))
+                )
+
+            rows = (
+                query.add_columns(hits.c.score)
+                .order_by(hits.c.score.asc(), SQLAlchemyInstructorProfile.id.asc())
+                .limit(limit)
+                .all()
+            )
+
+            return [(self.mapper.to_domain(db_profile), float(score)) for db_profile, score in rows], total
+
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to search instructor profiles: {str(e)}")
+
+    def get_search_facets(self, criteria: InstructorSearchCriteria) -> InstructorSearchFacets:
+        """Language, price bucket and subject counts in a single UNION ALL query."""
+        try:
+            language_ids = self._matching_ids(replace(criteria, language=None))
+            price_ids = self._matching_ids(replace(criteria, min_price=None, max_price=None))
+            subject_ids = self._matching_ids(
+                replace(criteria, subject_id=None, subject_slug=None, category=None)
+            )
+            if language_ids is None:
+                # Free-text query without searchable terms matches nothing
+                return InstructorSearchFacets()
+
+            language_facet = (
+                select(
+                    literal_column("'language'").label("facet"),
+                    SQLAlchemyInstructorLanguage.language.label("key"),
+                    SQLAlchemyInstructorLanguage.language.label("label"),
+                    func.count().label("count"),
+                )
+                .where(SQLAlchemyInstructorLanguage.instructor_id.in_(language_ids))
+                .group_by(SQLAlchemyInstructorLanguage.language)
+            )
+
+            # Bucket in a subquery so GROUP BY references a plain column
+            rate = SQLAlchemyInstructorProfile.regular_session_price
+            bucketed = (
+                select(
+                    case(
+                        *[
+                            (
+                                (rate >= bucket.min_price) & (rate < bucket.max_price)
+                                if bucket.max_price is not None
+                                else rate >= bucket.min_price,
+                                bucket.key,
+                            )
+                            for bucket in PRICE_BUCKETS
+                        ],
+                        else_=None,
+                    ).label("bucket")
+                )
+                .where(SQLAlchemyInstructorProfile.id.in_(price_ids), rate.isnot(None))
+                .subquery("price_buckets")
+            )
+            price_facet = (
+                select(
+                    literal_column("'price'").label("facet"),
+                    bucketed.c.bucket.label("key"),
+                    bucketed.c.bucket.label("label"),
+                    func.count().label("count"),
+                )
+                .where(bucketed.c.bucket.isnot(None))
+                .group_by(bucketed.c.bucket)
+            )
+
+            subject_facet = (
+                select(
+                    literal_column("'subject'").label("facet"),
+                    SQLAlchemySubject.slug.label("key"),
+                    SQLAlchemySubject.name.label("label"),
+                    func.count(distinct(SQLAlchemyInstructorSubject.instructor_profile_id)).label("count"),
+                )
+                .join(SQLAlchemySubject, SQLAlchemySubject.id == SQLAlchemyInstructorSubject.subject_id)
+                .where(
+                    SQLAlchemyInstructorSubject.instructor_profile_id.in_(subject_ids),
+                    SQLAlchemySubject.is_active.is_(True),
+                )
+                .group_by(SQLAlchemySubject.id, SQLAlchemySubject.slug, SQLAlchemySubject.name)
+            )
+
+            rows = self.db.execute(union_all(language_facet, price_facet, subject_facet)).all()
+
+            counts = {"language": [], "price": {}, "subject": []}
+            for row in rows:
+                if row.facet == "price":
+                    counts["price"][row.key] = row.count
+                else:
+                    counts[row.facet].append(FacetCount(key=row.key, label=row.label, count=row.count))
+
+            def by_count(facet: FacetCount) -> Tuple:
+                return (-facet.count, facet.label)
+
+            return InstructorSearchFacets(
+                languages=tuple(sorted(counts["language"], key=by_count)),
+                price_buckets=tuple(
+                    FacetCount(key=bucket.key, label=bucket.label, count=counts["price"].get(bucket.key, 0))
+                    for bucket in PRICE_BUCKETS
+                ),
+                subjects=tuple(sorted(counts["subject"], key=by_count)),
+            )
+
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to get instructor search facets: {str(e)}")
+
+    def _matching_ids(self, criteria: InstructorSearchCriteria):
+        """IDs of profiles matching criteria (including text_query) as a subquery."""
+        query = self._search_query(criteria).with_entities(SQLAlchemyInstructorProfile.id)
+
+        if criteria.is_text_search:
+            hits = self.search_index.matches(criteria.text_query)
+            if hits is None:
+                return None
+            query = query.join(hits, hits.c.instructor_id == SQLAlchemyInstructorProfile.id)
+
+        return query.scalar_subquery()
+
+    def _invalidate_search_cache(self, *statuses) -> None:
+        """Drop cached search results (after commit) if a searchable profile changed."""
+        if InstructorStatus.VERIFIED.value in {getattr(status, "value", status) for status in statuses}:
+            instructor_search_cache.invalidate_on_commit(self.db)
+
+    @staticmethod
+    def _indexed_text(db_profile: SQLAlchemyInstructorProfile) -> Tuple:
+        """Profile fields covered by the full-text index."""
+        return (db_profile.headline, db_profile.bio, db_profile.teaching_experience)
+
+    def _search_query(self, criteria: InstructorSearchCriteria) -> Query:
+        """Build the filtered (unordered) query for a search."""
+        model = SQLAlchemyInstructorProfile
+        query = self.db.query(model)
+
+        if criteria.status:
+            query = query.filter(model.status == criteria.status.value)
+
+        # Profiles without pricing never match a price range
+        if criteria.min_price is not None:
+            query = query.filter(model.regular_session_price >= criteria.min_price)
+        if criteria.max_price is not None:
+            query = query.filter(model.regular_session_price <= criteria.max_price)
+
+        if criteria.language:
+            # Indexed semi-join on the normalized instructor_languages table
+            query = query.filter(
+                self.db.query(SQLAlchemyInstructorLanguage.id)
+                .filter(
+                    SQLAlchemyInstructorLanguage.instructor_id == model.id,
+                    SQLAlchemyInstructorLanguage.language == criteria.language,
+                )
+                .exists()
+            )
+
+        if criteria.has_subject_filter:
+            query = query.filter(
+                SQLAlchemyInstructorSubjectRepository.teaches_filter(
+                    model.id,
+                    subject_id=criteria.subject_id,
+                    subject_slug=criteria.subject_slug,
+                    category=criteria.category,
+                )
+            )
+
+        return query
+
+    @staticmethod
+    def _search_ordering(sort: InstructorSortOrder) -> list:
+        """ORDER BY clauses for a sort order (always ending in a unique key)."""
+        model = SQLAlchemyInstructorProfile
+
+        if sort == InstructorSortOrder.PRICE_LOW:
+            return [model.regular_session_price.asc().nulls_last(), model.id.asc()]
+        if sort == InstructorSortOrder.PRICE_HIGH:
+            return [model.regular_session_price.desc().nulls_last(), model.id.asc()]
+        if sort == InstructorSortOrder.NEWEST:
+            return [model.created_at.desc(), model.id.desc()]
+
+        return [
+            model.average_rating.desc().nulls_last(),
+            model.total_ratings.desc(),
+            model.id.asc(),
+        ]
+
     def update(self, profile: InstructorProfile) -> InstructorProfile:
         """Update existing instructor profile."""
         try:
@@ -101,9 +405,18 @@ class SQLAlchemyInstructorProfileRepository(IInstructorProfileRepository):
             if not db_profile:
                 raise ValueError(f"Instructor profile with ID {profile.id} not found")
 
+            indexed_text = self._indexed_text(db_profile)
+            previous_status = db_profile.status
             self.mapper.update_orm_instance(db_profile, profile)
             self.db.flush()
 
+            # Verify / reject / suspend, pricing and about changes all land here
+            self._invalidate_search_cache(previous_status, db_profile.status)
+            public_profile_cache.invalidate_on_commit(self.db, instructor_id=db_profile.id)
+
+            if self._indexed_text(db_profile) != indexed_text:
+                self.search_index.index(db_profile.id)
+
             return profile
 
         except SQLAlchemyError as e:
@@ -120,8 +433,12 @@ class SQLAlchemyInstructorProfileRepository(IInstructorProfileRepository):
             if not db_profile:
                 return False
 
+            status = db_profile.status
             self.db.delete(db_profile)
             self.db.flush()
+            self.search_index.remove(instructor_id)
+            self._invalidate_search_cache(status)
+            public_profile_cache.invalidate_on_commit(self.db, instructor_id=instructor_id)
 
             return True
 
@@ -142,6 +459,19 @@ class SQLAlchemyInstructorProfileRepository(IInstructorProfileRepository):
         except SQLAlchemyError as e:
             raise Exception(f"Failed to count instructor profiles: {str(e)}")
 
+    def count_by_status(self) -> Dict[InstructorStatus, int]:
+        """Count instructor profiles grouped by status in a single query."""
+        try:
+            rows = self.db.query(
+                SQLAlchemyInstructorProfile.status,
+                func.count(SQLAlchemyInstructorProfile.id),
+            ).group_by(SQLAlchemyInstructorProfile.status).all()
+
+            return {InstructorStatus(status.value): count for status, count in rows}
+
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to count instructor profiles: {str(e)}")
+
     def get_dashboard_data(self, user_id: int) -> Optional[Tuple[InstructorProfile, User]]:
         """
         Get instructor profile with user data for dashboard.
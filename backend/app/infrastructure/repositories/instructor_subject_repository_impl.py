@@ -1,13 +1,20 @@
 """SQLAlchemy implementation of InstructorSubject repository."""
 
-from typing import Optional, List
+from typing import Optional, List, Dict
+from sqlalchemy import select, exists
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.sql.elements import ColumnElement
 
-from app.domains.subject.entities import InstructorSubject
+from app.domains.subject.entities import InstructorSubject, Subject
 from app.domains.subject.repositories import IInstructorSubjectRepository
-from app.infrastructure.persistence.mappers import InstructorSubjectMapper
-from app.infrastructure.persistence.sqlalchemy_models import InstructorSubject as SQLAlchemyInstructorSubject
+from app.infrastructure.persistence.mappers import InstructorSubjectMapper, SubjectMapper
+from app.infrastructure.cache import instructor_search_cache
+from app.infrastructure.search import InstructorSearchIndex
+from app.infrastructure.persistence.sqlalchemy_models import (
+    InstructorSubject as SQLAlchemyInstructorSubject,
+    Subject as SQLAlchemySubject,
+)
 
 
 class SQLAlchemyInstructorSubjectRepository(IInstructorSubjectRepository):
@@ -27,6 +34,7 @@ class SQLAlchemyInstructorSubjectRepository(IInstructorSubjectRepository):
         """
         self.db = db
         self.mapper = InstructorSubjectMapper
+        self.search_index = InstructorSearchIndex(db)
 
     def save(self, instructor_subject: InstructorSubject) -> InstructorSubject:
         """Save instructor-subject relationship to database."""
@@ -35,6 +43,10 @@ class SQLAlchemyInstructorSubjectRepository(IInstructorSubjectRepository):
             self.db.add(db_instructor_subject)
             self.db.flush()
 
+            # Subject names are part of the instructor's search document
+            self.search_index.index(db_instructor_subject.instructor_profile_id)
+            instructor_search_cache.invalidate_on_commit(self.db)
+
             instructor_subject.id = str(db_instructor_subject.id)
             return instructor_subject
 
@@ -58,7 +70,7 @@ class SQLAlchemyInstructorSubjectRepository(IInstructorSubjectRepository):
         """Get all subjects taught by an instructor."""
         try:
             db_instructor_subjects = self.db.query(SQLAlchemyInstructorSubject).filter(
-                SQLAlchemyInstructorSubject.instructor_id == int(instructor_id)
+                SQLAlchemyInstructorSubject.instructor_profile_id == int(instructor_id)
             ).all()
 
             return [self.mapper.to_domain(db_is) for db_is in db_instructor_subjects]
@@ -86,7 +98,7 @@ class SQLAlchemyInstructorSubjectRepository(IInstructorSubjectRepository):
         """Get specific instructor-subject relationship."""
         try:
             db_instructor_subject = self.db.query(SQLAlchemyInstructorSubject).filter(
-                SQLAlchemyInstructorSubject.instructor_id == int(instructor_id),
+                SQLAlchemyInstructorSubject.instructor_profile_id == int(instructor_id),
                 SQLAlchemyInstructorSubject.subject_id == int(subject_id)
             ).first()
 
@@ -124,8 +136,11 @@ class SQLAlchemyInstructorSubjectRepository(IInstructorSubjectRepository):
             if not db_instructor_subject:
                 return False
 
+            instructor_id = db_instructor_subject.instructor_profile_id
             self.db.delete(db_instructor_subject)
             self.db.flush()
+            self.search_index.index(instructor_id)
+            instructor_search_cache.invalidate_on_commit(self.db)
 
             return True
 
@@ -137,7 +152,7 @@ class SQLAlchemyInstructorSubjectRepository(IInstructorSubjectRepository):
         """Check if instructor-subject relationship exists."""
         try:
             count = self.db.query(SQLAlchemyInstructorSubject).filter(
-                SQLAlchemyInstructorSubject.instructor_id == int(instructor_id),
+                SQLAlchemyInstructorSubject.instructor_profile_id == int(instructor_id),
                 SQLAlchemyInstructorSubject.subject_id == int(subject_id)
             ).count()
 
@@ -145,3 +160,68 @@ class SQLAlchemyInstructorSubjectRepository(IInstructorSubjectRepository):
 
         except SQLAlchemyError as e:
             raise Exception(f"Failed to check instructor-subject existence: {str(e)}")
+
+    def get_subjects_for_instructors(self, instructor_ids: List[int]) -> Dict[int, List[Subject]]:
+        """Batch-load active subjects for many instructors in a single query."""
+        if not instructor_ids:
+            return {}
+
+        try:
+            rows = (
+                self.db.query(SQLAlchemyInstructorSubject.instructor_profile_id, SQLAlchemySubject)
+                .join(SQLAlchemySubject, SQLAlchemySubject.id == SQLAlchemyInstructorSubject.subject_id)
+                .filter(
+                    SQLAlchemyInstructorSubject.instructor_profile_id.in_(set(instructor_ids)),
+                    SQLAlchemySubject.is_active.is_(True),
+                )
+                .order_by(SQLAlchemyInstructorSubject.instructor_profile_id, SQLAlchemySubject.name)
+                .all()
+            )
+
+            subjects: Dict[int, List[Subject]] = {}
+            for instructor_id, db_subject in rows:
+                subjects.setdefault(instructor_id, []).append(SubjectMapper.to_domain(db_subject))
+            return subjects
+
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to get subjects for instructors: {str(e)}")
+
+    @staticmethod
+    def teaches_filter(
+        instructor_id_column,
+        subject_id: Optional[int] = None,
+        subject_slug: Optional[str] = None,
+        category: Optional[str] = None,
+    ) -> ColumnElement:
+        """
+        Correlated EXISTS clause: the instructor teaches a matching active subject.
+
+        Used by instructor search to filter profiles by subject or category
+        through the (subject_id, instructor_profile_id) index.
+
+        Args:
+            instructor_id_column: Instructor profile ID column of the outer query
+            subject_id: Optional subject ID
+            subject_slug: Optional subject slug
+            category: Optional subject category
+
+        Returns:
+            SQL boolean expression
+        """
+        query = (
+            select(SQLAlchemyInstructorSubject.id)
+            .join(SQLAlchemySubject, SQLAlchemySubject.id == SQLAlchemyInstructorSubject.subject_id)
+            .where(
+                SQLAlchemyInstructorSubject.instructor_profile_id == instructor_id_column,
+                SQLAlchemySubject.is_active.is_(True),
+            )
+        )
+
+        if subject_id is not None:
+            query = query.where(SQLAlchemyInstructorSubject.subject_id == subject_id)
+        if subject_slug:
+            query = query.where(SQLAlchemySubject.slug == subject_slug)
+        if category:
+            query = query.where(SQLAlchemySubject.category == category)
+
+        return exists(query)
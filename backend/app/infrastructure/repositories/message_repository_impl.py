@@ -1,6 +1,6 @@
 """SQLAlchemy implementation of Message repository."""
 
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy import desc, and_, or_, func
@@ -9,6 +9,7 @@ from app.domains.messaging.entities import Message
 from app.domains.messaging.value_objects import MessageStatus
 from app.domains.messaging.repositories import IMessageRepository
 from app.infrastructure.persistence.mappers import MessageMapper
+from app.infrastructure.search import MessageSearchIndex
 from app.database.models import (
     Message as SQLAlchemyMessage,
     Conversation as SQLAlchemyConversation,
@@ -33,6 +34,7 @@ class SQLAlchemyMessageRepository(IMessageRepository):
         """
         self.db = db
         self.mapper = MessageMapper
+        self.search_index = MessageSearchIndex(db)
 
     def save(self, message: Message) -> Message:
         """Save message to database."""
@@ -44,6 +46,8 @@ class SQLAlchemyMessageRepository(IMessageRepository):
             self.db.add(db_message)
             self.db.flush()
 
+            self.search_index.index(db_message.id, db_message.content)
+
             message.id = db_message.id
             return message
 
@@ -117,9 +121,15 @@ class SQLAlchemyMessageRepository(IMessageRepository):
             if not db_message:
                 raise ValueError(f"Message {message.id} not found")
 
+            content_changed = db_message.content != message.content
+
             self.mapper.update_orm_instance(db_message, message)
             self.db.flush()
 
+            # Status-only updates (delivered/read) leave the index untouched
+            if content_changed:
+                self.search_index.index(db_message.id, db_message.content)
+
             return message
 
         except SQLAlchemyError as e:
@@ -212,3 +222,38 @@ class SQLAlchemyMessageRepository(IMessageRepository):
 
         except SQLAlchemyError as e:
             raise Exception(f"Failed to count total unread messages: {str(e)}")
+
+    def search_messages(
+        self,
+        user_id: int,
+        query: str,
+        conversation_id: Optional[int] = None,
+        limit: int = 20,
+        after: Optional[Tuple[float, int]] = None,
+    ) -> List[Tuple[Message, float]]:
+        """Full-text search over messages in a user's conversations."""
+        try:
+            hits = self.search_index.search(
+                user_id=user_id,
+                query=query,
+                conversation_id=conversation_id,
+                limit=limit,
+                after=after,
+            )
+            if not hits:
+                return []
+
+            db_messages = self.db.query(SQLAlchemyMessage).filter(
+                SQLAlchemyMessage.id.in_([message_id for message_id, _ in hits])
+            ).all()
+            by_id = {m.id: m for m in db_messages}
+
+            # Preserve ranking order from the index
+            return [
+                (self.mapper.to_domain(by_id[message_id]), rank)
+                for message_id, rank in hits
+                if message_id in by_id
+            ]
+
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to search messages: {str(e)}")
@@ -5,8 +5,10 @@ SQLAlchemy implementation of the IPaymentRepository interface.
 """
 
 from datetime import datetime, timedelta
-from typing import List, Optional
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
 
+from sqlalchemy import and_, case, func, or_, update
 from sqlalchemy.orm import Session as DBSession
 
 from app.domains.payment.entities.payment import Payment
@@ -214,26 +216,83 @@ class PaymentRepositoryImpl(IPaymentRepository):
     def get_processing_payments_older_than(
         self,
         minutes: int,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, int]] = None,
     ) -> List[Payment]:
         """
         Get processing payments older than specified minutes.
 
-        Used to find stale payments that should be cancelled.
+        Used to find stale payments that should be cancelled. Batches are
+        read in (created_at, id) order, served by the
+        (status, created_at, id) index.
 
         Args:
             minutes: Age threshold in minutes
+            limit: Maximum number of payments returned (None: all)
+            after: Keyset cursor - (created_at, id) of the last payment of
+                the previous batch
 
         Returns:
-            List of stale processing payments
+            List of stale processing payments, oldest first
         """
         threshold = datetime.utcnow() - timedelta(minutes=minutes)
 
-        orm_payments = self.db.query(PaymentORM).filter(
+        query = self.db.query(PaymentORM).filter(
             PaymentORM.status == PaymentStatusORM.PROCESSING,
             PaymentORM.created_at < threshold
+        )
+
+        if after:
+            after_created_at, after_id = after
+            query = query.filter(
+                or_(
+                    PaymentORM.created_at > after_created_at,
+                    and_(
+                        PaymentORM.created_at == after_created_at,
+                        PaymentORM.id > after_id,
+                    ),
+                )
+            )
+
+        query = query.order_by(PaymentORM.created_at, PaymentORM.id)
+        if limit is not None:
+            query = query.limit(limit)
+
+        return [PaymentMapper.to_domain(p) for p in query.all()]
+
+    def fail_processing_payments(self, reasons: Dict[int, str]) -> Dict[int, int]:
+        """
+        Mark processing payments as failed in one statement.
+
+        Guarded on PROCESSING, so a payment confirmed while the reaper was
+        checking it is never overwritten.
+
+        Args:
+            reasons: Failure reason by payment ID
+
+        Returns:
+            Slot ID by payment ID, for the payments actually failed
+        """
+        if not reasons:
+            return {}
+
+        rows = self.db.execute(
+            update(PaymentORM)
+            .where(
+                PaymentORM.id.in_(list(reasons)),
+                PaymentORM.status == PaymentStatusORM.PROCESSING,
+            )
+            .values(
+                status=PaymentStatusORM.FAILED,
+                failure_reason=case(reasons, value=PaymentORM.id),
+                updated_at=datetime.utcnow(),
+            )
+            .returning(PaymentORM.id, PaymentORM.slot_id)
+            .execution_options(synchronize_session=False)
         ).all()
+        self.db.commit()
 
-        return [PaymentMapper.to_domain(p) for p in orm_payments]
+        return {payment_id: slot_id for payment_id, slot_id in rows}
 
     def count_by_student_id(
         self,
@@ -260,3 +319,29 @@ class PaymentRepositoryImpl(IPaymentRepository):
             )
 
         return query.count()
+
+    def sum_by_student_id(
+        self,
+        student_id: int,
+        status: Optional[PaymentStatus] = None,
+    ) -> Decimal:
+        """
+        Sum payment amounts by student ID.
+
+        Args:
+            student_id: Student identifier
+            status: Optional filter by status
+
+        Returns:
+            Total amount (0.00 if no payments)
+        """
+        query = self.db.query(func.coalesce(func.sum(PaymentORM.amount), 0)).filter(
+            PaymentORM.student_id == student_id
+        )
+
+        if status:
+            query = query.filter(
+                PaymentORM.status == PaymentStatusORM(status.value)
+            )
+
+        return Decimal(str(query.scalar())).quantize(Decimal("0.01"))
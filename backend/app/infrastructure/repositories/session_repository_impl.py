@@ -1,14 +1,20 @@
 """SQLAlchemy implementation of ISessionRepository."""
 
 from datetime import datetime, date, timedelta
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from sqlalchemy.orm import Session as DBSession
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, case, func
 
 from app.domains.scheduling.entities import Session
 from app.domains.scheduling.repositories import ISessionRepository
-from app.domains.scheduling.value_objects import SessionStatus
+from app.domains.scheduling.value_objects import (
+    SessionStatus,
+    SessionType,
+    InstructorSessionStats,
+    StudentSessionStats,
+    StudentInstructorSummary,
+)
 from app.infrastructure.persistence.sqlalchemy_models import Session as SessionModel
 from app.infrastructure.persistence.mappers import SessionMapper
 
@@ -127,6 +133,121 @@ class SessionRepositoryImpl(ISessionRepository):
 
         return [self.mapper.to_domain(m) for m in db_models]
 
+    def get_many(self, session_ids: Iterable[int]) -> Dict[int, Session]:
+        """Get several sessions by ID in one query."""
+        ids = set(session_ids)
+        if not ids:
+            return {}
+
+        db_models = self.db.query(SessionModel).filter(
+            SessionModel.id.in_(ids)
+        ).all()
+
+        return {m.id: self.mapper.to_domain(m) for m in db_models}
+
+    def get_past_by_student(
+        self,
+        student_id: int,
+        limit: int = 20,
+        offset: int = 0
+    ) -> List[Session]:
+        """Get one page of a student's past sessions, most recent first."""
+        now = datetime.utcnow()
+
+        db_models = self.db.query(SessionModel).filter(
+            SessionModel.student_id == student_id,
+            or_(
+                SessionModel.status.in_([
+                    SessionStatus.COMPLETED.value,
+                    SessionStatus.CANCELLED.value,
+                    SessionStatus.NO_SHOW.value
+                ]),
+                SessionModel.end_at < now
+            )
+        ).order_by(
+            SessionModel.start_at.desc(), SessionModel.id.desc()
+        ).offset(offset).limit(limit).all()
+
+        return [self.mapper.to_domain(m) for m in db_models]
+
+    def get_student_stats(self, student_id: int) -> StudentSessionStats:
+        """Aggregate a student's completed sessions in a single query."""
+        row = self.db.query(
+            func.count(SessionModel.id),
+            func.coalesce(func.sum(SessionModel.duration_minutes), 0),
+            func.count(func.distinct(SessionModel.instructor_id)),
+            func.coalesce(func.sum(case((SessionModel.session_type == SessionType.TRIAL.value, 1), else_=0)), 0),
+        ).filter(
+            SessionModel.student_id == student_id,
+            SessionModel.status == SessionStatus.COMPLETED.value
+        ).one()
+
+        return StudentSessionStats(
+            completed_sessions=int(row[0]),
+            completed_minutes=int(row[1]),
+            total_instructors=int(row[2]),
+            trial_sessions_completed=int(row[3]),
+        )
+
+    def get_instructor_summaries_for_student(
+        self,
+        student_id: int,
+        limit: int = 10
+    ) -> List[StudentInstructorSummary]:
+        """Per-instructor session counts for a student, grouped in SQL."""
+        last_completed = func.max(case(
+            (SessionModel.status == SessionStatus.COMPLETED.value, SessionModel.start_at),
+            else_=None
+        ))
+
+        rows = self.db.query(
+            SessionModel.instructor_id,
+            func.count(SessionModel.id),
+            last_completed,
+        ).filter(
+            SessionModel.student_id == student_id
+        ).group_by(
+            SessionModel.instructor_id
+        ).order_by(
+            last_completed.is_(None), last_completed.desc(), SessionModel.instructor_id
+        ).limit(limit).all()
+
+        return [
+            StudentInstructorSummary(
+                instructor_id=instructor_id,
+                total_sessions=int(total),
+                last_completed_at=last_at,
+            )
+            for instructor_id, total, last_at in rows
+        ]
+
+    def has_completed_session_with(
+        self,
+        student_id: int,
+        instructor_id: int,
+        exclude_session_id: Optional[int] = None
+    ) -> bool:
+        """Check whether a student has completed a session with an instructor."""
+        query = self.db.query(SessionModel.id).filter(
+            SessionModel.student_id == student_id,
+            SessionModel.instructor_id == instructor_id,
+            SessionModel.status == SessionStatus.COMPLETED.value
+        )
+
+        if exclude_session_id:
+            query = query.filter(SessionModel.id != exclude_session_id)
+
+        return self.db.query(query.exists()).scalar()
+
+    def get_completed_start_times_by_student(self, student_id: int) -> List[datetime]:
+        """Start times of a student's completed sessions, most recent first."""
+        rows = self.db.query(SessionModel.start_at).filter(
+            SessionModel.student_id == student_id,
+            SessionModel.status == SessionStatus.COMPLETED.value
+        ).order_by(SessionModel.start_at.desc()).all()
+
+        return [start_at for (start_at,) in rows]
+
     def get_upcoming_by_instructor(
         self,
         instructor_id: int,
@@ -219,6 +340,39 @@ class SessionRepositoryImpl(ISessionRepository):
 
         return query.count()
 
+    def get_instructor_stats(
+        self,
+        instructor_id: int,
+        period_start: Optional[datetime] = None
+    ) -> InstructorSessionStats:
+        """Aggregate an instructor's sessions in a single query."""
+        now = datetime.utcnow()
+        completed = SessionModel.status == SessionStatus.COMPLETED.value
+        upcoming = and_(
+            SessionModel.end_at > now,
+            SessionModel.status.in_([
+                SessionStatus.PENDING_CONFIRMATION.value,
+                SessionStatus.CONFIRMED.value
+            ])
+        )
+        in_period = and_(completed, SessionModel.start_at >= period_start) if period_start else completed
+
+        row = self.db.query(
+            func.count(func.distinct(SessionModel.student_id)),
+            func.coalesce(func.sum(case((completed, 1), else_=0)), 0),
+            func.coalesce(func.sum(case((upcoming, 1), else_=0)), 0),
+            func.coalesce(func.sum(case((in_period, 1), else_=0)), 0),
+        ).filter(
+            SessionModel.instructor_id == instructor_id
+        ).one()
+
+        return InstructorSessionStats(
+            total_students=int(row[0]),
+            completed_sessions=int(row[1]),
+            upcoming_sessions=int(row[2]),
+            period_completed_sessions=int(row[3]),
+        )
+
     def get_recurring_series(self, parent_session_id: int) -> List[Session]:
         """Get all sessions in a recurring series."""
         db_models = self.db.query(SessionModel).filter(
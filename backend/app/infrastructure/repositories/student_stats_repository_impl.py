@@ -0,0 +1,67 @@
+"""SQLAlchemy implementation of StudentStats repository."""
+
+from typing import Optional
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.domains.student.entities import StudentStats
+from app.domains.student.repositories import IStudentStatsRepository
+from app.infrastructure.persistence.mappers import StudentStatsMapper
+from app.infrastructure.persistence.sqlalchemy_models import StudentStats as SQLAlchemyStudentStats
+
+
+class SQLAlchemyStudentStatsRepository(IStudentStatsRepository):
+    """
+    SQLAlchemy implementation of IStudentStatsRepository.
+
+    Uses StudentStatsMapper to convert between domain and ORM models.
+    """
+
+    def __init__(self, db: Session):
+        """
+        Initialize repository with database session.
+
+        Args:
+            db: SQLAlchemy database session
+        """
+        self.db = db
+        self.mapper = StudentStatsMapper
+
+    def get_by_student_id(self, student_id: int, for_update: bool = False) -> Optional[StudentStats]:
+        """Get stats for a student."""
+        try:
+            query = self.db.query(SQLAlchemyStudentStats).filter(
+                SQLAlchemyStudentStats.student_id == student_id
+            )
+            if for_update:
+                query = query.with_for_update()
+
+            db_stats = query.first()
+            return self.mapper.to_domain(db_stats) if db_stats else None
+
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to get student stats: {str(e)}")
+
+    def save(self, stats: StudentStats) -> StudentStats:
+        """
+        Insert or update stats for a student.
+
+        Written inside a savepoint: stats are saved alongside other work in
+        the same transaction (e.g. a booking's wallet credit), and a failure
+        here - such as two requests both inserting a missing row - must
+        only undo the stats write.
+        """
+        try:
+            with self.db.begin_nested():
+                db_stats = self.db.get(SQLAlchemyStudentStats, stats.student_id)
+                if db_stats is None:
+                    db_stats = SQLAlchemyStudentStats(student_id=stats.student_id)
+                    self.db.add(db_stats)
+
+                self.mapper.update_orm_instance(db_stats, stats)
+                self.db.flush()
+
+            return stats
+
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to save student stats: {str(e)}")
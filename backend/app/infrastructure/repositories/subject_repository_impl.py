@@ -8,7 +8,12 @@ from sqlalchemy import func
 from app.domains.subject.entities import Subject
 from app.domains.subject.repositories import ISubjectRepository
 from app.infrastructure.persistence.mappers import SubjectMapper
-from app.infrastructure.persistence.sqlalchemy_models import Subject as SQLAlchemySubject
+from app.infrastructure.persistence.sqlalchemy_models import (
+    Subject as SQLAlchemySubject,
+    InstructorSubject as SQLAlchemyInstructorSubject,
+)
+from app.infrastructure.search import InstructorSearchIndex
+from app.infrastructure.cache import instructor_search_cache
 
 
 class SQLAlchemySubjectRepository(ISubjectRepository):
@@ -28,6 +33,7 @@ class SQLAlchemySubjectRepository(ISubjectRepository):
         """
         self.db = db
         self.mapper = SubjectMapper
+        self.search_index = InstructorSearchIndex(db)
 
     def save(self, subject: Subject) -> Subject:
         """Save subject to database."""
@@ -114,9 +120,14 @@ class SQLAlchemySubjectRepository(ISubjectRepository):
             if not db_subject:
                 raise ValueError(f"Subject with ID {subject.id} not found")
 
+            indexed_before = (db_subject.name, db_subject.is_active)
             self.mapper.update_orm_instance(db_subject, subject)
             self.db.flush()
 
+            # Subject names are part of their instructors' search documents
+            if (db_subject.name, db_subject.is_active) != indexed_before:
+                self._reindex_instructors(self._instructor_ids(db_subject.id))
+
             return subject
 
         except SQLAlchemyError as e:
@@ -133,8 +144,10 @@ class SQLAlchemySubjectRepository(ISubjectRepository):
             if not db_subject:
                 return False
 
+            instructor_ids = self._instructor_ids(db_subject.id)
             self.db.delete(db_subject)
             self.db.flush()
+            self._reindex_instructors(instructor_ids)
 
             return True
 
@@ -154,3 +167,17 @@ class SQLAlchemySubjectRepository(ISubjectRepository):
 
         except SQLAlchemyError as e:
             raise Exception(f"Failed to count subjects: {str(e)}")
+
+    def _instructor_ids(self, subject_id: int) -> List[int]:
+        """Instructor profiles teaching a subject."""
+        return [
+            instructor_id
+            for (instructor_id,) in self.db.query(
+                SQLAlchemyInstructorSubject.instructor_profile_id
+            ).filter(SQLAlchemyInstructorSubject.subject_id == subject_id)
+        ]
+
+    def _reindex_instructors(self, instructor_ids: List[int]) -> None:
+        if instructor_ids:
+            self.search_index.index_many(instructor_ids)
+            instructor_search_cache.invalidate_on_commit(self.db)
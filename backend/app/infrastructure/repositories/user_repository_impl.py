@@ -1,13 +1,17 @@
 """SQLAlchemy implementation of User repository."""
 
-from typing import Optional, List
+from typing import Optional, List, Dict, Iterable, Tuple
+from datetime import datetime
+from sqlalchemy import and_, func, or_
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.domains.user.entities import User
 from app.domains.user.value_objects import Email, UserRole, UserStatus
 from app.domains.user.repositories import IUserRepository
+from app.infrastructure.cache import public_profile_cache
 from app.infrastructure.persistence.mappers import UserMapper
+from app.infrastructure.search import user_search_filter
 from app.infrastructure.persistence.sqlalchemy_models import User as SQLAlchemyUser
 
 
@@ -84,6 +88,31 @@ class SQLAlchemyUserRepository(IUserRepository):
         except SQLAlchemyError as e:
             raise Exception(f"Failed to get user by ID: {str(e)}")
 
+    def get_many(self, user_ids: Iterable[int]) -> Dict[int, User]:
+        """
+        Get several users by ID in one query.
+
+        Args:
+            user_ids: User IDs (duplicates are ignored)
+
+        Returns:
+            Dict of user ID to User; missing users are omitted
+        """
+        ids = set(user_ids)
+        if not ids:
+            return {}
+
+        try:
+            db_users = self.db.query(SQLAlchemyUser).filter(
+                SQLAlchemyUser.id.in_(ids),
+                SQLAlchemyUser.deleted_at.is_(None)  # Soft delete check
+            ).all()
+
+            return {db_user.id: self.mapper.to_domain(db_user) for db_user in db_users}
+
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to get users by IDs: {str(e)}")
+
     def get_by_email(self, email: Email) -> Optional[User]:
         """
         Get user by email.
@@ -132,15 +161,19 @@ class SQLAlchemyUserRepository(IUserRepository):
         status: Optional[UserStatus] = None,
         skip: int = 0,
         limit: int = 100,
+        search: Optional[str] = None,
+        after: Optional[Tuple[datetime, int]] = None,
     ) -> List[User]:
         """
-        Get all users with optional filtering.
+        Get all users with optional filtering, newest first.
 
         Args:
             role: Filter by role
             status: Filter by status
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored when after is given)
             limit: Maximum number of records
+            search: Email / name prefix
+            after: (created_at, id) of the last user of the previous page
 
         Returns:
             List of users
@@ -157,8 +190,27 @@ class SQLAlchemyUserRepository(IUserRepository):
             if status:
                 query = query.filter(SQLAlchemyUser.status == status.value)
 
-            # Pagination
-            db_users = query.offset(skip).limit(limit).all()
+            if search:
+                search_filter = user_search_filter(search)
+                if search_filter is not None:
+                    query = query.filter(search_filter)
+
+            # Keyset pagination on (created_at, id); OFFSET only without a cursor
+            if after:
+                created_at, user_id = after
+                query = query.filter(or_(
+                    SQLAlchemyUser.created_at < created_at,
+                    and_(SQLAlchemyUser.created_at == created_at, SQLAlchemyUser.id < user_id),
+                ))
+
+            query = query.order_by(
+                SQLAlchemyUser.created_at.desc(),
+                SQLAlchemyUser.id.desc(),
+            )
+            if not after:
+                query = query.offset(skip)
+
+            db_users = query.limit(limit).all()
 
             return [self.mapper.to_domain(db_user) for db_user in db_users]
 
@@ -184,12 +236,18 @@ class SQLAlchemyUserRepository(IUserRepository):
             if not db_user:
                 raise ValueError(f"User with ID {user.id} not found")
 
+            previous_name = (db_user.first_name, db_user.last_name)
+
             # Update ORM instance from domain entity
             self.mapper.update_orm_instance(db_user, user)
 
             # Flush changes
             self.db.flush()
 
+            # Instructor names appear on cached public profiles
+            if (db_user.first_name, db_user.last_name) != previous_name:
+                public_profile_cache.invalidate_on_commit(self.db, user_id=db_user.id)
+
             return user
 
         except SQLAlchemyError as e:
@@ -254,3 +312,25 @@ class SQLAlchemyUserRepository(IUserRepository):
 
         except SQLAlchemyError as e:
             raise Exception(f"Failed to count users: {str(e)}")
+
+    def count_by_role_and_status(self) -> Dict[Tuple[str, str], int]:
+        """Count non-deleted users grouped by role and status in a single query."""
+        try:
+            rows = self.db.query(
+                SQLAlchemyUser.role,
+                SQLAlchemyUser.status,
+                func.count(SQLAlchemyUser.id),
+            ).filter(
+                SQLAlchemyUser.deleted_at.is_(None)
+            ).group_by(
+                SQLAlchemyUser.role,
+                SQLAlchemyUser.status,
+            ).all()
+
+            return {
+                (role.value, status.value): count
+                for role, status, count in rows
+            }
+
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to count users: {str(e)}")
@@ -1,21 +1,31 @@
 """SQLAlchemy implementation of Wallet repository."""
 
-from typing import Optional, List
+from collections import defaultdict
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, Optional, List, Tuple
 
+from sqlalchemy import and_, bindparam, case, func, or_, select, update
 from sqlalchemy.orm import Session
 
 from app.database.models import (
     Wallet as WalletORM,
     WalletTransaction as WalletTransactionORM,
+    WalletBalanceSnapshot as WalletBalanceSnapshotORM,
     TransactionType as TransactionTypeORM,
     TransactionStatus as TransactionStatusORM,
 )
-from app.domains.wallet.entities import Wallet, WalletTransaction
-from app.domains.wallet.repositories import IWalletRepository
-from app.domains.wallet.value_objects import TransactionType, TransactionStatus
+from app.domains.wallet.entities import Wallet, WalletTransaction, WalletBalanceSnapshot
+from app.domains.wallet.repositories import IWalletRepository, WalletConflictError
+from app.domains.wallet.value_objects import BalanceChange, TransactionType, TransactionStatus
 from app.infrastructure.persistence.mappers.wallet_mapper import WalletMapper
 
 
+def _to_amount(value) -> Decimal:
+    """SUM() of a money column as a 2-place Decimal (SQLite returns floats)."""
+    return Decimal(str(value or 0)).quantize(Decimal("0.01"))
+
+
 class SQLAlchemyWalletRepository(IWalletRepository):
     """SQLAlchemy implementation of IWalletRepository."""
 
@@ -43,9 +53,11 @@ class SQLAlchemyWalletRepository(IWalletRepository):
 
     def get_by_id(self, wallet_id: int) -> Optional[Wallet]:
         """Get wallet by ID."""
+        # populate_existing: a retry after a conflict must see current balances
         orm_wallet = (
             self.db.query(WalletORM)
             .filter(WalletORM.id == wallet_id)
+            .populate_existing()
             .first()
         )
         if not orm_wallet:
@@ -57,6 +69,7 @@ class SQLAlchemyWalletRepository(IWalletRepository):
         orm_wallet = (
             self.db.query(WalletORM)
             .filter(WalletORM.instructor_id == instructor_id)
+            .populate_existing()
             .first()
         )
         if not orm_wallet:
@@ -64,21 +77,61 @@ class SQLAlchemyWalletRepository(IWalletRepository):
         return self.mapper.to_domain(orm_wallet)
 
     def update(self, wallet: Wallet) -> Wallet:
-        """Update an existing wallet."""
-        orm_wallet = (
-            self.db.query(WalletORM)
-            .filter(WalletORM.id == wallet.id)
-            .first()
-        )
-        if not orm_wallet:
-            raise ValueError(f"Wallet not found: {wallet.id}")
+        """
+        Update an existing wallet.
 
-        # Update fields
-        update_data = self.mapper.to_persistence(wallet)
-        for key, value in update_data.items():
-            setattr(orm_wallet, key, value)
+        Balance changes are a single UPDATE ... SET balance = balance + :delta
+        RETURNING the new values. Concurrent deposits therefore never
+        overwrite each other and never wait on an explicit lock. Debits
+        also require the stored balance to cover them.
+        """
+        change = wallet.pending_balance_change
+        now = datetime.utcnow()
+        stmt = update(WalletORM).where(WalletORM.id == wallet.id)
 
-        self.db.flush()
+        if change.is_zero:
+            # Status and other fields: only if nobody wrote since we loaded it
+            stmt = stmt.where(WalletORM.version == wallet.version).values(
+                **{**self.mapper.to_persistence(wallet), "updated_at": now},
+                version=WalletORM.version + 1,
+            )
+        else:
+            stmt = stmt.values(
+                balance=WalletORM.balance + change.balance,
+                total_earned=WalletORM.total_earned + change.total_earned,
+                total_withdrawn=WalletORM.total_withdrawn + change.total_withdrawn,
+                updated_at=now,
+                version=WalletORM.version + 1,
+            )
+            if change.is_debit:
+                stmt = stmt.where(WalletORM.balance + change.balance >= 0)
+
+        row = self.db.execute(
+            stmt.returning(
+                WalletORM.balance,
+                WalletORM.total_earned,
+                WalletORM.total_withdrawn,
+                WalletORM.version,
+            ).execution_options(synchronize_session="fetch")
+        ).first()
+
+        if row is None:
+            exists = self.db.query(WalletORM.id).filter(WalletORM.id == wallet.id).first()
+            if not exists:
+                raise ValueError(f"Wallet not found: {wallet.id}")
+            if change.is_debit:
+                raise WalletConflictError(
+                    f"Insufficient funds in wallet {wallet.id} after a concurrent update"
+                )
+            raise WalletConflictError(f"Wallet {wallet.id} was modified concurrently")
+
+        wallet.apply_persisted_balances(
+            balance=Decimal(str(row.balance)),
+            total_earned=Decimal(str(row.total_earned)),
+            total_withdrawn=Decimal(str(row.total_withdrawn)),
+            version=row.version,
+        )
+        wallet.updated_at = now
         return wallet
 
     # ========================================================================
@@ -107,9 +160,29 @@ class SQLAlchemyWalletRepository(IWalletRepository):
         return self.mapper.transaction_to_domain(orm_txn)
 
     def update_transaction(
-        self, transaction: WalletTransaction
+        self,
+        transaction: WalletTransaction,
+        expected_status: Optional[TransactionStatus] = None,
     ) -> WalletTransaction:
-        """Update an existing transaction."""
+        """Update an existing transaction, optionally guarded on its stored status."""
+        if expected_status is not None:
+            result = self.db.execute(
+                update(WalletTransactionORM)
+                .where(
+                    WalletTransactionORM.id == transaction.id,
+                    WalletTransactionORM.status == TransactionStatusORM(expected_status.value),
+                )
+                .values(**self.mapper.transaction_to_persistence(transaction))
+                .execution_options(synchronize_session="fetch")
+            )
+            if result.rowcount == 0:
+                if self.get_transaction_by_id(transaction.id) is None:
+                    raise ValueError(f"Transaction not found: {transaction.id}")
+                raise WalletConflictError(
+                    f"Transaction {transaction.id} is no longer {expected_status.value}"
+                )
+            return transaction
+
         orm_txn = (
             self.db.query(WalletTransactionORM)
             .filter(WalletTransactionORM.id == transaction.id)
@@ -133,8 +206,9 @@ class SQLAlchemyWalletRepository(IWalletRepository):
         status: Optional[TransactionStatus] = None,
         limit: int = 50,
         offset: int = 0,
+        after: Optional[Tuple[datetime, int]] = None,
     ) -> List[WalletTransaction]:
-        """Get transactions for a wallet with optional filters."""
+        """Get transactions for a wallet with optional filters, newest first."""
         query = (
             self.db.query(WalletTransactionORM)
             .filter(WalletTransactionORM.wallet_id == wallet_id)
@@ -150,11 +224,29 @@ class SQLAlchemyWalletRepository(IWalletRepository):
                 WalletTransactionORM.status == TransactionStatusORM(status.value)
             )
 
-        # Order by most recent first
-        query = query.order_by(WalletTransactionORM.created_at.desc())
+        # Keyset: continue after the previous page's last (created_at, id)
+        if after:
+            after_created_at, after_id = after
+            query = query.filter(
+                or_(
+                    WalletTransactionORM.created_at < after_created_at,
+                    and_(
+                        WalletTransactionORM.created_at == after_created_at,
+                        WalletTransactionORM.id < after_id,
+                    ),
+                )
+            )
+
+        # Order by most recent first (served by (wallet_id, created_at, id))
+        query = query.order_by(
+            WalletTransactionORM.created_at.desc(),
+            WalletTransactionORM.id.desc(),
+        )
 
         # Apply pagination
-        query = query.offset(offset).limit(limit)
+        if not after:
+            query = query.offset(offset)
+        query = query.limit(limit)
 
         orm_txns = query.all()
         return [self.mapper.transaction_to_domain(txn) for txn in orm_txns]
@@ -196,3 +288,297 @@ class SQLAlchemyWalletRepository(IWalletRepository):
             )
 
         return query.count()
+
+    def sum_transactions(
+        self,
+        wallet_id: int,
+        transaction_type: Optional[TransactionType] = None,
+        status: Optional[TransactionStatus] = None,
+        since: Optional[datetime] = None,
+    ) -> Decimal:
+        """Sum transaction amounts for a wallet with optional filters."""
+        query = (
+            self.db.query(func.coalesce(func.sum(WalletTransactionORM.amount), 0))
+            .filter(WalletTransactionORM.wallet_id == wallet_id)
+        )
+
+        # Apply filters
+        if transaction_type:
+            query = query.filter(
+                WalletTransactionORM.type == TransactionTypeORM(transaction_type.value)
+            )
+        if status:
+            query = query.filter(
+                WalletTransactionORM.status == TransactionStatusORM(status.value)
+            )
+        if since:
+            query = query.filter(WalletTransactionORM.created_at >= since)
+
+        return Decimal(str(query.scalar())).quantize(Decimal("0.01"))
+
+    # ========================================================================
+    # Ledger Snapshots
+    # ========================================================================
+
+    def get_wallet_ids(self, after_id: int = 0, limit: int = 500) -> List[int]:
+        """Get wallet IDs in ascending order, for batch jobs."""
+        rows = (
+            self.db.query(WalletORM.id)
+            .filter(WalletORM.id > after_id)
+            .order_by(WalletORM.id)
+            .limit(limit)
+            .all()
+        )
+        return [row.id for row in rows]
+
+    def get_latest_snapshots(
+        self,
+        wallet_ids: List[int],
+        as_of: Optional[datetime] = None,
+    ) -> Dict[int, WalletBalanceSnapshot]:
+        """Get each wallet's most recent balance snapshot."""
+        if not wallet_ids:
+            return {}
+
+        latest = (
+            self.db.query(
+                WalletBalanceSnapshotORM.wallet_id.label("wallet_id"),
+                func.max(WalletBalanceSnapshotORM.as_of).label("as_of"),
+            )
+            .filter(WalletBalanceSnapshotORM.wallet_id.in_(wallet_ids))
+        )
+        if as_of:
+            latest = latest.filter(WalletBalanceSnapshotORM.as_of <= as_of)
+        latest = latest.group_by(WalletBalanceSnapshotORM.wallet_id).subquery()
+
+        orm_snapshots = (
+            self.db.query(WalletBalanceSnapshotORM)
+            .join(
+                latest,
+                and_(
+                    WalletBalanceSnapshotORM.wallet_id == latest.c.wallet_id,
+                    WalletBalanceSnapshotORM.as_of == latest.c.as_of,
+                ),
+            )
+            .all()
+        )
+        return {
+            orm_snapshot.wallet_id: self.mapper.snapshot_to_domain(orm_snapshot)
+            for orm_snapshot in orm_snapshots
+        }
+
+    def get_ledger_changes(
+        self,
+        windows: Dict[int, Optional[datetime]],
+        until: datetime,
+    ) -> Dict[int, BalanceChange]:
+        """Net effect of each wallet's transactions over a window."""
+        if not windows:
+            return {}
+
+        # Wallets sharing a window start share one range condition
+        by_start: Dict[Optional[datetime], List[int]] = defaultdict(list)
+        for wallet_id, start in windows.items():
+            by_start[start].append(wallet_id)
+
+        def in_window(column):
+            return or_(*[
+                WalletTransactionORM.wallet_id.in_(wallet_ids)
+                if start is None
+                else and_(WalletTransactionORM.wallet_id.in_(wallet_ids), column > start)
+                for start, wallet_ids in by_start.items()
+            ])
+
+        created: Dict[int, Dict[TransactionType, Decimal]] = defaultdict(dict)
+        for wallet_id, txn_type, amount in (
+            self.db.query(
+                WalletTransactionORM.wallet_id,
+                WalletTransactionORM.type,
+                func.sum(WalletTransactionORM.amount),
+            )
+            .filter(in_window(WalletTransactionORM.created_at))
+            .filter(WalletTransactionORM.created_at <= until)
+            .group_by(WalletTransactionORM.wallet_id, WalletTransactionORM.type)
+        ):
+            created[wallet_id][TransactionType(txn_type.value)] = _to_amount(amount)
+
+        settled: Dict[int, Dict[TransactionStatus, Decimal]] = defaultdict(dict)
+        for wallet_id, txn_status, amount in (
+            self.db.query(
+                WalletTransactionORM.wallet_id,
+                WalletTransactionORM.status,
+                func.sum(WalletTransactionORM.amount),
+            )
+            .filter(in_window(WalletTransactionORM.completed_at))
+            .filter(WalletTransactionORM.completed_at <= until)
+            .filter(WalletTransactionORM.type == TransactionTypeORM.WITHDRAWAL)
+            .filter(
+                WalletTransactionORM.status.in_(
+                    [TransactionStatusORM.COMPLETED, TransactionStatusORM.FAILED]
+                )
+            )
+            .group_by(WalletTransactionORM.wallet_id, WalletTransactionORM.status)
+        ):
+            settled[wallet_id][TransactionStatus(txn_status.value)] = _to_amount(amount)
+
+        return {
+            wallet_id: BalanceChange.from_ledger(created.get(wallet_id, {}), settled.get(wallet_id, {}))
+            for wallet_id in set(created) | set(settled)
+        }
+
+    def save_snapshots(self, snapshots: List[WalletBalanceSnapshot]) -> None:
+        """Save new balance snapshots in bulk."""
+        if not snapshots:
+            return
+
+        now = datetime.utcnow()
+        for snapshot in snapshots:
+            snapshot.created_at = snapshot.created_at or now
+        self.db.execute(
+            WalletBalanceSnapshotORM.__table__.insert(),
+            [self.mapper.snapshot_to_row(snapshot) for snapshot in snapshots],
+        )
+        self.db.flush()
+
+    # ========================================================================
+    # Payouts
+    # ========================================================================
+
+    def claim_pending_withdrawals(
+        self,
+        claim_token: str,
+        limit: int,
+        stale_before: datetime,
+    ) -> List[WalletTransaction]:
+        """Claim the oldest unclaimed pending withdrawals for payout."""
+        # SKIP LOCKED lets concurrent workers claim disjoint chunks on
+        # PostgreSQL; SQLite ignores FOR UPDATE and serializes writers, and
+        # the claim columns keep claimed rows out of the next worker's pick.
+        candidates = (
+            select(WalletTransactionORM.id)
+            .where(
+                WalletTransactionORM.type == TransactionTypeORM.WITHDRAWAL,
+                WalletTransactionORM.status == TransactionStatusORM.PENDING,
+                or_(
+                    WalletTransactionORM.claimed_at.is_(None),
+                    WalletTransactionORM.claimed_at < stale_before,
+                ),
+            )
+            .order_by(WalletTransactionORM.created_at, WalletTransactionORM.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        claimed_ids = self.db.execute(
+            update(WalletTransactionORM)
+            .where(WalletTransactionORM.id.in_(candidates))
+            .values(claim_token=claim_token, claimed_at=datetime.utcnow())
+            .returning(WalletTransactionORM.id)
+            .execution_options(synchronize_session=False)
+        ).scalars().all()
+        if not claimed_ids:
+            return []
+
+        orm_txns = (
+            self.db.query(WalletTransactionORM)
+            .filter(WalletTransactionORM.id.in_(claimed_ids))
+            .order_by(WalletTransactionORM.created_at, WalletTransactionORM.id)
+            .populate_existing()
+            .all()
+        )
+        return [self.mapper.transaction_to_domain(txn) for txn in orm_txns]
+
+    def release_withdrawal_claims(self, claim_token: str, transaction_ids: List[int]) -> int:
+        """Release claims so the withdrawals can be picked up again."""
+        if not transaction_ids:
+            return 0
+
+        result = self.db.execute(
+            update(WalletTransactionORM)
+            .where(
+                WalletTransactionORM.id.in_(transaction_ids),
+                WalletTransactionORM.claim_token == claim_token,
+            )
+            .values(claim_token=None, claimed_at=None)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    def settle_withdrawals(
+        self,
+        claim_token: str,
+        status: TransactionStatus,
+        outcomes: Dict[int, Optional[str]],
+        settled_at: datetime,
+    ) -> List[WalletTransaction]:
+        """Complete or fail claimed withdrawals in bulk."""
+        if not outcomes:
+            return []
+        if status not in (TransactionStatus.COMPLETED, TransactionStatus.FAILED):
+            raise ValueError(f"Withdrawals can only be settled as completed or failed, got: {status}")
+
+        # Per-row reference / reason in a single statement
+        detail = case(outcomes, value=WalletTransactionORM.id)
+        values = {
+            "status": TransactionStatusORM(status.value),
+            "completed_at": settled_at,
+            "claim_token": None,
+            "claimed_at": None,
+        }
+        if status == TransactionStatus.COMPLETED:
+            values["payout_reference"] = detail
+        else:
+            values["failure_reason"] = detail
+
+        settled_ids = self.db.execute(
+            update(WalletTransactionORM)
+            .where(
+                WalletTransactionORM.id.in_(list(outcomes)),
+                WalletTransactionORM.type == TransactionTypeORM.WITHDRAWAL,
+                WalletTransactionORM.status == TransactionStatusORM.PENDING,
+                WalletTransactionORM.claim_token == claim_token,
+            )
+            .values(**values)
+            .returning(WalletTransactionORM.id)
+            .execution_options(synchronize_session=False)
+        ).scalars().all()
+        if not settled_ids:
+            return []
+
+        orm_txns = (
+            self.db.query(WalletTransactionORM)
+            .filter(WalletTransactionORM.id.in_(settled_ids))
+            .populate_existing()
+            .all()
+        )
+        return [self.mapper.transaction_to_domain(txn) for txn in orm_txns]
+
+    def apply_balance_changes(self, changes: Dict[int, BalanceChange]) -> None:
+        """Apply balance deltas to many wallets in one round trip."""
+        rows = [
+            {
+                "wallet_id": wallet_id,
+                "d_balance": change.balance,
+                "d_total_earned": change.total_earned,
+                "d_total_withdrawn": change.total_withdrawn,
+                "now": datetime.utcnow(),
+            }
+            # Consistent wallet order, so concurrent batches can't deadlock
+            for wallet_id, change in sorted(changes.items())
+            if not change.is_zero
+        ]
+        if not rows:
+            return
+
+        wallets = WalletORM.__table__
+        self.db.execute(
+            wallets.update()
+            .where(wallets.c.id == bindparam("wallet_id"))
+            .values(
+                balance=wallets.c.balance + bindparam("d_balance"),
+                total_earned=wallets.c.total_earned + bindparam("d_total_earned"),
+                total_withdrawn=wallets.c.total_withdrawn + bindparam("d_total_withdrawn"),
+                updated_at=bindparam("now"),
+                version=wallets.c.version + 1,
+            ),
+            rows,
+        )
@@ -0,0 +1,23 @@
+"""Full-text search indexes and indexed prefix matching."""
+
+from app.infrastructure.search.instructor_search import (
+    InstructorSearchIndex,
+    ensure_instructor_search_schema,
+)
+from app.infrastructure.search.prefix_search import (
+    prefix_match,
+    user_search_filter,
+)
+from app.infrastructure.search.message_search import (
+    MessageSearchIndex,
+    ensure_message_search_schema,
+)
+
+__all__ = [
+    "InstructorSearchIndex",
+    "ensure_instructor_search_schema",
+    "prefix_match",
+    "user_search_filter",
+    "MessageSearchIndex",
+    "ensure_message_search_schema",
+]
@@ -0,0 +1,212 @@
+"""
+Full-text search index for instructor profiles.
+
+Indexed fields, most to least important: headline, subject names, bio,
+teaching experience.
+
+Backends:
+- SQLite (development): an FTS5 virtual table ``instructor_profiles_fts``
+  whose rowid is the instructor profile id.
+- PostgreSQL (production): a weighted ``search_vector`` tsvector column on
+  ``instructor_profiles`` with a GIN index.
+
+Index entries are rebuilt from the database row (plus the instructor's
+active subjects) by SQLAlchemyInstructorProfileRepository,
+SQLAlchemyInstructorSubjectRepository and - for every instructor teaching
+a renamed, (de)activated or deleted subject - SQLAlchemySubjectRepository,
+inside the caller's unit of work.
+
+As with message search, ranks are normalized so that LOWER is better.
+"""
+
+from typing import Iterable, Optional
+
+from sqlalchemy import Float, Integer, bindparam, text
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.selectable import Subquery
+
+from app.infrastructure.search.message_search import PG_TS_CONFIG, tokenize_query
+
+
+SQLITE_FTS_TABLE = "instructor_profiles_fts"
+
+# bm25 column weights: headline, subjects, bio, teaching_experience
+SQLITE_BM25_WEIGHTS = "10.0, 5.0, 2.0, 1.0"
+
+# Active subject names of one instructor as a single space-separated string
+_SUBJECT_NAMES_SQLITE = (
+    "(SELECT group_concat(s.name, ' ') FROM instructor_subjects isub "
+    "JOIN subjects s ON s.id = isub.subject_id "
+    "WHERE isub.instructor_profile_id = p.id AND s.is_active = 1)"
+)
+_SUBJECT_NAMES_PG = (
+    "(SELECT string_agg(s.name, ' ') FROM instructor_subjects isub "
+    "JOIN subjects s ON s.id = isub.subject_id "
+    "WHERE isub.instructor_profile_id = p.id AND s.is_active)"
+)
+
+_PG_VECTOR = (
+    f"setweight(to_tsvector('{PG_TS_CONFIG}', coalesce(p.headline, '')), 'A') || "
+    f"setweight(to_tsvector('{PG_TS_CONFIG}', coalesce({_SUBJECT_NAMES_PG}, '')), 'B') || "
+    f"setweight(to_tsvector('{PG_TS_CONFIG}', coalesce(p.bio, '')), 'C') || "
+    f"setweight(to_tsvector('{PG_TS_CONFIG}', coalesce(p.teaching_experience, '')), 'D')"
+)
+
+
+def ensure_instructor_search_schema(bind) -> None:
+    """
+    Create the instructor search index if it does not exist yet.
+
+    Used by init_db() for development databases created with create_all();
+    production schemas are managed by the matching Alembic migration.
+
+    Args:
+        bind: SQLAlchemy engine or connection
+    """
+    dialect = bind.dialect.name
+
+    with bind.begin() as conn:
+        if dialect == "sqlite":
+            exists = conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                {"name": SQLITE_FTS_TABLE},
+            ).first()
+            if exists:
+                return
+
+            conn.execute(text(
+                f"CREATE VIRTUAL TABLE {SQLITE_FTS_TABLE} "
+                "USING fts5(headline, subjects, bio, teaching_experience, tokenize = 'unicode61')"
+            ))
+            conn.execute(text(
+                f"INSERT INTO {SQLITE_FTS_TABLE} (rowid, headline, subjects, bio, teaching_experience) "
+                f"SELECT p.id, p.headline, {_SUBJECT_NAMES_SQLITE}, p.bio, p.teaching_experience "
+                "FROM instructor_profiles p"
+            ))
+
+        elif dialect == "postgresql":
+            conn.execute(text(
+                "ALTER TABLE instructor_profiles ADD COLUMN IF NOT EXISTS search_vector tsvector"
+            ))
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_instructor_profiles_search_vector "
+                "ON instructor_profiles USING GIN (search_vector)"
+            ))
+            conn.execute(text(
+                f"UPDATE instructor_profiles p SET search_vector = {_PG_VECTOR} "
+                "WHERE p.search_vector IS NULL"
+            ))
+
+
+class InstructorSearchIndex:
+    """
+    Dialect-aware reader/writer for the instructor full-text index.
+
+    Operates on the caller's session so index writes commit or roll back
+    together with the profile itself.
+    """
+
+    def __init__(self, db: Session):
+        """
+        Initialize index with database session.
+
+        Args:
+            db: SQLAlchemy database session
+        """
+        self.db = db
+        self.dialect = db.get_bind().dialect.name
+
+    def index(self, instructor_id: int) -> None:
+        """Rebuild the index entry for a profile from its current (flushed) row."""
+        if self.dialect == "sqlite":
+            self.remove(instructor_id)
+            self.db.execute(
+                text(
+                    f"INSERT INTO {SQLITE_FTS_TABLE} (rowid, headline, subjects, bio, teaching_experience) "
+                    f"SELECT p.id, p.headline, {_SUBJECT_NAMES_SQLITE}, p.bio, p.teaching_experience "
+                    "FROM instructor_profiles p WHERE p.id = :id"
+                ),
+                {"id": instructor_id},
+            )
+        elif self.dialect == "postgresql":
+            self.db.execute(
+                text(f"UPDATE instructor_profiles p SET search_vector = {_PG_VECTOR} WHERE p.id = :id"),
+                {"id": instructor_id},
+            )
+
+    def index_many(self, instructor_ids: Iterable[int]) -> None:
+        """Rebuild the index entries for several profiles in one statement per backend."""
+        ids = sorted(set(instructor_ids))
+        if not ids:
+            return
+
+        id_list = bindparam("ids", expanding=True)
+        if self.dialect == "sqlite":
+            self.db.execute(
+                text(f"DELETE FROM {SQLITE_FTS_TABLE} WHERE rowid IN :ids").bindparams(id_list),
+                {"ids": ids},
+            )
+            self.db.execute(
+                text(
+                    f"INSERT INTO {SQLITE_FTS_TABLE} (rowid, headline, subjects, bio, teaching_experience) "
+                    f"SELECT p.id, p.headline, {_SUBJECT_NAMES_SQLITE}, p.bio, p.teaching_experience "
+                    "FROM instructor_profiles p WHERE p.id IN :ids"
+                ).bindparams(id_list),
+                {"ids": ids},
+            )
+        elif self.dialect == "postgresql":
+            self.db.execute(
+                text(
+                    f"UPDATE instructor_profiles p SET search_vector = {_PG_VECTOR} WHERE p.id IN :ids"
+                ).bindparams(id_list),
+                {"ids": ids},
+            )
+
+    def remove(self, instructor_id: int) -> None:
+        """Remove the index entry for a profile."""
+        if self.dialect == "sqlite":
+            self.db.execute(
+                text(f"DELETE FROM {SQLITE_FTS_TABLE} WHERE rowid = :id"),
+                {"id": instructor_id},
+            )
+        # PostgreSQL: the vector lives on the row and goes away with it
+
+    def matches(self, query: str) -> Optional[Subquery]:
+        """
+        Ranked matches for a free-text query, for joining into a search.
+
+        Every term must match; the last one is a prefix so partially typed
+        words still find results.
+
+        Args:
+            query: Free-text query
+
+        Returns:
+            Subquery with ``instructor_id`` and ``score`` (lower is better)
+            columns, or None if the query has no searchable terms
+        """
+        terms = tokenize_query(query)
+        if not terms:
+            return None
+
+        if self.dialect == "sqlite":
+            sql = text(
+                f"SELECT rowid AS instructor_id, bm25({SQLITE_FTS_TABLE}, {SQLITE_BM25_WEIGHTS}) AS score "
+                f"FROM {SQLITE_FTS_TABLE} WHERE {SQLITE_FTS_TABLE} MATCH :match"
+            ).bindparams(match=" ".join(f'"{t}"' for t in terms) + "*")
+        elif self.dialect == "postgresql":
+            sql = text(
+                f"SELECT id AS instructor_id, "
+                f"-ts_rank_cd(search_vector, to_tsquery('{PG_TS_CONFIG}', :tsquery)) AS score "
+                "FROM instructor_profiles "
+                f"WHERE search_vector @@ to_tsquery('{PG_TS_CONFIG}', :tsquery)"
+            ).bindparams(tsquery=" & ".join(terms) + ":*")
+        else:
+            # No full-text support: unranked substring scan.
+            sql = text(
+                "SELECT id AS instructor_id, 0.0 AS score FROM instructor_profiles "
+                "WHERE lower(coalesce(headline, '') || ' ' || coalesce(bio, '') || ' ' || "
+                "coalesce(teaching_experience, '')) LIKE :pattern"
+            ).bindparams(pattern=f"%{' '.join(terms)}%")
+
+        return sql.columns(instructor_id=Integer, score=Float).subquery("search_hits")
@@ -0,0 +1,213 @@
+"""
+Full-text search index for message content.
+
+Backends:
+- SQLite (development): an FTS5 virtual table ``messages_fts`` whose rowid
+  is the message id.
+- PostgreSQL (production): a ``search_vector`` tsvector column on
+  ``messages`` with a GIN index.
+
+The index is written explicitly by SQLAlchemyMessageRepository inside the
+same unit of work as the message row (no database triggers), so a rolled
+back message never leaves a stale index entry behind.
+
+Ranks are normalized so that LOWER is better on every backend, which lets
+callers keyset-paginate on ``(rank, message_id DESC)``.
+"""
+
+import re
+from typing import List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+
+SQLITE_FTS_TABLE = "messages_fts"
+PG_TS_CONFIG = "simple"
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize_query(query: str) -> List[str]:
+    """
+    Split free text into search terms.
+
+    Only word characters survive, which also strips any FTS5 / tsquery
+    operator syntax from user input.
+    """
+    return _TOKEN_RE.findall((query or "").lower())
+
+
+def ensure_message_search_schema(bind) -> None:
+    """
+    Create the message search index if it does not exist yet.
+
+    Used by init_db() for development databases created with create_all();
+    production schemas are managed by the matching Alembic migration.
+
+    Args:
+        bind: SQLAlchemy engine or connection
+    """
+    dialect = bind.dialect.name
+
+    with bind.begin() as conn:
+        if dialect == "sqlite":
+            exists = conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                {"name": SQLITE_FTS_TABLE},
+            ).first()
+            if exists:
+                return
+
+            conn.execute(text(
+                f"CREATE VIRTUAL TABLE {SQLITE_FTS_TABLE} "
+                "USING fts5(content, tokenize = 'unicode61')"
+            ))
+            conn.execute(text(
+                f"INSERT INTO {SQLITE_FTS_TABLE} (rowid, content) "
+                "SELECT id, content FROM messages "
+                "WHERE content IS NOT NULL AND deleted_at IS NULL"
+            ))
+
+        elif dialect == "postgresql":
+            conn.execute(text(
+                "ALTER TABLE messages ADD COLUMN IF NOT EXISTS search_vector tsvector"
+            ))
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_messages_search_vector "
+                "ON messages USING GIN (search_vector)"
+            ))
+            conn.execute(text(
+                f"UPDATE messages SET search_vector = to_tsvector('{PG_TS_CONFIG}', coalesce(content, '')) "
+                "WHERE search_vector IS NULL"
+            ))
+
+
+class MessageSearchIndex:
+    """
+    Dialect-aware reader/writer for the message full-text index.
+
+    Operates on the caller's session so index writes commit or roll back
+    together with the message itself.
+    """
+
+    def __init__(self, db: Session):
+        """
+        Initialize index with database session.
+
+        Args:
+            db: SQLAlchemy database session
+        """
+        self.db = db
+        self.dialect = db.get_bind().dialect.name
+
+    def index(self, message_id: int, content: Optional[str]) -> None:
+        """Add or replace the index entry for a message."""
+        if self.dialect == "sqlite":
+            self.remove(message_id)
+            if content:
+                self.db.execute(
+                    text(f"INSERT INTO {SQLITE_FTS_TABLE} (rowid, content) VALUES (:id, :content)"),
+                    {"id": message_id, "content": content},
+                )
+        elif self.dialect == "postgresql":
+            self.db.execute(
+                text(
+                    f"UPDATE messages SET search_vector = to_tsvector('{PG_TS_CONFIG}', coalesce(:content, '')) "
+                    "WHERE id = :id"
+                ),
+                {"id": message_id, "content": content},
+            )
+
+    def remove(self, message_id: int) -> None:
+        """Remove the index entry for a message."""
+        if self.dialect == "sqlite":
+            self.db.execute(
+                text(f"DELETE FROM {SQLITE_FTS_TABLE} WHERE rowid = :id"),
+                {"id": message_id},
+            )
+        elif self.dialect == "postgresql":
+            self.db.execute(
+                text("UPDATE messages SET search_vector = NULL WHERE id = :id"),
+                {"id": message_id},
+            )
+
+    def search(
+        self,
+        user_id: int,
+        query: str,
+        conversation_id: Optional[int] = None,
+        limit: int = 20,
+        after: Optional[Tuple[float, int]] = None,
+    ) -> List[Tuple[int, float]]:
+        """
+        Find messages matching a free-text query.
+
+        Only messages in conversations where user_id is a participant are
+        considered. Results are ordered best match first, ties broken by
+        newest message.
+
+        Args:
+            user_id: User performing the search
+            query: Free-text query
+            conversation_id: Optional conversation to restrict the search to
+            limit: Maximum number of hits
+            after: (rank, message_id) of the last hit on the previous page
+
+        Returns:
+            List of (message_id, rank) tuples
+        """
+        terms = tokenize_query(query)
+        if not terms:
+            return []
+
+        params = {"user_id": user_id, "limit": limit}
+
+        if self.dialect == "sqlite":
+            # Every term must match; the last one is a prefix so partially
+            # typed words still find results.
+            params["match"] = " ".join(f'"{t}"' for t in terms) + "*"
+            inner = (
+                f"SELECT m.id AS message_id, bm25({SQLITE_FTS_TABLE}) AS score "
+                f"FROM {SQLITE_FTS_TABLE} "
+                f"JOIN messages m ON m.id = {SQLITE_FTS_TABLE}.rowid "
+                "JOIN conversations c ON c.id = m.conversation_id "
+                f"WHERE {SQLITE_FTS_TABLE} MATCH :match "
+            )
+        elif self.dialect == "postgresql":
+            params["tsquery"] = " & ".join(terms) + ":*"
+            inner = (
+                f"SELECT m.id AS message_id, -ts_rank_cd(m.search_vector, to_tsquery('{PG_TS_CONFIG}', :tsquery)) AS score "
+                "FROM messages m "
+                "JOIN conversations c ON c.id = m.conversation_id "
+                f"WHERE m.search_vector @@ to_tsquery('{PG_TS_CONFIG}', :tsquery) "
+            )
+        else:
+            # No full-text support: unranked substring scan.
+            params["pattern"] = f"%{' '.join(terms)}%"
+            inner = (
+                "SELECT m.id AS message_id, 0.0 AS score "
+                "FROM messages m "
+                "JOIN conversations c ON c.id = m.conversation_id "
+                "WHERE lower(m.content) LIKE :pattern "
+            )
+
+        inner += (
+            "AND m.deleted_at IS NULL "
+            "AND (c.participant_1_id = :user_id OR c.participant_2_id = :user_id) "
+        )
+        if conversation_id is not None:
+            inner += "AND m.conversation_id = :conversation_id "
+            params["conversation_id"] = conversation_id
+
+        sql = f"SELECT message_id, score FROM ({inner}) hits "
+        if after is not None:
+            sql += (
+                "WHERE score > :after_score "
+                "OR (score = :after_score AND message_id < :after_id) "
+            )
+            params["after_score"], params["after_id"] = after
+        sql += "ORDER BY score ASC, message_id DESC LIMIT :limit"
+
+        rows = self.db.execute(text(sql), params).all()
+        return [(row.message_id, float(row.score)) for row in rows]
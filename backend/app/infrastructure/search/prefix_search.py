@@ -0,0 +1,75 @@
+"""
+Indexed, case-insensitive prefix matching on user email and names.
+
+Predicates compare lower(column), so they're served by the functional
+indexes on users (ix_users_email_lower, ix_users_first_name_lower,
+ix_users_last_name_lower). A prefix becomes a range on the indexed
+expression, lower(col) >= 'abc' AND lower(col) < 'abd', which both SQLite
+and PostgreSQL answer with an index range scan regardless of collation; a
+LIKE on the same expression keeps the result exact under linguistic
+collations, where the range alone can admit extra rows.
+"""
+
+from typing import Optional
+
+from sqlalchemy import and_, func, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.infrastructure.persistence.sqlalchemy_models import User as SQLAlchemyUser
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def prefix_match(column, prefix: str) -> ColumnElement:
+    """
+    Case-insensitive "column starts with prefix" predicate.
+
+    Args:
+        column: String column (matched through lower(column))
+        prefix: Non-empty prefix
+
+    Returns:
+        SQL predicate usable with a lower(column) index
+    """
+    prefix = prefix.lower()
+    expression = func.lower(column)
+    upper_bound = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+    return and_(
+        expression >= prefix,
+        expression < upper_bound,
+        expression.like(_escape_like(prefix) + "%", escape="\\"),
+    )
+
+
+def user_search_filter(query: str) -> Optional[ColumnElement]:
+    """
+    Predicate matching users by email, first name or last name prefix.
+
+    "ann" matches ann@x.com, Anna Smith and Joe Annan; "ann sm" matches
+    first name "ann*" with last name "sm*".
+
+    Args:
+        query: Search text as typed by the admin
+
+    Returns:
+        SQL predicate over the users table, or None for a blank query
+    """
+    terms = query.split()
+    if not terms:
+        return None
+
+    if len(terms) > 1:
+        return and_(
+            prefix_match(SQLAlchemyUser.first_name, terms[0]),
+            prefix_match(SQLAlchemyUser.last_name, " ".join(terms[1:])),
+        )
+
+    term = terms[0]
+    return or_(
+        prefix_match(SQLAlchemyUser.email, term),
+        prefix_match(SQLAlchemyUser.first_name, term),
+        prefix_match(SQLAlchemyUser.last_name, term),
+    )
+
@@ -38,6 +38,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "Server-Timing"],
 )
 
 
@@ -68,11 +69,15 @@ async def startup_event():
         except Exception as e:
             logger.error(f"Database initialization failed: {e}")
 
+    # WebSocket heartbeat / idle connection reaper
+    websocket.manager.start_reaper()
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Application shutdown event."""
     logger.info(f"Shutting down {settings.APP_NAME}")
+    await websocket.manager.stop_reaper()
 
 
 @app.get("/", tags=["Root"])
@@ -148,4 +153,5 @@ if __name__ == "__main__":
         port=settings.PORT,
         reload=settings.is_development,
         log_level=settings.LOG_LEVEL.lower(),
+        ws_per_message_deflate=settings.WS_PER_MESSAGE_DEFLATE,
     )
@@ -5,10 +5,14 @@ Provides admin-only endpoints for:
 - Dashboard statistics
 - Instructor profile management (verify, reject, suspend)
 - User management (suspend, ban, activate)
+- Data exports (CSV / NDJSON)
+- Analytics (daily rollups)
 """
 
+from datetime import date, datetime, timedelta
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from app.domains.user.entities import User
@@ -19,10 +23,21 @@ from app.core.dependencies import (
     get_user_repository,
     get_instructor_repository,
     get_verify_instructor_use_case,
+    get_admin_stats_snapshot,
+    get_admin_exporter,
+    get_daily_rollup_repository,
+    get_wallet_repository,
 )
 from app.domains.user.repositories import IUserRepository
+from app.domains.analytics.entities import DailyMetrics
+from app.domains.analytics.repositories import IDailyRollupRepository
+from app.infrastructure.cache import SnapshotCache
+from app.infrastructure.export import EXPORT_FORMATS, RowExporter
 from app.domains.instructor.repositories import IInstructorProfileRepository
+from app.domains.wallet.repositories import IWalletRepository
 from app.application.use_cases.instructor import VerifyInstructorUseCase
+from app.application.use_cases.wallet import VerifyWalletBalanceUseCase
+from app.utils.pagination import encode_cursor, decode_cursor, parse_cursor_datetime
 from app.application.use_cases.admin import (
     RejectInstructorUseCase,
     SuspendInstructorUseCase,
@@ -31,12 +46,29 @@ from app.application.use_cases.admin import (
     ActivateUserUseCase,
     GetPendingInstructorsUseCase,
     GetAdminDashboardStatsUseCase,
+    GetDailyRollupsUseCase,
+    RollupSeries,
 )
+from app.core.config import settings
 
 
 router = APIRouter()
 
 
+# Admin lists are plain JSON arrays; the keyset cursor for the next page
+# travels in this header (absent on the last page).
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def parse_list_cursor(cursor: Optional[str]):
+    """Decode an admin list cursor into (created_at, id), or None."""
+    try:
+        after = decode_cursor(cursor, size=2)
+        return (parse_cursor_datetime(after[0]), int(after[1])) if after else None
+    except (TypeError, ValueError) as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
 # ============================================================================
 # Request/Response Models
 # ============================================================================
@@ -56,6 +88,7 @@ class AdminDashboardStatsResponse(BaseModel):
     verified_instructors: int
     rejected_instructors: int
     suspended_instructors: int
+    generated_at: Optional[str] = None
 
 
 class UserResponse(BaseModel):
@@ -123,6 +156,52 @@ class ActionResponse(BaseModel):
     message: str
 
 
+class DailyMetricsResponse(BaseModel):
+    """One day (or the totals) of an analytics series."""
+
+    day: str
+    bookings: int
+    cancellations: int
+    completed_sessions: int
+    completed_minutes: int
+    gross_amount: float
+    platform_fee: float
+    instructor_earnings: float
+    active_instructors: Optional[int] = None  # Platform series only
+
+
+class AnalyticsSeriesResponse(BaseModel):
+    """Daily analytics series response."""
+
+    start: str
+    end: str
+    rolled_up_through: Optional[str] = None
+    platform_fee_percent: int
+    totals: DailyMetricsResponse
+    days: List[DailyMetricsResponse]
+
+
+class BalancesResponse(BaseModel):
+    """A wallet's balance, lifetime earnings and lifetime withdrawals."""
+
+    balance: float
+    total_earned: float
+    total_withdrawn: float
+
+
+class WalletVerificationResponse(BaseModel):
+    """Stored wallet balances checked against the transaction ledger."""
+
+    wallet_id: int
+    instructor_id: int
+    is_consistent: bool
+    checked_at: datetime
+    snapshot_as_of: Optional[datetime] = None
+    stored: BalancesResponse
+    ledger: BalancesResponse
+    difference: BalancesResponse  # stored - ledger
+
+
 # ============================================================================
 # Dependency Injection for Use Cases
 # ============================================================================
@@ -179,6 +258,20 @@ def get_admin_dashboard_stats_use_case(
     return GetAdminDashboardStatsUseCase(user_repo, instructor_repo)
 
 
+def get_daily_rollups_use_case(
+    rollup_repo: IDailyRollupRepository = Depends(get_daily_rollup_repository),
+) -> GetDailyRollupsUseCase:
+    """Get GetDailyRollups use case."""
+    return GetDailyRollupsUseCase(rollup_repo, max_range_days=settings.ANALYTICS_MAX_RANGE_DAYS)
+
+
+def get_verify_wallet_balance_use_case(
+    wallet_repo: IWalletRepository = Depends(get_wallet_repository),
+) -> VerifyWalletBalanceUseCase:
+    """Get VerifyWalletBalance use case."""
+    return VerifyWalletBalanceUseCase(wallet_repo)
+
+
 # ============================================================================
 # Helper Functions
 # ============================================================================
@@ -216,6 +309,40 @@ def instructor_profile_to_response(profile) -> InstructorProfileResponse:
     )
 
 
+def daily_metrics_to_response(metrics: DailyMetrics) -> DailyMetricsResponse:
+    """Convert daily metrics (or totals) to response model."""
+    return DailyMetricsResponse(
+        day=metrics.day.isoformat(),
+        bookings=metrics.bookings,
+        cancellations=metrics.cancellations,
+        completed_sessions=metrics.completed_sessions,
+        completed_minutes=metrics.completed_minutes,
+        gross_amount=float(metrics.gross_amount),
+        platform_fee=float(metrics.platform_fee),
+        instructor_earnings=float(metrics.instructor_earnings),
+        active_instructors=getattr(metrics, "active_instructors", None),
+    )
+
+
+def series_to_response(series: RollupSeries) -> AnalyticsSeriesResponse:
+    """Convert a rollup series to response model."""
+    return AnalyticsSeriesResponse(
+        start=series.start.isoformat(),
+        end=series.end.isoformat(),
+        rolled_up_through=series.rolled_up_through.isoformat() if series.rolled_up_through else None,
+        platform_fee_percent=settings.PLATFORM_FEE_PERCENT,
+        totals=daily_metrics_to_response(series.totals),
+        days=[daily_metrics_to_response(day) for day in series.days],
+    )
+
+
+def resolve_analytics_range(start: Optional[date], end: Optional[date]) -> tuple:
+    """Default analytics range: the 30 days ending today (UTC)."""
+    end = end or datetime.utcnow().date()
+    start = start or end - timedelta(days=29)
+    return start, end
+
+
 # ============================================================================
 # Dashboard Endpoints
 # ============================================================================
@@ -224,15 +351,22 @@ def instructor_profile_to_response(profile) -> InstructorProfileResponse:
 @router.get("/dashboard/stats", response_model=AdminDashboardStatsResponse)
 async def get_dashboard_stats(
     current_admin: User = Depends(get_current_admin),
-    use_case: GetAdminDashboardStatsUseCase = Depends(get_admin_dashboard_stats_use_case),
+    snapshot: SnapshotCache = Depends(get_admin_stats_snapshot),
 ):
     """
     Get admin dashboard statistics.
 
     Returns platform-wide statistics including user counts,
     instructor status counts, and moderation metrics.
+
+    Served from a short-lived snapshot that is refreshed in the background;
+    generated_at tells when the counts were taken.
     """
-    stats = use_case.execute()
+    stats = snapshot.get(
+        lambda db: get_admin_dashboard_stats_use_case(
+            get_user_repository(db), get_instructor_repository(db)
+        ).execute()
+    )
     return AdminDashboardStatsResponse(
         total_users=stats.total_users,
         total_students=stats.total_students,
@@ -245,6 +379,7 @@ async def get_dashboard_stats(
         verified_instructors=stats.verified_instructors,
         rejected_instructors=stats.rejected_instructors,
         suspended_instructors=stats.suspended_instructors,
+        generated_at=stats.generated_at.isoformat() if stats.generated_at else None,
     )
 
 
@@ -278,7 +413,10 @@ async def get_pending_instructors(
 
 @router.get("/instructors", response_model=List[PendingInstructorResponse])
 async def get_all_instructors(
+    response: Response,
     status: Optional[str] = Query(None, description="Filter by status"),
+    search: Optional[str] = Query(None, max_length=100, description="Email or name prefix"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
     current_admin: User = Depends(get_current_admin),
@@ -286,9 +424,13 @@ async def get_all_instructors(
     user_repo: IUserRepository = Depends(get_user_repository),
 ):
     """
-    Get all instructor profiles with optional status filter.
+    Get all instructor profiles with optional status filter, newest first.
+
+    Admin can filter by instructor status: draft, pending_review, verified, rejected, suspended,
+    and search by the instructor's email or name prefix.
 
-    Admin can filter by instructor status: draft, pending_review, verified, rejected, suspended.
+    Pages are addressed by `cursor` (the X-Next-Cursor response header of
+    the previous page); `skip` is still accepted when no cursor is given.
     """
     # Parse status filter
     instructor_status = None
@@ -301,13 +443,26 @@ async def get_all_instructors(
                 detail=f"Invalid status. Must be one of: {[s.value for s in InstructorStatus]}",
             )
 
-    # Get profiles
-    profiles = instructor_repo.get_all(status=instructor_status, skip=skip, limit=limit)
+    after = parse_list_cursor(cursor)
+
+    # Fetch one extra profile to know whether another page exists
+    profiles = instructor_repo.get_all(
+        status=instructor_status,
+        skip=skip,
+        limit=limit + 1,
+        search=search,
+        after=after,
+    )
+    if len(profiles) > limit:
+        profiles = profiles[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(profiles[-1].created_at, profiles[-1].id)
+
+    # Enrich with user data (one query for the whole page)
+    users = user_repo.get_many(profile.user_id for profile in profiles)
 
-    # Enrich with user data
     results = []
     for profile in profiles:
-        user = user_repo.get_by_id(profile.user_id)
+        user = users.get(profile.user_id)
         if user:
             results.append(
                 PendingInstructorResponse(
@@ -388,6 +543,49 @@ async def suspend_instructor(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+@router.get("/instructors/{instructor_id}/wallet/verify", response_model=WalletVerificationResponse)
+async def verify_instructor_wallet(
+    instructor_id: int,
+    current_admin: User = Depends(get_current_admin),
+    use_case: VerifyWalletBalanceUseCase = Depends(get_verify_wallet_balance_use_case),
+):
+    """
+    Check an instructor's stored wallet balances against the transaction ledger.
+
+    The ledger side is the latest balance snapshot plus the transactions
+    since it. A difference can be transient if a write landed mid-check;
+    re-run to confirm.
+    """
+    try:
+        result = use_case.execute(instructor_id)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    difference = result.difference
+    return WalletVerificationResponse(
+        wallet_id=result.wallet.id,
+        instructor_id=instructor_id,
+        is_consistent=result.is_consistent,
+        checked_at=result.ledger.as_of,
+        snapshot_as_of=result.snapshot_as_of,
+        stored=BalancesResponse(
+            balance=float(result.wallet.balance),
+            total_earned=float(result.wallet.total_earned),
+            total_withdrawn=float(result.wallet.total_withdrawn),
+        ),
+        ledger=BalancesResponse(
+            balance=float(result.ledger.balance),
+            total_earned=float(result.ledger.total_earned),
+            total_withdrawn=float(result.ledger.total_withdrawn),
+        ),
+        difference=BalancesResponse(
+            balance=float(difference.balance),
+            total_earned=float(difference.total_earned),
+            total_withdrawn=float(difference.total_withdrawn),
+        ),
+    )
+
+
 # ============================================================================
 # User Management Endpoints
 # ============================================================================
@@ -395,18 +593,25 @@ async def suspend_instructor(
 
 @router.get("/users", response_model=List[UserResponse])
 async def get_all_users(
+    response: Response,
     role: Optional[str] = Query(None, description="Filter by role"),
     user_status: Optional[str] = Query(None, alias="status", description="Filter by status"),
+    search: Optional[str] = Query(None, max_length=100, description="Email or name prefix"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
     current_admin: User = Depends(get_current_admin),
     user_repo: IUserRepository = Depends(get_user_repository),
 ):
     """
-    Get all users with optional filters.
+    Get all users with optional filters, newest first.
 
     Admin can filter by role (student, instructor, admin) and
-    status (active, inactive, suspended, banned, deleted).
+    status (active, inactive, suspended, banned, deleted), and search
+    by email or name prefix ("ann" or "ann sm").
+
+    Pages are addressed by `cursor` (the X-Next-Cursor response header of
+    the previous page); `skip` is still accepted when no cursor is given.
     """
     # Parse role filter
     user_role = None
@@ -430,8 +635,21 @@ async def get_all_users(
                 detail=f"Invalid status. Must be one of: {[s.value for s in UserStatus]}",
             )
 
-    # Get users
-    users = user_repo.get_all(role=user_role, status=status_filter, skip=skip, limit=limit)
+    after = parse_list_cursor(cursor)
+
+    # Fetch one extra user to know whether another page exists
+    users = user_repo.get_all(
+        role=user_role,
+        status=status_filter,
+        skip=skip,
+        limit=limit + 1,
+        search=search,
+        after=after,
+    )
+    if len(users) > limit:
+        users = users[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(users[-1].created_at, users[-1].id)
+
     return [user_to_response(user) for user in users]
 
 
@@ -516,3 +734,89 @@ async def activate_user(
         )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+# ============================================================================
+# Data Export Endpoints
+# ============================================================================
+
+
+@router.get("/exports/{dataset}")
+async def export_dataset(
+    dataset: str,
+    export_format: str = Query("csv", alias="format", pattern="^(csv|ndjson)$"),
+    start: Optional[date] = Query(None, description="First day included (YYYY-MM-DD)"),
+    end: Optional[date] = Query(None, description="Last day included (YYYY-MM-DD)"),
+    current_admin: User = Depends(get_current_admin),
+    exporter: RowExporter = Depends(get_admin_exporter),
+):
+    """
+    Stream a full table export as CSV or NDJSON.
+
+    Datasets: users, payments and wallet_transactions (by created_at) and
+    sessions (by start_at). Rows are streamed oldest first straight from
+    the database, so exports of any size use constant memory.
+    """
+    try:
+        export = exporter.get_dataset(dataset)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    if start and end and start > end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start must be on or before end",
+        )
+
+    filename = f"{dataset}-{datetime.utcnow():%Y%m%d-%H%M%S}.{export_format}"
+    return StreamingResponse(
+        exporter.stream(export, export_format, start=start, end=end),
+        media_type=EXPORT_FORMATS[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+# ============================================================================
+# Analytics Endpoints
+# ============================================================================
+
+
+@router.get("/analytics/daily", response_model=AnalyticsSeriesResponse)
+async def get_platform_analytics(
+    start: Optional[date] = Query(None, description="First day (default: 29 days before end)"),
+    end: Optional[date] = Query(None, description="Last day (default: today, UTC)"),
+    current_admin: User = Depends(get_current_admin),
+    use_case: GetDailyRollupsUseCase = Depends(get_daily_rollups_use_case),
+):
+    """
+    Platform-wide daily bookings, cancellations, completed minutes and revenue.
+
+    Served from the daily rollups (refreshed by
+    `python -m app.database.refresh_daily_rollups`); days after
+    `rolled_up_through` are not included yet.
+    """
+    start, end = resolve_analytics_range(start, end)
+    try:
+        return series_to_response(use_case.get_platform_series(start, end))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/analytics/instructors/{instructor_id}/daily", response_model=AnalyticsSeriesResponse)
+async def get_instructor_analytics(
+    instructor_id: int,
+    start: Optional[date] = Query(None, description="First day (default: 29 days before end)"),
+    end: Optional[date] = Query(None, description="Last day (default: today, UTC)"),
+    current_admin: User = Depends(get_current_admin),
+    use_case: GetDailyRollupsUseCase = Depends(get_daily_rollups_use_case),
+):
+    """
+    One instructor's daily bookings, cancellations, completed minutes and revenue.
+
+    Served from the daily rollups; days without activity are returned as zeros.
+    """
+    start, end = resolve_analytics_range(start, end)
+    try:
+        return series_to_response(use_case.get_instructor_series(instructor_id, start, end))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
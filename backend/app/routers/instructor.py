@@ -8,15 +8,22 @@ HTTP endpoints for instructor onboarding and profile management using Pure DDD p
 - Proper error handling and HTTP status codes
 """
 
+import time
+from dataclasses import asdict
 from typing import List, Optional
 from decimal import Decimal
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 
 from app.domains.user.entities import User
 from app.domains.instructor.entities import InstructorProfile, Education, Experience
-from app.domains.instructor.value_objects import InstructorStatus
+from app.domains.instructor.value_objects import (
+    InstructorStatus,
+    InstructorSearchCriteria,
+    InstructorSortOrder,
+)
 from app.core.dependencies import (
     get_current_instructor,
     get_current_instructor_allow_inactive,
@@ -32,11 +39,15 @@ from app.core.dependencies import (
     get_add_education_use_case,
     get_add_experience_use_case,
     get_instructor_repository,
+    get_instructor_subject_repository,
+    get_instructor_search_cache,
+    get_public_profile_cache,
     get_instructor_dashboard_use_case,
     get_instructor_public_profile_use_case,
+    get_dashboard_composer,
+    build_instructor_dashboard_use_case,
     get_user_repository,
 )
-from app.domains.user.repositories import IUserRepository
 from app.application.use_cases.instructor import (
     CreateInstructorProfileUseCase,
     UpdateInstructorAboutUseCase,
@@ -52,6 +63,11 @@ from app.application.use_cases.instructor import (
 from app.domains.instructor.entities import InstructorDashboard
 from app.domains.instructor.value_objects import DashboardStats
 from app.domains.instructor.repositories import IInstructorProfileRepository
+from app.domains.subject.repositories import IInstructorSubjectRepository
+from app.utils.pagination import encode_cursor, decode_cursor
+from app.core.config import settings
+from app.infrastructure.cache import PublicProfileCache, SearchResultCache
+from app.infrastructure.dashboard import SectionComposer, parse_sections
 
 
 # ============================================================================
@@ -352,6 +368,14 @@ class LanguageListItem(BaseModel):
     proficiency: str = "Native"
 
 
+class SubjectListItem(BaseModel):
+    """Subject item for search results."""
+    id: int
+    name: str
+    slug: Optional[str] = None
+    category: Optional[str] = None
+
+
 # Search - InstructorListItem matches frontend InstructorProfile type
 class InstructorListItem(BaseModel):
     """Instructor list item for search results - matches frontend InstructorProfile."""
@@ -371,6 +395,21 @@ class InstructorListItem(BaseModel):
     is_onboarding_complete: bool = True
     education: List[EducationResponse] = []
     experience: List[ExperienceResponse] = []
+    subjects: List[SubjectListItem] = []
+
+
+class FacetCountResponse(BaseModel):
+    """Number of matching instructors for one facet value."""
+    key: str
+    label: str
+    count: int
+
+
+class SearchFacetsResponse(BaseModel):
+    """Sidebar counts for the current search filters."""
+    languages: List[FacetCountResponse] = []
+    price_buckets: List[FacetCountResponse] = []
+    subjects: List[FacetCountResponse] = []
 
 
 class InstructorSearchResponse(BaseModel):
@@ -379,6 +418,8 @@ class InstructorSearchResponse(BaseModel):
     skip: int
     limit: int
     instructors: List[InstructorListItem]
+    next_cursor: Optional[str] = None  # Only for relevance-ranked (q=) searches
+    facets: Optional[SearchFacetsResponse] = None  # Only when facets=true
 
 
 class MessageResponse(BaseModel):
@@ -394,6 +435,8 @@ class DashboardStatsResponse(BaseModel):
     completed_sessions: int
     total_earnings: float
     profile_completion_percent: int
+    sessions_this_month: int = 0
+    earnings_this_month: float = 0.0
 
     @classmethod
     def from_domain(cls, stats: DashboardStats) -> "DashboardStatsResponse":
@@ -404,6 +447,8 @@ class DashboardStatsResponse(BaseModel):
             completed_sessions=stats.completed_sessions,
             total_earnings=stats.earnings_float,
             profile_completion_percent=stats.profile_completion_percent,
+            sessions_this_month=stats.sessions_this_month,
+            earnings_this_month=float(stats.earnings_this_month),
         )
 
 
@@ -442,11 +487,15 @@ class UpcomingSessionResponse(BaseModel):
 
 
 class InstructorDashboardResponse(BaseModel):
-    """Complete dashboard response DTO."""
-    profile: InstructorProfileResponse
-    user: UserBasicInfoResponse
-    stats: DashboardStatsResponse
-    upcoming_sessions: List[UpcomingSessionResponse]
+    """Complete dashboard response DTO (sections not requested are null)."""
+    profile: Optional[InstructorProfileResponse] = None
+    user: Optional[UserBasicInfoResponse] = None
+    stats: Optional[DashboardStatsResponse] = None
+    upcoming_sessions: Optional[List[UpcomingSessionResponse]] = None
+
+
+# Sections of GET /instructor/dashboard ("profile" includes user)
+INSTRUCTOR_DASHBOARD_SECTIONS = ("profile", "stats", "upcoming_sessions")
 
 
 # Create router
@@ -864,56 +913,95 @@ async def get_my_profile(
 )
 async def get_instructor_profile(
     instructor_id: int,
+    request: Request,
     use_case: GetInstructorPublicProfileUseCase = Depends(get_instructor_public_profile_use_case),
     current_user: Optional[User] = Depends(get_optional_current_user),
+    cache: PublicProfileCache = Depends(get_public_profile_cache),
 ) -> InstructorProfileResponse:
     """
     Get instructor profile by ID.
 
     Public endpoint - only returns verified instructor profiles.
     Authenticated users can see more details.
+
+    Verified profiles are served from a cache with an ETag; a request whose
+    If-None-Match matches gets 304 Not Modified.
     """
-    try:
-        # Execute use case to get profile with user data
-        profile_dto = use_case.execute(
-            instructor_id=instructor_id,
-            requesting_user_id=current_user.id if current_user else None,
-        )
+    cached = cache.get(instructor_id)
+    if cached is None:
+        version = cache.current_version(instructor_id)
+        try:
+            # Execute use case to get profile with user data
+            profile_dto = use_case.execute(
+                instructor_id=instructor_id,
+                requesting_user_id=current_user.id if current_user else None,
+            )
 
-        # Convert DTO to response model
-        return InstructorProfileResponse(
-            id=profile_dto.id,
+            # Convert DTO to response model
+            profile_response = InstructorProfileResponse(
+                id=profile_dto.id,
+                user_id=profile_dto.user_id,
+                first_name=profile_dto.first_name,
+                last_name=profile_dto.last_name,
+                status=profile_dto.status,
+                country_of_birth=profile_dto.country_of_birth,
+                languages=[
+                    LanguageResponse(language=lang.language, proficiency=lang.proficiency)
+                    for lang in profile_dto.languages
+                ],
+                profile_photo_url=profile_dto.profile_photo_url,
+                bio=profile_dto.bio,
+                teaching_experience=profile_dto.teaching_experience,
+                headline=profile_dto.headline,
+                intro_video_url=profile_dto.intro_video_url,
+                hourly_rate=profile_dto.hourly_rate,
+                trial_lesson_price=profile_dto.trial_lesson_price,
+                onboarding_step=profile_dto.onboarding_step,
+                is_onboarding_complete=profile_dto.is_onboarding_complete,
+                education=[],  # TODO: Add education via use case
+                experience=[],  # TODO: Add experience via use case
+            )
+
+        except PermissionError:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Instructor profile not found",
+            )
+        except ValueError as e:
+            handle_domain_exception(e)
+        except Exception as e:
+            handle_domain_exception(e)
+
+        if profile_dto.status != InstructorStatus.VERIFIED:
+            # Only visible to authenticated users; never shared or cached
+            return JSONResponse(
+                content=profile_response.model_dump(mode="json"),
+                headers={"Cache-Control": "private, no-store"},
+            )
+
+        cached = cache.put(
+            instructor_id=instructor_id,
             user_id=profile_dto.user_id,
-            first_name=profile_dto.first_name,
-            last_name=profile_dto.last_name,
-            status=profile_dto.status,
-            country_of_birth=profile_dto.country_of_birth,
-            languages=[
-                LanguageResponse(language=lang.language, proficiency=lang.proficiency)
-                for lang in profile_dto.languages
-            ],
-            profile_photo_url=profile_dto.profile_photo_url,
-            bio=profile_dto.bio,
-            teaching_experience=profile_dto.teaching_experience,
-            headline=profile_dto.headline,
-            intro_video_url=profile_dto.intro_video_url,
-            hourly_rate=profile_dto.hourly_rate,
-            trial_lesson_price=profile_dto.trial_lesson_price,
-            onboarding_step=profile_dto.onboarding_step,
-            is_onboarding_complete=profile_dto.is_onboarding_complete,
-            education=[],  # TODO: Add education via use case
-            experience=[],  # TODO: Add experience via use case
+            payload=profile_response.model_dump(mode="json"),
+            version=version,
         )
 
-    except PermissionError:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Instructor profile not found",
-        )
-    except ValueError as e:
-        handle_domain_exception(e)
-    except Exception as e:
-        handle_domain_exception(e)
+    headers = {
+        "ETag": cached.etag,
+        "Cache-Control": f"public, max-age={settings.PROFILE_CACHE_MAX_AGE_SECONDS}, must-revalidate",
+    }
+    if _etag_matches(request.headers.get("if-none-match"), cached.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return JSONResponse(content=cached.payload, headers=headers)
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
 
 
 # ============================================================================
@@ -928,9 +1016,14 @@ async def get_instructor_profile(
     description="Get complete dashboard data including profile, stats, and upcoming sessions.",
 )
 async def get_instructor_dashboard(
+    response: Response,
+    sections: Optional[str] = Query(
+        None,
+        description=f"Comma separated sections to load (default: all): {', '.join(INSTRUCTOR_DASHBOARD_SECTIONS)}",
+    ),
     current_user: User = Depends(get_current_instructor_allow_inactive),
     use_case: GetInstructorDashboardUseCase = Depends(get_instructor_dashboard_use_case),
-    user_repo: IUserRepository = Depends(get_user_repository),
+    composer: SectionComposer = Depends(get_dashboard_composer),
 ) -> InstructorDashboardResponse:
     """
     Get instructor dashboard data.
@@ -941,47 +1034,89 @@ async def get_instructor_dashboard(
     - Statistics (sessions, students, earnings)
     - Upcoming sessions with student details
 
+    The profile is loaded first; earnings, session aggregates and upcoming
+    sessions then load concurrently, each on its own DB session. Pass
+    sections= to load a subset; the others are null. Per section load
+    times are reported in the Server-Timing header.
+
     Raises:
     - 404: Instructor profile not found
+    - 422: Unknown section
     """
     try:
-        dashboard = use_case.execute(current_user.id)
-
-        # Build student name cache for upcoming sessions
-        student_ids = {s.student_id for s in dashboard.upcoming_sessions}
-        student_cache = {}
-        for student_id in student_ids:
-            student = user_repo.get_by_id(student_id)
-            if student:
-                student_cache[student_id] = f"{student.first_name} {student.last_name}"
-            else:
-                student_cache[student_id] = "Unknown Student"
-
-        # Build upcoming sessions response with student names
-        from app.utils.datetime_utils import is_in_progress
-
-        upcoming_sessions = [
-            UpcomingSessionResponse(
-                id=session.id,
-                student_id=session.student_id,
-                student_name=student_cache.get(session.student_id, "Unknown Student"),
-                start_at=session.start_at,
-                end_at=session.end_at,
-                duration_minutes=session.duration_minutes,
-                session_type=session.session_type.value,
-                status=session.status.value,
-                is_trial=session.is_trial,
-                is_in_progress=is_in_progress(session.start_at, session.end_at),
-                amount=session.amount,
-                currency=session.currency,
+        wanted = parse_sections(sections, INSTRUCTOR_DASHBOARD_SECTIONS)
+
+        # Every section is keyed by the instructor profile
+        started = time.perf_counter()
+        profile, user = use_case.get_profile(current_user.id)
+        profile_ms = (time.perf_counter() - started) * 1000
+
+        instructor_id = profile.id
+        period_start = use_case.current_period_start()
+
+        def load_upcoming_sessions(db):
+            sessions = build_instructor_dashboard_use_case(db).get_upcoming_sessions(instructor_id)
+            # Student names for all sessions in one query
+            students = get_user_repository(db).get_many(s.student_id for s in sessions)
+            return sessions, students
+
+        loaders = {}
+        if "stats" in wanted:
+            loaders["earnings"] = lambda db: build_instructor_dashboard_use_case(db).get_earnings(
+                instructor_id, period_start
+            )
+            loaders["session_stats"] = lambda db: build_instructor_dashboard_use_case(db).get_session_stats(
+                instructor_id, period_start
+            )
+        if "upcoming_sessions" in wanted:
+            loaders["upcoming_sessions"] = load_upcoming_sessions
+
+        composed = await composer.compose(loaders)
+        composed.timings_ms["profile"] = profile_ms
+        response.headers["Server-Timing"] = composed.server_timing()
+        result = composed.results
+
+        stats = None
+        if "stats" in wanted:
+            total_earnings, earnings_this_month = result["earnings"]
+            stats = DashboardStatsResponse.from_domain(
+                use_case.build_stats(profile, total_earnings, earnings_this_month, result["session_stats"])
             )
-            for session in dashboard.upcoming_sessions
-        ]
 
+        upcoming_sessions = None
+        if "upcoming_sessions" in wanted:
+            sessions, students = result["upcoming_sessions"]
+            student_cache = {
+                student_id: f"{student.first_name} {student.last_name}"
+                for student_id, student in students.items()
+            }
+
+            # Build upcoming sessions response with student names
+            from app.utils.datetime_utils import is_in_progress
+
+            upcoming_sessions = [
+                UpcomingSessionResponse(
+                    id=session.id,
+                    student_id=session.student_id,
+                    student_name=student_cache.get(session.student_id, "Unknown Student"),
+                    start_at=session.start_at,
+                    end_at=session.end_at,
+                    duration_minutes=session.duration_minutes,
+                    session_type=session.session_type.value,
+                    status=session.status.value,
+                    is_trial=session.is_trial,
+                    is_in_progress=is_in_progress(session.start_at, session.end_at),
+                    amount=session.amount,
+                    currency=session.currency,
+                )
+                for session in sessions
+            ]
+
+        include_profile = "profile" in wanted
         return InstructorDashboardResponse(
-            profile=InstructorProfileResponse.from_domain(dashboard.profile),
-            user=UserBasicInfoResponse.from_domain(dashboard.user),
-            stats=DashboardStatsResponse.from_domain(dashboard.stats),
+            profile=InstructorProfileResponse.from_domain(profile) if include_profile else None,
+            user=UserBasicInfoResponse.from_domain(user) if include_profile else None,
+            stats=stats,
             upcoming_sessions=upcoming_sessions,
         )
     except ValueError as e:
@@ -1048,53 +1183,84 @@ async def verify_instructor(
     "/search",
     response_model=InstructorSearchResponse,
     summary="Search Instructors",
-    description="Search for verified instructors with various filters.",
+    description=(
+        "Search for verified instructors with various filters. With `q`, results are "
+        "ranked by relevance over headline, subjects, bio and teaching experience and "
+        "paginated with `cursor` / `next_cursor` instead of `skip`."
+    ),
 )
 async def search_instructors(
+    q: Optional[str] = Query(None, max_length=200, description="Free-text query"),
     min_price: Optional[Decimal] = Query(None, ge=Decimal("0.00"), description="Minimum hourly rate"),
     max_price: Optional[Decimal] = Query(None, le=Decimal("1000.00"), description="Maximum hourly rate"),
     language: Optional[str] = Query(None, description="Filter by language"),
+    subject_id: Optional[int] = Query(None, ge=1, description="Filter by subject ID"),
+    subject: Optional[str] = Query(None, description="Filter by subject slug"),
+    category: Optional[str] = Query(None, description="Filter by subject category"),
+    sort: InstructorSortOrder = Query(InstructorSortOrder.RECOMMENDED, description="Result ordering"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(20, ge=1, le=100, description="Maximum number of records to return"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page (q= searches)"),
+    facets: bool = Query(False, description="Include language, price bucket and subject counts"),
     instructor_repo: IInstructorProfileRepository = Depends(get_instructor_repository),
+    instructor_subject_repo: IInstructorSubjectRepository = Depends(get_instructor_subject_repository),
+    search_cache: SearchResultCache = Depends(get_instructor_search_cache),
 ) -> InstructorSearchResponse:
     """Search for verified instructors with filters."""
     try:
-        # Get all verified instructors
-        profiles = instructor_repo.get_all(
+        criteria = InstructorSearchCriteria(
             status=InstructorStatus.VERIFIED,
-            skip=0,  # We'll filter in memory for now, then paginate
-            limit=1000,  # Get more to filter
+            text_query=q,
+            min_price=min_price,
+            max_price=max_price,
+            language=language,
+            subject_id=subject_id,
+            subject_slug=subject,
+            category=category,
+            sort=sort,
         )
 
-        # Apply filters
-        filtered_profiles = []
-        for profile in profiles:
-            # Price filter
-            if profile.pricing:
-                hourly_rate = float(profile.pricing.regular_session_price)
-                if min_price is not None and hourly_rate < float(min_price):
-                    continue
-                if max_price is not None and hourly_rate > float(max_price):
-                    continue
-
-            # Language filter
-            if language and profile.languages_spoken:
-                lang_names = [lang.name.lower() for lang in profile.languages_spoken.languages]
-                if language.lower() not in lang_names:
-                    continue
-
-            filtered_profiles.append(profile)
+        # Popular anonymous searches are served from the short-lived cache;
+        # profile changes that affect results invalidate it on commit.
+        cache_key = search_cache.make_key({
+            **asdict(criteria),
+            "skip": skip,
+            "limit": limit,
+            "cursor": cursor,
+            "facets": facets,
+        })
+        cached, cache_generation = search_cache.lookup(cache_key)
+        if cached is not None:
+            return InstructorSearchResponse(**cached)
+
+        # Filtering, ordering, counting and pagination all run in the database
+        next_cursor = None
+        if criteria.is_text_search:
+            after = decode_cursor(cursor, size=2)
+
+            # Fetch one extra hit to know whether another page exists
+            hits, total = instructor_repo.search_ranked(
+                criteria,
+                limit=limit + 1,
+                after=(float(after[0]), int(after[1])) if after else None,
+            )
+            if len(hits) > limit:
+                hits = hits[:limit]
+                last_profile, last_rank = hits[-1]
+                next_cursor = encode_cursor(last_rank, last_profile.id)
 
-        # Calculate total before pagination
-        total = len(filtered_profiles)
+            profiles = [profile for profile, _ in hits]
+        else:
+            profiles, total = instructor_repo.search(criteria, skip=skip, limit=limit)
 
-        # Apply pagination
-        paginated_profiles = filtered_profiles[skip:skip + limit]
+        # One query for the subjects of every instructor on this page
+        subjects_by_instructor = instructor_subject_repo.get_subjects_for_instructors(
+            [profile.id for profile in profiles]
+        )
 
         # Convert to response DTOs
         instructors = []
-        for profile in paginated_profiles:
+        for profile in profiles:
             # Extract languages as LanguageListItem objects
             languages_list = []
             if profile.languages_spoken:
@@ -1131,14 +1297,50 @@ async def search_instructors(
                 is_onboarding_complete=profile.is_onboarding_complete,
                 education=[],  # Can be populated if needed
                 experience=[],  # Can be populated if needed
+                subjects=[
+                    SubjectListItem(
+                        id=int(subject_entity.id),
+                        name=subject_entity.name,
+                        slug=subject_entity.slug,
+                        category=subject_entity.category,
+                    )
+                    for subject_entity in subjects_by_instructor.get(profile.id, [])
+                ],
             ))
 
-        return InstructorSearchResponse(
+        facets_response = None
+        if facets:
+            search_facets = instructor_repo.get_search_facets(criteria)
+            facets_response = SearchFacetsResponse(
+                languages=[FacetCountResponse(**vars(f)) for f in search_facets.languages],
+                price_buckets=[FacetCountResponse(**vars(f)) for f in search_facets.price_buckets],
+                subjects=[FacetCountResponse(**vars(f)) for f in search_facets.subjects],
+            )
+
+        response = InstructorSearchResponse(
             total=total,
             skip=skip,
             limit=limit,
             instructors=instructors,
+            next_cursor=next_cursor,
+            facets=facets_response,
         )
+        search_cache.store(cache_key, response.model_dump(mode="json"), cache_generation)
+
+        return response
 
     except Exception as e:
         handle_domain_exception(e)
+
+
+@router.get(
+    "/search/cache-stats",
+    summary="Search Cache Statistics (Admin Only)",
+    description="Hit/miss counters for the instructor search result cache.",
+)
+async def get_search_cache_stats(
+    current_user: User = Depends(get_current_admin),
+    search_cache: SearchResultCache = Depends(get_instructor_search_cache),
+) -> dict:
+    """Get instructor search cache statistics (admin only)."""
+    return search_cache.stats()
@@ -6,7 +6,7 @@ Uses DDD use cases for business logic.
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
@@ -34,6 +34,7 @@ from app.application.use_cases.messaging import (
     CheckFeatureAccessUseCase,
     FeatureAccess,
     GetUnreadCountUseCase,
+    SearchMessagesUseCase,
 )
 
 # Repository imports
@@ -122,6 +123,18 @@ class UnreadCountResponse(BaseModel):
     unread_count: int
 
 
+class MessageSearchHitResponse(BaseModel):
+    """Single ranked search hit."""
+    message: MessageResponse
+    rank: float
+
+
+class MessageSearchResponse(BaseModel):
+    """Message search results page."""
+    results: List[MessageSearchHitResponse]
+    next_cursor: Optional[str] = None
+
+
 # ============================================================================
 # Session Repository Adapter for Feature Access
 # ============================================================================
@@ -145,28 +158,43 @@ class SessionRepositoryAdapter:
 # Helper Functions
 # ============================================================================
 
+def get_users_basic_info(db: Session, user_ids: Iterable[int]) -> Dict[int, UserBasicResponse]:
+    """
+    Get basic info for several users in two queries.
+
+    Users that don't exist are absent from the result.
+    """
+    ids = set(user_ids)
+    if not ids:
+        return {}
+
+    users = db.query(UserModel).filter(UserModel.id.in_(ids)).all()
+
+    # Profile photos for instructors
+    instructor_user_ids = [u.id for u in users if u.role.value == "instructor"]
+    photos: Dict[int, Optional[str]] = {}
+    if instructor_user_ids:
+        photos = dict(
+            db.query(InstructorProfile.user_id, InstructorProfile.profile_photo_url)
+            .filter(InstructorProfile.user_id.in_(instructor_user_ids))
+            .all()
+        )
+
+    return {
+        user.id: UserBasicResponse(
+            id=user.id,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            profile_photo_url=photos.get(user.id),
+            role=user.role.value,
+        )
+        for user in users
+    }
+
+
 def get_user_basic_info(db: Session, user_id: int) -> Optional[UserBasicResponse]:
     """Get basic user info."""
-    user = db.query(UserModel).filter(UserModel.id == user_id).first()
-    if not user:
-        return None
-
-    # Get profile photo
-    profile_photo = None
-    if user.role.value == "instructor":
-        instructor_profile = db.query(InstructorProfile).filter(
-            InstructorProfile.user_id == user_id
-        ).first()
-        if instructor_profile:
-            profile_photo = instructor_profile.profile_photo_url
-
-    return UserBasicResponse(
-        id=user.id,
-        first_name=user.first_name,
-        last_name=user.last_name,
-        profile_photo_url=profile_photo,
-        role=user.role.value,
-    )
+    return get_users_basic_info(db, [user_id]).get(user_id)
 
 
 def conversation_to_response(
@@ -174,10 +202,19 @@ def conversation_to_response(
     db: Session,
     current_user_id: int,
     unread_count: int = 0,
+    participants: Optional[Dict[int, UserBasicResponse]] = None,
 ) -> ConversationResponse:
-    """Convert domain Conversation to response."""
+    """
+    Convert domain Conversation to response.
+
+    Pass participants (from get_users_basic_info) when converting a list,
+    so the other participants are loaded in one batch instead of per row.
+    """
     other_id = conversation.get_other_participant_id(current_user_id)
-    other_participant = get_user_basic_info(db, other_id)
+    if participants is not None:
+        other_participant = participants.get(other_id)
+    else:
+        other_participant = get_user_basic_info(db, other_id)
 
     return ConversationResponse(
         id=conversation.id,
@@ -190,9 +227,21 @@ def conversation_to_response(
     )
 
 
-def message_to_response(message: Message, db: Session) -> MessageResponse:
-    """Convert domain Message to response."""
-    sender = get_user_basic_info(db, message.sender_id)
+def message_to_response(
+    message: Message,
+    db: Session,
+    senders: Optional[Dict[int, UserBasicResponse]] = None,
+) -> MessageResponse:
+    """
+    Convert domain Message to response.
+
+    Pass senders (from get_users_basic_info) when converting a list,
+    so senders are loaded in one batch instead of per message.
+    """
+    if senders is not None:
+        sender = senders.get(message.sender_id)
+    else:
+        sender = get_user_basic_info(db, message.sender_id)
 
     return MessageResponse(
         id=message.id,
@@ -237,12 +286,17 @@ async def get_conversations(
     )
 
     # Convert to responses
+    participants = get_users_basic_info(
+        db,
+        (r["conversation"].get_other_participant_id(current_user.id) for r in results),
+    )
     return [
         conversation_to_response(
             conversation=r["conversation"],
             db=db,
             current_user_id=current_user.id,
             unread_count=r["unread_count"],
+            participants=participants,
         )
         for r in results
     ]
@@ -331,6 +385,60 @@ async def start_conversation(
     )
 
 
+@router.get("/messages/search", response_model=MessageSearchResponse)
+async def search_messages(
+    q: str = Query(..., min_length=1, max_length=200, description="Free-text query"),
+    conversation_id: Optional[int] = Query(None, description="Restrict to one conversation"),
+    limit: int = Query(20, ge=1, le=50),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    db: Session = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user_allow_inactive),
+):
+    """
+    Full-text search across the current user's conversations.
+
+    Results are ranked by relevance (lower rank is better) and paginated
+    with an opaque keyset cursor.
+    """
+    conversation_repo = SQLAlchemyConversationRepository(db)
+    message_repo = SQLAlchemyMessageRepository(db)
+
+    use_case = SearchMessagesUseCase(
+        conversation_repo=conversation_repo,
+        message_repo=message_repo,
+    )
+
+    try:
+        page = use_case.execute(
+            user_id=current_user.id,
+            query=q,
+            conversation_id=conversation_id,
+            limit=limit,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        error_message = str(e)
+        if "not found" in error_message.lower():
+            status_code = status.HTTP_404_NOT_FOUND
+        elif "access denied" in error_message.lower():
+            status_code = status.HTTP_403_FORBIDDEN
+        else:
+            status_code = status.HTTP_400_BAD_REQUEST
+        raise HTTPException(
+            status_code=status_code,
+            detail=error_message,
+        )
+
+    senders = get_users_basic_info(db, (m.sender_id for m, _ in page.hits))
+    return MessageSearchResponse(
+        results=[
+            MessageSearchHitResponse(message=message_to_response(m, db, senders), rank=rank)
+            for m, rank in page.hits
+        ],
+        next_cursor=page.next_cursor,
+    )
+
+
 @router.get("/conversations/{conversation_id}/messages", response_model=List[MessageResponse])
 async def get_messages(
     conversation_id: int,
@@ -361,7 +469,8 @@ async def get_messages(
             detail=str(e),
         )
 
-    return [message_to_response(m, db) for m in messages]
+    senders = get_users_basic_info(db, (m.sender_id for m in messages))
+    return [message_to_response(m, db, senders) for m in messages]
 
 
 @router.post("/conversations/{conversation_id}/messages", response_model=MessageResponse)
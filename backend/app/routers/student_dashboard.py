@@ -13,7 +13,7 @@ from datetime import datetime
 from typing import List, Optional
 from decimal import Decimal
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from pydantic import BaseModel, Field
 
 from app.core.dependencies import (
@@ -23,17 +23,22 @@ from app.core.dependencies import (
     get_instructor_repository,
     get_student_repository,
     get_user_repository,
+    get_student_stats_repository,
+    get_dashboard_composer,
+    build_student_dashboard_use_case,
 )
 from app.domains.user.entities import User
 from app.domains.scheduling.repositories import ISessionRepository
 from app.domains.payment.repositories import IPaymentRepository
 from app.domains.instructor.repositories import IInstructorProfileRepository
-from app.domains.student.repositories import IStudentProfileRepository
+from app.domains.student.repositories import IStudentProfileRepository, IStudentStatsRepository
 from app.domains.user.repositories import IUserRepository
 from app.application.use_cases.student_dashboard import (
     GetStudentDashboardUseCase,
+    STUDENT_DASHBOARD_SECTIONS,
     StudentDashboardOutput,
 )
+from app.infrastructure.dashboard import SectionComposer, parse_sections
 
 router = APIRouter(prefix="/student/dashboard", tags=["student-dashboard"])
 
@@ -76,6 +81,7 @@ class StudentStatsResponse(BaseModel):
     currency: str
     total_instructors: int
     trial_sessions_used: int
+    longest_streak_weeks: int = 0
 
     class Config:
         from_attributes = True
@@ -141,12 +147,12 @@ class PaymentHistoryResponse(BaseModel):
 
 
 class StudentDashboardResponse(BaseModel):
-    """Complete student dashboard response."""
-    upcoming_sessions: List[UpcomingSessionResponse]
-    stats: StudentStatsResponse
-    my_instructors: List[MyInstructorResponse]
-    session_history: List[SessionHistoryResponse]
-    payment_history: List[PaymentHistoryResponse]
+    """Complete student dashboard response (sections not requested are null)."""
+    upcoming_sessions: Optional[List[UpcomingSessionResponse]] = None
+    stats: Optional[StudentStatsResponse] = None
+    my_instructors: Optional[List[MyInstructorResponse]] = None
+    session_history: Optional[List[SessionHistoryResponse]] = None
+    payment_history: Optional[List[PaymentHistoryResponse]] = None
 
     class Config:
         from_attributes = True
@@ -158,12 +164,14 @@ class StudentDashboardResponse(BaseModel):
 
 @router.get("", response_model=StudentDashboardResponse)
 async def get_student_dashboard(
+    response: Response,
+    sections: Optional[str] = Query(
+        None,
+        description=f"Comma separated sections to load (default: all): {', '.join(STUDENT_DASHBOARD_SECTIONS)}",
+    ),
     current_user: User = Depends(get_current_user),
-    session_repo: ISessionRepository = Depends(get_session_repository),
-    payment_repo: IPaymentRepository = Depends(get_payment_repository),
-    instructor_repo: IInstructorProfileRepository = Depends(get_instructor_repository),
     student_repo: IStudentProfileRepository = Depends(get_student_repository),
-    user_repo: IUserRepository = Depends(get_user_repository),
+    composer: SectionComposer = Depends(get_dashboard_composer),
 ):
     """
     Get complete student dashboard data.
@@ -174,6 +182,10 @@ async def get_student_dashboard(
     - My instructors (instructors the student has booked with)
     - Session history (past sessions)
     - Payment history (recent transactions)
+
+    Sections are independent and load concurrently, each on its own DB
+    session. Pass sections= to load a subset; the others are null. Per
+    section load times are reported in the Server-Timing header.
     """
     # Verify user is a student
     if current_user.role.value not in ("student", "admin"):
@@ -182,16 +194,37 @@ async def get_student_dashboard(
             detail="Only students can access the student dashboard"
         )
 
-    # Execute use case
-    use_case = GetStudentDashboardUseCase(
-        session_repo=session_repo,
-        payment_repo=payment_repo,
-        instructor_repo=instructor_repo,
-        student_repo=student_repo,
-        user_repo=user_repo,
-    )
+    try:
+        wanted = parse_sections(sections, STUDENT_DASHBOARD_SECTIONS)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
 
-    result = use_case.execute(user_id=current_user.id)
+    # Sessions store profile IDs, payments store user IDs
+    user_id = current_user.id
+    student_profile = student_repo.get_by_user_id(user_id)
+    if not student_profile:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No student profile found for user {user_id}"
+        )
+    student_profile_id = student_profile.id
+
+    loaders = {
+        "upcoming_sessions": lambda db: build_student_dashboard_use_case(db).get_upcoming_sessions(
+            student_profile_id
+        ),
+        "stats": lambda db: build_student_dashboard_use_case(db).get_stats(student_profile_id, user_id),
+        "my_instructors": lambda db: build_student_dashboard_use_case(db).get_my_instructors(
+            student_profile_id
+        ),
+        "session_history": lambda db: build_student_dashboard_use_case(db).get_session_history(
+            student_profile_id
+        ),
+        "payment_history": lambda db: build_student_dashboard_use_case(db).get_payment_history(user_id),
+    }
+    composed = await composer.compose({name: loaders[name] for name in wanted})
+    response.headers["Server-Timing"] = composed.server_timing()
+    result = composed.results
 
     # Convert to response models
     from app.utils.datetime_utils import is_in_progress
@@ -218,25 +251,18 @@ async def get_student_dashboard(
                 amount=float(s.amount),
                 currency=s.currency,
             )
-            for s in result.upcoming_sessions
-        ],
+            for s in result["upcoming_sessions"]
+        ] if "upcoming_sessions" in result else None,
         stats=StudentStatsResponse(
-            total_sessions_completed=result.stats.total_sessions_completed,
-            total_hours_learning=result.stats.total_hours_learning,
-            current_streak_weeks=result.stats.current_streak_weeks,
-            total_spent=float(result.stats.total_spent),
-            currency=result.stats.currency,
-            total_instructors=result.stats.total_instructors,
-            trial_sessions_used=result.stats.trial_sessions_used,
-        ) if result.stats else StudentStatsResponse(
-            total_sessions_completed=0,
-            total_hours_learning=0,
-            current_streak_weeks=0,
-            total_spent=0,
-            currency="INR",
-            total_instructors=0,
-            trial_sessions_used=0,
-        ),
+            total_sessions_completed=result["stats"].total_sessions_completed,
+            total_hours_learning=result["stats"].total_hours_learning,
+            current_streak_weeks=result["stats"].current_streak_weeks,
+            total_spent=float(result["stats"].total_spent),
+            currency=result["stats"].currency,
+            total_instructors=result["stats"].total_instructors,
+            trial_sessions_used=result["stats"].trial_sessions_used,
+            longest_streak_weeks=result["stats"].longest_streak_weeks,
+        ) if "stats" in result else None,
         my_instructors=[
             MyInstructorResponse(
                 instructor_id=i.instructor_id,
@@ -251,8 +277,8 @@ async def get_student_dashboard(
                 trial_session_price=float(i.trial_session_price) if i.trial_session_price else None,
                 currency=i.currency,
             )
-            for i in result.my_instructors
-        ],
+            for i in result["my_instructors"]
+        ] if "my_instructors" in result else None,
         session_history=[
             SessionHistoryResponse(
                 session_id=s.session_id,
@@ -271,8 +297,8 @@ async def get_student_dashboard(
                 has_review=s.has_review,
                 instructor_notes=s.instructor_notes,
             )
-            for s in result.session_history
-        ],
+            for s in result["session_history"]
+        ] if "session_history" in result else None,
         payment_history=[
             PaymentHistoryResponse(
                 payment_id=p.payment_id,
@@ -288,8 +314,8 @@ async def get_student_dashboard(
                 session_date=p.session_date,
                 refund_status=p.refund_status,
             )
-            for p in result.payment_history
-        ],
+            for p in result["payment_history"]
+        ] if "payment_history" in result else None,
     )
 
 
@@ -318,7 +344,7 @@ async def get_upcoming_sessions(
         user_repo=user_repo,
     )
 
-    result = use_case.execute(user_id=current_user.id)
+    result = use_case.execute(user_id=current_user.id, sections=("upcoming_sessions",))
 
     from app.utils.datetime_utils import is_in_progress
 
@@ -355,6 +381,7 @@ async def get_student_stats(
     instructor_repo: IInstructorProfileRepository = Depends(get_instructor_repository),
     student_repo: IStudentProfileRepository = Depends(get_student_repository),
     user_repo: IUserRepository = Depends(get_user_repository),
+    stats_repo: IStudentStatsRepository = Depends(get_student_stats_repository),
 ):
     """Get only student statistics."""
     if current_user.role.value not in ("student", "admin"):
@@ -369,9 +396,10 @@ async def get_student_stats(
         instructor_repo=instructor_repo,
         student_repo=student_repo,
         user_repo=user_repo,
+        stats_repo=stats_repo,
     )
 
-    result = use_case.execute(user_id=current_user.id)
+    result = use_case.execute(user_id=current_user.id, sections=("stats",))
 
     return StudentStatsResponse(
         total_sessions_completed=result.stats.total_sessions_completed,
@@ -381,6 +409,7 @@ async def get_student_stats(
         currency=result.stats.currency,
         total_instructors=result.stats.total_instructors,
         trial_sessions_used=result.stats.trial_sessions_used,
+        longest_streak_weeks=result.stats.longest_streak_weeks,
     )
 
 
@@ -409,7 +438,7 @@ async def get_my_instructors(
         user_repo=user_repo,
     )
 
-    result = use_case.execute(user_id=current_user.id)
+    result = use_case.execute(user_id=current_user.id, sections=("my_instructors",))
 
     return [
         MyInstructorResponse(
@@ -431,8 +460,8 @@ async def get_my_instructors(
 
 @router.get("/session-history", response_model=List[SessionHistoryResponse])
 async def get_session_history(
-    limit: int = 20,
-    offset: int = 0,
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
     current_user: User = Depends(get_current_user),
     session_repo: ISessionRepository = Depends(get_session_repository),
     payment_repo: IPaymentRepository = Depends(get_payment_repository),
@@ -455,7 +484,12 @@ async def get_session_history(
         user_repo=user_repo,
     )
 
-    result = use_case.execute(user_id=current_user.id)
+    result = use_case.execute(
+        user_id=current_user.id,
+        history_limit=limit,
+        history_offset=offset,
+        sections=("session_history",),
+    )
 
     return [
         SessionHistoryResponse(
@@ -475,14 +509,14 @@ async def get_session_history(
             has_review=s.has_review,
             instructor_notes=s.instructor_notes,
         )
-        for s in result.session_history[offset:offset + limit]
+        for s in result.session_history
     ]
 
 
 @router.get("/payment-history", response_model=List[PaymentHistoryResponse])
 async def get_payment_history(
-    limit: int = 20,
-    offset: int = 0,
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
     current_user: User = Depends(get_current_user),
     session_repo: ISessionRepository = Depends(get_session_repository),
     payment_repo: IPaymentRepository = Depends(get_payment_repository),
@@ -505,7 +539,12 @@ async def get_payment_history(
         user_repo=user_repo,
     )
 
-    result = use_case.execute(user_id=current_user.id)
+    result = use_case.execute(
+        user_id=current_user.id,
+        payment_limit=limit,
+        payment_offset=offset,
+        sections=("payment_history",),
+    )
 
     return [
         PaymentHistoryResponse(
@@ -522,5 +561,5 @@ async def get_payment_history(
             session_date=p.session_date,
             refund_status=p.refund_status,
         )
-        for p in result.payment_history[offset:offset + limit]
+        for p in result.payment_history
     ]
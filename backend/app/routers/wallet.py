@@ -2,9 +2,9 @@
 
 from decimal import Decimal
 from typing import Optional, List, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field
 
 from app.core.dependencies import (
@@ -20,6 +20,7 @@ from app.application.use_cases.wallet import (
     DepositFundsUseCase,
     RequestWithdrawalUseCase,
     GetWalletBalanceUseCase,
+    GetBalanceAsOfUseCase,
 )
 from app.application.use_cases.wallet.get_wallet_balance import (
     GetTransactionHistoryUseCase,
@@ -28,6 +29,7 @@ from app.application.use_cases.wallet.request_withdrawal import (
     CompleteWithdrawalUseCase,
     FailWithdrawalUseCase,
 )
+from app.utils.pagination import encode_cursor, decode_cursor, parse_cursor_datetime
 
 router = APIRouter(prefix="/wallet", tags=["wallet"])
 
@@ -75,8 +77,21 @@ class TransactionListResponse(BaseModel):
     """Response containing list of transactions."""
 
     transactions: List[TransactionResponse]
-    total_count: int
     has_more: bool
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Pass as cursor to get the next page",
+    )
+
+
+class BalanceAsOfResponse(BaseModel):
+    """Wallet balances at a point in time, derived from the transaction ledger."""
+
+    wallet_id: int
+    as_of: datetime
+    balance: float
+    total_earned: float
+    total_withdrawn: float
 
 
 class WithdrawalRequest(BaseModel):
@@ -175,17 +190,25 @@ async def get_transactions(
     status_filter: Optional[str] = None,
     limit: int = 50,
     offset: int = 0,
+    cursor: Optional[str] = None,
     current_user: User = Depends(get_current_user),
     wallet_repo: IWalletRepository = Depends(get_wallet_repository),
     instructor_repo: IInstructorProfileRepository = Depends(get_instructor_repository),
 ):
     """
-    Get transaction history for the authenticated instructor.
+    Get transaction history for the authenticated instructor, newest first.
 
-    Supports filtering by type and status, with pagination.
+    Supports filtering by type and status. Page with `cursor` (the previous
+    response's `next_cursor`); `offset` is still accepted for the first page.
     """
     instructor_id = await get_instructor_profile_id(current_user, instructor_repo)
 
+    try:
+        after = decode_cursor(cursor, size=2)
+        after = (parse_cursor_datetime(after[0]), int(after[1])) if after else None
+    except (TypeError, ValueError) as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
     try:
         use_case = GetTransactionHistoryUseCase(wallet_repo)
         result = use_case.execute(
@@ -194,6 +217,7 @@ async def get_transactions(
             status=status_filter,
             limit=limit,
             offset=offset,
+            after=after,
         )
 
         transactions = [
@@ -215,8 +239,8 @@ async def get_transactions(
 
         return TransactionListResponse(
             transactions=transactions,
-            total_count=result.total_count,
             has_more=result.has_more,
+            next_cursor=encode_cursor(*result.next_after) if result.next_after else None,
         )
     except ValueError as e:
         raise HTTPException(
@@ -225,6 +249,40 @@ async def get_transactions(
         )
 
 
+@router.get("/balance/as-of", response_model=BalanceAsOfResponse)
+async def get_balance_as_of(
+    at: datetime = Query(..., description="Point in time (UTC)"),
+    current_user: User = Depends(get_current_user),
+    wallet_repo: IWalletRepository = Depends(get_wallet_repository),
+    instructor_repo: IInstructorProfileRepository = Depends(get_instructor_repository),
+):
+    """
+    Get the authenticated instructor's wallet balances at a point in time.
+
+    Computed from the latest balance snapshot before `at` plus the
+    transactions since it.
+    """
+    instructor_id = await get_instructor_profile_id(current_user, instructor_repo)
+    if at.tzinfo:
+        at = at.astimezone(timezone.utc).replace(tzinfo=None)
+
+    try:
+        balances = GetBalanceAsOfUseCase(wallet_repo).execute(instructor_id, at)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+
+    return BalanceAsOfResponse(
+        wallet_id=balances.wallet_id,
+        as_of=balances.as_of,
+        balance=float(balances.balance),
+        total_earned=float(balances.total_earned),
+        total_withdrawn=float(balances.total_withdrawn),
+    )
+
+
 @router.post("/withdraw", response_model=WithdrawalResponse)
 async def request_withdrawal(
     request: WithdrawalRequest,
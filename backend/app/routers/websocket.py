@@ -10,14 +10,20 @@ Handles WebSocket connections for:
 Uses DDD use cases for business logic.
 """
 
+import asyncio
 import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Set, Optional
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query
+from typing import Deque, Dict, Set, Optional, Tuple
+from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import or_
 
 from app.database.connection import SessionLocal
+from app.core.config import settings
+from app.core.dependencies import get_current_admin
 from app.core.security import decode_token
 from app.database.models import (
     Conversation as OrmConversation,
@@ -28,6 +34,7 @@ from app.database.models import (
 # Domain imports
 from app.domains.messaging.value_objects import MessageType
 from app.domains.messaging.entities import Message
+from app.domains.user.entities import User
 
 # Use case imports
 from app.application.use_cases.messaging import (
@@ -42,6 +49,8 @@ from app.infrastructure.repositories import (
     SQLAlchemyReadStatusRepository,
 )
 
+from app.routers.websocket_protocol import codec_for, negotiate_codec, send_event
+
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +61,53 @@ router = APIRouter()
 # Connection Manager
 # ============================================================================
 
+@dataclass
+class TypingState:
+    """Server-side typing state for one (user, conversation) pair."""
+
+    recipient_id: int
+    expires_at: float
+    last_sent_at: float
+    timer: Optional[asyncio.TimerHandle] = None
+
+
+@dataclass
+class ConnectionMetrics:
+    """Counters for the real-time messaging endpoint."""
+
+    connects_total: int = 0
+    disconnects_total: int = 0
+    frames_sent_total: int = 0
+    send_failures_total: int = 0
+    frames_in_flight: int = 0
+    pings_sent_total: int = 0
+    evictions_total: Dict[str, int] = field(default_factory=dict)
+    reaper_runs_total: int = 0
+    # Recent send latencies in milliseconds (bounded sample window)
+    send_latency_ms: Deque[float] = field(default_factory=lambda: deque(maxlen=2048))
+
+    def record_eviction(self, reason: str):
+        """Count an eviction by reason."""
+        self.evictions_total[reason] = self.evictions_total.get(reason, 0) + 1
+
+    def latency_summary(self) -> dict:
+        """Summarize the recent send latency window."""
+        samples = sorted(self.send_latency_ms)
+        if not samples:
+            return {"samples": 0, "avg_ms": 0.0, "p50_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+
+        def pct(p: float) -> float:
+            return round(samples[min(len(samples) - 1, int(p * len(samples)))], 3)
+
+        return {
+            "samples": len(samples),
+            "avg_ms": round(sum(samples) / len(samples), 3),
+            "p50_ms": pct(0.50),
+            "p99_ms": pct(0.99),
+            "max_ms": round(samples[-1], 3),
+        }
+
+
 class ConnectionManager:
     """Manages WebSocket connections for real-time messaging."""
 
@@ -62,30 +118,77 @@ class ConnectionManager:
         self.conversation_viewers: Dict[int, Set[int]] = {}
         # Map user_id to set of conversation_ids they're viewing
         self.user_conversations: Dict[int, Set[int]] = {}
+        # Map (user_id, conversation_id) to typing state
+        self.typing_states: Dict[Tuple[int, int], TypingState] = {}
+        # Map (user_id, conversation_id) to monotonic time until which typing
+        # events are dropped without a DB check (access was denied)
+        self.typing_denied: Dict[Tuple[int, int], float] = {}
+        # Map user_id to monotonic time of the last frame received from them
+        self.last_seen: Dict[int, float] = {}
+
+        self.metrics = ConnectionMetrics()
+        self._reaper_task: Optional[asyncio.Task] = None
+        # Fire-and-forget tasks, referenced until done so they aren't collected
+        self._background_tasks: Set[asyncio.Task] = set()
 
     async def connect(self, websocket: WebSocket, user_id: int):
-        """Accept WebSocket connection and track user."""
-        await websocket.accept()
+        """Negotiate the wire protocol, accept the connection and track user."""
+        codec = negotiate_codec(websocket)
+        websocket.state.codec = codec
+        await websocket.accept(subprotocol=codec.subprotocol)
         self.active_connections[user_id] = websocket
         self.user_conversations[user_id] = set()
+        self.last_seen[user_id] = time.monotonic()
+        self.metrics.connects_total += 1
         logger.info(f"User {user_id} connected via WebSocket")
 
-    def disconnect(self, user_id: int):
-        """Remove WebSocket connection and clean up."""
+    def disconnect(self, user_id: int, websocket: Optional[WebSocket] = None):
+        """
+        Remove WebSocket connection and clean up.
+
+        If websocket is given, only clean up when it is still the user's
+        current connection, so a stale socket closing late can't tear down
+        the user's newer connection.
+        """
+        if websocket is not None and self.active_connections.get(user_id) is not websocket:
+            return
+
         if user_id in self.active_connections:
             del self.active_connections[user_id]
+            self.metrics.disconnects_total += 1
+
+        self.last_seen.pop(user_id, None)
 
         # Remove user from all conversation viewers
         if user_id in self.user_conversations:
             for conv_id in self.user_conversations[user_id]:
-                if conv_id in self.conversation_viewers:
-                    self.conversation_viewers[conv_id].discard(user_id)
+                viewers = self.conversation_viewers.get(conv_id)
+                if viewers is not None:
+                    viewers.discard(user_id)
+                    if not viewers:
+                        del self.conversation_viewers[conv_id]
             del self.user_conversations[user_id]
 
+        # Drop typing state; user_offline already tells the other side
+        for key in [k for k in self.typing_states if k[0] == user_id]:
+            state = self.typing_states.pop(key)
+            if state.timer:
+                state.timer.cancel()
+        for key in [k for k in self.typing_denied if k[0] == user_id]:
+            del self.typing_denied[key]
+
         logger.info(f"User {user_id} disconnected from WebSocket")
 
+    def touch(self, user_id: int):
+        """Record that a frame was received from the user (liveness)."""
+        if user_id in self.active_connections:
+            self.last_seen[user_id] = time.monotonic()
+
     def join_conversation(self, user_id: int, conversation_id: int):
         """Mark user as viewing a conversation."""
+        if user_id not in self.active_connections:
+            return
+
         if conversation_id not in self.conversation_viewers:
             self.conversation_viewers[conversation_id] = set()
         self.conversation_viewers[conversation_id].add(user_id)
@@ -95,8 +198,11 @@ class ConnectionManager:
 
     def leave_conversation(self, user_id: int, conversation_id: int):
         """Mark user as no longer viewing a conversation."""
-        if conversation_id in self.conversation_viewers:
-            self.conversation_viewers[conversation_id].discard(user_id)
+        viewers = self.conversation_viewers.get(conversation_id)
+        if viewers is not None:
+            viewers.discard(user_id)
+            if not viewers:
+                del self.conversation_viewers[conversation_id]
 
         if user_id in self.user_conversations:
             self.user_conversations[user_id].discard(conversation_id)
@@ -111,14 +217,271 @@ class ConnectionManager:
 
     async def send_to_user(self, user_id: int, message: dict):
         """Send message to a specific user if connected."""
-        if user_id in self.active_connections:
+        websocket = self.active_connections.get(user_id)
+        if websocket is None:
+            return False
+
+        self.metrics.frames_in_flight += 1
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(
+                send_event(websocket, message),
+                timeout=settings.WS_SEND_TIMEOUT_SECONDS,
+            )
+            self.metrics.frames_sent_total += 1
+            self.metrics.send_latency_ms.append((time.perf_counter() - started) * 1000)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to send to user {user_id}: {e!r}")
+            self.metrics.send_failures_total += 1
+            self.metrics.record_eviction("send_failure")
+            self.disconnect(user_id, websocket)
+            return False
+        finally:
+            self.metrics.frames_in_flight -= 1
+
+    # ------------------------------------------------------------------------
+    # Heartbeat and reaping
+    #
+    # Half-open connections (typically mobile clients losing network) never
+    # raise WebSocketDisconnect. Every WS_HEARTBEAT_INTERVAL_SECONDS the
+    # reaper pings sockets that have been silent for a full interval and
+    # evicts those that stayed silent for WS_PONG_TIMEOUT_SECONDS beyond
+    # that. Any received frame counts as a pong.
+    # ------------------------------------------------------------------------
+
+    def start_reaper(self):
+        """Start the periodic heartbeat/reaper task (idempotent)."""
+        if self._reaper_task is None or self._reaper_task.done():
+            self._reaper_task = asyncio.create_task(self._reaper_loop())
+
+    async def stop_reaper(self):
+        """Stop the periodic heartbeat/reaper task."""
+        if self._reaper_task is not None:
+            self._reaper_task.cancel()
+            try:
+                await self._reaper_task
+            except asyncio.CancelledError:
+                pass
+            self._reaper_task = None
+
+    async def _reaper_loop(self):
+        """Run reap_once() forever at the heartbeat interval."""
+        while True:
+            await asyncio.sleep(settings.WS_HEARTBEAT_INTERVAL_SECONDS)
             try:
-                await self.active_connections[user_id].send_json(message)
-                return True
+                await self.reap_once()
             except Exception as e:
-                logger.error(f"Failed to send to user {user_id}: {e}")
-                self.disconnect(user_id)
-        return False
+                logger.error(f"WebSocket reaper run failed: {e!r}")
+
+    async def reap_once(self) -> int:
+        """
+        Ping idle connections, evict dead ones and prune orphaned state.
+
+        Returns:
+            Number of connections evicted
+        """
+        self.metrics.reaper_runs_total += 1
+        now = time.monotonic()
+        interval = settings.WS_HEARTBEAT_INTERVAL_SECONDS
+        deadline = interval + settings.WS_PONG_TIMEOUT_SECONDS
+
+        evicted = 0
+        for user_id, websocket in list(self.active_connections.items()):
+            idle = now - self.last_seen.get(user_id, now)
+
+            if idle >= deadline:
+                logger.info(f"Evicting silent WebSocket for user {user_id} (idle {idle:.0f}s)")
+                self.metrics.record_eviction("heartbeat_timeout")
+                self.disconnect(user_id, websocket)
+                evicted += 1
+                try:
+                    await websocket.close(code=1001)
+                except Exception:
+                    pass
+
+            elif idle >= interval:
+                self.metrics.pings_sent_total += 1
+                await self.send_to_user(user_id, {"type": "ping"})
+
+        self._prune_orphans()
+        return evicted
+
+    def _prune_orphans(self):
+        """Drop map entries that no longer belong to a live connection."""
+        for user_id in [u for u in self.user_conversations if u not in self.active_connections]:
+            del self.user_conversations[user_id]
+
+        for user_id in [u for u in self.last_seen if u not in self.active_connections]:
+            del self.last_seen[user_id]
+
+        for conv_id in list(self.conversation_viewers):
+            viewers = self.conversation_viewers[conv_id]
+            viewers.intersection_update(self.active_connections.keys())
+            if not viewers:
+                del self.conversation_viewers[conv_id]
+
+        now = time.monotonic()
+        for key in [k for k, until in self.typing_denied.items() if until <= now]:
+            del self.typing_denied[key]
+
+    def snapshot_metrics(self) -> dict:
+        """Current gauges and counters for the metrics endpoint."""
+        m = self.metrics
+        return {
+            "connected_sockets": len(self.active_connections),
+            "viewed_conversations": len(self.conversation_viewers),
+            "typing_bursts": len(self.typing_states),
+            "typing_denied": len(self.typing_denied),
+            "frames_in_flight": m.frames_in_flight,
+            "connects_total": m.connects_total,
+            "disconnects_total": m.disconnects_total,
+            "frames_sent_total": m.frames_sent_total,
+            "send_failures_total": m.send_failures_total,
+            "pings_sent_total": m.pings_sent_total,
+            "evictions_total": dict(m.evictions_total),
+            "reaper_runs_total": m.reaper_runs_total,
+            "send_latency": m.latency_summary(),
+        }
+
+    # ------------------------------------------------------------------------
+    # Typing indicators
+    #
+    # Clients may emit typing_start / typing_stop on every keystroke. The
+    # manager keeps one TypingState per (user, conversation) and forwards at
+    # most one user_typing per TYPING_KEEPALIVE_SECONDS plus a single
+    # user_stopped_typing per burst. typing_stop is deferred by
+    # TYPING_STOP_GRACE_SECONDS so a quick restart coalesces into the same
+    # burst, and a burst with no typing_start for TYPING_IDLE_TIMEOUT_SECONDS
+    # ends on its own.
+    # ------------------------------------------------------------------------
+
+    def is_typing_denied(self, user_id: int, conversation_id: int) -> bool:
+        """Whether typing in this conversation was recently refused for the user."""
+        until = self.typing_denied.get((user_id, conversation_id))
+        if until is None:
+            return False
+        if until <= time.monotonic():
+            del self.typing_denied[(user_id, conversation_id)]
+            return False
+        return True
+
+    def deny_typing(self, user_id: int, conversation_id: int):
+        """Drop the user's typing events for this conversation for a while."""
+        self.typing_denied[(user_id, conversation_id)] = (
+            time.monotonic() + settings.TYPING_DENIED_TTL_SECONDS
+        )
+
+    async def refresh_typing(self, user_id: int, conversation_id: int) -> bool:
+        """
+        Extend an ongoing typing burst.
+
+        Returns:
+            True if the user was already typing (no further work needed),
+            False if a new burst must be started with start_typing().
+        """
+        state = self.typing_states.get((user_id, conversation_id))
+        if state is None:
+            return False
+
+        now = time.monotonic()
+        state.expires_at = now + settings.TYPING_IDLE_TIMEOUT_SECONDS
+
+        # Keepalive so the recipient's indicator doesn't time out client-side
+        if now - state.last_sent_at >= settings.TYPING_KEEPALIVE_SECONDS:
+            state.last_sent_at = now
+            await self.send_to_user(state.recipient_id, {
+                "type": "user_typing",
+                "conversation_id": conversation_id,
+                "user_id": user_id
+            })
+        return True
+
+    async def start_typing(self, user_id: int, conversation_id: int, recipient_id: int):
+        """Start a typing burst and notify the recipient."""
+        key = (user_id, conversation_id)
+        if key in self.typing_states:
+            await self.refresh_typing(user_id, conversation_id)
+            return
+
+        now = time.monotonic()
+        state = TypingState(
+            recipient_id=recipient_id,
+            expires_at=now + settings.TYPING_IDLE_TIMEOUT_SECONDS,
+            last_sent_at=now,
+        )
+        self.typing_states[key] = state
+        self._arm_typing_timer(key, state)
+
+        await self.send_to_user(recipient_id, {
+            "type": "user_typing",
+            "conversation_id": conversation_id,
+            "user_id": user_id
+        })
+
+    def schedule_typing_stop(self, user_id: int, conversation_id: int):
+        """End a typing burst after the stop grace period (coalesced)."""
+        state = self.typing_states.get((user_id, conversation_id))
+        if state is None:
+            return
+
+        deadline = time.monotonic() + settings.TYPING_STOP_GRACE_SECONDS
+        if deadline < state.expires_at:
+            state.expires_at = deadline
+            self._arm_typing_timer((user_id, conversation_id), state)
+
+    async def stop_typing(self, user_id: int, conversation_id: int):
+        """End a typing burst immediately and notify the recipient."""
+        state = self.typing_states.pop((user_id, conversation_id), None)
+        if state is None:
+            return
+
+        if state.timer:
+            state.timer.cancel()
+
+        await self.send_to_user(state.recipient_id, {
+            "type": "user_stopped_typing",
+            "conversation_id": conversation_id,
+            "user_id": user_id
+        })
+
+    def _arm_typing_timer(self, key: Tuple[int, int], state: TypingState):
+        """(Re)schedule the expiry check for a burst at its current deadline."""
+        if state.timer:
+            state.timer.cancel()
+        delay = max(0.0, state.expires_at - time.monotonic())
+        state.timer = asyncio.get_running_loop().call_later(
+            delay, self._on_typing_timer, key
+        )
+
+    def _on_typing_timer(self, key: Tuple[int, int]):
+        """
+        Expiry check for a typing burst.
+
+        refresh_typing() only moves the deadline forward without touching
+        the timer, so a keystroke costs no timer churn; the timer simply
+        re-arms itself here if the deadline has moved.
+        """
+        state = self.typing_states.get(key)
+        if state is None:
+            return
+
+        state.timer = None
+        if state.expires_at > time.monotonic():
+            self._arm_typing_timer(key, state)
+        else:
+            self._spawn(self.stop_typing(*key))
+
+    def _spawn(self, coro):
+        """Run a coroutine in the background, keeping it referenced until done."""
+        task = asyncio.get_running_loop().create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._on_background_task_done)
+
+    def _on_background_task_done(self, task: asyncio.Task):
+        self._background_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"WebSocket background task failed: {task.exception()!r}")
 
     async def broadcast_to_conversation(
         self,
@@ -127,7 +490,7 @@ class ConnectionManager:
         exclude_user: Optional[int] = None
     ):
         """Send message to all users viewing a conversation."""
-        viewers = self.get_conversation_users(conversation_id)
+        viewers = list(self.get_conversation_users(conversation_id))
         for user_id in viewers:
             if user_id != exclude_user:
                 await self.send_to_user(user_id, message)
@@ -223,6 +586,10 @@ async def websocket_endpoint(
     """
     WebSocket endpoint for real-time messaging.
 
+    Wire protocol is negotiated via Sec-WebSocket-Protocol (JSON by
+    default, "tutorly.msgpack.v1" for compact binary frames); see
+    app/routers/websocket_protocol.py.
+
     Events from client:
     - join_conversation: { conversation_id }
     - leave_conversation: { conversation_id }
@@ -230,9 +597,13 @@ async def websocket_endpoint(
     - typing_start: { conversation_id }
     - typing_stop: { conversation_id }
     - mark_read: { conversation_id, message_id }
+    - pong: {}  (reply to server ping; any frame counts as liveness)
+    - ping: {}  (optional client-driven keepalive)
 
     Events to client:
     - connected: { user_id }
+    - ping: {}  (sent to idle sockets; unanswered pings lead to eviction)
+    - pong: {}  (reply to client ping)
     - new_message: { message }
     - message_sent: { message, temp_id }
     - message_delivered: { message_id }
@@ -253,7 +624,7 @@ async def websocket_endpoint(
     await manager.connect(websocket, user_id)
 
     # Send connection confirmation
-    await websocket.send_json({
+    await send_event(websocket, {
         "type": "connected",
         "user_id": user_id
     })
@@ -283,10 +654,17 @@ async def websocket_endpoint(
     try:
         while True:
             # Receive message
-            data = await websocket.receive_json()
+            data = await codec_for(websocket).receive(websocket)
+            manager.touch(user_id)
             event_type = data.get("type")
 
-            if event_type == "join_conversation":
+            if event_type == "pong":
+                pass
+
+            elif event_type == "ping":
+                await manager.send_to_user(user_id, {"type": "pong"})
+
+            elif event_type == "join_conversation":
                 await handle_join_conversation(user_id, data)
 
             elif event_type == "leave_conversation":
@@ -305,15 +683,21 @@ async def websocket_endpoint(
                 await handle_mark_read(user_id, data)
 
             else:
-                await websocket.send_json({
+                await send_event(websocket, {
                     "type": "error",
                     "message": f"Unknown event type: {event_type}"
                 })
 
     except WebSocketDisconnect:
-        manager.disconnect(user_id)
+        pass
+    except Exception as e:
+        # Includes receives on a socket the reaper already closed
+        logger.info(f"WebSocket for user {user_id} ended: {e!r}")
+
+    manager.disconnect(user_id, websocket)
 
-        # Notify contacts that user is offline
+    # Notify contacts that user is offline, unless they already reconnected
+    if not manager.is_user_online(user_id):
         db = get_db_session()
         try:
             conversations = db.query(OrmConversation).filter(
@@ -372,7 +756,7 @@ async def handle_send_message(user_id: int, data: dict, websocket: WebSocket):
     temp_id = data.get("temp_id")  # Client-side temporary ID for optimistic UI
 
     if not conversation_id or not content:
-        await websocket.send_json({
+        await send_event(websocket, {
             "type": "error",
             "message": "Missing conversation_id or content"
         })
@@ -387,7 +771,7 @@ async def handle_send_message(user_id: int, data: dict, websocket: WebSocket):
         # Verify access
         conversation = conversation_repo.get_by_id(conversation_id)
         if not conversation or not conversation.is_participant(user_id):
-            await websocket.send_json({
+            await send_event(websocket, {
                 "type": "error",
                 "message": "Access denied"
             })
@@ -411,11 +795,14 @@ async def handle_send_message(user_id: int, data: dict, websocket: WebSocket):
 
         db.commit()
 
+        # Sending ends any typing burst in this conversation
+        await manager.stop_typing(user_id, conversation_id)
+
         # Build message response
         message_data = message_to_dict(message, db)
 
         # Send confirmation to sender
-        await websocket.send_json({
+        await send_event(websocket, {
             "type": "message_sent",
             "message": message_data,
             "temp_id": temp_id
@@ -436,13 +823,13 @@ async def handle_send_message(user_id: int, data: dict, websocket: WebSocket):
                 db.commit()
 
                 # Notify sender of delivery
-                await websocket.send_json({
+                await send_event(websocket, {
                     "type": "message_delivered",
                     "message_id": message.id
                 })
 
     except ValueError as e:
-        await websocket.send_json({
+        await send_event(websocket, {
             "type": "error",
             "message": str(e)
         })
@@ -451,43 +838,40 @@ async def handle_send_message(user_id: int, data: dict, websocket: WebSocket):
 
 
 async def handle_typing_start(user_id: int, data: dict):
-    """Handle typing start indicator."""
+    """Handle typing start indicator (throttled by the connection manager)."""
     conversation_id = data.get("conversation_id")
     if not conversation_id:
         return
 
+    # Ongoing burst: no DB access and at most a keepalive frame
+    if await manager.refresh_typing(user_id, conversation_id):
+        return
+
+    # Recently refused: drop without touching the DB
+    if manager.is_typing_denied(user_id, conversation_id):
+        return
+
     db = get_db_session()
     try:
+        other_id = None
         if can_access_conversation(db, user_id, conversation_id):
             other_id = get_other_participant_id(db, conversation_id, user_id)
-            if other_id:
-                await manager.send_to_user(other_id, {
-                    "type": "user_typing",
-                    "conversation_id": conversation_id,
-                    "user_id": user_id
-                })
     finally:
         db.close()
 
+    if other_id:
+        await manager.start_typing(user_id, conversation_id, other_id)
+    else:
+        manager.deny_typing(user_id, conversation_id)
+
 
 async def handle_typing_stop(user_id: int, data: dict):
-    """Handle typing stop indicator."""
+    """Handle typing stop indicator (coalesced by the connection manager)."""
     conversation_id = data.get("conversation_id")
     if not conversation_id:
         return
 
-    db = get_db_session()
-    try:
-        if can_access_conversation(db, user_id, conversation_id):
-            other_id = get_other_participant_id(db, conversation_id, user_id)
-            if other_id:
-                await manager.send_to_user(other_id, {
-                    "type": "user_stopped_typing",
-                    "conversation_id": conversation_id,
-                    "user_id": user_id
-                })
-    finally:
-        db.close()
+    manager.schedule_typing_stop(user_id, conversation_id)
 
 
 async def handle_mark_read(user_id: int, data: dict):
@@ -544,3 +928,11 @@ async def handle_mark_read(user_id: int, data: dict):
 async def check_user_online(user_id: int):
     """Check if a specific user is currently online."""
     return {"user_id": user_id, "online": manager.is_user_online(user_id)}
+
+
+@router.get("/ws/metrics")
+async def get_websocket_metrics(
+    current_user: User = Depends(get_current_admin),
+):
+    """Connection, frame, latency and eviction counters for /api/ws (admin only)."""
+    return manager.snapshot_metrics()
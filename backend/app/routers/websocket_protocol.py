@@ -0,0 +1,178 @@
+"""
+Wire protocols for the real-time messaging WebSocket.
+
+Clients pick a protocol with the standard Sec-WebSocket-Protocol header:
+
+- (none) or "tutorly.json.v1": JSON text frames with the verbose event
+  shapes documented on websocket_endpoint. This is the default.
+- "tutorly.msgpack.v1": binary MessagePack frames. Keys are shortened
+  through KEY_ALIASES and message senders are interned per connection:
+  a message carries only the sender id under "s", and the sender's
+  details are attached under "sx" ({id: sender}) the first time that
+  sender appears on the connection (or when the details change).
+  Clients may send either short or long keys.
+
+Clients should offer both protocols (msgpack first). If MessagePack is
+not installed on the server, the JSON protocol is selected instead.
+
+Transport compression (permessage-deflate) is negotiated by the ASGI
+server independently of the protocol chosen here.
+"""
+
+import json
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi import WebSocket, WebSocketDisconnect
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+
+logger = logging.getLogger(__name__)
+
+JSON_SUBPROTOCOL = "tutorly.json.v1"
+MSGPACK_SUBPROTOCOL = "tutorly.msgpack.v1"
+
+# Long key -> short key for the MessagePack protocol
+KEY_ALIASES: Dict[str, str] = {
+    "type": "t",
+    "conversation_id": "c",
+    "message": "m",
+    "message_id": "mi",
+    "user_id": "u",
+    "temp_id": "tmp",
+    "id": "i",
+    "content": "b",
+    "message_type": "mt",
+    "status": "st",
+    "reply_to_id": "r",
+    "created_at": "ts",
+    "read_by": "rb",
+    "first_name": "fn",
+    "last_name": "ln",
+    "profile_photo_url": "p",
+    "role": "ro",
+}
+KEY_EXPANSIONS: Dict[str, str] = {short: long for long, short in KEY_ALIASES.items()}
+
+
+def _compact(value: Any) -> Any:
+    """Recursively replace long keys with their short aliases."""
+    if isinstance(value, dict):
+        return {KEY_ALIASES.get(k, k): _compact(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_compact(v) for v in value]
+    return value
+
+
+def _expand(value: Any) -> Any:
+    """Recursively replace short keys with their long names."""
+    if isinstance(value, dict):
+        return {KEY_EXPANSIONS.get(k, k): _expand(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_expand(v) for v in value]
+    return value
+
+
+class JsonCodec:
+    """Default protocol: JSON text frames, verbose keys."""
+
+    def __init__(self, subprotocol: Optional[str] = None):
+        self.subprotocol = subprotocol
+
+    async def send(self, websocket: WebSocket, event: dict):
+        await websocket.send_json(event)
+
+    async def receive(self, websocket: WebSocket) -> dict:
+        return await websocket.receive_json()
+
+
+class MsgPackCodec:
+    """Compact protocol: MessagePack binary frames with interned senders."""
+
+    subprotocol = MSGPACK_SUBPROTOCOL
+
+    def __init__(self):
+        # sender_id -> sender details already sent on this connection
+        self._interned_senders: Dict[int, Tuple] = {}
+
+    def encode(self, event: dict) -> bytes:
+        """Compact an outgoing event and pack it."""
+        senders = {}
+        message = event.get("message")
+
+        if isinstance(message, dict) and isinstance(message.get("sender"), dict):
+            sender = message["sender"]
+            sender_id = sender.get("id")
+            fingerprint = tuple(sorted(sender.items()))
+
+            if self._interned_senders.get(sender_id) != fingerprint:
+                self._interned_senders[sender_id] = fingerprint
+                senders[sender_id] = _compact(sender)
+
+            message = {k: v for k, v in message.items() if k != "sender"}
+            message["s"] = sender_id
+            event = {**event, "message": message}
+
+        compact = _compact(event)
+        if senders:
+            compact["sx"] = senders
+
+        return msgpack.packb(compact, use_bin_type=True)
+
+    def decode(self, payload: bytes) -> dict:
+        """Unpack an incoming frame and expand its keys."""
+        data = msgpack.unpackb(payload, raw=False, strict_map_key=False)
+        if not isinstance(data, dict):
+            raise ValueError("Frame must be a map")
+        return _expand(data)
+
+    async def send(self, websocket: WebSocket, event: dict):
+        await websocket.send_bytes(self.encode(event))
+
+    async def receive(self, websocket: WebSocket) -> dict:
+        frame = await websocket.receive()
+        if frame["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(frame.get("code", 1000))
+
+        if frame.get("bytes") is not None:
+            return self.decode(frame["bytes"])
+        # Tolerate JSON text frames (e.g. from debugging tools)
+        return _expand(json.loads(frame["text"]))
+
+
+def negotiate_codec(websocket: WebSocket):
+    """
+    Pick the wire protocol from the client's offered subprotocols.
+
+    Returns:
+        Codec instance; its ``subprotocol`` must be passed to accept()
+    """
+    offered = websocket.scope.get("subprotocols") or []
+
+    if MSGPACK_SUBPROTOCOL in offered and msgpack is not None:
+        return MsgPackCodec()
+
+    if MSGPACK_SUBPROTOCOL in offered:
+        logger.warning("Client requested MessagePack but msgpack is not installed")
+
+    if JSON_SUBPROTOCOL in offered:
+        return JsonCodec(subprotocol=JSON_SUBPROTOCOL)
+
+    return JsonCodec()
+
+
+_DEFAULT_CODEC = JsonCodec()
+
+
+def codec_for(websocket: WebSocket):
+    """Codec negotiated for a connection (JSON if none was recorded)."""
+    return getattr(websocket.state, "codec", None) or _DEFAULT_CODEC
+
+
+async def send_event(websocket: WebSocket, event: dict):
+    """Send an event using the connection's negotiated protocol."""
+    await codec_for(websocket).send(websocket, event)
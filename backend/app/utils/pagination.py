@@ -0,0 +1,76 @@
+"""
+Keyset pagination helpers.
+
+Keyset ("seek") pagination addresses a page by the sort key of the last row
+the client has already seen, e.g. ``(rank, id)`` or ``(created_at, id)``,
+instead of by an OFFSET. The database can then jump straight to the next
+row through an index, so deep pages cost the same as the first one.
+
+The sort key is serialized into an opaque, URL-safe cursor string so that
+clients never depend on its structure.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Encode a keyset sort key into an opaque cursor string.
+
+    Datetimes are serialized as ISO-8601 strings; all other values must
+    be JSON-serializable.
+
+    Args:
+        *values: Sort key components of the last row on the page
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], size: int) -> Optional[List[Any]]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from a previous page (None for the first page)
+        size: Expected number of sort key components
+
+    Returns:
+        List of sort key components, or None if no cursor was given
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if not cursor:
+        return None
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid pagination cursor")
+
+    return values
+
+
+def parse_cursor_datetime(value: str) -> datetime:
+    """
+    Parse a datetime component decoded from a cursor.
+
+    Raises:
+        ValueError: If the value is not an ISO-8601 datetime
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError) as e:
+        raise ValueError("Invalid pagination cursor") from e
@@ -0,0 +1,468 @@
+#!/usr/bin/env python
+"""
+Load test for the real-time messaging WebSocket (/api/ws).
+
+Self-contained: seeds users and conversations into a throwaway SQLite
+database, runs the FastAPI app in-process (uvicorn on a background thread
+with its own event loop) and drives simulated clients against it.
+
+Each conversation gets two clients. Every client connects, joins its
+conversation and then, for each message it sends, emits a burst of
+typing_start events, a send_message, and a typing_stop. Receivers answer
+every new_message with mark_read. Once every message is delivered the
+clients wait (up to --drain-timeout) for the message_read acks of all
+mark_read frames, and the server state is sampled before the sockets close.
+
+Reported:
+- send-to-deliver latency (sender's send_message -> recipient's new_message)
+- server event-loop lag (probe task scheduled on the server loop)
+- DB queries per handled event type (SQLAlchemy cursor events)
+- ConnectionManager metrics once the run has drained (before teardown)
+
+Usage (from backend/):
+    python benchmarks/ws_load.py --pairs 500 --messages 10
+    python benchmarks/ws_load.py --pairs 2000 --messages 5 --protocol msgpack --json
+
+Thousands of clients need a raised file descriptor limit (ulimit -n).
+"""
+
+import argparse
+import asyncio
+import contextvars
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+# Configure an isolated database BEFORE importing the app
+_DB_DIR = tempfile.mkdtemp(prefix="tutorly-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_DB_DIR, 'bench.db')}"
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+os.environ["DEBUG"] = "false"
+os.environ["ENVIRONMENT"] = "benchmark"
+os.environ["LOG_LEVEL"] = "WARNING"
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import uvicorn  # noqa: E402
+import websockets  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from app.core.security import create_access_token  # noqa: E402
+from app.database.connection import SessionLocal, engine, init_db  # noqa: E402
+from app.database.models import (  # noqa: E402
+    Conversation,
+    User,
+    UserRole,
+    UserStatus,
+)
+from app.main import app  # noqa: E402
+from app.routers import websocket as ws_router  # noqa: E402
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+# ============================================================================
+# Server-side instrumentation
+# ============================================================================
+
+_current_event: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "bench_current_event", default=None
+)
+query_counts: Dict[str, int] = defaultdict(int)
+event_counts: Dict[str, int] = defaultdict(int)
+
+
+@event.listens_for(engine, "before_cursor_execute")
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    query_counts[_current_event.get() or "connect/disconnect"] += 1
+
+
+def _instrument_handler(name: str, event_type: str):
+    """Wrap a websocket handler so its queries are attributed to event_type."""
+    original = getattr(ws_router, name)
+
+    async def wrapper(*args, **kwargs):
+        token = _current_event.set(event_type)
+        event_counts[event_type] += 1
+        try:
+            return await original(*args, **kwargs)
+        finally:
+            _current_event.reset(token)
+
+    setattr(ws_router, name, wrapper)
+
+
+for _name, _event_type in [
+    ("handle_join_conversation", "join_conversation"),
+    ("handle_send_message", "send_message"),
+    ("handle_typing_start", "typing_start"),
+    ("handle_typing_stop", "typing_stop"),
+    ("handle_mark_read", "mark_read"),
+]:
+    _instrument_handler(_name, _event_type)
+
+
+loop_lag_ms: List[float] = []
+
+
+async def _loop_lag_probe(interval: float = 0.05):
+    """Measure how late the server loop wakes up a sleeping task."""
+    while True:
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        loop_lag_ms.append(max(0.0, (time.perf_counter() - started - interval) * 1000))
+
+
+class BenchServer:
+    """Runs uvicorn in a background thread with its own event loop."""
+
+    def __init__(self, port: int):
+        self.port = port
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.server = uvicorn.Server(uvicorn.Config(
+            app,
+            host="127.0.0.1",
+            port=port,
+            log_level="warning",
+            ws_max_queue=1024,
+            backlog=4096,
+        ))
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        probe = self.loop.create_task(_loop_lag_probe())
+        try:
+            self.loop.run_until_complete(self.server.serve())
+        finally:
+            probe.cancel()
+            self.loop.run_until_complete(asyncio.gather(probe, return_exceptions=True))
+            self.loop.close()
+
+    def start(self):
+        self.thread.start()
+        while not self.server.started:
+            time.sleep(0.05)
+
+    def stop(self):
+        self.server.should_exit = True
+        self.thread.join(timeout=10)
+
+
+# ============================================================================
+# Seeding
+# ============================================================================
+
+def seed(pairs: int) -> List[Dict]:
+    """Create 2 users per conversation and return connection fixtures."""
+    init_db()
+    db = SessionLocal()
+    try:
+        users = []
+        for i in range(pairs):
+            for role in (UserRole.STUDENT, UserRole.INSTRUCTOR):
+                users.append(User(
+                    email=f"bench-{role.value}-{i}@example.com",
+                    hashed_password="!",
+                    role=role,
+                    status=UserStatus.ACTIVE,
+                    first_name=f"{role.value.title()}",
+                    last_name=str(i),
+                    is_email_verified=True,
+                ))
+        db.add_all(users)
+        db.flush()
+
+        conversations = []
+        for i in range(pairs):
+            conversations.append(Conversation(
+                participant_1_id=users[2 * i].id,
+                participant_2_id=users[2 * i + 1].id,
+            ))
+        db.add_all(conversations)
+        db.commit()
+
+        return [
+            {
+                "conversation_id": conv.id,
+                "users": [conv.participant_1_id, conv.participant_2_id],
+            }
+            for conv in conversations
+        ]
+    finally:
+        db.close()
+
+
+# ============================================================================
+# Simulated clients
+# ============================================================================
+
+class Client:
+    """One simulated user connection."""
+
+    def __init__(self, url: str, user_id: int, conversation_id: int, protocol: str, results: Dict):
+        self.url = url
+        self.user_id = user_id
+        self.conversation_id = conversation_id
+        self.protocol = protocol
+        self.results = results
+        self.ws = None
+        self.received_messages = 0
+        self.received_acks = 0  # message_read for messages this client sent
+
+    async def send(self, event: dict):
+        if self.protocol == "msgpack":
+            await self.ws.send(msgpack.packb(event, use_bin_type=True))
+        else:
+            await self.ws.send(json.dumps(event))
+
+    def decode(self, frame) -> dict:
+        if isinstance(frame, bytes):
+            data = msgpack.unpackb(frame, raw=False, strict_map_key=False)
+            # Expand the few short keys the harness cares about
+            data["type"] = data.pop("t", data.get("type"))
+            if "m" in data:
+                data["message"] = {"content": data["m"].get("b"), "id": data["m"].get("i")}
+            return data
+        return json.loads(frame)
+
+    async def connect(self):
+        token = create_access_token({"sub": str(self.user_id)})
+        subprotocols = ["tutorly.msgpack.v1"] if self.protocol == "msgpack" else None
+        self.ws = await websockets.connect(
+            f"{self.url}?token={token}",
+            subprotocols=subprotocols,
+            max_queue=None,
+            open_timeout=60,
+        )
+        await self.send({"type": "join_conversation", "conversation_id": self.conversation_id})
+
+    async def reader(self, expected_messages: int):
+        """Consume frames until all expected messages have arrived."""
+        while self.received_messages < expected_messages:
+            await self.handle(await self.ws.recv())
+
+    async def drain(self, expected_acks: int):
+        """Consume frames until the peer's mark_read of every sent message is acked."""
+        while self.received_acks < expected_acks:
+            await self.handle(await self.ws.recv())
+
+    async def handle(self, frame):
+        data = self.decode(frame)
+        event_type = data.get("type")
+
+        if event_type == "ping":
+            await self.send({"type": "pong"})
+
+        elif event_type == "message_read":
+            self.received_acks += 1
+
+        elif event_type == "new_message":
+            self.received_messages += 1
+            content = data["message"]["content"] or ""
+            if content.startswith("bench:"):
+                sent_at = float(content.split(":", 2)[1])
+                self.results["latency_ms"].append((time.perf_counter() - sent_at) * 1000)
+            await self.send({
+                "type": "mark_read",
+                "conversation_id": self.conversation_id,
+                "message_id": data["message"]["id"],
+            })
+
+    async def writer(self, messages: int, keystrokes: int, think_time: float):
+        """Type and send messages."""
+        for seq in range(messages):
+            for _ in range(keystrokes):
+                await self.send({"type": "typing_start", "conversation_id": self.conversation_id})
+            await self.send({
+                "type": "send_message",
+                "conversation_id": self.conversation_id,
+                "content": f"bench:{time.perf_counter()}:{self.user_id}:{seq}",
+            })
+            await self.send({"type": "typing_stop", "conversation_id": self.conversation_id})
+            self.results["sent"] += 1
+            if think_time:
+                await asyncio.sleep(think_time)
+
+    async def close(self):
+        if self.ws is not None:
+            await self.ws.close()
+
+
+async def _snapshot_server() -> Dict:
+    """Server-side counters, read on the server loop."""
+    return {
+        "connection_manager": ws_router.manager.snapshot_metrics(),
+        "handled_events": dict(event_counts),
+        "db_queries": dict(query_counts),
+        "loop_lag_ms": list(loop_lag_ms),
+    }
+
+
+async def run_clients(args, fixtures: List[Dict], url: str, server_loop) -> Dict:
+    results = {"latency_ms": [], "sent": 0}
+    clients = [
+        Client(url, user_id, fx["conversation_id"], args.protocol, results)
+        for fx in fixtures
+        for user_id in fx["users"]
+    ]
+
+    connect_started = time.perf_counter()
+    semaphore = asyncio.Semaphore(args.connect_concurrency)
+
+    async def connect(client: Client):
+        async with semaphore:
+            await client.connect()
+
+    await asyncio.gather(*(connect(c) for c in clients))
+    results["connect_seconds"] = time.perf_counter() - connect_started
+
+    run_started = time.perf_counter()
+    tasks = []
+    for client in clients:
+        tasks.append(client.reader(args.messages))
+        tasks.append(client.writer(args.messages, args.keystrokes, args.think_time))
+    await asyncio.wait_for(asyncio.gather(*tasks), timeout=args.timeout)
+    results["run_seconds"] = time.perf_counter() - run_started
+
+    # Let the server finish the trailing mark_read frames before sampling it
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(*(c.drain(args.messages) for c in clients)),
+            timeout=args.drain_timeout,
+        )
+    except asyncio.TimeoutError:
+        pass
+    results["unacked_mark_reads"] = sum(max(0, args.messages - c.received_acks) for c in clients)
+
+    # Sample before closing, so teardown disconnects/send failures aren't counted
+    results["server"] = await asyncio.wrap_future(
+        asyncio.run_coroutine_threadsafe(_snapshot_server(), server_loop)
+    )
+
+    await asyncio.gather(*(c.close() for c in clients), return_exceptions=True)
+    results["clients"] = len(clients)
+    return results
+
+
+# ============================================================================
+# Reporting
+# ============================================================================
+
+def percentile(samples: List[float], p: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+
+def build_report(args, results: Dict) -> Dict:
+    latency = results["latency_ms"]
+    server = results["server"]
+    lag = server["loop_lag_ms"]
+    handled = server["handled_events"]
+    queries = server["db_queries"]
+    return {
+        "config": {
+            "pairs": args.pairs,
+            "clients": results["clients"],
+            "messages_per_client": args.messages,
+            "keystrokes_per_message": args.keystrokes,
+            "protocol": args.protocol,
+        },
+        "connect_seconds": round(results["connect_seconds"], 3),
+        "run_seconds": round(results["run_seconds"], 3),
+        "messages_sent": results["sent"],
+        "messages_per_second": round(results["sent"] / results["run_seconds"], 1) if results["run_seconds"] else 0.0,
+        "send_to_deliver_ms": {
+            "samples": len(latency),
+            "p50": round(percentile(latency, 0.50), 3),
+            "p99": round(percentile(latency, 0.99), 3),
+            "max": round(max(latency), 3) if latency else 0.0,
+            "mean": round(statistics.fmean(latency), 3) if latency else 0.0,
+        },
+        "unacked_mark_reads": results["unacked_mark_reads"],
+        "server_loop_lag_ms": {
+            "p50": round(percentile(lag, 0.50), 3),
+            "p99": round(percentile(lag, 0.99), 3),
+            "max": round(max(lag), 3) if lag else 0.0,
+        },
+        "db_queries_per_event": {
+            event_type: round(queries.get(event_type, 0) / count, 2)
+            for event_type, count in sorted(handled.items())
+            if count
+        },
+        "handled_events": dict(sorted(handled.items())),
+        "db_queries_total": dict(sorted(queries.items())),
+        "connection_manager": server["connection_manager"],
+    }
+
+
+def print_report(report: Dict):
+    cfg = report["config"]
+    print("=" * 60)
+    print(f"  /api/ws load test: {cfg['clients']} clients, {cfg['messages_per_client']} msgs each ({cfg['protocol']})")
+    print("=" * 60)
+    print(f"Connect phase:        {report['connect_seconds']}s")
+    print(f"Run phase:            {report['run_seconds']}s  ({report['messages_per_second']} msg/s)")
+    lat = report["send_to_deliver_ms"]
+    print(f"Send->deliver (ms):   p50={lat['p50']}  p99={lat['p99']}  max={lat['max']}  (n={lat['samples']})")
+    print(f"Unacked mark_read:    {report['unacked_mark_reads']}")
+    lag = report["server_loop_lag_ms"]
+    print(f"Server loop lag (ms): p50={lag['p50']}  p99={lag['p99']}  max={lag['max']}")
+    print("DB queries per event:")
+    for event_type, per_event in report["db_queries_per_event"].items():
+        print(f"  {event_type:<20} {per_event:>6}  ({report['handled_events'][event_type]} events)")
+    metrics = report["connection_manager"]
+    print(f"Frames sent:          {metrics['frames_sent_total']}  (failures={metrics['send_failures_total']})")
+    print(f"Evictions:            {metrics['evictions_total']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pairs", type=int, default=250, help="Conversations (2 clients each)")
+    parser.add_argument("--messages", type=int, default=10, help="Messages sent per client")
+    parser.add_argument("--keystrokes", type=int, default=5, help="typing_start events per message")
+    parser.add_argument("--think-time", type=float, default=0.05, help="Seconds between messages per client")
+    parser.add_argument("--protocol", choices=["json", "msgpack"], default="json")
+    parser.add_argument("--connect-concurrency", type=int, default=200)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--timeout", type=float, default=600.0, help="Run phase timeout in seconds")
+    parser.add_argument("--drain-timeout", type=float, default=30.0,
+                        help="Seconds to wait for outstanding mark_read acks before sampling")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    if args.protocol == "msgpack" and msgpack is None:
+        parser.error("msgpack is not installed")
+
+    fixtures = seed(args.pairs)
+
+    server = BenchServer(args.port)
+    server.start()
+    try:
+        results = asyncio.run(
+            run_clients(args, fixtures, f"ws://127.0.0.1:{args.port}/api/ws", server.loop)
+        )
+    finally:
+        server.stop()
+
+    report = build_report(args, results)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
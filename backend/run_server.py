@@ -24,12 +24,15 @@ def main():
     # Set environment
     os.environ['APP_ENV'] = 'production' if args.prod else 'development'
 
+    from app.core.config import settings
+
     # Build command
     cmd = [
         'uvicorn',
         'app.main:app',
         '--host', args.host,
         '--port', str(args.port),
+        '--ws-per-message-deflate', str(settings.WS_PER_MESSAGE_DEFLATE).lower(),
     ]
 
     # Add reload for development
@@ -0,0 +1,76 @@
+"""
+Shared fixtures for the database-backed tests.
+
+These run against a throwaway SQLite file database, so no server or
+PostgreSQL instance is needed. (The test_*_flow / classroom scripts in
+this directory are run against a live server instead.)
+"""
+
+import os
+
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.application.use_cases.wallet import CreateWalletUseCase
+from app.database.connection import Base
+from app.infrastructure.repositories.wallet_repository_impl import SQLAlchemyWalletRepository
+
+INSTRUCTOR_ID = 1
+
+
+def _make_session_factory(path, begin_immediate):
+    engine = create_engine(
+        f"sqlite:///{path}",
+        connect_args={"check_same_thread": False, "timeout": 30},
+    )
+
+    if begin_immediate:
+        # pysqlite defers BEGIN; take the write lock up front so concurrent
+        # threads serialize like row locks would on PostgreSQL
+        @event.listens_for(engine, "connect")
+        def _disable_pysqlite_transactions(dbapi_connection, _record):
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(engine, "begin")
+        def _begin_immediate(connection):
+            connection.exec_driver_sql("BEGIN IMMEDIATE")
+
+    Base.metadata.create_all(engine)
+    return engine, sessionmaker(bind=engine, autoflush=False)
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    """
+    Session factory on a fresh file database, one connection per session.
+
+    Transactions take the write lock when they begin, so concurrent
+    sessions serialize. The database starts with a wallet for
+    INSTRUCTOR_ID.
+    """
+    engine, factory = _make_session_factory(tmp_path / "test.db", begin_immediate=True)
+
+    db = factory()
+    CreateWalletUseCase(SQLAlchemyWalletRepository(db)).execute(INSTRUCTOR_ID)
+    db.commit()
+    db.close()
+
+    yield factory
+    engine.dispose()
+
+
+@pytest.fixture
+def deferred_session_factory(tmp_path):
+    """
+    Session factory whose reads take no lock (pysqlite's default).
+
+    For interleavings where another session writes between a session's
+    read and its own write.
+    """
+    engine, factory = _make_session_factory(tmp_path / "test.db", begin_immediate=False)
+    yield factory
+    engine.dispose()
@@ -0,0 +1,139 @@
+"""
+Tests for RefreshDailyRollupsUseCase.
+
+Refreshing a day recomputes and replaces it, so re-runs over the same or
+overlapping ranges must leave exactly the rows a single run produces.
+"""
+
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from app.application.use_cases.admin.daily_rollups import RefreshDailyRollupsUseCase
+from app.database.models import (
+    InstructorDailyRollup as InstructorDailyRollupORM,
+    InstructorProfile as InstructorProfileORM,
+    Payment as PaymentORM,
+    PaymentStatus as PaymentStatusORM,
+    PlatformDailyRollup as PlatformDailyRollupORM,
+    Session as SessionORM,
+)
+from app.infrastructure.repositories.daily_rollup_repository_impl import (
+    SQLAlchemyDailyRollupRepository,
+)
+
+FIRST_DAY = date(2026, 3, 1)
+LAST_DAY = FIRST_DAY + timedelta(days=4)
+INSTRUCTOR_USER_ID = 100
+STUDENT_USER_ID = 200
+
+
+def _at(day_offset: int, hour: int = 10) -> datetime:
+    return datetime.combine(FIRST_DAY + timedelta(days=day_offset), datetime.min.time()).replace(hour=hour)
+
+
+def _seed(db):
+    """Activity on the first three days; the last two are quiet."""
+    instructor = InstructorProfileORM(user_id=INSTRUCTOR_USER_ID)
+    db.add(instructor)
+    db.flush()
+
+    def session(**values):
+        start_at = values.pop("start_at")
+        return SessionORM(
+            instructor_id=instructor.id,
+            student_id=STUDENT_USER_ID,
+            start_at=start_at,
+            end_at=start_at + timedelta(minutes=60),
+            duration_minutes=60,
+            session_type="single",
+            amount=Decimal("500.00"),
+            **values,
+        )
+
+    db.add_all([
+        # Booked day 0, held day 1
+        session(created_at=_at(0), start_at=_at(1), status="completed"),
+        # Booked day 0, cancelled day 2
+        session(
+            created_at=_at(0, 11),
+            start_at=_at(3),
+            status="cancelled",
+            cancelled_at=_at(2),
+            cancelled_by=STUDENT_USER_ID,
+        ),
+        PaymentORM(
+            student_id=STUDENT_USER_ID,
+            instructor_id=INSTRUCTOR_USER_ID,
+            slot_id=1,
+            amount=Decimal("500.00"),
+            status=PaymentStatusORM.COMPLETED,
+            created_at=_at(0),
+            completed_at=_at(0, 12),
+        ),
+    ])
+    db.commit()
+    return instructor.id
+
+
+def _refresh(db, start, end):
+    result = RefreshDailyRollupsUseCase(
+        SQLAlchemyDailyRollupRepository(db), platform_fee_percent=Decimal("20"), chunk_days=2
+    ).execute(start=start, end=end)
+    db.commit()
+    return result
+
+
+def _rows(db):
+    """Stored rollups, without their updated_at."""
+    columns = ("bookings", "cancellations", "completed_sessions", "completed_minutes", "gross_amount", "platform_fee")
+    instructor_rows = [
+        (row.day, row.instructor_id) + tuple(getattr(row, column) for column in columns)
+        for row in db.query(InstructorDailyRollupORM).order_by(
+            InstructorDailyRollupORM.day, InstructorDailyRollupORM.instructor_id
+        )
+    ]
+    platform_rows = [
+        (row.day, row.active_instructors) + tuple(getattr(row, column) for column in columns)
+        for row in db.query(PlatformDailyRollupORM).order_by(PlatformDailyRollupORM.day)
+    ]
+    return instructor_rows, platform_rows
+
+
+def test_overlapping_reruns_produce_identical_rows(session_factory):
+    db = session_factory()
+    instructor_id = _seed(db)
+
+    _refresh(db, FIRST_DAY, LAST_DAY)
+    expected = _rows(db)
+
+    # Same range again, then overlapping ranges in either order
+    _refresh(db, FIRST_DAY, LAST_DAY)
+    assert _rows(db) == expected
+    _refresh(db, FIRST_DAY + timedelta(days=1), LAST_DAY)
+    _refresh(db, FIRST_DAY, FIRST_DAY + timedelta(days=2))
+    assert _rows(db) == expected
+
+    instructor_rows, platform_rows = expected
+    assert instructor_rows == [
+        (_at(0).date(), instructor_id, 2, 0, 0, 0, Decimal("500.00"), Decimal("100.00")),
+        (_at(1).date(), instructor_id, 0, 0, 1, 60, Decimal("0.00"), Decimal("0.00")),
+        (_at(2).date(), instructor_id, 0, 1, 0, 0, Decimal("0.00"), Decimal("0.00")),
+    ]
+    assert [row[0] for row in platform_rows] == [FIRST_DAY + timedelta(days=i) for i in range(5)]
+    db.close()
+
+
+def test_quiet_days_get_zero_filled_platform_rows(session_factory):
+    db = session_factory()
+    _seed(db)
+
+    result = _refresh(db, FIRST_DAY, LAST_DAY)
+    assert (result.days, result.instructor_rows) == (5, 3)
+
+    _, platform_rows = _rows(db)
+    quiet = [row for row in platform_rows if row[0] > FIRST_DAY + timedelta(days=2)]
+    assert quiet == [
+        (FIRST_DAY + timedelta(days=offset), 0, 0, 0, 0, 0, Decimal("0.00"), Decimal("0.00"))
+        for offset in (3, 4)
+    ]
+    db.close()
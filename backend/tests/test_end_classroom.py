@@ -0,0 +1,119 @@
+"""
+Tests for EndClassroomUseCase completing the tutoring session.
+
+Uses in-memory repositories: only a class that actually took place may
+complete its session (and count towards the student's stats).
+"""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from app.application.use_cases.classroom.end_classroom import EndClassroomUseCase
+from app.domains.classroom.entities import ClassroomSession
+from app.domains.scheduling.entities.session import Session
+from app.domains.scheduling.value_objects import SessionStatus, SessionType
+
+SESSION_ID = 7
+INSTRUCTOR_USER_ID = 10
+STUDENT_USER_ID = 20
+
+
+class InMemoryClassroomRepository:
+    def __init__(self, classroom):
+        self.classroom = classroom
+
+    def get_by_session_id(self, session_id):
+        return self.classroom if self.classroom.session_id == session_id else None
+
+    def save(self, classroom):
+        self.classroom = classroom
+        return classroom
+
+
+class InMemorySessionRepository:
+    def __init__(self, session):
+        self.session = session
+
+    def get_by_id(self, session_id):
+        return self.session if self.session.id == session_id else None
+
+    def save(self, session):
+        self.session = session
+        return session
+
+
+class NullVideoProvider:
+    def delete_room(self, room_name):
+        return True
+
+
+class RecordingCompletion:
+    def __init__(self):
+        self.calls = []
+
+    def execute(self, **kwargs):
+        self.calls.append(kwargs)
+
+
+def _end_classroom(start_at, joined_minutes_ago=None):
+    session = Session(
+        id=SESSION_ID,
+        instructor_id=1,
+        student_id=STUDENT_USER_ID,
+        start_at=start_at,
+        end_at=start_at + timedelta(minutes=50),
+        session_type=SessionType.SINGLE,
+        status=SessionStatus.CONFIRMED,
+        amount=Decimal("500.00"),
+    )
+    classroom = ClassroomSession(
+        session_id=SESSION_ID,
+        instructor_id=INSTRUCTOR_USER_ID,
+        student_id=STUDENT_USER_ID,
+        room_name="room",
+        room_url="https://video.example/room",
+        provider="daily",
+    )
+    if joined_minutes_ago is not None:
+        classroom.mark_active()
+        classroom.started_at = datetime.utcnow() - timedelta(minutes=joined_minutes_ago)
+
+    session_repo = InMemorySessionRepository(session)
+    record_completion = RecordingCompletion()
+    EndClassroomUseCase(
+        classroom_repo=InMemoryClassroomRepository(classroom),
+        video_provider=NullVideoProvider(),
+        session_repo=session_repo,
+        record_completion=record_completion,
+    ).execute(session_id=SESSION_ID, user_id=INSTRUCTOR_USER_ID)
+    return session_repo.session, record_completion.calls
+
+
+def test_ending_before_start_does_not_complete_session():
+    session, completions = _end_classroom(
+        start_at=datetime.utcnow() + timedelta(hours=2), joined_minutes_ago=5
+    )
+
+    assert session.status == SessionStatus.CONFIRMED
+    assert completions == []
+    # Still cancellable by the student
+    session.cancel(cancelled_by=STUDENT_USER_ID)
+    assert session.status == SessionStatus.CANCELLED
+
+
+def test_ending_a_room_nobody_joined_does_not_complete_session():
+    session, completions = _end_classroom(start_at=datetime.utcnow() - timedelta(minutes=10))
+
+    assert session.status == SessionStatus.CONFIRMED
+    assert completions == []
+
+
+def test_ending_a_class_that_ran_completes_and_records_session():
+    session, completions = _end_classroom(
+        start_at=datetime.utcnow() - timedelta(minutes=50), joined_minutes_ago=48
+    )
+
+    assert session.status == SessionStatus.COMPLETED
+    assert len(completions) == 1
+    assert completions[0]["student_id"] == STUDENT_USER_ID
+    assert completions[0]["amount_spent"] == 500.0
@@ -0,0 +1,241 @@
+"""
+Tests for batched withdrawal payouts (ProcessPayoutsUseCase).
+
+Covers the claim (concurrent workers get disjoint batches), settlement
+guarded by the claim token (an expired or replayed claim never settles a
+withdrawal twice), refunds of failed payouts and releasing a batch the
+gateway rejected.
+"""
+
+import threading
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from app.application.use_cases.wallet import (
+    CreateWalletUseCase,
+    DepositFundsUseCase,
+    ProcessPayoutsUseCase,
+    RequestWithdrawalUseCase,
+)
+from app.database.models import WalletTransaction as WalletTransactionORM
+from app.domains.wallet.services import PayoutGatewayError
+from app.domains.wallet.value_objects import TransactionStatus
+from app.infrastructure.payment_gateways.mock_payout_gateway import MockPayoutGateway
+from app.infrastructure.repositories.wallet_repository_impl import SQLAlchemyWalletRepository
+
+from tests.conftest import INSTRUCTOR_ID
+
+
+class FailingPayoutGateway:
+    """Payout provider that rejects every batch."""
+
+    def submit_payouts(self, requests):
+        raise PayoutGatewayError("Provider unavailable", code="UNAVAILABLE")
+
+
+def _withdrawals(factory, count, amount=60):
+    """One funded wallet with a pending withdrawal per instructor; returns the ids."""
+    ids = []
+    db = factory()
+    try:
+        repo = SQLAlchemyWalletRepository(db)
+        for instructor_id in range(INSTRUCTOR_ID, INSTRUCTOR_ID + count):
+            if instructor_id != INSTRUCTOR_ID:
+                CreateWalletUseCase(repo).execute(instructor_id)
+            DepositFundsUseCase(repo).execute(instructor_id, 100, "session", 0, "Session payment")
+            ids.append(
+                RequestWithdrawalUseCase(repo).execute(instructor_id, amount, "bank_transfer").id
+            )
+        db.commit()
+    finally:
+        db.close()
+    return ids
+
+
+def _claim(factory, token, limit, stale_before=None):
+    db = factory()
+    try:
+        claimed = SQLAlchemyWalletRepository(db).claim_pending_withdrawals(
+            token, limit=limit, stale_before=stale_before or datetime.utcnow() - timedelta(minutes=15)
+        )
+        db.commit()
+        return {withdrawal.id for withdrawal in claimed}
+    finally:
+        db.close()
+
+
+def _run_payouts(factory, gateway, **kwargs):
+    db = factory()
+    try:
+        return ProcessPayoutsUseCase(
+            SQLAlchemyWalletRepository(db), gateway, commit=db.commit, **kwargs
+        ).execute()
+    finally:
+        db.close()
+
+
+def _wallet(factory, instructor_id=INSTRUCTOR_ID):
+    db = factory()
+    try:
+        wallet = SQLAlchemyWalletRepository(db).get_by_instructor_id(instructor_id)
+        db.commit()
+        return wallet
+    finally:
+        db.close()
+
+
+def _transaction_row(factory, transaction_id):
+    db = factory()
+    try:
+        # Closing (not committing) detaches the row with its attributes loaded
+        return db.get(WalletTransactionORM, transaction_id)
+    finally:
+        db.close()
+
+
+# ============================================================================
+# Claiming
+# ============================================================================
+
+
+def test_two_claimers_get_disjoint_batches(session_factory):
+    ids = _withdrawals(session_factory, 6)
+
+    first = _claim(session_factory, "worker-a", limit=4)
+    second = _claim(session_factory, "worker-b", limit=4)
+
+    assert len(first) == 4
+    assert len(second) == 2
+    assert first.isdisjoint(second)
+    assert first | second == set(ids)
+    assert _claim(session_factory, "worker-c", limit=4) == set()
+
+
+def test_concurrent_claimers_never_share_a_withdrawal(session_factory):
+    ids = _withdrawals(session_factory, 6)
+    batches = []
+
+    def claim(token):
+        batches.append(_claim(session_factory, token, limit=2))
+
+    threads = [threading.Thread(target=claim, args=(f"worker-{i}",)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    claimed = [transaction_id for batch in batches for transaction_id in batch]
+    assert len(claimed) == len(set(claimed))
+    assert set(claimed) == set(ids)
+
+
+# ============================================================================
+# Settlement
+# ============================================================================
+
+
+def test_expired_claim_cannot_settle_after_reclaim(session_factory):
+    (transaction_id,) = _withdrawals(session_factory, 1)
+
+    assert _claim(session_factory, "slow-worker", limit=10) == {transaction_id}
+    # The claim expires and another worker picks the withdrawal up again
+    assert _claim(
+        session_factory, "fast-worker", limit=10, stale_before=datetime.utcnow() + timedelta(seconds=1)
+    ) == {transaction_id}
+
+    db = session_factory()
+    repo = SQLAlchemyWalletRepository(db)
+    outcome = {transaction_id: "pout_fast"}
+    now = datetime.utcnow()
+
+    # The slow worker's claim no longer matches
+    assert repo.settle_withdrawals("slow-worker", TransactionStatus.COMPLETED, outcome, now) == []
+
+    settled = repo.settle_withdrawals("fast-worker", TransactionStatus.COMPLETED, outcome, now)
+    assert [withdrawal.id for withdrawal in settled] == [transaction_id]
+    repo.apply_balance_changes({settled[0].wallet_id: settled[0].settlement_change})
+
+    # Replaying the same settlement is a no-op
+    assert repo.settle_withdrawals("fast-worker", TransactionStatus.COMPLETED, outcome, now) == []
+    db.commit()
+    db.close()
+
+    wallet = _wallet(session_factory)
+    assert wallet.balance == Decimal("40.00")
+    assert wallet.total_withdrawn == Decimal("60.00")
+    row = _transaction_row(session_factory, transaction_id)
+    assert row.payout_reference == "pout_fast"
+    assert row.claim_token is None
+
+
+def test_completed_payouts_are_settled_once(session_factory):
+    ids = _withdrawals(session_factory, 3)
+    gateway = MockPayoutGateway()
+
+    result = _run_payouts(session_factory, gateway, batch_size=2)
+    assert (result.batches, result.claimed, result.completed) == (2, 3, 3)
+
+    # Nothing left to claim: a second run (same provider) changes nothing
+    again = _run_payouts(session_factory, gateway)
+    assert (again.claimed, again.completed) == (0, 0)
+
+    for offset in range(len(ids)):
+        wallet = _wallet(session_factory, INSTRUCTOR_ID + offset)
+        assert wallet.balance == Decimal("40.00")
+        assert wallet.total_withdrawn == Decimal("60.00")
+
+
+def test_failed_payout_refunds_balance_exactly_once(session_factory):
+    (transaction_id,) = _withdrawals(session_factory, 1)
+    gateway = MockPayoutGateway(max_amount=Decimal("50"))
+
+    result = _run_payouts(session_factory, gateway)
+    assert (result.claimed, result.failed, result.completed) == (1, 1, 0)
+
+    wallet = _wallet(session_factory)
+    assert wallet.balance == Decimal("100.00")
+    assert wallet.total_withdrawn == Decimal("0.00")
+    row = _transaction_row(session_factory, transaction_id)
+    assert row.status.value == TransactionStatus.FAILED.value
+    assert row.failure_reason.startswith("Amount exceeds payout limit")
+
+    # A later run finds nothing to refund again
+    assert _run_payouts(session_factory, gateway).claimed == 0
+    assert _wallet(session_factory).balance == Decimal("100.00")
+
+
+def test_processing_payout_stays_claimed_until_its_claim_expires(session_factory):
+    (transaction_id,) = _withdrawals(session_factory, 1)
+
+    result = _run_payouts(session_factory, MockPayoutGateway(processing_methods=("bank_transfer",)))
+    assert (result.claimed, result.processing, result.completed) == (1, 1, 0)
+
+    row = _transaction_row(session_factory, transaction_id)
+    assert row.status.value == TransactionStatus.PENDING.value
+    assert row.claim_token is not None
+    assert _run_payouts(session_factory, MockPayoutGateway()).claimed == 0
+    assert _wallet(session_factory).total_withdrawn == Decimal("0.00")
+
+
+# ============================================================================
+# Gateway errors
+# ============================================================================
+
+
+def test_gateway_error_releases_the_claims(session_factory):
+    ids = _withdrawals(session_factory, 2)
+
+    result = _run_payouts(session_factory, FailingPayoutGateway())
+    assert result.claimed == 2
+    assert result.errors == ["Provider unavailable"]
+
+    for transaction_id in ids:
+        row = _transaction_row(session_factory, transaction_id)
+        assert row.status.value == TransactionStatus.PENDING.value
+        assert row.claim_token is None
+        assert row.claimed_at is None
+
+    # Released rows are picked up by the next run straight away
+    retry = _run_payouts(session_factory, MockPayoutGateway())
+    assert (retry.claimed, retry.completed) == (2, 2)
+    assert _wallet(session_factory).total_withdrawn == Decimal("60.00")
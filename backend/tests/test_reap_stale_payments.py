@@ -0,0 +1,155 @@
+"""
+Tests for the stale checkout reaper (ReapStalePaymentsUseCase).
+
+Order statuses come from MockGateway. Paid orders must never be failed,
+and a payment confirmed while the reaper is checking it must be left
+alone.
+"""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from sqlalchemy import update
+
+from app.application.use_cases.booking.reap_stale_payments import (
+    ABANDONED_REASON,
+    EXPIRED_REASON,
+    ReapStalePaymentsUseCase,
+)
+from app.database.models import Payment as PaymentORM, PaymentStatus as PaymentStatusORM
+from app.infrastructure.payment_gateways.mock_gateway import MockGateway
+from app.infrastructure.repositories.payment_repository_impl import PaymentRepositoryImpl
+
+STALE = datetime.utcnow() - timedelta(hours=2)
+
+
+def _payment(factory, gateway, slot_id, order_status="created", created_at=STALE, with_order=True):
+    """Insert a PROCESSING payment whose order has the given gateway status."""
+    order_id = None
+    if with_order:
+        order_id = gateway.create_order(Decimal("500.00"), "INR", f"slot_{slot_id}").order_id
+        if order_status == "paid":
+            gateway.simulate_payment(order_id)
+        gateway._orders[order_id]["status"] = order_status
+
+    db = factory()
+    try:
+        payment = PaymentORM(
+            student_id=1,
+            instructor_id=2,
+            slot_id=slot_id,
+            amount=Decimal("500.00"),
+            status=PaymentStatusORM.PROCESSING,
+            gateway_order_id=order_id,
+            created_at=created_at,
+            updated_at=created_at,
+        )
+        db.add(payment)
+        db.commit()
+        return payment.id
+    finally:
+        db.close()
+
+
+def _reap(factory, gateway, **kwargs):
+    db = factory()
+    try:
+        return ReapStalePaymentsUseCase(PaymentRepositoryImpl(db), gateway, **kwargs).execute()
+    finally:
+        db.close()
+
+
+def _statuses(factory):
+    db = factory()
+    try:
+        return {
+            payment.id: (payment.status, payment.failure_reason)
+            for payment in db.query(PaymentORM).all()
+        }
+    finally:
+        db.close()
+
+
+def test_expired_attempted_and_paid_orders(deferred_session_factory):
+    factory, gateway = deferred_session_factory, MockGateway()
+    expired = _payment(factory, gateway, slot_id=1, order_status="created")
+    no_order = _payment(factory, gateway, slot_id=2, with_order=False)
+    attempted = _payment(factory, gateway, slot_id=3, order_status="attempted")
+    paid = _payment(factory, gateway, slot_id=4, order_status="paid")
+    recent = _payment(factory, gateway, slot_id=5, created_at=datetime.utcnow())
+
+    result = _reap(factory, gateway)
+
+    assert (result.scanned, result.expired, result.failed) == (4, 2, 1)
+    assert result.paid_unconfirmed == 1
+    assert result.slots_released == 3
+    statuses = _statuses(factory)
+    assert statuses[expired] == (PaymentStatusORM.FAILED, EXPIRED_REASON)
+    assert statuses[no_order] == (PaymentStatusORM.FAILED, EXPIRED_REASON)
+    assert statuses[attempted] == (PaymentStatusORM.FAILED, ABANDONED_REASON)
+    # Paid at the gateway: never failed, left for confirmation
+    assert statuses[paid] == (PaymentStatusORM.PROCESSING, None)
+    assert statuses[recent] == (PaymentStatusORM.PROCESSING, None)
+
+    # A second run only rechecks what is still processing
+    again = _reap(factory, gateway)
+    assert (again.scanned, again.reaped, again.paid_unconfirmed) == (1, 0, 1)
+
+
+def test_payment_confirmed_mid_run_is_not_failed(deferred_session_factory):
+    factory = deferred_session_factory
+
+    class ConfirmingGateway(MockGateway):
+        """Confirms the payment (in another session) while its order is being checked."""
+
+        def get_order_status(self, order_id):
+            db = factory()
+            try:
+                db.execute(
+                    update(PaymentORM)
+                    .where(PaymentORM.gateway_order_id == order_id)
+                    .values(status=PaymentStatusORM.COMPLETED)
+                )
+                db.commit()
+            finally:
+                db.close()
+            return super().get_order_status(order_id)
+
+    gateway = ConfirmingGateway()
+    payment_id = _payment(factory, gateway, slot_id=1, order_status="attempted")
+
+    result = _reap(factory, gateway)
+
+    assert (result.scanned, result.failed, result.slots_released) == (1, 0, 0)
+    assert _statuses(factory)[payment_id] == (PaymentStatusORM.COMPLETED, None)
+
+
+def test_keyset_batches_cover_payments_with_equal_created_at(deferred_session_factory):
+    factory, gateway = deferred_session_factory, MockGateway()
+    # Paid orders stay PROCESSING, so each batch must move past the last one
+    paid = [_payment(factory, gateway, slot_id=i, order_status="paid") for i in range(5)]
+    expired = _payment(
+        factory, gateway, slot_id=10, created_at=STALE + timedelta(minutes=1)
+    )
+
+    result = _reap(factory, gateway, batch_size=2)
+
+    assert result.batches == 3
+    assert result.scanned == 6
+    assert (result.paid_unconfirmed, result.expired) == (5, 1)
+    statuses = _statuses(factory)
+    assert all(statuses[payment_id][0] == PaymentStatusORM.PROCESSING for payment_id in paid)
+    assert statuses[expired][0] == PaymentStatusORM.FAILED
+
+
+def test_slots_released_counts_distinct_slots(deferred_session_factory):
+    factory, gateway = deferred_session_factory, MockGateway()
+    _payment(factory, gateway, slot_id=1, order_status="created")
+    _payment(factory, gateway, slot_id=1, order_status="attempted")
+    _payment(factory, gateway, slot_id=2, order_status="created")
+    _payment(factory, gateway, slot_id=3, order_status="paid")
+
+    result = _reap(factory, gateway)
+
+    assert result.reaped == 3
+    assert result.slots_released == 2
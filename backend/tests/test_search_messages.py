@@ -0,0 +1,30 @@
+"""Tests for SearchMessagesUseCase cursor handling."""
+
+import pytest
+
+from app.application.use_cases.messaging import SearchMessagesUseCase
+from app.utils.pagination import encode_cursor
+
+
+class EmptyMessageRepository:
+    def search_messages(self, **kwargs):
+        return []
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [encode_cursor(None, "x"), encode_cursor("rank", 1), encode_cursor(0.5, None), "not-a-cursor"],
+)
+def test_malformed_cursor_is_rejected_as_invalid(cursor):
+    use_case = SearchMessagesUseCase(conversation_repo=None, message_repo=EmptyMessageRepository())
+
+    with pytest.raises(ValueError, match="Invalid pagination cursor"):
+        use_case.execute(user_id=1, query="homework", cursor=cursor)
+
+
+def test_valid_cursor_is_accepted():
+    use_case = SearchMessagesUseCase(conversation_repo=None, message_repo=EmptyMessageRepository())
+
+    page = use_case.execute(user_id=1, query="homework", cursor=encode_cursor(0.5, 10))
+    assert page.hits == []
+    assert page.next_cursor is None
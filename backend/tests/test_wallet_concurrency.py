@@ -0,0 +1,329 @@
+"""
+Concurrency tests for wallet balance updates and withdrawal settlement.
+
+Runs against a throwaway SQLite file database (no server needed). Each
+test opens several sessions on the same wallet to reproduce the races the
+repository guards against: lost updates, overdrafts from a stale balance,
+and a withdrawal being settled twice.
+"""
+
+import threading
+from decimal import Decimal
+
+import pytest
+
+from app.application.use_cases.wallet import (
+    DepositFundsUseCase,
+    RequestWithdrawalUseCase,
+)
+from app.application.use_cases.wallet.request_withdrawal import (
+    CompleteWithdrawalUseCase,
+    FailWithdrawalUseCase,
+)
+from app.application.use_cases.wallet.wallet_retry import retry_on_wallet_conflict
+from app.domains.wallet.repositories import WalletConflictError
+from app.domains.wallet.value_objects import Money, TransactionStatus
+from app.infrastructure.repositories.wallet_repository_impl import SQLAlchemyWalletRepository
+
+from tests.conftest import INSTRUCTOR_ID
+
+
+def _deposit(factory, amount, reference_id=0):
+    db = factory()
+    try:
+        DepositFundsUseCase(SQLAlchemyWalletRepository(db)).execute(
+            INSTRUCTOR_ID, amount, "session", reference_id, "Session payment"
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def _wallet(factory):
+    db = factory()
+    try:
+        wallet = SQLAlchemyWalletRepository(db).get_by_instructor_id(INSTRUCTOR_ID)
+        db.commit()
+        return wallet
+    finally:
+        db.close()
+
+
+def _request_withdrawal(factory, amount):
+    db = factory()
+    try:
+        transaction = RequestWithdrawalUseCase(SQLAlchemyWalletRepository(db)).execute(
+            INSTRUCTOR_ID, amount, "bank_transfer"
+        )
+        db.commit()
+        return transaction.id
+    finally:
+        db.close()
+
+
+# ============================================================================
+# Lost updates
+# ============================================================================
+
+
+def test_deposit_from_stale_wallet_does_not_overwrite_concurrent_deposit(session_factory):
+    stale_db = session_factory()
+    stale_repo = SQLAlchemyWalletRepository(stale_db)
+    stale_wallet = stale_repo.get_by_instructor_id(INSTRUCTOR_ID)
+    stale_db.commit()
+
+    _deposit(session_factory, 100)
+
+    transaction = stale_wallet.deposit(Money.create(50, "INR"), "manual", 0, "Adjustment")
+    stale_repo.update(stale_wallet)
+    stale_repo.save_transaction(transaction)
+    stale_db.commit()
+    stale_db.close()
+
+    wallet = _wallet(session_factory)
+    assert wallet.balance == Decimal("150.00")
+    assert wallet.total_earned == Decimal("150.00")
+    # The in-memory wallet and its transaction see the stored result
+    assert stale_wallet.balance == Decimal("150.00")
+    assert transaction.balance_after == Decimal("150.00")
+
+
+def test_concurrent_deposits_are_all_applied(session_factory):
+    errors = []
+
+    def deposit(reference_id):
+        try:
+            _deposit(session_factory, 1.25, reference_id)
+        except Exception as e:  # pragma: no cover - surfaced by the assert below
+            errors.append(e)
+
+    threads = [threading.Thread(target=deposit, args=(i,)) for i in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    wallet = _wallet(session_factory)
+    assert wallet.balance == Decimal("25.00")
+    assert wallet.version == 1 + 20
+
+
+# ============================================================================
+# Overdraft conflicts
+# ============================================================================
+
+
+def test_debit_from_stale_balance_conflicts_instead_of_overdrawing(session_factory):
+    _deposit(session_factory, 100)
+
+    stale_db = session_factory()
+    stale_repo = SQLAlchemyWalletRepository(stale_db)
+    stale_wallet = stale_repo.get_by_instructor_id(INSTRUCTOR_ID)
+    stale_db.commit()
+
+    # Someone else spends most of the balance first
+    _request_withdrawal(session_factory, 80)
+
+    stale_wallet.request_withdrawal(Money.create(50, "INR"), "Withdrawal via bank_transfer")
+    with pytest.raises(WalletConflictError):
+        stale_repo.update(stale_wallet)
+    stale_db.rollback()
+    stale_db.close()
+
+    assert _wallet(session_factory).balance == Decimal("20.00")
+
+
+def test_status_update_from_stale_wallet_conflicts(session_factory):
+    first_db, second_db = session_factory(), session_factory()
+    first_repo = SQLAlchemyWalletRepository(first_db)
+    second_repo = SQLAlchemyWalletRepository(second_db)
+    first = first_repo.get_by_instructor_id(INSTRUCTOR_ID)
+    first_db.commit()
+    second = second_repo.get_by_instructor_id(INSTRUCTOR_ID)
+    second_db.commit()
+
+    first.freeze()
+    first_repo.update(first)
+    first_db.commit()
+
+    second.suspend()
+    with pytest.raises(WalletConflictError):
+        second_repo.update(second)
+    second_db.rollback()
+    first_db.close()
+    second_db.close()
+
+
+# ============================================================================
+# Retry
+# ============================================================================
+
+
+def test_retry_on_wallet_conflict_reruns_until_success():
+    calls = []
+
+    def operation():
+        calls.append(1)
+        if len(calls) < 3:
+            raise WalletConflictError("conflict")
+        return "done"
+
+    assert retry_on_wallet_conflict(operation) == "done"
+    assert len(calls) == 3
+
+
+def test_retry_on_wallet_conflict_gives_up_after_attempts():
+    calls = []
+
+    def operation():
+        calls.append(1)
+        raise WalletConflictError("conflict")
+
+    with pytest.raises(WalletConflictError):
+        retry_on_wallet_conflict(operation, attempts=2)
+    assert len(calls) == 2
+
+
+def test_request_withdrawal_retry_revalidates_against_current_balance(session_factory):
+    _deposit(session_factory, 100)
+
+    db = session_factory()
+    repo = SQLAlchemyWalletRepository(db)
+    load = repo.get_by_instructor_id
+    loads = []
+
+    def get_by_instructor_id(instructor_id):
+        wallet = load(instructor_id)
+        loads.append(wallet.balance)
+        if len(loads) == 1:
+            db.commit()
+            # A concurrent debit lands between our read and our update
+            other_db = session_factory()
+            other_repo = SQLAlchemyWalletRepository(other_db)
+            other = other_repo.get_by_instructor_id(instructor_id)
+            other.request_withdrawal(Money.create(70, "INR"), "Withdrawal via payoneer")
+            other_repo.update(other)
+            other_db.commit()
+            other_db.close()
+        return wallet
+
+    repo.get_by_instructor_id = get_by_instructor_id
+
+    with pytest.raises(ValueError) as exc_info:
+        RequestWithdrawalUseCase(repo).execute(INSTRUCTOR_ID, 50, "bank_transfer")
+    db.rollback()
+    db.close()
+
+    # Retried once with the reloaded balance, which no longer covers it
+    assert not isinstance(exc_info.value, WalletConflictError)
+    assert loads == [Decimal("100.00"), Decimal("30.00")]
+    assert _wallet(session_factory).balance == Decimal("30.00")
+
+
+def test_concurrent_withdrawals_never_overdraw(session_factory):
+    _deposit(session_factory, 100)
+    results = []
+
+    def withdraw():
+        try:
+            _request_withdrawal(session_factory, 60)
+            results.append("ok")
+        except ValueError:
+            results.append("rejected")
+
+    threads = [threading.Thread(target=withdraw) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results.count("ok") == 1
+    assert _wallet(session_factory).balance == Decimal("40.00")
+
+
+# ============================================================================
+# Withdrawal settlement
+# ============================================================================
+
+
+def _complete(repo, transaction_id):
+    CompleteWithdrawalUseCase(repo).execute(transaction_id)
+
+
+def _fail(repo, transaction_id):
+    FailWithdrawalUseCase(repo).execute(transaction_id, "Bank rejected")
+
+
+def _settle_twice(session_factory, settle_first, settle_second):
+    """Load the same pending withdrawal in two sessions and settle both."""
+    transaction_id = _request_withdrawal(session_factory, 60)
+
+    first_db, second_db = session_factory(), session_factory()
+    first_repo = SQLAlchemyWalletRepository(first_db)
+    second_repo = SQLAlchemyWalletRepository(second_db)
+
+    # Both runs load the transaction while it is still pending
+    first_txn = first_repo.get_transaction_by_id(transaction_id)
+    first_db.commit()
+    second_txn = second_repo.get_transaction_by_id(transaction_id)
+    second_db.commit()
+    first_repo.get_transaction_by_id = lambda _id: first_txn
+    second_repo.get_transaction_by_id = lambda _id: second_txn
+
+    settle_first(first_repo, transaction_id)
+    first_db.commit()
+
+    with pytest.raises(WalletConflictError):
+        settle_second(second_repo, transaction_id)
+    second_db.rollback()
+    first_db.close()
+    second_db.close()
+    return transaction_id
+
+
+def test_withdrawal_is_completed_only_once(session_factory):
+    _deposit(session_factory, 100)
+
+    transaction_id = _settle_twice(session_factory, _complete, _complete)
+
+    wallet = _wallet(session_factory)
+    assert wallet.balance == Decimal("40.00")
+    assert wallet.total_withdrawn == Decimal("60.00")
+
+    db = session_factory()
+    assert SQLAlchemyWalletRepository(db).get_transaction_by_id(
+        transaction_id
+    ).status == TransactionStatus.COMPLETED
+    db.close()
+
+
+def test_withdrawal_is_refunded_only_once(session_factory):
+    _deposit(session_factory, 100)
+
+    transaction_id = _settle_twice(session_factory, _fail, _fail)
+
+    wallet = _wallet(session_factory)
+    assert wallet.balance == Decimal("100.00")
+    assert wallet.total_withdrawn == Decimal("0.00")
+
+    db = session_factory()
+    transaction = SQLAlchemyWalletRepository(db).get_transaction_by_id(transaction_id)
+    assert transaction.status == TransactionStatus.FAILED
+    assert transaction.failure_reason == "Bank rejected"
+    db.close()
+
+
+def test_completing_a_failed_withdrawal_is_rejected(session_factory):
+    _deposit(session_factory, 100)
+
+    transaction_id = _settle_twice(session_factory, _fail, _complete)
+
+    wallet = _wallet(session_factory)
+    assert wallet.balance == Decimal("100.00")
+    assert wallet.total_withdrawn == Decimal("0.00")
+    db = session_factory()
+    assert SQLAlchemyWalletRepository(db).get_transaction_by_id(
+        transaction_id
+    ).status == TransactionStatus.FAILED
+    db.close()
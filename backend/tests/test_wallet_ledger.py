@@ -0,0 +1,129 @@
+"""
+Tests for the wallet ledger: BalanceChange.from_ledger, snapshots,
+balances as of a point in time and balance verification.
+"""
+
+import time
+from datetime import datetime
+from decimal import Decimal
+
+from app.application.use_cases.wallet import (
+    DepositFundsUseCase,
+    GetBalanceAsOfUseCase,
+    RequestWithdrawalUseCase,
+    SnapshotWalletBalancesUseCase,
+    VerifyWalletBalanceUseCase,
+)
+from app.application.use_cases.wallet.request_withdrawal import (
+    CompleteWithdrawalUseCase,
+    FailWithdrawalUseCase,
+)
+from app.domains.wallet.value_objects import BalanceChange, Money, TransactionStatus, TransactionType
+from app.infrastructure.repositories.wallet_repository_impl import SQLAlchemyWalletRepository
+
+from tests.conftest import INSTRUCTOR_ID
+
+
+def _moment() -> datetime:
+    """A point in time strictly between the transactions around it."""
+    time.sleep(0.01)
+    moment = datetime.utcnow()
+    time.sleep(0.01)
+    return moment
+
+
+def _verify(repo):
+    verification = VerifyWalletBalanceUseCase(repo).execute(INSTRUCTOR_ID)
+    assert verification.is_consistent, verification.difference
+    return verification
+
+
+def _balances(snapshot):
+    return (snapshot.balance, snapshot.total_earned, snapshot.total_withdrawn)
+
+
+def test_from_ledger_applies_creation_and_settlement_rules():
+    change = BalanceChange.from_ledger(
+        created={
+            TransactionType.DEPOSIT: Decimal("100.00"),
+            TransactionType.WITHDRAWAL: Decimal("60.00"),  # Debited when requested
+            TransactionType.REFUND: Decimal("10.00"),
+        },
+        settled_withdrawals={
+            TransactionStatus.FAILED: Decimal("20.00"),  # Credited back when it fails
+            TransactionStatus.COMPLETED: Decimal("40.00"),
+        },
+    )
+
+    assert change == BalanceChange(
+        balance=Decimal("50.00"),
+        total_earned=Decimal("100.00"),
+        total_withdrawn=Decimal("40.00"),
+    )
+
+
+def test_verification_and_balances_as_of_across_a_snapshot(session_factory):
+    db = session_factory()
+    repo = SQLAlchemyWalletRepository(db)
+    _verify(repo)
+
+    DepositFundsUseCase(repo).execute(INSTRUCTOR_ID, 100, "session", 1, "Session payment")
+    after_deposit = _moment()
+    _verify(repo)
+
+    # Withdrawal debited when requested, credited back when it fails
+    failed = RequestWithdrawalUseCase(repo).execute(INSTRUCTOR_ID, 30, "bank_transfer")
+    while_pending = _moment()
+    _verify(repo)
+    FailWithdrawalUseCase(repo).execute(failed.id, "Bank rejected")
+    _verify(repo)
+
+    completed = RequestWithdrawalUseCase(repo).execute(INSTRUCTOR_ID, 50, "bank_transfer")
+    CompleteWithdrawalUseCase(repo).execute(completed.id)
+
+    wallet = repo.get_by_instructor_id(INSTRUCTOR_ID)
+    refund = wallet.process_refund(Money.create(5, "INR"), session_id=1, description="Session refund")
+    repo.update(wallet)
+    repo.save_transaction(refund)
+    db.commit()
+    _verify(repo)
+
+    snapshot_at = _moment()
+    result = SnapshotWalletBalancesUseCase(repo).execute(as_of=snapshot_at)
+    db.commit()
+    assert (result.wallets, result.snapshots) == (1, 1)
+
+    DepositFundsUseCase(repo).execute(INSTRUCTOR_ID, 25, "session", 2, "Session payment")
+    db.commit()
+
+    verification = _verify(repo)
+    assert verification.snapshot_as_of == snapshot_at
+    assert _balances(verification.ledger) == (Decimal("70.00"), Decimal("125.00"), Decimal("50.00"))
+
+    as_of = GetBalanceAsOfUseCase(repo)
+    # Before the snapshot: summed from the start of the ledger
+    assert _balances(as_of.execute(INSTRUCTOR_ID, after_deposit)) == (
+        Decimal("100.00"), Decimal("100.00"), Decimal("0.00")
+    )
+    assert _balances(as_of.execute(INSTRUCTOR_ID, while_pending)) == (
+        Decimal("70.00"), Decimal("100.00"), Decimal("0.00")
+    )
+    # At and after the snapshot: the snapshot plus later transactions
+    assert _balances(as_of.execute(INSTRUCTOR_ID, snapshot_at)) == (
+        Decimal("45.00"), Decimal("100.00"), Decimal("50.00")
+    )
+    assert _balances(as_of.execute(INSTRUCTOR_ID, datetime.utcnow())) == (
+        Decimal("70.00"), Decimal("125.00"), Decimal("50.00")
+    )
+
+    # A second snapshot chains from the first
+    second_snapshot_at = _moment()
+    SnapshotWalletBalancesUseCase(repo).execute(as_of=second_snapshot_at)
+    db.commit()
+    verification = _verify(repo)
+    assert verification.snapshot_as_of == second_snapshot_at
+    assert _balances(verification.ledger) == (Decimal("70.00"), Decimal("125.00"), Decimal("50.00"))
+    assert _balances(as_of.execute(INSTRUCTOR_ID, snapshot_at)) == (
+        Decimal("45.00"), Decimal("100.00"), Decimal("50.00")
+    )
+    db.close()